@@ -0,0 +1,54 @@
+"""backfill games.has_stats / has_lineup from stats and lineup rows
+
+Read paths now trust the stored flags instead of re-deriving has_stats with
+a UNION over game_team_stats / game_player_stats per request, so the
+columns must match the rows before that code ships. Writers maintain them
+from here on; app.tasks.sync_tasks.reconcile_game_flags repairs drift.
+
+Revision ID: hs2a3b4c5d6e7
+Revises: sj1a2b3c4d5e6
+Create Date: 2026-10-18 18:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "hs2a3b4c5d6e7"
+down_revision: Union[str, None] = "sj1a2b3c4d5e6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        UPDATE games g SET has_stats = derived.value
+        FROM (
+            SELECT id,
+                   EXISTS (SELECT 1 FROM game_team_stats ts WHERE ts.game_id = games.id)
+                   OR EXISTS (SELECT 1 FROM game_player_stats ps WHERE ps.game_id = games.id)
+                   AS value
+            FROM games
+        ) derived
+        WHERE derived.id = g.id AND g.has_stats IS DISTINCT FROM derived.value
+        """
+    )
+    op.execute(
+        """
+        UPDATE games g SET has_lineup = derived.value
+        FROM (
+            SELECT id,
+                   EXISTS (SELECT 1 FROM game_lineups l WHERE l.game_id = games.id) AS value
+            FROM games
+        ) derived
+        WHERE derived.id = g.id AND g.has_lineup IS DISTINCT FROM derived.value
+        """
+    )
+
+
+def downgrade() -> None:
+    # Data-only migration: the derived flags are valid under the old code too.
+    pass
@@ -0,0 +1,67 @@
+"""add sync_jobs and sync_job_units tables
+
+Revision ID: sj1a2b3c4d5e6
+Revises: 98832ad659b3
+Create Date: 2026-10-18 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision: str = "sj1a2b3c4d5e6"
+down_revision: Union[str, None] = "98832ad659b3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_jobs",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("kind", sa.String(50), nullable=False),
+        sa.Column("params", JSONB(), nullable=False, server_default="{}"),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("units_total", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("units_done", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("units_failed", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("slices", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("triggered_by", sa.String(255), nullable=False, server_default="admin"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("completed_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_sync_jobs_status", "sync_jobs", ["status"])
+    op.create_index("ix_sync_jobs_created_at", "sync_jobs", ["created_at"])
+
+    op.create_table(
+        "sync_job_units",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("job_id", sa.Integer(), nullable=False),
+        sa.Column("position", sa.Integer(), nullable=False),
+        sa.Column("unit_key", sa.String(100), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="pending"),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("result", JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["job_id"], ["sync_jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("job_id", "unit_key", name="uq_sync_job_units_job_key"),
+    )
+    op.create_index("ix_sync_job_units_job_status", "sync_job_units", ["job_id", "status"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sync_job_units_job_status", table_name="sync_job_units")
+    op.drop_table("sync_job_units")
+    op.drop_index("ix_sync_jobs_created_at", table_name="sync_jobs")
+    op.drop_index("ix_sync_jobs_status", table_name="sync_jobs")
+    op.drop_table("sync_jobs")
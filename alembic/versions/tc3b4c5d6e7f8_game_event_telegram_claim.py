@@ -0,0 +1,33 @@
+"""add game_events.telegram_sending_at (outbox claim marker)
+
+The per-game Telegram outbox used to claim events with FOR UPDATE SKIP
+LOCKED and keep that transaction open across the Telegram call. It now
+claims by setting this column in a short transaction instead.
+
+Revision ID: tc3b4c5d6e7f8
+Revises: hs2a3b4c5d6e7
+Create Date: 2026-10-19 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "tc3b4c5d6e7f8"
+down_revision: Union[str, None] = "hs2a3b4c5d6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "game_events",
+        sa.Column("telegram_sending_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("game_events", "telegram_sending_at")
@@ -0,0 +1,33 @@
+"""add game_events.video_poster_url (HLS poster, when one was produced)
+
+Poster extraction is best-effort, so an HLS package may have no poster.
+The clip pipeline records the poster object here only when it uploaded
+one.
+
+Revision ID: vp4c5d6e7f8a9
+Revises: tc3b4c5d6e7f8
+Create Date: 2026-10-19 14:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "vp4c5d6e7f8a9"
+down_revision: Union[str, None] = "tc3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "game_events",
+        sa.Column("video_poster_url", sa.Text(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("game_events", "video_poster_url")
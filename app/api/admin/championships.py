@@ -11,6 +11,7 @@ from app.schemas.admin.championships import (
     AdminChampionshipResponse,
     AdminChampionshipsListResponse,
 )
+from app.services.reference_data import bump_reference_version
 
 router = APIRouter(
     prefix="/championships",
@@ -55,6 +56,7 @@ async def create_championship(
     obj = Championship(**body.model_dump())
     db.add(obj)
     await db.commit()
+    await bump_reference_version()
     await db.refresh(obj)
     return AdminChampionshipResponse.model_validate(obj)
 
@@ -74,6 +76,7 @@ async def update_championship(
         setattr(obj, key, value)
 
     await db.commit()
+    await bump_reference_version()
     await db.refresh(obj)
     return AdminChampionshipResponse.model_validate(obj)
 
@@ -87,3 +90,4 @@ async def delete_championship(id: int, db: AsyncSession = Depends(get_db)):
 
     await db.delete(obj)
     await db.commit()
+    await bump_reference_version()
@@ -11,6 +11,7 @@ from app.schemas.admin.clubs import (
     AdminClubResponse,
     AdminClubsListResponse,
 )
+from app.services.reference_data import bump_reference_version
 
 router = APIRouter(
     prefix="/clubs",
@@ -52,6 +53,7 @@ async def create_club(
     obj = Club(**body.model_dump())
     db.add(obj)
     await db.commit()
+    await bump_reference_version()
     await db.refresh(obj)
     return AdminClubResponse.model_validate(obj)
 
@@ -71,6 +73,7 @@ async def update_club(
         setattr(obj, key, value)
 
     await db.commit()
+    await bump_reference_version()
     await db.refresh(obj)
     return AdminClubResponse.model_validate(obj)
 
@@ -84,3 +87,4 @@ async def delete_club(id: int, db: AsyncSession = Depends(get_db)):
 
     await db.delete(obj)
     await db.commit()
+    await bump_reference_version()
@@ -20,6 +20,7 @@ from app.schemas.admin.contracts import (
     AdminContractUpdateRequest,
     AdminContractsListResponse,
 )
+from app.services.list_counts import invalidate_list_counts
 from app.services.telegram import notify_contract_change, notify_contract_updated, send_telegram_message
 from app.utils.file_urls import to_object_name
 
@@ -255,6 +256,7 @@ async def bulk_copy_contracts(
         created_names.append(players_map.get(src.player_id, f"#{src.player_id}"))
 
     await db.commit()
+    invalidate_list_counts("players")
 
     # Build detailed notification
     msg_parts = [
@@ -363,6 +365,7 @@ async def create_contract(
     await db.flush()
     pt_id = pt.id
     await db.commit()
+    invalidate_list_counts("players")
 
     await notify_contract_change(
         action="создан",
@@ -435,6 +438,7 @@ async def update_contract(
         setattr(pt, field, value)
 
     await db.commit()
+    invalidate_list_counts("players")
 
     row = await _fetch_contract_row(db, contract_id)
     pt2, player2, team2, season2 = row
@@ -464,6 +468,7 @@ async def delete_contract(
 
     await db.delete(pt)
     await db.commit()
+    invalidate_list_counts("players")
 
     await notify_contract_change(
         action="удалён",
@@ -24,6 +24,7 @@ from app.services.cup_draw import (
     publish_pair,
     _load_teams_by_id,
 )
+from app.services.season_snapshots import enqueue_season_snapshot_build
 
 router = APIRouter(
     prefix="/cup-draw",
@@ -117,6 +118,8 @@ async def add_pair_endpoint(
         "cup_draw_action action=add_pair season_id=%s round_key=%s sort_order=%s admin_user_id=%s",
         season_id, round_key, body.sort_order, current_admin.id,
     )
+    # Active and published draws feed the public cup bracket (all draw actions rebuild it).
+    await enqueue_season_snapshot_build(season_id)
     return await _enrich_draw(db, draw)
 
 
@@ -137,6 +140,7 @@ async def publish_pair_endpoint(
         "cup_draw_action action=publish_pair season_id=%s round_key=%s sort_order=%s admin_user_id=%s",
         season_id, round_key, sort_order, current_admin.id,
     )
+    await enqueue_season_snapshot_build(season_id)
     return await _enrich_draw(db, draw)
 
 
@@ -157,6 +161,7 @@ async def delete_pair_endpoint(
         "cup_draw_action action=delete_pair season_id=%s round_key=%s sort_order=%s admin_user_id=%s",
         season_id, round_key, sort_order, current_admin.id,
     )
+    await enqueue_season_snapshot_build(season_id)
     return await _enrich_draw(db, draw)
 
 
@@ -172,6 +177,7 @@ async def complete_draw_endpoint(
         "cup_draw_action action=complete season_id=%s round_key=%s admin_user_id=%s",
         season_id, round_key, current_admin.id,
     )
+    await enqueue_season_snapshot_build(season_id)
     return await _enrich_draw(db, draw)
 
 
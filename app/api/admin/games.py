@@ -41,9 +41,13 @@ from app.services.game_lifecycle import (
     InvalidTransition,
     VALID_ACTIONS,
 )
+from app.services.game_api_cache import invalidate_game_api_cache
+from app.services.home_widget_snapshots import enqueue_home_widget_refresh
+from app.services.season_snapshots import enqueue_season_snapshot_build
+from app.services.team_overview_aggregates import refresh_team_overview_aggregates
 from app.services.season_filters import get_group_team_ids
 from app.utils.game_event_assists import is_assist_supported_event_type
-from app.utils.has_stats import enrich_games_has_stats, compute_single_has_stats
+from app.utils.has_stats import mark_has_stats
 
 router = APIRouter(
     prefix="/games",
@@ -185,7 +189,6 @@ async def list_games(
         .limit(limit)
     )
     games = list(result.scalars().all())
-    await enrich_games_has_stats(db, games)
     items = [_game_to_response(g) for g in games]
     return AdminGamesListResponse(items=items, total=total)
 
@@ -231,7 +234,6 @@ async def get_game(game_id: int, db: AsyncSession = Depends(get_db)):
     game = result.scalar_one_or_none()
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
-    game.has_stats = await compute_single_has_stats(db, game_id)
     return _game_to_response(game)
 
 
@@ -259,6 +261,7 @@ async def transition_game(
     try:
         svc = GameLifecycleService(db)
         result = await svc.dispatch(game_id, body.action)
+        invalidate_game_api_cache(game_id)
         _lifecycle_logger.info(
             "game=%s action=%s admin=%s result=%s",
             game_id, body.action, admin.email, result,
@@ -325,6 +328,7 @@ async def update_game(
     game = result.scalar_one_or_none()
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
+    previous_teams = (game.season_id, game.home_team_id, game.away_team_id)
 
     # NOT NULL fields — silently skip if caller sends null
     NOT_NULLABLE = {"date", "is_featured", "is_free_entry", "is_schedule_tentative", "sync_disabled"}
@@ -357,6 +361,18 @@ async def update_game(
             )
 
     await db.commit()
+    invalidate_game_api_cache(game_id)
+    # Score / date / broadcast edits show on the homepage widget and, with
+    # stage / tour edits, in the season results grid and brackets.
+    await enqueue_home_widget_refresh(game.season_id)
+    await enqueue_season_snapshot_build(game.season_id)
+    if previous_teams[0] != game.season_id:
+        await enqueue_season_snapshot_build(previous_teams[0])
+    # ...and in both teams' overview (form, upcoming fixtures); teams or
+    # season may have been edited too.
+    await refresh_team_overview_aggregates(db, game.season_id, [game.home_team_id, game.away_team_id])
+    if previous_teams != (game.season_id, game.home_team_id, game.away_team_id):
+        await refresh_team_overview_aggregates(db, previous_teams[0], previous_teams[1:])
     result = await db.execute(
         select(Game)
         .options(
@@ -368,7 +384,6 @@ async def update_game(
         .where(Game.id == game_id)
     )
     game = result.scalar_one()
-    game.has_stats = await compute_single_has_stats(db, game_id)
 
     response = JSONResponse(
         content=_game_to_response(game).model_dump(mode="json"),
@@ -423,6 +438,7 @@ async def clear_lineup(game_id: int, db: AsyncSession = Depends(get_db)):
     game.lineup_source = None
     game.prematch_pdf_hash = None
     await db.commit()
+    invalidate_game_api_cache(game_id)
     return {"ok": True}
 
 
@@ -445,6 +461,7 @@ async def add_lineup(game_id: int, body: AdminLineupAddRequest, db: AsyncSession
     db.add(entry)
     try:
         await db.commit()
+        invalidate_game_api_cache(game_id)
     except Exception:
         await db.rollback()
         raise HTTPException(status_code=409, detail="Player already in lineup for this game")
@@ -490,6 +507,7 @@ async def update_lineup(game_id: int, lineup_id: int, body: AdminLineupUpdateReq
     if body.field_position is not None:
         entry.field_position = body.field_position if body.field_position != "" else None
     await db.commit()
+    invalidate_game_api_cache(game_id)
     await db.refresh(entry)
 
     player_result = await db.execute(
@@ -520,6 +538,7 @@ async def delete_lineup(game_id: int, lineup_id: int, db: AsyncSession = Depends
         raise HTTPException(status_code=404, detail="Lineup entry not found")
     await db.delete(entry)
     await db.commit()
+    invalidate_game_api_cache(game_id)
     return {"ok": True}
 
 
@@ -746,6 +765,7 @@ async def import_prematch_lineup(
         game.lineup_source = "prematch_report"
 
     await db.commit()
+    invalidate_game_api_cache(game_id)
 
     # Add warnings for unmatched
     for pm in home_matches + away_matches:
@@ -805,6 +825,7 @@ async def sync_fcms_lineup(
         result = await service.sync_fcms_lineup(game_id)
     finally:
         await client.close()
+    invalidate_game_api_cache(game_id)
 
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
@@ -832,6 +853,7 @@ async def sync_fcms_events(
         result = await service.sync_fcms_events(game_id)
     finally:
         await client.close()
+    invalidate_game_api_cache(game_id)
 
     if "error" in result:
         raise HTTPException(status_code=400, detail=result["error"])
@@ -896,6 +918,7 @@ async def add_event(game_id: int, body: AdminEventAddRequest, db: AsyncSession =
     )
     db.add(ev)
     await db.commit()
+    invalidate_game_api_cache(game_id)
     await db.refresh(ev)
 
     return AdminEventItem(
@@ -925,6 +948,7 @@ async def delete_event(game_id: int, event_id: int, db: AsyncSession = Depends(g
         raise HTTPException(status_code=404, detail="Event not found")
     await db.delete(ev)
     await db.commit()
+    invalidate_game_api_cache(game_id)
     return {"ok": True}
 
 
@@ -940,6 +964,7 @@ async def delete_event_video(
     """
     from app.services.file_storage import FileStorageService
     from app.utils.file_urls import to_object_name
+    from app.utils.video_transcode import hls_package_prefix, is_hls_manifest
 
     result = await db.execute(
         select(GameEvent).where(GameEvent.id == event_id, GameEvent.game_id == game_id)
@@ -950,11 +975,16 @@ async def delete_event_video(
 
     object_name = to_object_name(ev.video_url) if ev.video_url else None
     ev.video_url = None
+    ev.video_poster_url = None
     await db.commit()
+    invalidate_game_api_cache(game_id)
 
     if object_name:
         try:
-            await FileStorageService.delete_file(object_name)
+            if is_hls_manifest(object_name):
+                await FileStorageService.delete_prefix(hls_package_prefix(object_name))
+            else:
+                await FileStorageService.delete_file(object_name)
         except Exception:
             logging.getLogger(__name__).warning(
                 "Failed to delete goal video object %s", object_name, exc_info=True
@@ -1013,6 +1043,7 @@ async def update_event(game_id: int, event_id: int, body: AdminEventUpdateReques
     ):
         ev.assist_manual_override = True
     await db.commit()
+    invalidate_game_api_cache(game_id)
     await db.refresh(ev)
     return AdminEventItem(
         id=ev.id,
@@ -1071,6 +1102,7 @@ async def add_referee(game_id: int, body: AdminRefereeAddRequest, db: AsyncSessi
     db.add(entry)
     try:
         await db.commit()
+        invalidate_game_api_cache(game_id)
     except Exception:
         await db.rollback()
         raise HTTPException(status_code=409, detail="Referee already assigned with this role")
@@ -1099,6 +1131,7 @@ async def delete_referee(game_id: int, entry_id: int, db: AsyncSession = Depends
         raise HTTPException(status_code=404, detail="Referee entry not found")
     await db.delete(entry)
     await db.commit()
+    invalidate_game_api_cache(game_id)
     return {"ok": True}
 
 
@@ -1120,6 +1153,7 @@ async def sync_fcms_referees(game_id: int, db: AsyncSession = Depends(get_db)):
         await db.rollback()
         raise HTTPException(status_code=502, detail=result["error"])
     await db.commit()
+    invalidate_game_api_cache(game_id)
     return result
 
 
@@ -1175,6 +1209,7 @@ async def add_game_broadcaster(
     db.add(entry)
     try:
         await db.commit()
+        invalidate_game_api_cache(game_id)
     except Exception:
         await db.rollback()
         raise HTTPException(status_code=409, detail="Broadcaster already added to this game")
@@ -1210,6 +1245,7 @@ async def delete_game_broadcaster(game_id: int, entry_id: int, db: AsyncSession
         raise HTTPException(status_code=404, detail="Broadcaster entry not found")
     await db.delete(entry)
     await db.commit()
+    invalidate_game_api_cache(game_id)
     return {"ok": True}
 
 
@@ -1271,11 +1307,13 @@ async def upsert_team_stats(
     if not ts:
         ts = GameTeamStats(game_id=game_id, team_id=team_id)
         db.add(ts)
+        await mark_has_stats(db, game_id)
 
     for field, value in body.model_dump(exclude_unset=True).items():
         setattr(ts, field, value)
 
     await db.commit()
+    invalidate_game_api_cache(game_id)
     await db.refresh(ts)
 
     # Reload with team
@@ -1350,11 +1388,13 @@ async def upsert_player_stats(
     if not ps:
         ps = GamePlayerStats(game_id=game_id, player_id=player_id, team_id=body.team_id)
         db.add(ps)
+        await mark_has_stats(db, game_id)
 
     for field, value in body.model_dump(exclude_unset=True).items():
         setattr(ps, field, value)
 
     await db.commit()
+    invalidate_game_api_cache(game_id)
     await db.refresh(ps)
 
     # Reload with player and team
@@ -28,6 +28,7 @@ from app.schemas.admin.news import (
     AdminNewsTranslationResponse,
 )
 from app.services.file_storage import FileStorageService
+from app.services.list_counts import invalidate_list_counts
 from app.services.news_classifier import NewsClassifierService
 from app.services.news_translator import NewsTranslatorService
 from app.utils.html_cleaner import sanitize_news_html
@@ -418,6 +419,7 @@ async def classify_materials(
 
     if payload.apply and updated_group_ids:
         await db.commit()
+        invalidate_list_counts("news")
 
     summary = AdminNewsClassifySummary(
         dry_run=not payload.apply,
@@ -480,6 +482,7 @@ async def create_material(
 
     db.add_all([ru_item, kz_item])
     await db.commit()
+    invalidate_list_counts("news")
     await db.refresh(ru_item)
     await db.refresh(kz_item)
 
@@ -516,6 +519,7 @@ async def update_material(
         await _apply_payload(kz_item, payload.kz, current_admin.id, db, partial=True)
 
     await db.commit()
+    invalidate_list_counts("news")
 
     refreshed = await db.execute(select(News).where(News.translation_group_id == group_id))
     return _to_material_response(refreshed.scalars().all())
@@ -541,6 +545,7 @@ async def set_material_article_type(
         item.updated_by_admin_id = current_admin.id
 
     await db.commit()
+    invalidate_list_counts("news")
     refreshed = await db.execute(select(News).where(News.translation_group_id == group_id))
     return _to_material_response(refreshed.scalars().all())
 
@@ -573,6 +578,7 @@ async def create_missing_translation(
 
     db.add(item)
     await db.commit()
+    invalidate_list_counts("news")
 
     refreshed = await db.execute(select(News).where(News.translation_group_id == group_id))
     return _to_material_response(refreshed.scalars().all())
@@ -612,6 +618,7 @@ async def delete_material(
         )
 
     await db.commit()
+    invalidate_list_counts("news")
     return {"message": "Material deleted"}
 
 
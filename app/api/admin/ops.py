@@ -6,6 +6,7 @@ from sqlalchemy.orm import joinedload
 
 from app.api.admin.deps import require_roles
 from app.api.deps import get_db
+from app.config import get_settings
 from app.models import AdminUser, Broadcaster, Game, GameReferee, Referee, RefereeRole, Stadium
 from app.models.game import GameStatus
 from app.services.poster_parser import PosterParserService
@@ -16,7 +17,17 @@ from app.services.live_sync_service import LiveSyncService
 from app.services.season_visibility import get_current_season_id
 from app.services.sota_client import SotaClient, get_sota_client
 from app.services.sync import GameSyncService, SyncOrchestrator
-from app.tasks.sync_tasks import resync_extended_stats_task, backfill_player_tour_stats_task
+from app.services.sync_jobs import (
+    JOB_PENDING,
+    create_job,
+    job_summary,
+    list_job_summaries,
+    pause_job,
+    registered_job_kinds,
+    resume_job,
+)
+from app.tasks.sync_job_tasks import run_sync_job_task
+from app.utils.outbound_governor import get_governor
 from app.utils.timestamps import utcnow
 router = APIRouter(prefix="/ops", tags=["admin-ops"])
 
@@ -58,6 +69,32 @@ async def sync_full(
         return SyncResponse(status=SyncStatus.FAILED, message=f"Full sync failed: {exc}")
 
 
+@router.post("/sync/full-all", response_model=SyncResponse)
+async def sync_full_all(
+    season_ids: list[int] | None = Query(default=None),
+    force: bool = Query(default=False),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    """Full sync for several seasons in parallel; details carry the per-node timing report."""
+    from app.database import AsyncSessionLocal
+    from app.services.sync import run_full_sync_dag
+
+    try:
+        report = await run_full_sync_dag(
+            season_ids or get_settings().sync_season_ids,
+            session_factory=AsyncSessionLocal,
+            force=force,
+        )
+    except Exception as exc:
+        return SyncResponse(status=SyncStatus.FAILED, message=f"Full sync failed: {exc}")
+    failed = report["counts"].get("failed", 0)
+    return SyncResponse(
+        status=SyncStatus.PARTIAL if failed else SyncStatus.SUCCESS,
+        message=f"Full sync completed for {len(report['seasons'])} seasons",
+        details=report,
+    )
+
+
 @router.post("/sync/games", response_model=SyncResponse)
 async def sync_games(
     season_id: int = Query(default=None),
@@ -200,11 +237,15 @@ async def sync_game_events(
     db: AsyncSession = Depends(get_db),
     _admin: AdminUser = Depends(require_roles("superadmin", "operator", "editor")),
 ):
-    try:
-        details = await SyncOrchestrator(db).sync_game_events(game_id)
-        return SyncResponse(status=SyncStatus.SUCCESS, message="Game events sync completed", details=details)
-    except Exception as exc:
-        return SyncResponse(status=SyncStatus.FAILED, message=f"Game events sync failed: {exc}")
+    """Queue game events sync for a single game as a sync job."""
+    job = await create_job(db, "sync_game_events", {"game_id": game_id}, triggered_by=_admin.email)
+    await db.commit()
+    run_sync_job_task.delay(job.id)
+    return SyncResponse(
+        status=SyncStatus.SUCCESS,
+        message=f"Queued game events sync for game {game_id}",
+        details={"game_id": game_id, "job_id": job.id},
+    )
 
 
 @router.post("/sync/all-game-events", response_model=SyncResponse)
@@ -214,12 +255,22 @@ async def sync_all_game_events(
     db: AsyncSession = Depends(get_db),
     _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
 ):
+    """Queue game events sync for a season as a resumable job (one unit per game)."""
     season_id = season_id or await get_current_season_id(db)
-    try:
-        details = await SyncOrchestrator(db).sync_all_game_events(season_id, force=force)
-        return SyncResponse(status=SyncStatus.SUCCESS, message="All game events sync completed", details=details)
-    except Exception as exc:
-        return SyncResponse(status=SyncStatus.FAILED, message=f"All game events sync failed: {exc}")
+    job = await create_job(
+        db,
+        "sync_all_game_events",
+        {"season_id": season_id, "force": force},
+        triggered_by=_admin.email,
+    )
+    await db.commit()
+    if job.units_total:
+        run_sync_job_task.delay(job.id)
+    return SyncResponse(
+        status=SyncStatus.SUCCESS,
+        message=f"Queued game events sync for {job.units_total} games of season {season_id}",
+        details={"season_id": season_id, "games": job.units_total, "job_id": job.id},
+    )
 
 
 class ResyncExtendedStatsRequest(BaseModel):
@@ -263,13 +314,17 @@ async def resync_extended_stats(
         game.extended_stats_synced_at = None
     await db.commit()
 
-    # 3. Queue Celery task
-    resync_extended_stats_task.delay(resolved_ids)
+    # 3. Plan a resumable job (one unit per game + per season) and queue it
+    job = await create_job(
+        db, "resync_extended_stats", {"game_ids": resolved_ids}, triggered_by=_admin.email,
+    )
+    await db.commit()
+    run_sync_job_task.delay(job.id)
 
     return SyncResponse(
         status=SyncStatus.SUCCESS,
         message=f"Queued {len(resolved_ids)} games for resync",
-        details={"game_ids": resolved_ids},
+        details={"game_ids": resolved_ids, "job_id": job.id},
     )
 
 
@@ -306,15 +361,108 @@ async def backfill_player_tour_stats(
     db: AsyncSession = Depends(get_db),
     _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
 ):
-    """Queue backfill of player tour stats via Celery."""
-    backfill_player_tour_stats_task.delay(season_id, max_tour)
+    """Queue backfill of player tour stats as a resumable job (one unit per tour)."""
+    job = await create_job(
+        db,
+        "backfill_player_tour_stats",
+        {"season_id": season_id, "max_tour": max_tour},
+        triggered_by=_admin.email,
+    )
+    await db.commit()
+    if job.units_total:
+        run_sync_job_task.delay(job.id)
     return SyncResponse(
         status=SyncStatus.SUCCESS,
         message=f"Queued backfill for season {season_id}, tours 1..{max_tour}",
-        details={"season_id": season_id, "max_tour": max_tour},
+        details={"season_id": season_id, "max_tour": max_tour, "job_id": job.id},
     )
 
 
+# ==================== Resumable bulk sync jobs ====================
+
+class SyncJobCreateRequest(BaseModel):
+    kind: str
+    params: dict = {}
+
+
+@router.post("/jobs")
+async def start_sync_job(
+    payload: SyncJobCreateRequest,
+    db: AsyncSession = Depends(get_db),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    """Plan and queue a checkpointed bulk job (see ``GET /ops/jobs/kinds``)."""
+    if payload.kind not in registered_job_kinds():
+        raise HTTPException(status_code=400, detail=f"Unknown job kind: {payload.kind}")
+    try:
+        job = await create_job(db, payload.kind, payload.params, triggered_by=_admin.email)
+    except (KeyError, TypeError, ValueError) as exc:
+        raise HTTPException(status_code=400, detail=f"Invalid params: {exc}")
+    await db.commit()
+    if job.units_total:
+        run_sync_job_task.delay(job.id)
+    return await job_summary(db, job.id)
+
+
+@router.get("/jobs/kinds")
+async def list_sync_job_kinds(
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    return {"kinds": registered_job_kinds()}
+
+
+@router.get("/jobs")
+async def list_sync_jobs(
+    limit: int = Query(default=20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    return {"items": await list_job_summaries(db, limit=limit)}
+
+
+@router.get("/jobs/{job_id}")
+async def get_sync_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    summary = await job_summary(db, job_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return summary
+
+
+@router.post("/jobs/{job_id}/pause")
+async def pause_sync_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    """Pause after the unit currently in flight; progress so far is kept."""
+    job = await pause_job(db, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    await db.commit()
+    return await job_summary(db, job_id)
+
+
+@router.post("/jobs/{job_id}/resume")
+async def resume_sync_job(
+    job_id: int,
+    retry_failed: bool = Query(default=False),
+    db: AsyncSession = Depends(get_db),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    """Continue from the last checkpoint; ``retry_failed`` re-queues given-up units."""
+    job = await resume_job(db, job_id, retry_failed=retry_failed)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    await db.commit()
+    if job.status == JOB_PENDING:
+        run_sync_job_task.delay(job.id)
+    return await job_summary(db, job_id)
+
+
 @router.post("/backfill-player-stats/{season_id}", response_model=SyncResponse)
 async def backfill_player_stats(
     season_id: int,
@@ -1142,3 +1290,38 @@ async def tg_test_daily_results(
         "locale": locale,
         "sent": ok,
     }
+
+
+# ==================== SOTA response cache ====================
+
+@router.get("/sota-cache")
+async def sota_cache_stats(
+    client: SotaClient = Depends(get_sota_client),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    """Per-endpoint hit/miss/revalidated/coalesced counters and TTL policy."""
+    return {
+        "enabled": client.cache.enabled,
+        "ttls": client.cache.ttls,
+        "stats": await client.cache.shared_stats(),
+        "this_process": client.cache.local_stats(),
+    }
+
+
+@router.post("/sota-cache/clear")
+async def clear_sota_cache(
+    endpoint: str | None = Query(default=None),
+    client: SotaClient = Depends(get_sota_client),
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    """Drop cached SOTA responses so the next sync refetches everything."""
+    return {"deleted": await client.cache.clear(endpoint)}
+
+
+@router.get("/outbound")
+async def outbound_governor_state(
+    _admin: AdminUser = Depends(require_roles("superadmin", "operator")),
+):
+    """Per-host breaker state, throttling and latency for external API calls (this process)."""
+    governor = get_governor()
+    return {"enabled": governor.enabled, "hosts": governor.snapshot()}
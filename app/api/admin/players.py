@@ -20,6 +20,7 @@ from app.models import (
     Season,
     Team,
 )
+from app.services.list_counts import invalidate_list_counts
 from app.services.season_visibility import ensure_visible_season_or_404, is_season_visible_clause
 from app.schemas.admin.players import (
     AdminMetaCountry,
@@ -360,6 +361,7 @@ async def create_player(
 
     await _replace_team_bindings(db, player.id, payload.team_bindings)
     await db.commit()
+    invalidate_list_counts("players")
     await db.refresh(player)
 
     bindings_map = await _get_player_bindings(db, [player.id])
@@ -412,6 +414,7 @@ async def update_player(
         await _replace_team_bindings(db, player_id, payload.team_bindings)
 
     await db.commit()
+    invalidate_list_counts("players")
     await db.refresh(player)
 
     if changes:
@@ -501,6 +504,7 @@ async def delete_player(
     await db.execute(delete(PlayerTeam).where(PlayerTeam.player_id == player_id))
     await db.delete(player)
     await db.commit()
+    invalidate_list_counts("players")
 
     await send_telegram_message(
         f"\U0001f464 Игрок <b>удалён</b>\n\n"
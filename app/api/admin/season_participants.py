@@ -5,6 +5,7 @@ from sqlalchemy import delete, select, func
 from app.api.deps import get_db
 from app.api.admin.deps import require_roles
 from app.models import Season, SeasonParticipant, Team
+from app.services.season_snapshots import enqueue_season_snapshot_build
 from app.services.season_visibility import ensure_visible_season_or_404, is_season_visible_clause
 from app.schemas.admin.season_participants import (
     AdminSeasonParticipantsBulkSetRequest,
@@ -54,6 +55,7 @@ async def create_season_participant(
     obj = SeasonParticipant(**body.model_dump())
     db.add(obj)
     await db.commit()
+    await enqueue_season_snapshot_build(obj.season_id)
     await db.refresh(obj)
     return AdminSeasonParticipantResponse.model_validate(obj)
 
@@ -101,6 +103,7 @@ async def bulk_set_season_participants(
         created_rows.append(row)
 
     await db.commit()
+    await enqueue_season_snapshot_build(body.season_id)
 
     for row in created_rows:
         await db.refresh(row)
@@ -130,10 +133,13 @@ async def update_season_participant(
     if not obj:
         raise HTTPException(status_code=404, detail="Season participant entry not found")
 
+    previous_season_id = obj.season_id
     for key, value in body.model_dump(exclude_unset=True).items():
         setattr(obj, key, value)
 
     await db.commit()
+    for season_id in {previous_season_id, obj.season_id}:
+        await enqueue_season_snapshot_build(season_id)
     await db.refresh(obj)
     return AdminSeasonParticipantResponse.model_validate(obj)
 
@@ -154,3 +160,4 @@ async def delete_season_participant(id: int, db: AsyncSession = Depends(get_db))
 
     await db.delete(obj)
     await db.commit()
+    await enqueue_season_snapshot_build(obj.season_id)
@@ -11,6 +11,7 @@ from app.schemas.admin.stadiums import (
     AdminStadiumUpdateRequest,
     AdminStadiumsListResponse,
 )
+from app.services.reference_data import bump_reference_version
 
 router = APIRouter(prefix="/stadiums", tags=["admin-stadiums"])
 
@@ -131,6 +132,7 @@ async def create_stadium(
     stadium = Stadium(**data)
     db.add(stadium)
     await db.commit()
+    await bump_reference_version()
     await db.refresh(stadium)
     return _to_response(stadium)
 
@@ -151,6 +153,7 @@ async def update_stadium(
         setattr(stadium, field, value)
 
     await db.commit()
+    await bump_reference_version()
     await db.refresh(stadium)
     return _to_response(stadium)
 
@@ -172,4 +175,5 @@ async def delete_stadium(stadium_id: int, db: AsyncSession = Depends(get_db)):
 
     await db.delete(stadium)
     await db.commit()
+    await bump_reference_version()
     return {"ok": True}
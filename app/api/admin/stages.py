@@ -5,6 +5,7 @@ from sqlalchemy import select, func
 from app.api.deps import get_db
 from app.api.admin.deps import require_roles
 from app.models import Season, Stage
+from app.services.season_snapshots import enqueue_season_snapshot_build
 from app.services.season_visibility import ensure_visible_season_or_404, is_season_visible_clause
 from app.schemas.admin.stages import (
     AdminStageCreateRequest,
@@ -52,6 +53,7 @@ async def create_stage(
     obj = Stage(**body.model_dump())
     db.add(obj)
     await db.commit()
+    await enqueue_season_snapshot_build(obj.season_id)
     await db.refresh(obj)
     return AdminStageResponse.model_validate(obj)
 
@@ -74,10 +76,13 @@ async def update_stage(
     if not obj:
         raise HTTPException(status_code=404, detail="Stage not found")
 
+    previous_season_id = obj.season_id
     for key, value in body.model_dump(exclude_unset=True).items():
         setattr(obj, key, value)
 
     await db.commit()
+    for season_id in {previous_season_id, obj.season_id}:
+        await enqueue_season_snapshot_build(season_id)
     await db.refresh(obj)
     return AdminStageResponse.model_validate(obj)
 
@@ -98,3 +103,4 @@ async def delete_stage(id: int, db: AsyncSession = Depends(get_db)):
 
     await db.delete(obj)
     await db.commit()
+    await enqueue_season_snapshot_build(obj.season_id)
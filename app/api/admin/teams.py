@@ -14,6 +14,8 @@ from app.schemas.admin.teams import (
     AdminTeamsListResponse,
     AdminTeamUpdateRequest,
 )
+from app.services.reference_data import bump_reference_version
+from app.services.season_snapshots import enqueue_team_season_snapshot_builds
 from app.utils.localization import get_localized_name
 
 router = APIRouter(prefix="/teams", tags=["admin-teams"])
@@ -114,6 +116,8 @@ async def update_team(
         setattr(team, key, value)
 
     await db.commit()
+    await bump_reference_version()
+    await enqueue_team_season_snapshot_builds(db, team_id)
     await db.refresh(team)
 
     # Reload with stadium + club
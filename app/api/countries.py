@@ -14,6 +14,7 @@ from app.schemas.country import (
     CountryListResponse,
 )
 from app.services.file_storage import FileStorageService
+from app.services.reference_data import bump_reference_version
 from app.utils.localization import get_localized_name
 
 router = APIRouter(prefix="/countries", tags=["countries"])
@@ -93,6 +94,7 @@ async def create_country(
     )
     db.add(db_country)
     await db.commit()
+    await bump_reference_version()
     await db.refresh(db_country)
 
     return CountryResponse.model_validate(db_country)
@@ -119,6 +121,7 @@ async def update_country(
         setattr(db_country, field, value)
 
     await db.commit()
+    await bump_reference_version()
     await db.refresh(db_country)
 
     return CountryResponse.model_validate(db_country)
@@ -147,6 +150,7 @@ async def upload_country_flag(
 
     country.flag_url = upload_result["object_name"]
     await db.commit()
+    await bump_reference_version()
     await db.refresh(country)
 
     return CountryResponse.model_validate(country)
@@ -195,5 +199,6 @@ async def delete_country(
 
     country.is_active = False
     await db.commit()
+    await bump_reference_version()
 
     return {"message": "Country deactivated"}
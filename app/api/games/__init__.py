@@ -3,8 +3,10 @@ from fastapi import APIRouter
 from app.api.games.router import router as _router_base
 from app.api.games.stats import router as _router_stats
 from app.api.games.lineup import router as _router_lineup
+from app.api.games.match_center import router as _router_match_center
 
 router = APIRouter()
 router.include_router(_router_base)
 router.include_router(_router_stats)
 router.include_router(_router_lineup)
+router.include_router(_router_match_center)
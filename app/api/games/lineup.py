@@ -1,7 +1,5 @@
 """Game lineup endpoint."""
 
-import asyncio
-
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -10,10 +8,11 @@ from sqlalchemy.orm import joinedload, selectinload
 
 from app.api.deps import get_db
 from app.utils.cache import cache_get, cache_set
+from app.services.game_api_cache import game_lineup_cache_key
+from app.services.reference_data import get_reference_snapshot
 from app.models import (
     Game, GameStatus, Player, PlayerTeam, GameLineup, GameReferee, Season,
 )
-from app.models.referee import Referee
 from app.schemas.game_lineup import (
     GameLineupResponse, LineupCoach, LineupCoaches, LineupCountryBrief,
     LineupPlayer, LineupReferee, LineupRendering, LineupTeam, LineupTeams,
@@ -54,7 +53,7 @@ async def get_game_lineup(
     Get pre-game lineup data for a game.
     Includes referees, coaches for both teams, and player lineups.
     """
-    cache_key = f"game_lineup:{game_id}:{lang}"
+    cache_key = game_lineup_cache_key(game_id, lang)
     cached = cache_get(cache_key)
     if cached is not None:
         return Response(content=cached, media_type="application/json")
@@ -74,6 +73,16 @@ async def get_game_lineup(
 
     if not game:
         raise HTTPException(status_code=404, detail="Game not found")
+    return await render_game_lineup(db, game, lang)
+
+
+async def render_game_lineup(db: AsyncSession, game: Game, lang: str):
+    """Build (and cache) the lineup for a loaded ``game``.
+
+    ``game`` needs home_team, away_team and season.championship loaded.
+    """
+    game_id = game.id
+    cache_key = game_lineup_cache_key(game_id, lang)
 
     empty_lineup = LineupTeam(team_id=None, team_name=None)
     empty_rendering = LineupRendering(mode="hidden")
@@ -98,13 +107,14 @@ async def get_game_lineup(
             ),
         )
 
-    # Get referees for this game (with country eager-loaded)
+    # Countries are joined from the in-process reference snapshot.
+    refs = await get_reference_snapshot(db)
+
+    # Get referees for this game
     referees_result = await db.execute(
         select(GameReferee)
         .where(GameReferee.game_id == game_id)
-        .options(
-            selectinload(GameReferee.referee).selectinload(Referee.country),
-        )
+        .options(selectinload(GameReferee.referee))
     )
     game_referees = referees_result.scalars().all()
 
@@ -129,7 +139,7 @@ async def get_game_lineup(
                 last_name=last_name,
                 role=gr.role.value,
                 photo_url=ref.photo_url,
-                country=_build_country(ref.country),
+                country=_build_country(refs.countries.get(ref.country_id)),
             ))
 
     # Get coaches for home and away teams (from PlayerTeam contracts with role != 1)
@@ -143,9 +153,7 @@ async def get_game_lineup(
                 PlayerTeam.is_hidden == False,  # noqa: E712
                 PlayerTeam.is_active == True,  # noqa: E712
             )
-            .options(
-                selectinload(PlayerTeam.player).selectinload(Player.country),
-            )
+            .options(selectinload(PlayerTeam.player))
         )
         contracts = contracts_result.scalars().all()
         # Sort by role integer; head coach first within same role group
@@ -170,13 +178,15 @@ async def get_game_lineup(
                 last_name=last_name,
                 role=role_text,
                 photo_url=photo,
-                country=_build_country(player.country),
+                country=_build_country(refs.countries.get(player.country_id)),
             ))
         return coaches_list
 
-    home_coaches_coro = get_team_coaches(game.home_team_id) if game.home_team_id else asyncio.sleep(0, result=[])
-    away_coaches_coro = get_team_coaches(game.away_team_id) if game.away_team_id else asyncio.sleep(0, result=[])
-    home_coaches, away_coaches = await asyncio.gather(home_coaches_coro, away_coaches_coro)
+    # Sequential on purpose: both helpers share ``db``, and an AsyncSession
+    # must not run two statements at once. Cross-section parallelism lives
+    # in /match-center, where each section gets its own session.
+    home_coaches = await get_team_coaches(game.home_team_id) if game.home_team_id else []
+    away_coaches = await get_team_coaches(game.away_team_id) if game.away_team_id else []
 
     # Get lineups for home and away teams
     async def get_team_lineup(
@@ -188,10 +198,7 @@ async def get_game_lineup(
         lineup_result = await db.execute(
             select(GameLineup)
             .where(GameLineup.game_id == game_id, GameLineup.team_id == team_id)
-            .options(
-                selectinload(GameLineup.player).selectinload(Player.country),
-                selectinload(GameLineup.player).selectinload(Player.player_teams),
-            )
+            .options(selectinload(GameLineup.player).selectinload(Player.player_teams))
             .order_by(GameLineup.lineup_type)
         )
         lineup_entries = lineup_result.scalars().all()
@@ -215,7 +222,7 @@ async def get_game_lineup(
                 player_id=entry.player_id,
                 first_name=get_localized_field(player, "first_name", lang) if player else None,
                 last_name=get_localized_field(player, "last_name", lang) if player else None,
-                country=_build_country(player.country) if player else None,
+                country=_build_country(refs.countries.get(player.country_id)) if player else None,
                 shirt_number=(
                     next(
                         (pt.number for pt in player.player_teams
@@ -264,29 +271,26 @@ async def get_game_lineup(
             substitutes=substitutes,
         ), field_ok
 
-    # Use formations from game (synced from SOTA) — fetch both in parallel
-    home_lineup_coro = (
-        get_team_lineup(
+    # Use formations from game (synced from SOTA)
+    home_lineup, home_field_ok = (
+        await get_team_lineup(
             game.home_team_id,
             game.home_team.name if game.home_team else None,
             game.home_formation,
             game.home_kit_color,
         )
         if game.home_team_id
-        else asyncio.sleep(0, result=(empty_lineup, False))
+        else (empty_lineup, False)
     )
-    away_lineup_coro = (
-        get_team_lineup(
+    away_lineup, away_field_ok = (
+        await get_team_lineup(
             game.away_team_id,
             game.away_team.name if game.away_team else None,
             game.away_formation,
             game.away_kit_color,
         )
         if game.away_team_id
-        else asyncio.sleep(0, result=(empty_lineup, False))
-    )
-    (home_lineup, home_field_ok), (away_lineup, away_field_ok) = await asyncio.gather(
-        home_lineup_coro, away_lineup_coro,
+        else (empty_lineup, False)
     )
 
     # Convert to dicts for lineup utility checks
@@ -0,0 +1,170 @@
+"""Composite match-center endpoint.
+
+One request for everything the match page renders: the game detail plus
+lineup, events, stats, the league-table widget and head-to-head. The game
+(with teams, season and the detail relations) is loaded once; the detail,
+lineup and stats renders of the standalone endpoints build from that row,
+each on its own short session, so sections run concurrently on separate
+pooled connections and keep sharing cache entries (keys, TTLs and
+invalidation) with the standalone endpoints.
+"""
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import Response
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import database
+from app.api.games.lineup import render_game_lineup
+from app.api.games.router import load_game, render_game_detail
+from app.api.games.stats import render_game_stats
+from app.api.live import get_game_events
+from app.api.seasons.table import get_season_table
+from app.api.teams.head_to_head import get_head_to_head
+from app.config import get_settings
+from app.services.game_api_cache import (
+    game_detail_cache_key,
+    game_h2h_cache_key,
+    game_lineup_cache_key,
+    game_stats_cache_key,
+)
+from app.utils.cache import cache_get, cache_get_or_compute
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/games", tags=["games"])
+
+# Head-to-head only moves when one of the two teams finishes a game.
+H2H_CACHE_TTL = 300
+
+
+def _json_bytes(result) -> bytes:
+    if isinstance(result, Response):
+        return result.body
+    if isinstance(result, BaseModel):
+        return result.model_dump_json().encode()
+    return json.dumps(result, ensure_ascii=False, default=str).encode()
+
+
+async def _in_session(budget: asyncio.Semaphore, build: Callable[[AsyncSession], Awaitable]) -> bytes:
+    """Run one section on its own session, holding a slot of the request's connection budget."""
+    async with budget:
+        async with database.get_web_session_factory()() as db:
+            try:
+                result = await build(db)
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+    return _json_bytes(result)
+
+
+async def _table_section(budget: asyncio.Semaphore, season_id: int, team_id: int | None, lang: str) -> bytes:
+    # The table handler manages its own short sessions (and singleflight),
+    # so it only needs a budget slot, not a session from us.
+    async with budget:
+        result = await get_season_table(
+            season_id, group=None, final=False, tour_from=None, tour_to=None,
+            home_away=None, include_live=True, team_id=team_id, lang=lang,
+        )
+    return _json_bytes(result)
+
+
+async def _h2h_section(
+    budget: asyncio.Semaphore, game_id: int, home_id: int, away_id: int, season_id: int | None, lang: str,
+) -> bytes:
+    async def _compute() -> bytes:
+        return await _in_session(
+            budget,
+            lambda db: get_head_to_head(home_id, away_id, season_id=season_id, lang=lang, db=db),
+        )
+
+    return await cache_get_or_compute(game_h2h_cache_key(game_id, lang), ttl=H2H_CACHE_TTL, compute=_compute)
+
+
+@router.get("/{game_id}/match-center")
+async def get_match_center(
+    game_id: int,
+    lang: str = Query(default="kz", pattern="^(kz|ru|en)$"),
+):
+    """
+    Game detail, lineup, events, stats, table widget and H2H in one response.
+
+    Sections run concurrently, at most ``match_center_max_connections`` of
+    them holding a DB connection at a time. A section that fails comes back
+    as ``null``; a missing game is a 404.
+    """
+    budget = asyncio.Semaphore(max(1, settings.match_center_max_connections))
+    tasks = {
+        "events": asyncio.create_task(_in_session(budget, lambda db: get_game_events(game_id, lang=lang, db=db))),
+    }
+    cached = {
+        "game": cache_get(game_detail_cache_key(game_id, lang)),
+        "lineup": cache_get(game_lineup_cache_key(game_id, lang)),
+        "stats": cache_get(game_stats_cache_key(game_id)),
+    }
+
+    # Loaded once, only when a section has to be rendered; the renders read
+    # it on their own sessions (every relation they need is loaded here).
+    game = None
+    if any(body is None for body in cached.values()):
+        try:
+            async with budget:
+                async with database.get_web_session_factory()() as db:
+                    game = await load_game(db, game_id)
+            if game is None:
+                raise HTTPException(status_code=404, detail="Game not found")
+        except BaseException:
+            tasks["events"].cancel()
+            await asyncio.gather(tasks["events"], return_exceptions=True)
+            raise
+
+    renders = {
+        "game": lambda db: render_game_detail(db, game, lang),
+        "lineup": lambda db: render_game_lineup(db, game, lang),
+        "stats": lambda db: render_game_stats(db, game),
+    }
+    sections: dict[str, bytes] = {}
+    for name, body in cached.items():
+        if body is not None:
+            sections[name] = body
+        else:
+            tasks[name] = asyncio.create_task(_in_session(budget, renders[name]))
+
+    # The table and H2H depend on the teams: read them off the loaded game,
+    # or off the cached detail when nothing had to be loaded.
+    if game is not None:
+        home_id, away_id, season_id = game.home_team_id, game.away_team_id, game.season_id
+    else:
+        detail = json.loads(cached["game"])
+        home_id = (detail.get("home_team") or {}).get("id")
+        away_id = (detail.get("away_team") or {}).get("id")
+        season_id = detail.get("season_id")
+    if season_id is not None:
+        tasks["table"] = asyncio.create_task(_table_section(budget, season_id, home_id, lang))
+    if home_id is not None and away_id is not None:
+        tasks["h2h"] = asyncio.create_task(_h2h_section(budget, game_id, home_id, away_id, season_id, lang))
+
+    names = list(tasks)
+    results = await asyncio.gather(*(tasks[name] for name in names), return_exceptions=True)
+
+    for name, result in zip(names, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, HTTPException):
+                logger.warning(
+                    "match-center section %s failed for game %s", name, game_id, exc_info=result,
+                )
+            continue
+        sections[name] = result
+
+    body = b",".join(
+        b'"%s":%s' % (name.encode(), sections.get(name, b"null"))
+        for name in ("game", "lineup", "events", "stats", "table", "h2h")
+    )
+    return Response(content=b"{" + body + b"}", media_type="application/json")
@@ -24,21 +24,27 @@ from app.schemas.team import TeamInGame
 from app.utils.localization import get_localized_field
 from app.utils.team_logo_fallback import resolve_team_logo_url
 from app.utils.game_status import compute_game_status
+from app.utils import keyset
+from app.utils.fast_json import json_response
 from app.utils.game_grouping import group_games_by_date
 from app.utils.decided_in import compute_decided_in_lite
+from app.services.game_api_cache import game_detail_cache_key
+from app.services.list_counts import cached_count
+from app.services.reference_data import StadiumRef, TeamRef, get_reference_snapshot
 from app.services.weather import format_weather
 from app.config import get_settings
 from app.services.season_visibility import ensure_visible_season_or_404, get_current_season_id
 from app.services.season_filters import get_group_team_ids, get_final_stage_ids
-from app.utils.has_stats import enrich_games_has_stats, compute_single_has_stats
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/games", tags=["games"])
 
+GAME_LIST_SORT = (keyset.SortKey(Game.date), keyset.SortKey(Game.time), keyset.SortKey(Game.id))
 
-def _build_team_in_match_center(team: Team | None, lang: str) -> TeamInMatchCenter | None:
+
+def _build_team_in_match_center(team: Team | TeamRef | None, lang: str) -> TeamInMatchCenter | None:
     if not team:
         return None
     return TeamInMatchCenter(
@@ -53,7 +59,7 @@ def _build_team_in_match_center(team: Team | None, lang: str) -> TeamInMatchCent
     )
 
 
-def _build_stadium_info(stadium: Stadium | None, lang: str) -> StadiumInfo | None:
+def _build_stadium_info(stadium: Stadium | StadiumRef | None, lang: str) -> StadiumInfo | None:
     if not stadium:
         return None
     return StadiumInfo(
@@ -90,6 +96,7 @@ async def get_games(
     lang: str = Query(default="kz", pattern="^(kz|ru|en)$"),
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page; replaces offset"),
     db: AsyncSession = Depends(get_db),
 ):
     """
@@ -111,6 +118,8 @@ async def get_games(
     - hide_past: Hide matches before today
     - group_by_date: Group results by date with formatted labels
     - lang: Language for localized fields (kz, ru, en)
+    - limit/offset or cursor: page size and position; `cursor` is the
+      `next_cursor` of the previous page (keyset paging, no deep OFFSET)
 
     `group` and `final=true` cannot be used together.
     """
@@ -214,35 +223,39 @@ async def get_games(
         elif status == "live":
             query = query.where(Game.status == GameStatus.live)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    total = await cached_count(
+        db, "games", query,
+        season_id=season_id, group=group, final=final, team_id=team_id, team_ids=team_ids,
+        tour=tour, tours=tours, month=month, year=year, date_from=date_from, date_to=date_to,
+        status=status, hide_past=hide_past, include_cancelled=include_cancelled, today=today,
+    )
 
     # Get paginated results with eager loading
-    query = (
-        query.options(
-            selectinload(Game.home_team),
-            selectinload(Game.away_team),
-            selectinload(Game.season),
-            selectinload(Game.stadium_rel),
-            selectinload(Game.stage),
-            selectinload(Game.broadcasters).selectinload(GameBroadcaster.broadcaster),
-        )
-        .order_by(Game.date.asc(), Game.time.asc())
-        .offset(offset)
-        .limit(limit)
-    )
+    query = query.options(
+        selectinload(Game.season),
+        selectinload(Game.stage),
+        selectinload(Game.broadcasters).selectinload(GameBroadcaster.broadcaster),
+    ).order_by(*keyset.order_by(GAME_LIST_SORT))
+    if cursor:
+        query = query.where(keyset.after(GAME_LIST_SORT, keyset.decode_cursor(cursor, "games", GAME_LIST_SORT)))
+    else:
+        query = query.offset(offset)
 
-    result = await db.execute(query)
-    games = list(result.scalars().all())
+    result = await db.execute(query.limit(limit + 1))
+    games, next_cursor = keyset.split_page(
+        result.scalars().all(), limit, "games", lambda g: (g.date, g.time, g.id),
+    )
 
-    # Derive has_stats from actual stats records
-    await enrich_games_has_stats(db, games)
+    # Teams and stadiums come from the in-process reference snapshot.
+    refs = await get_reference_snapshot(
+        db,
+        teams=[tid for g in games for tid in (g.home_team_id, g.away_team_id)],
+        stadiums=[g.stadium_id for g in games],
+    )
 
     # Return grouped format if requested
     if group_by_date:
-        grouped = group_games_by_date(games, lang)
+        grouped = group_games_by_date(games, lang, refs=refs)
 
         # Full date ranges for tentative tours (ignores filters like team_ids)
         tent_query = (
@@ -265,11 +278,12 @@ async def get_games(
             if row.date_from != row.date_to
         }
 
-        return MatchCenterResponse(
+        return json_response(MatchCenterResponse(
             groups=grouped,
             total=total,
             tentative_tour_dates=tentative_tour_dates,
-        )
+            next_cursor=next_cursor,
+        ))
 
     # Standard list format
     items = []
@@ -307,9 +321,9 @@ async def get_games(
             youtube_live_url=g.youtube_live_url,
             protocol_url=g.protocol_url,
             where_broadcast=g.where_broadcast,
-            home_team=_build_team_in_match_center(g.home_team, lang),
-            away_team=_build_team_in_match_center(g.away_team, lang),
-            stadium_info=_build_stadium_info(g.stadium_rel, lang),
+            home_team=_build_team_in_match_center(refs.teams.get(g.home_team_id), lang),
+            away_team=_build_team_in_match_center(refs.teams.get(g.away_team_id), lang),
+            stadium_info=_build_stadium_info(refs.stadiums.get(g.stadium_id), lang),
             season_name=get_localized_field(g.season, "name", lang) if g.season else None,
             broadcasters=[
                 BroadcasterInfo(
@@ -324,7 +338,7 @@ async def get_games(
             ],
         ))
 
-    return {"items": items, "total": total}
+    return json_response({"items": items, "total": total, "next_cursor": next_cursor})
 
 @router.get("/home-widget")
 async def home_widget(
@@ -333,35 +347,11 @@ async def home_widget(
     group: str | None = Query(default=None, pattern="^(A|B|final)$"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Home matches widget for tour-based leagues."""
-    from app.utils.cache import cache_get, cache_set
-    from app.services.home_matches import get_home_widget
-
-    cache_key = f"home_widget:{frontend_code}:{group or ''}:{lang}"
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return Response(content=cached, media_type="application/json")
+    """Home matches widget for tour-based leagues (precomputed snapshot)."""
+    from app.services.home_widget_snapshots import read_home_widget
 
-    result = await get_home_widget(db, frontend_code, lang, group=group)
-    json_bytes = result.model_dump_json().encode()
-
-    # TTL varies by window_state
-    if result.window_state == "completed_window" and result.completed_window_expires_at:
-        from datetime import datetime as _dt, timezone as _tz
-        remaining = (result.completed_window_expires_at - _dt.now(_tz.utc)).total_seconds()
-        if remaining <= 0:
-            return Response(content=json_bytes, media_type="application/json")
-        ttl = max(1, min(60, int(remaining)))
-    elif result.window_state == "active_round":
-        has_live = any(
-            g.status == "live" for group in result.groups for g in group.games
-        )
-        ttl = 10 if has_live else 15
-    else:
-        ttl = 60
-
-    cache_set(cache_key, json_bytes, ttl)
-    return Response(content=json_bytes, media_type="application/json")
+    body = await read_home_widget(db, frontend_code, lang, group=group)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{game_id}")
@@ -371,32 +361,42 @@ async def get_game(
     db: AsyncSession = Depends(get_db),
 ):
     """Get game by ID."""
-    from app.utils.cache import cache_get, cache_set
+    from app.utils.cache import cache_get
 
-    cache_key = f"game:{game_id}:{lang}"
-    cached = cache_get(cache_key)
+    cached = cache_get(game_detail_cache_key(game_id, lang))
     if cached is not None:
         return Response(content=cached, media_type="application/json")
 
+    game = await load_game(db, game_id)
+    if not game:
+        raise HTTPException(status_code=404, detail="Game not found")
+    return await render_game_detail(db, game, lang)
+
+
+async def load_game(db: AsyncSession, game_id: int) -> Game | None:
+    """The game with every relation the detail, lineup and stats renders read."""
     result = await db.execute(
         select(Game)
         .where(Game.id == game_id)
         .options(
             joinedload(Game.home_team),
             joinedload(Game.away_team),
-            joinedload(Game.season),
+            joinedload(Game.season).joinedload(Season.championship),
             joinedload(Game.stadium_rel),
             joinedload(Game.stage),
             selectinload(Game.referees).selectinload(GameReferee.referee),
             selectinload(Game.broadcasters).selectinload(GameBroadcaster.broadcaster),
         )
     )
-    game = result.unique().scalar_one_or_none()
+    return result.unique().scalar_one_or_none()
 
-    if not game:
-        raise HTTPException(status_code=404, detail="Game not found")
 
-    game.has_stats = await compute_single_has_stats(db, game_id)
+async def render_game_detail(db: AsyncSession, game: Game, lang: str) -> Response:
+    """Build, cache and return the game detail for an already loaded ``game``."""
+    from app.utils.cache import cache_set
+
+    game_id = game.id
+    cache_key = game_detail_cache_key(game_id, lang)
 
     # decided_in: cheap check for penalties, single EXISTS query for extra time.
     decided_in = compute_decided_in_lite(game)
@@ -8,15 +8,16 @@ from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_db
 from app.models import (
-    Game, GameStatus, GameTeamStats, GamePlayerStats, GameEvent, GameEventType, Player,
+    Game, GameStatus, GameTeamStats, GamePlayerStats, GameEvent, GameEventType,
 )
 from app.schemas.game_stats import (
     GameStatsResponse, GameStatsTeamEntry, GameStatsPlayerEntry,
     GameStatsEventEntry, StatsCountryBrief,
 )
+from app.services.game_api_cache import game_stats_cache_key
+from app.services.reference_data import get_reference_snapshot
 from app.utils.cache import cache_get, cache_set
 from app.utils.numbers import to_finite_float
-from app.utils.team_logo_fallback import resolve_team_logo_url
 from app.utils.game_grouping import get_player_names_fallback
 
 router = APIRouter(prefix="/games", tags=["games"])
@@ -25,19 +26,26 @@ router = APIRouter(prefix="/games", tags=["games"])
 @router.get("/{game_id}/stats", response_model=GameStatsResponse)
 async def get_game_stats(game_id: int, db: AsyncSession = Depends(get_db)):
     """Get statistics for a game."""
-    cache_key = f"game_stats:{game_id}"
+    cache_key = game_stats_cache_key(game_id)
     cached = cache_get(cache_key)
     if cached is not None:
         return Response(content=cached, media_type="application/json")
 
-    # Early return for technical wins — no real stats exist
-    tech_result = await db.execute(
-        select(Game.status, Game.is_live).where(Game.id == game_id)
-    )
-    row = tech_result.one_or_none()
+    row = (
+        await db.execute(select(Game.id, Game.status, Game.is_live).where(Game.id == game_id))
+    ).one_or_none()
     if row is None:
         raise HTTPException(status_code=404, detail="Game not found")
-    game_status, is_live = row
+    return await render_game_stats(db, row)
+
+
+async def render_game_stats(db: AsyncSession, game):
+    """Build (and cache) the stats for a loaded game (or its id/status/is_live row)."""
+    game_id = game.id
+    cache_key = game_stats_cache_key(game_id)
+    game_status, is_live = game.status, game.is_live
+
+    # Early return for technical wins — no real stats exist
     if game_status == GameStatus.technical_defeat:
         return GameStatsResponse(game_id=game_id, is_technical=True)
 
@@ -45,19 +53,34 @@ async def get_game_stats(game_id: int, db: AsyncSession = Depends(get_db)):
     team_stats_result = await db.execute(
         select(GameTeamStats)
         .where(GameTeamStats.game_id == game_id)
-        .options(selectinload(GameTeamStats.team))
     )
     team_stats = team_stats_result.scalars().all()
 
+    # Get player stats (teams and countries are joined from the reference snapshot)
+    player_stats_result = await db.execute(
+        select(GamePlayerStats)
+        .where(GamePlayerStats.game_id == game_id)
+        .options(selectinload(GamePlayerStats.player))
+        .order_by(GamePlayerStats.team_id, GamePlayerStats.started.desc())
+    )
+    player_stats = player_stats_result.scalars().all()
+
+    refs = await get_reference_snapshot(
+        db,
+        teams=[ts.team_id for ts in team_stats] + [ps.team_id for ps in player_stats],
+        countries=[ps.player.country_id for ps in player_stats if ps.player],
+    )
+
     team_stats_response = []
     for ts in team_stats:
+        team = refs.teams.get(ts.team_id)
         team_stats_response.append(GameStatsTeamEntry(
             team_id=ts.team_id,
-            team_name=ts.team.name if ts.team else None,
-            logo_url=resolve_team_logo_url(ts.team),
-            primary_color=ts.team.primary_color if ts.team else None,
-            secondary_color=ts.team.secondary_color if ts.team else None,
-            accent_color=ts.team.accent_color if ts.team else None,
+            team_name=team.name if team else None,
+            logo_url=team.logo_url if team else None,
+            primary_color=team.primary_color if team else None,
+            secondary_color=team.secondary_color if team else None,
+            accent_color=team.accent_color if team else None,
             possession=to_finite_float(ts.possession),
             possession_percent=ts.possession_percent,
             shots=ts.shots,
@@ -116,18 +139,6 @@ async def get_game_stats(game_id: int, db: AsyncSession = Depends(get_db)):
     )
     player_assists = {row.assist_player_id: row.count for row in assists_result}
 
-    # Get player stats
-    player_stats_result = await db.execute(
-        select(GamePlayerStats)
-        .where(GamePlayerStats.game_id == game_id)
-        .options(
-            selectinload(GamePlayerStats.player).selectinload(Player.country),
-            selectinload(GamePlayerStats.team),
-        )
-        .order_by(GamePlayerStats.team_id, GamePlayerStats.started.desc())
-    )
-    player_stats = player_stats_result.scalars().all()
-
     # Get fallback names from GameEvent
     player_ids = [ps.player_id for ps in player_stats]
     fallback_names = await get_player_names_fallback(db, game_id, player_ids)
@@ -146,13 +157,15 @@ async def get_game_stats(game_id: int, db: AsyncSession = Depends(get_db)):
 
         # Build country data
         country_data = None
-        if ps.player and ps.player.country:
+        country = refs.countries.get(ps.player.country_id) if ps.player else None
+        if country:
             country_data = StatsCountryBrief(
-                id=ps.player.country.id,
-                code=ps.player.country.code,
-                name=ps.player.country.name,
-                flag_url=ps.player.country.flag_url,
+                id=country.id,
+                code=country.code,
+                name=country.name,
+                flag_url=country.flag_url,
             )
+        team = refs.teams.get(ps.team_id)
 
         player_stats_response.append(GameStatsPlayerEntry(
             player_id=ps.player_id,
@@ -160,10 +173,10 @@ async def get_game_stats(game_id: int, db: AsyncSession = Depends(get_db)):
             last_name=last_name,
             country=country_data,
             team_id=ps.team_id,
-            team_name=ps.team.name if ps.team else None,
-            team_primary_color=ps.team.primary_color if ps.team else None,
-            team_secondary_color=ps.team.secondary_color if ps.team else None,
-            team_accent_color=ps.team.accent_color if ps.team else None,
+            team_name=team.name if team else None,
+            team_primary_color=team.primary_color if team else None,
+            team_secondary_color=team.secondary_color if team else None,
+            team_accent_color=team.accent_color if team else None,
             position=ps.position,
             minutes_played=ps.minutes_played,
             started=ps.started,
@@ -9,8 +9,14 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_db
+from app.services.game_api_cache import game_events_cache_key
 from app.models.game_event import GameEvent, GameEventType
 from app.utils.localization import get_localized_full_name, get_localized_name
+from app.utils.video_transcode import (
+    HLS_FALLBACK_MP4,
+    hls_sibling,
+    is_hls_manifest,
+)
 
 router = APIRouter(prefix="/live", tags=["live"])
 logger = logging.getLogger(__name__)
@@ -35,6 +41,10 @@ class GameEventResponse(BaseModel):
     assist_player_id: int | None = None
     assist_player_name: str | None = None
     video_url: str | None = None
+    # Only set for HLS clips (video_url is then the master playlist); the
+    # poster only when the package has one.
+    video_poster_url: str | None = None
+    video_mp4_url: str | None = None
     created_at: datetime
 
     model_config = {"from_attributes": True}
@@ -81,10 +91,17 @@ def _localized_event(event: GameEvent, lang: str) -> GameEventResponse:
             "assist_player_name": resolve_player(
                 event.assist_player, event.assist_player_name
             ),
+            **_video_variant_urls(event.video_url),
         }
     )
 
 
+def _video_variant_urls(video_url: str | None) -> dict[str, str | None]:
+    if not is_hls_manifest(video_url):
+        return {}
+    return {"video_mp4_url": hls_sibling(video_url, HLS_FALLBACK_MP4)}
+
+
 @router.get("/events/{game_id}", response_model=GameEventsListResponse)
 async def get_game_events(
     game_id: int, lang: str = "ru", db: AsyncSession = Depends(get_db)
@@ -92,7 +109,7 @@ async def get_game_events(
     """Get all events for a match, with player names in the requested language."""
     from app.utils.cache import cache_get, cache_set
 
-    cache_key = f"events:{game_id}:{lang}"
+    cache_key = game_events_cache_key(game_id, lang)
     cached = cache_get(cache_key)
     if cached is not None:
         return Response(content=cached, media_type="application/json")
@@ -13,6 +13,8 @@ from app.schemas.news import (
 )
 from app.schemas.common import OkResponse
 from app.services.file_storage import FileStorageService
+from app.services.list_counts import cached_count, count_rows
+from app.utils import keyset
 from app.utils.file_urls import get_file_data_with_url
 from app.utils.error_messages import get_error_message
 from app.utils.html_cleaner import sanitize_news_html
@@ -79,14 +81,27 @@ async def _resolve_news_by_id_and_lang(
     return result.scalar_one_or_none()
 
 
-def _news_order_by(sort: str):
-    if sort == "date_asc":
-        return [asc(News.publish_date), asc(News.id)]
-    if sort == "views_desc":
-        return [desc(News.views_count), desc(News.publish_date), desc(News.id)]
-    if sort == "likes_desc":
-        return [desc(News.likes_count), desc(News.publish_date), desc(News.id)]
-    return [desc(News.publish_date), desc(News.id)]
+NEWS_SORT_KEYS: dict[str, tuple[keyset.SortKey, ...]] = {
+    "date_desc": (
+        keyset.SortKey(News.publish_date, descending=True),
+        keyset.SortKey(News.id, descending=True),
+    ),
+    "date_asc": (keyset.SortKey(News.publish_date), keyset.SortKey(News.id)),
+    "views_desc": (
+        keyset.SortKey(News.views_count, descending=True),
+        keyset.SortKey(News.publish_date, descending=True),
+        keyset.SortKey(News.id, descending=True),
+    ),
+    "likes_desc": (
+        keyset.SortKey(News.likes_count, descending=True),
+        keyset.SortKey(News.publish_date, descending=True),
+        keyset.SortKey(News.id, descending=True),
+    ),
+}
+
+
+def _news_sort_values(news: News, sort: str) -> tuple:
+    return tuple(getattr(news, key.column.key) for key in NEWS_SORT_KEYS[sort])
 
 
 @router.get("", response_model=NewsListResponse)
@@ -104,9 +119,10 @@ async def get_news_list(
     date_to: date | None = Query(None, description="Filter to publish date (inclusive)"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page; replaces page"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get paginated news list."""
+    """Get paginated news list, by ``page`` or by ``cursor`` (keyset)."""
     lang_enum = _resolve_language(lang)
     article_type_enum = _article_type_from_query(article_type)
 
@@ -137,24 +153,36 @@ async def get_news_list(
     if date_to:
         query = query.where(News.publish_date <= date_to)
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar()
+    if search and search.strip():
+        # Arbitrary text would fill the shared cache and evict hot entries.
+        total_count = await count_rows(db, query)
+    else:
+        total_count = await cached_count(
+            db, "news", query,
+            lang=lang, championship_code=championship_code, article_type=article_type,
+            date_from=date_from, date_to=date_to,
+        )
 
     # Paginate and order
-    query = query.order_by(*_news_order_by(sort))
-    query = query.offset((page - 1) * per_page).limit(per_page)
+    sort_keys = NEWS_SORT_KEYS[sort]
+    query = query.order_by(*keyset.order_by(sort_keys))
+    if cursor:
+        query = query.where(keyset.after(sort_keys, keyset.decode_cursor(cursor, f"news:{sort}", sort_keys)))
+    else:
+        query = query.offset((page - 1) * per_page)
 
-    result = await db.execute(query)
-    items = result.scalars().all()
+    result = await db.execute(query.limit(per_page + 1))
+    items, next_cursor = keyset.split_page(
+        result.scalars().all(), per_page, f"news:{sort}", lambda n: _news_sort_values(n, sort),
+    )
 
-    total_count = total or 0
     return NewsListResponse(
         items=[NewsListItem.model_validate(item) for item in items],
         total=total_count,
         page=page,
         per_page=per_page,
         pages=(total_count + per_page - 1) // per_page if total_count > 0 else 0,
+        next_cursor=next_cursor,
     )
 
 
@@ -37,10 +37,17 @@ from app.utils.positions import (
     infer_position_code,
 )
 from app.utils.team_logo_fallback import resolve_team_logo_url
-from app.utils.has_stats import enrich_games_has_stats
+from app.utils import keyset
+from app.services.list_counts import cached_count
 
 router = APIRouter(prefix="/players", tags=["players"])
 
+PLAYER_LIST_SORT = (
+    keyset.SortKey(Player.last_name),
+    keyset.SortKey(Player.first_name),
+    keyset.SortKey(Player.id),
+)
+
 
 def _resolve_top_role(
     player: Player,
@@ -80,10 +87,15 @@ async def get_players(
     team_id: int | None = None,
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page; replaces offset"),
     lang: str = Query(default="kz", description="Language: kz, ru, or en"),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get players, optionally filtered by season and team."""
+    """Get players, optionally filtered by season and team.
+
+    Pages either by ``offset`` or, for deep paging, by ``cursor`` (the
+    ``next_cursor`` of the previous page).
+    """
     if season_id is not None:
         await ensure_visible_season_or_404(db, season_id)
 
@@ -97,15 +109,18 @@ async def get_players(
             subquery = subquery.where(PlayerTeam.team_id == team_id)
         query = query.where(Player.id.in_(subquery.distinct()))
 
-    # Count total
-    count_query = select(func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    total = await cached_count(db, "players", query, season_id=season_id, team_id=team_id)
 
     # Get paginated results
-    query = query.order_by(Player.last_name, Player.first_name).offset(offset).limit(limit)
-    result = await db.execute(query)
-    players = result.scalars().all()
+    query = query.order_by(*keyset.order_by(PLAYER_LIST_SORT))
+    if cursor:
+        query = query.where(keyset.after(PLAYER_LIST_SORT, keyset.decode_cursor(cursor, "players", PLAYER_LIST_SORT)))
+    else:
+        query = query.offset(offset)
+    result = await db.execute(query.limit(limit + 1))
+    players, next_cursor = keyset.split_page(
+        result.scalars().all(), limit, "players", lambda p: (p.last_name, p.first_name, p.id),
+    )
 
     # Build localized response
     items = []
@@ -130,7 +145,7 @@ async def get_players(
             "top_role": _resolve_top_role(p, lang),
         })
 
-    return {"items": items, "total": total}
+    return {"items": items, "total": total, "next_cursor": next_cursor}
 
 
 @router.get("/{player_id}", response_model=PlayerDetailResponse)
@@ -370,7 +385,6 @@ async def get_player_games(
         .limit(limit)
     )
     games = list(result.scalars().all())
-    await enrich_games_has_stats(db, games)
 
     items = []
     for g in games:
@@ -1,4 +1,5 @@
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
 
 from app.api.seasons import router as seasons_router
 from app.api.teams import router as teams_router
@@ -18,8 +19,9 @@ from app.api.media_videos import router as media_videos_router
 from app.api.live import router as live_router
 from app.api.youtube_stats import router as youtube_stats_router
 from app.api.admin.router import router as admin_router
+from app.utils.fast_json import FastJSONResponse
 
-api_router = APIRouter()
+api_router = APIRouter(default_response_class=FastJSONResponse)
 
 api_router.include_router(seasons_router)
 api_router.include_router(teams_router)
@@ -57,5 +59,5 @@ api_router.include_router(live_router)
 # Internal: YouTube view stats overview (no menu entry)
 api_router.include_router(youtube_stats_router)
 
-# Admin API
-api_router.include_router(admin_router)
+# Admin API (low traffic; keeps the stock JSON response class)
+api_router.include_router(admin_router, default_response_class=JSONResponse)
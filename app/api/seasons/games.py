@@ -14,7 +14,6 @@ from app.utils.decided_in import compute_decided_in_lite
 from app.utils.game_status import compute_game_status
 from app.utils.localization import get_localized_field, get_localized_name
 from app.utils.team_logo_fallback import resolve_team_logo_url
-from app.utils.has_stats import enrich_games_has_stats
 
 router = APIRouter(prefix="/seasons", tags=["seasons"])
 
@@ -48,7 +47,6 @@ async def get_season_games(
 
     result = await db.execute(query)
     games = list(result.scalars().all())
-    await enrich_games_has_stats(db, games)
 
     items = []
     for g in games:
@@ -126,7 +124,6 @@ async def get_stage_games(
         .order_by(Game.date, Game.time)
     )
     games = list(result.scalars().all())
-    await enrich_games_has_stats(db, games)
 
     items = []
     for g in games:
@@ -8,14 +8,14 @@ from sqlalchemy import func, select
 from sqlalchemy.orm import selectinload
 
 from app.api.deps import get_db
-from app.models import Season, Game, Stage, SeasonParticipant
+from app.models import Season, Stage, SeasonParticipant
 from app.services.season_participants import resolve_season_participants
-from app.services.cup_rounds import build_playoff_bracket_from_rounds, build_schedule_rounds
 from app.services.season_api_cache import (
     SEASONS_LIST_CACHE_KEY,
     invalidate_season_api_cache,
     season_detail_cache_key,
 )
+from app.services.season_snapshots import SEASON_BRACKET, read_season_snapshot
 from app.services.season_visibility import ensure_visible_season_or_404, is_season_visible_clause
 from app.utils.cache import cache_get, cache_set
 from app.utils.localization import get_localized_field
@@ -252,33 +252,8 @@ async def get_season_bracket(
     """Get playoff bracket for a season, derived from games and stages."""
     await _ensure_visible_season(db, season_id)
 
-    stage_result = await db.execute(
-        select(Stage)
-        .where(Stage.season_id == season_id)
-        .order_by(Stage.sort_order, Stage.id)
-    )
-    stages = list(stage_result.scalars().all())
-
-    games_result = await db.execute(
-        select(Game)
-        .where(Game.season_id == season_id)
-        .options(
-            selectinload(Game.home_team),
-            selectinload(Game.away_team),
-            selectinload(Game.stage),
-        )
-        .order_by(Game.date, Game.time)
-    )
-    games = list(games_result.scalars().all())
-
-    rounds = build_schedule_rounds(
-        games=games,
-        stages=stages,
-        lang=lang,
-        include_games=True,
-    )
-    bracket = build_playoff_bracket_from_rounds(season_id, rounds)
-    return bracket or PlayoffBracketResponse(season_id=season_id, rounds=[])
+    body = await read_season_snapshot(db, season_id, SEASON_BRACKET, lang)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{season_id}/teams", response_model=SeasonParticipantListResponse)
@@ -2,7 +2,7 @@
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, desc, nulls_last, case, distinct, extract, text, cast, or_
+from sqlalchemy import select, func, case, distinct, extract, text, cast, or_
 from sqlalchemy.types import Numeric
 from sqlalchemy.orm import selectinload
 
@@ -13,11 +13,14 @@ from app.models import (
     GameEvent, GameEventType, GameTeamStats, GamePlayerStats,
     PlayerTourStats,
 )
+from app.services.list_counts import cached_count
 from app.services.season_filters import get_group_team_ids
 from app.services.season_participants import resolve_season_participants
 from app.services.season_scope import compute_season_stats_scope
 from app.services.season_visibility import ensure_visible_season_or_404, is_season_visible_clause
+from app.utils import keyset
 from app.utils.localization import get_localized_field
+from app.utils.fast_json import json_response
 from app.utils.numbers import to_finite_float
 from app.utils.team_logo_fallback import resolve_team_logo_url
 from app.schemas.season import (
@@ -69,6 +72,7 @@ async def get_player_stats_table(
     nationality: str | None = Query(default=None, pattern="^(kz|foreign)$"),
     limit: int = Query(default=50, le=100),
     offset: int = Query(default=0),
+    cursor: str | None = Query(default=None, description="next_cursor of the previous page; replaces offset"),
     lang: str = Query(default="kz", pattern="^(kz|ru|en)$"),
     db: AsyncSession = Depends(get_db),
 ):
@@ -275,9 +279,11 @@ async def get_player_stats_table(
             exit_success=stats.exit_success,
         )
 
-    count_query = select(func.count()).select_from(base_query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    total = await cached_count(
+        db, "player_stats", base_query,
+        season_id=season_id, sort_by=sort_by, team_id=team_id, group=group,
+        position_code=position_code, nationality=nationality,
+    )
 
     if use_rank_sort:
         # Sort by the displayed metric first, then by SOTA's official rank as the
@@ -291,19 +297,25 @@ async def get_player_stats_table(
         # 6, 7). Making the visible metric primary keeps the column monotonic
         # regardless of sync timing, while goal_rank still decides ties exactly as
         # SOTA ordered them.
-        value_column = getattr(PlayerSeasonStats, sort_by)
-        query = (
-            base_query.order_by(
-                nulls_last(desc(value_column)),
-                nulls_last(sort_column.asc()),
-            )
-            .offset(offset)
-            .limit(limit)
+        sort_keys = (
+            keyset.SortKey(getattr(PlayerSeasonStats, sort_by), descending=True),
+            keyset.SortKey(sort_column),
+            keyset.SortKey(PlayerSeasonStats.id),
+        )
+    else:
+        sort_keys = (keyset.SortKey(sort_column, descending=True), keyset.SortKey(PlayerSeasonStats.id))
+    query = base_query.order_by(*keyset.order_by(sort_keys))
+    if cursor:
+        query = query.where(
+            keyset.after(sort_keys, keyset.decode_cursor(cursor, f"player_stats:{sort_by}", sort_keys))
         )
     else:
-        query = base_query.order_by(nulls_last(desc(sort_column))).offset(offset).limit(limit)
-    result = await db.execute(query)
-    rows = result.all()
+        query = query.offset(offset)
+    result = await db.execute(query.limit(limit + 1))
+    rows, next_cursor = keyset.split_page(
+        result.all(), limit, f"player_stats:{sort_by}",
+        lambda row: tuple(getattr(row[0], key.column.key) for key in sort_keys),
+    )
     items = [
         build_entry(
             stats,
@@ -318,12 +330,13 @@ async def get_player_stats_table(
         for stats, player, team, country, contract_photo, contract_photo_avatar, contract_photo_leaderboard, contract_amplua in rows
     ]
 
-    return PlayerStatsTableResponse(
+    return json_response(PlayerStatsTableResponse(
         season_id=season_id,
         sort_by=sort_by,
         items=items,
         total=total,
-    )
+        next_cursor=next_cursor,
+    ))
 
 
 # Map response field names (sent by frontend) to DB column names.
@@ -1,18 +1,19 @@
 """Season table endpoints: standings table, results grid, league performance."""
 
 from collections import defaultdict
+from typing import TypedDict
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.utils.cache import cache_get_or_compute
 
 from app.api.deps import get_db
 from app import database
-from app.models import Game, GameStatus, ScoreTable, Season, Team
+from app.models import Game, GameStatus, Season
 from app.services.season_filters import get_group_team_ids, get_final_stage_ids, get_group_for_team
 from app.services.standings import (
     _primary_sort_key,
@@ -23,15 +24,17 @@ from app.services.standings import (
     get_next_games_for_teams,
 )
 from app.services.table_zones import resolve_table_zone
+from app.services.reference_data import get_reference_snapshot
+from app.services.season_snapshots import RESULTS_GRID, grid_variant, read_season_snapshot
 from app.services.season_visibility import ensure_visible_season_or_404
 from app.utils.localization import get_localized_field
+from app.utils.fast_json import json_response
 from app.utils.team_logo_fallback import resolve_team_logo_url
 from app.schemas.stats import (
     ScoreTableResponse,
     ScoreTableEntryResponse,
     ScoreTableFilters,
     ResultsGridResponse,
-    TeamResultsGridEntry,
     LiveMatchInline,
 )
 router = APIRouter(prefix="/seasons", tags=["seasons"])
@@ -359,157 +362,29 @@ async def get_results_grid(
     Get results grid - W/D/L for each team in each tour.
 
     Returns a matrix where each team has an array of results for each matchweek.
+    Served from the prebuilt season snapshot (see app.services.season_snapshots).
     """
     await _ensure_visible_season(db, season_id)
 
     if group and final:
         raise HTTPException(status_code=400, detail="group and final filters are mutually exclusive")
 
-    # Resolve group team_ids if group filter is specified
-    group_team_ids: list[int] | None = None
-    if group:
-        group_team_ids = await get_group_team_ids(db, season_id, group)
-        if not group_team_ids:
-            return ResultsGridResponse(season_id=season_id, total_tours=0, teams=[])
-
-    final_stage_ids_list: list[int] | None = None
-    if final:
-        final_stage_ids_list = await get_final_stage_ids(db, season_id)
-        if not final_stage_ids_list:
-            return ResultsGridResponse(season_id=season_id, total_tours=0, teams=[])
-
-    # Get teams from score_table (sorted by position) for stable ordering
-    score_query = (
-        select(ScoreTable)
-        .where(ScoreTable.season_id == season_id)
-        .options(selectinload(ScoreTable.team))
+    body = await read_season_snapshot(
+        db, season_id, RESULTS_GRID, lang, variant=grid_variant(group=group, final=final),
     )
-    if group_team_ids is not None:
-        score_query = score_query.where(ScoreTable.team_id.in_(group_team_ids))
-    score_query = score_query.order_by(ScoreTable.position)
-
-    score_result = await db.execute(score_query)
-    score_entries = score_result.scalars().all()
+    return Response(content=body, media_type="application/json")
 
-    # Get all played games for the selected phase
-    games_query = (
-        select(Game)
-        .where(
-            Game.season_id == season_id,
-            Game.status.in_([GameStatus.finished, GameStatus.technical_defeat]),
-            Game.tour.isnot(None),
-        )
-    )
-    if group_team_ids is not None:
-        games_query = games_query.where(
-            Game.home_team_id.in_(group_team_ids),
-            Game.away_team_id.in_(group_team_ids),
-        )
-    if final_stage_ids_list is not None:
-        games_query = games_query.where(Game.stage_id.in_(final_stage_ids_list))
-    games_query = games_query.order_by(Game.tour)
 
-    games_result = await db.execute(games_query)
-    games = games_result.scalars().all()
+class _PerformanceWeek(TypedDict):
+    week: int
+    start: str
 
-    if not score_entries and not games:
-        return ResultsGridResponse(season_id=season_id, total_tours=0, teams=[])
 
-    # Find max tour from ALL matches (including upcoming) so the tour slider
-    # shows the full season, not just played tours.
-    season = await db.get(Season, season_id)
-    all_tours_max = await db.scalar(
-        select(func.max(Game.tour)).where(
-            Game.season_id == season_id,
-            Game.tour.isnot(None),
-        )
-    )
-    max_tour = (
-        (season.total_rounds if season and season.total_rounds else None)
-        or all_tours_max
-        or max((g.tour for g in games), default=0)
-    )
-
-    score_by_team_id: dict[int, ScoreTable] = {
-        entry.team_id: entry for entry in score_entries
-    }
-    played_team_ids: set[int] = {
-        team_id
-        for game in games
-        for team_id in (game.home_team_id, game.away_team_id)
-        if team_id is not None
-    }
-
-    if final_stage_ids_list is not None:
-        ordered_team_ids = [entry.team_id for entry in score_entries if entry.team_id in played_team_ids]
-        remaining_ids = sorted(played_team_ids - set(ordered_team_ids))
-        ordered_team_ids.extend(remaining_ids)
-    elif score_entries:
-        ordered_team_ids = [entry.team_id for entry in score_entries]
-    else:
-        ordered_team_ids = sorted(played_team_ids)
-
-    if not ordered_team_ids:
-        return ResultsGridResponse(season_id=season_id, total_tours=max_tour, teams=[])
-
-    # Build results dict: team_id -> [result for each tour]
-    team_results: dict[int, list[str | None]] = {
-        team_id: [None] * max_tour
-        for team_id in ordered_team_ids
-    }
-
-    # Fill in results from games
-    for game in games:
-        tour_idx = game.tour - 1
-        home_id = game.home_team_id
-        away_id = game.away_team_id
-
-        if game.home_score > game.away_score:
-            home_result, away_result = "W", "L"
-        elif game.home_score < game.away_score:
-            home_result, away_result = "L", "W"
-        else:
-            home_result, away_result = "D", "D"
-
-        if home_id in team_results and tour_idx < len(team_results[home_id]):
-            team_results[home_id][tour_idx] = home_result
-        if away_id in team_results and tour_idx < len(team_results[away_id]):
-            team_results[away_id][tour_idx] = away_result
-
-    missing_team_ids = [
-        team_id
-        for team_id in ordered_team_ids
-        if score_by_team_id.get(team_id) is None or score_by_team_id[team_id].team is None
-    ]
-    teams_lookup: dict[int, Team] = {}
-    if missing_team_ids:
-        teams_result = await db.execute(
-            select(Team).where(Team.id.in_(missing_team_ids))
-        )
-        teams_lookup = {team.id: team for team in teams_result.scalars().all()}
-
-    # Build response
-    phase_filtered = group_team_ids is not None or final_stage_ids_list is not None
-    teams = []
-    for idx, team_id in enumerate(ordered_team_ids, 1):
-        score_entry = score_by_team_id.get(team_id)
-        team = score_entry.team if score_entry and score_entry.team else teams_lookup.get(team_id)
-        position = (
-            idx
-            if phase_filtered
-            else (score_entry.position if score_entry and score_entry.position is not None else idx)
-        )
-        teams.append(
-            TeamResultsGridEntry(
-                position=position,
-                team_id=team_id,
-                team_name=get_localized_field(team, "name", lang) if team else None,
-                team_logo=resolve_team_logo_url(team),
-                results=team_results.get(team_id, []),
-            )
-        )
-
-    return ResultsGridResponse(season_id=season_id, total_tours=max_tour, teams=teams)
+class _PerformanceTeam(TypedDict):
+    team_id: int
+    team_name: str | None
+    team_logo: str | None
+    positions: list[int]
 
 
 @router.get("/{season_id}/league-performance")
@@ -547,7 +422,6 @@ async def get_league_performance(
                 GameStatus.live,
             ]),
         )
-        .options(selectinload(Game.home_team), selectinload(Game.away_team))
         .order_by(Game.date, Game.time)
     )
 
@@ -556,21 +430,18 @@ async def get_league_performance(
 
     empty_response = {"season_id": season_id, "week_count": 0, "max_tour": 0, "weeks": [], "teams": []}
     if not games:
-        return empty_response
+        return json_response(empty_response)
 
-    # Collect team info from all loaded games.
+    # Collect team info from the reference snapshot.
+    refs = await get_reference_snapshot(
+        db, teams=[tid for g in games for tid in (g.home_team_id, g.away_team_id)],
+    )
     team_info: dict[int, dict] = {}
     for game in games:
-        if game.home_team_id not in team_info and game.home_team:
-            team_info[game.home_team_id] = {
-                "name": get_localized_field(game.home_team, "name", lang),
-                "logo": resolve_team_logo_url(game.home_team),
-            }
-        if game.away_team_id not in team_info and game.away_team:
-            team_info[game.away_team_id] = {
-                "name": get_localized_field(game.away_team, "name", lang),
-                "logo": resolve_team_logo_url(game.away_team),
-            }
+        for tid in (game.home_team_id, game.away_team_id):
+            team = refs.teams.get(tid)
+            if tid not in team_info and team:
+                team_info[tid] = {"name": get_localized_field(team, "name", lang), "logo": team.logo_url}
 
     # Bucket fully-played games by the ISO (year, week) of their date. A game is
     # counted only if BOTH scores are present and BOTH teams are known, so a
@@ -587,7 +458,7 @@ async def get_league_performance(
         games_by_week[(iso[0], iso[1])].append(g)
 
     if not games_by_week:
-        return empty_response
+        return json_response(empty_response)
 
     week_keys = sorted(games_by_week.keys())
 
@@ -597,7 +468,7 @@ async def get_league_performance(
         for tid in team_info
     }
     positions_by_team: dict[int, list[int]] = {tid: [] for tid in team_info}
-    weeks_meta: list[dict] = []
+    weeks_meta: list[_PerformanceWeek] = []
 
     for idx, week_key in enumerate(week_keys, 1):
         for game in games_by_week[week_key]:
@@ -632,7 +503,7 @@ async def get_league_performance(
         first_date = min(g.date for g in games_by_week[week_key])
         weeks_meta.append({"week": idx, "start": first_date.isoformat()})
 
-    teams_result = []
+    teams_result: list[_PerformanceTeam] = []
     for tid, positions in positions_by_team.items():
         if filter_team_ids and tid not in filter_team_ids:
             continue
@@ -649,11 +520,11 @@ async def get_league_performance(
     )
 
     week_count = len(week_keys)
-    return {
+    return json_response({
         "season_id": season_id,
         "week_count": week_count,
         # Legacy alias kept so the chart's X-axis length keeps working.
         "max_tour": week_count,
         "weeks": weeks_meta,
         "teams": teams_result,
-    }
+    })
@@ -1,8 +1,9 @@
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import Response
-from sqlalchemy import or_, select
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload, selectinload
 
 from app.api.deps import get_db
 from app.utils.cache import cache_get, cache_set
@@ -15,7 +16,6 @@ from app.models import (
     ScoreTable,
     Season,
     Team,
-    TeamSeasonStats,
 )
 from app.schemas.team import (
     TeamOverviewCoachPreview,
@@ -33,14 +33,17 @@ from app.schemas.team import (
 from app.services.season_visibility import is_season_visible_clause, resolve_visible_season_id
 from app.services.team_overview import (
     _build_overview_match,
-    _compute_summary_from_games,
     _safe_int,
     _window_around_team,
 )
+from app.services.team_overview_aggregates import (
+    MAX_FIXTURES,
+    MAX_LEADERS,
+    get_team_overview_aggregate,
+)
 from app.utils.localization import get_localized_name, get_localized_city, get_localized_field
 from app.utils.error_messages import get_error_message
 from app.utils.team_logo_fallback import resolve_team_logo_url
-from app.utils.has_stats import enrich_games_has_stats
 
 router = APIRouter(prefix="/teams", tags=["teams"])
 
@@ -49,19 +52,37 @@ router = APIRouter(prefix="/teams", tags=["teams"])
 async def get_team_overview(
     team_id: int,
     season_id: int | None = Query(default=None),
-    fixtures_limit: int = Query(default=5, ge=1, le=10),
-    leaders_limit: int = Query(default=8, ge=3, le=20),
+    fixtures_limit: int = Query(default=5, ge=1, le=MAX_FIXTURES),
+    leaders_limit: int = Query(default=8, ge=3, le=MAX_LEADERS),
     lang: str = Query(default="kz", pattern="^(kz|ru|en)$"),
     db: AsyncSession = Depends(get_db),
 ):
     """Get aggregated team overview data for the team page."""
     season_id = await resolve_visible_season_id(db, season_id)
 
-    cache_key = f"team_overview:{team_id}:{season_id}:{lang}:{fixtures_limit}:{leaders_limit}"
-    cached = cache_get(cache_key)
-    if cached is not None:
-        return Response(content=cached, media_type="application/json")
+    # One entry per language, rendered at the maximum limits and sliced per request.
+    cache_key = f"team_overview:{team_id}:{season_id}:{lang}"
+    body = cache_get(cache_key)
+    if body is None:
+        body = await _render_team_overview(db, team_id, season_id, lang)
+        cache_set(cache_key, body, 30)
+    return Response(
+        content=_slice_overview(body, fixtures_limit, leaders_limit),
+        media_type="application/json",
+    )
+
+
+def _slice_overview(body: bytes, fixtures_limit: int, leaders_limit: int) -> bytes:
+    if fixtures_limit >= MAX_FIXTURES and leaders_limit >= MAX_LEADERS:
+        return body
+    data = orjson.loads(body)
+    data["upcoming_matches"] = data["upcoming_matches"][:fixtures_limit]
+    data["leaders"]["goals_table"] = data["leaders"]["goals_table"][:leaders_limit]
+    data["leaders"]["assists_table"] = data["leaders"]["assists_table"][:leaders_limit]
+    return orjson.dumps(data)
+
 
+async def _render_team_overview(db: AsyncSession, team_id: int, season_id: int | None, lang: str) -> bytes:
     team_result = await db.execute(
         select(Team)
         .where(Team.id == team_id)
@@ -79,63 +100,28 @@ async def get_team_overview(
     )
     season = season_result.scalar_one_or_none()
 
+    aggregate = await get_team_overview_aggregate(db, team_id, season_id)
+    form_ids = aggregate["form_game_ids"]
+    upcoming_ids = aggregate["upcoming_game_ids"]
+
     games_result = await db.execute(
         select(Game)
-        .where(
-            Game.season_id == season_id,
-            or_(Game.home_team_id == team_id, Game.away_team_id == team_id),
-        )
+        .where(Game.id.in_([*form_ids, *upcoming_ids]))
         .options(
-            selectinload(Game.home_team),
-            selectinload(Game.away_team),
-            selectinload(Game.stadium_rel),
+            joinedload(Game.home_team),
+            joinedload(Game.away_team),
+            joinedload(Game.stadium_rel),
         )
-        .order_by(Game.date.desc(), Game.time.desc())
-    )
-    team_games = list(games_result.scalars().all())
-    await enrich_games_has_stats(db, team_games)
-
-    finished_games = [
-        game for game in team_games if game.home_score is not None and game.away_score is not None
-    ]
-    upcoming_games = sorted(
-        [game for game in team_games if game.home_score is None or game.away_score is None],
-        key=lambda game: (game.date, game.time.isoformat() if game.time else ""),
     )
+    games_by_id = {game.id: game for game in games_result.scalars().all()}
+    finished_games = [games_by_id[game_id] for game_id in form_ids if game_id in games_by_id]
+    upcoming_games = [games_by_id[game_id] for game_id in upcoming_ids if game_id in games_by_id]
 
-    stats_result = await db.execute(
-        select(TeamSeasonStats).where(
-            TeamSeasonStats.team_id == team_id,
-            TeamSeasonStats.season_id == season_id,
-        )
-    )
-    stats = stats_result.scalar_one_or_none()
-
-    if stats:
-        goals_scored = _safe_int(stats.goal)
-        goals_conceded = _safe_int(stats.goals_conceded)
-        goal_difference = (
-            _safe_int(stats.goals_difference)
-            if stats.goals_difference is not None
-            else goals_scored - goals_conceded
-        )
-        summary = TeamOverviewSummary(
-            games_played=_safe_int(stats.games_played),
-            win=_safe_int(stats.win),
-            draw=_safe_int(stats.draw),
-            match_loss=_safe_int(stats.match_loss),
-            goal=goals_scored,
-            goals_conceded=goals_conceded,
-            goal_difference=goal_difference,
-            points=_safe_int(stats.points),
-        )
-    else:
-        summary = _compute_summary_from_games(team_id, finished_games)
-
+    summary = TeamOverviewSummary(**aggregate["summary"])
     recent_match = _build_overview_match(finished_games[0], lang) if finished_games else None
 
     form_last5: list[TeamOverviewFormEntry] = []
-    for game in finished_games[:5]:
+    for game in finished_games:
         is_home = game.home_team_id == team_id
         opponent = game.away_team if is_home else game.home_team
         team_score = _safe_int(game.home_score if is_home else game.away_score)
@@ -159,9 +145,7 @@ async def get_team_overview(
             )
         )
 
-    upcoming_matches = [
-        _build_overview_match(game, lang) for game in upcoming_games[:fixtures_limit]
-    ]
+    upcoming_matches = [_build_overview_match(game, lang) for game in upcoming_games]
 
     # Standings window: load only ±3 positions around the team.
     team_pos_result = await db.execute(
@@ -343,6 +327,8 @@ async def get_team_overview(
         .scalar_subquery()
     )
 
+    candidates: dict[str, list[int]] = aggregate["leaders"]
+    leader_ids = sorted({player_id for ids in candidates.values() for player_id in ids})
     players_result = await db.execute(
         select(
             PlayerSeasonStats,
@@ -360,15 +346,12 @@ async def get_team_overview(
         .where(
             PlayerSeasonStats.season_id == season_id,
             PlayerSeasonStats.team_id == team_id,
+            PlayerSeasonStats.player_id.in_(leader_ids),
         )
     )
     player_rows = players_result.all()
 
-    players: list[TeamOverviewLeaderPlayer] = []
-    gk_entries: list[tuple[int, TeamOverviewLeaderPlayer]] = []
-    def_entries: list[tuple[int, TeamOverviewLeaderPlayer]] = []
-    mid_entries: list[tuple[int, TeamOverviewLeaderPlayer]] = []
-    fwd_entries: list[tuple[int, TeamOverviewLeaderPlayer]] = []
+    players: dict[int, TeamOverviewLeaderPlayer] = {}
     AMPLUA_MAP = {1: "GK", 2: "DEF", 3: "MID", 4: "FWD"}
     for row_stats, row_player, row_team, row_country, contract_photo, contract_photo_leaderboard, contract_amplua, contract_number in player_rows:
         player_entry = TeamOverviewLeaderPlayer(
@@ -401,24 +384,10 @@ async def get_team_overview(
             goals_conceded=_safe_int(row_stats.goals_conceded),
             time_on_field_total=_safe_int(row_stats.time_on_field_total),
         )
-        players.append(player_entry)
-        if contract_amplua == 1:  # GK
-            gk_entries.append((_safe_int(row_stats.games_starting), player_entry))
-        if contract_amplua == 2:  # DEF
-            def_entries.append((_safe_int(row_stats.games_starting), player_entry))
-        if contract_amplua == 3:  # MID
-            mid_entries.append((_safe_int(row_stats.games_starting), player_entry))
-        if contract_amplua == 4:  # FWD
-            fwd_entries.append((_safe_int(row_stats.games_starting), player_entry))
-
-    gk_entries.sort(key=lambda x: x[0] or 0, reverse=True)
-    gk_players = [entry for _, entry in gk_entries]
-    def_entries.sort(key=lambda x: x[0] or 0, reverse=True)
-    def_players = [entry for _, entry in def_entries]
-    mid_entries.sort(key=lambda x: x[0] or 0, reverse=True)
-    mid_players = [entry for _, entry in mid_entries]
-    fwd_entries.sort(key=lambda x: x[0] or 0, reverse=True)
-    fwd_players = [entry for _, entry in fwd_entries]
+        players[player_entry.player_id] = player_entry
+
+    def candidates_for(name: str) -> list[TeamOverviewLeaderPlayer]:
+        return [players[player_id] for player_id in candidates.get(name, []) if player_id in players]
 
     def sort_players(items: list[TeamOverviewLeaderPlayer], field: str) -> list[TeamOverviewLeaderPlayer]:
         return sorted(
@@ -432,22 +401,29 @@ async def get_team_overview(
             reverse=True,
         )
 
-    goals_table = sort_players(players, "goal")[:leaders_limit]
-    assists_table = sort_players(players, "goal_pass")[:leaders_limit]
+    def top(name: str, field: str | None = None) -> TeamOverviewLeaderPlayer | None:
+        items = candidates_for(name)
+        if field is not None:
+            items = sort_players(items, field)
+        return items[0] if items else None
+
+    goals_table = sort_players(candidates_for("goal"), "goal")[:MAX_LEADERS]
+    assists_table = sort_players(candidates_for("goal_pass"), "goal_pass")[:MAX_LEADERS]
+    goalkeeper = top("gk")  # candidates are ordered by games started
     leaders = TeamOverviewLeaders(
         top_scorer=goals_table[0] if goals_table else None,
         top_assister=assists_table[0] if assists_table else None,
         goals_table=goals_table,
         assists_table=assists_table,
         mini_leaders=TeamOverviewMiniLeaders(
-            passes=sort_players(players, "passes")[0] if players else None,
-            appearances=sort_players(players, "games_played")[0] if players else None,
-            saves=gk_players[0] if gk_players else None,
-            clean_sheets=gk_players[0] if gk_players else None,
-            red_cards=sort_players(players, "red_cards")[0] if players else None,
-            top_defender=sort_players(def_players, "passes")[0] if def_players else None,
-            top_midfielder=sort_players(mid_players, "passes")[0] if mid_players else None,
-            top_forward=sort_players(fwd_players, "shot")[0] if fwd_players else None,
+            passes=top("passes", "passes"),
+            appearances=top("games_played", "games_played"),
+            saves=goalkeeper,
+            clean_sheets=goalkeeper,
+            red_cards=top("red_cards", "red_cards"),
+            top_defender=top("def", "passes"),
+            top_midfielder=top("mid", "passes"),
+            top_forward=top("fwd", "shot"),
         ),
     )
 
@@ -523,6 +499,4 @@ async def get_team_overview(
         leaders=leaders,
         staff_preview=staff_preview,
     )
-    json_bytes = response.model_dump_json().encode()
-    cache_set(cache_key, json_bytes, 30)
-    return Response(content=json_bytes, media_type="application/json")
+    return response.model_dump_json().encode()
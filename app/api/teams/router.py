@@ -37,7 +37,6 @@ from app.services.team_overview import _extract_year
 from app.utils.game_status import compute_game_status
 from app.utils.localization import get_localized_name, get_localized_city, get_localized_field
 from app.utils.error_messages import get_error_message
-from app.utils.has_stats import enrich_games_has_stats
 from app.utils.positions import infer_position_code
 from app.utils.team_logo_fallback import resolve_team_logo_url
 
@@ -324,7 +323,6 @@ async def get_team_games(
 
     result = await db.execute(query)
     games = list(result.scalars().all())
-    await enrich_games_has_stats(db, games)
 
     items = []
     for g in games:
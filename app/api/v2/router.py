@@ -1,6 +1,7 @@
 from fastapi import APIRouter
 
 from app.api.v2.stats import router as stats_router
+from app.utils.fast_json import FastJSONResponse
 
-router = APIRouter()
+router = APIRouter(default_response_class=FastJSONResponse)
 router.include_router(stats_router)
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
     # Identifies which container holds a PG session (web/worker/live-worker/beat) in
     # pg_stat_activity. Empty = don't set application_name (keeps tests/local clean).
     app_instance_name: str = ""
+    # Pooled connections one /games/{id}/match-center request may hold at once
+    # while its sections build in parallel (keep well below database_pool_size).
+    match_center_max_connections: int = 3
 
     # MinIO (S3-compatible object storage)
     minio_endpoint: str = "localhost:9000"
@@ -31,9 +34,30 @@ class Settings(BaseSettings):
     sota_api_base_url: str = "https://sota.id/api"
     lineup_live_refresh_ttl_seconds: int = 30
     lineup_live_refresh_timeout_seconds: int = 3
+    # Redis-backed response cache in SotaClient (TTL + ETag revalidation).
+    # Overrides: comma-separated endpoint=seconds, e.g. "games=60,score_table=0".
+    sota_cache_enabled: bool = True
+    sota_cache_ttl_overrides: str = ""
 
     # Redis (Celery broker)
     redis_url: str = "redis://localhost:6379/0"
+    # Comma-separated task modules this worker registers ("" = all). A worker
+    # that only consumes the live queue sets "app.tasks.live_tasks" and never
+    # imports the ticket/telegram/media stacks.
+    celery_task_modules: str = ""
+    # Worker profile from app.tasks.worker_profiles: live / telegram / media /
+    # bulk. Sets queues, pool, concurrency, prefetch and time limits ("" = none).
+    celery_worker_profile: str = ""
+    # Prometheus exporter port in Celery workers (0 = off).
+    metrics_worker_port: int = 0
+    # Bearer token the web app's GET /metrics requires (Prometheus
+    # ``authorization`` / ``bearer_token``); "" = endpoint disabled (404).
+    metrics_token: str = ""
+    # Per-request SQL profiling (app.utils.query_profiler): Server-Timing header
+    # plus one log line per request; WARNING when a statement repeats at least
+    # QUERY_PROFILER_REPEAT_THRESHOLD times (N+1).
+    query_profiler_enabled: bool = False
+    query_profiler_repeat_threshold: int = 5
 
     # Current season (default for API when season_id not specified)
     current_season_id: int = 200
@@ -45,6 +69,15 @@ class Settings(BaseSettings):
     # Excludes Вторая Лига — SOTA doesn't collect detailed analytics for it.
     extended_stats_season_ids: list[int] = [61, 85, 71, 80, 200, 202, 204]
 
+    # Parallel sync DAG (SyncDagExecutor) — global caps per run. Keep the DB
+    # cap below database_pool_size + database_max_overflow.
+    sync_dag_sota_concurrency: int = 4
+    sync_dag_db_concurrency: int = 4
+
+    # Outbound API governor (per-host Redis token buckets, circuit breakers,
+    # adaptive timeouts) for SOTA/FCMS/Serper/YouTube/weather clients.
+    outbound_governor_enabled: bool = True
+
     # CORS
     allowed_origins: str = "*"  # Comma-separated origins, e.g. "https://kffleague.kz"
 
@@ -103,6 +136,11 @@ class Settings(BaseSettings):
     # often lives there only. Reliable plain-HTTP scrape, no Serper credits.
     ticket_telegram_scrape_enabled: bool = True
     ticket_telegram_scrape_max_channels: int = 5
+    # Games searched at once per run; Serper calls are additionally paced to
+    # ticket_serper_rps and GLM validations capped at ticket_glm_concurrency.
+    ticket_search_concurrency: int = 4
+    ticket_serper_rps: float = 2.0
+    ticket_glm_concurrency: int = 2
 
     # FCMS (FIFA CMS) API
     fcms_enabled: bool = False
@@ -112,6 +150,9 @@ class Settings(BaseSettings):
     fcms_password: str = ""
     fcms_customer_code: str = "kaz"
     fcms_competition_season_map: str = "3517:200,3585:204,3596:203,3597:203,3598:202,3674:205,3675:205"
+    # FCMS calls a sync run issues at once while prefetching (before its DB
+    # phase); the outbound governor still paces them to the FCMS host budget.
+    fcms_prefetch_concurrency: int = 6
 
     # apps.kffleague.kz — clubs' match-ops system (kit colors per match).
     # MariaDB lives in the `1sport_intranet` docker network on prod as `kffleague-db`.
@@ -155,6 +196,12 @@ class Settings(BaseSettings):
     # "0" = let libx264 pick (usually all cores). On a dedicated media host we
     # want all cores; on a shared box you may want to cap it.
     goal_video_transcode_threads: str = "0"
+    # Package clips as fMP4 HLS (ABR ladder + master playlist + poster +
+    # faststart MP4 fallback). When on, GameEvent.video_url stores the master
+    # playlist; any packaging failure falls back to the single-MP4 upload.
+    goal_video_hls_enabled: bool = False
+    goal_video_hls_ladder: str = "1080,720,480"  # Comma-separated rung heights
+    goal_video_hls_segment_seconds: int = 4
 
     # SOTA sync guardrails / diagnostics
     sota_dead_season_min_404: int = 30
@@ -7,6 +7,7 @@ from sqlalchemy.orm import DeclarativeBase
 from sqlalchemy.pool import NullPool
 
 from app.config import get_settings
+from app.utils.metrics import instrument_pool
 
 settings = get_settings()
 
@@ -55,6 +56,8 @@ web_engine = create_async_engine(
     settings.database_url,
     **build_engine_kwargs(statement_timeout_ms=settings.web_statement_timeout_ms),
 )
+instrument_pool(engine, "worker")
+instrument_pool(web_engine, "web")
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -1,8 +1,9 @@
 import asyncio
+import hmac
 import logging
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from starlette.middleware.gzip import GZipMiddleware
 
@@ -10,6 +11,8 @@ from app.config import get_settings
 from app.database import engine, log_pool_stats
 from app.minio_client import init_minio
 from app.utils.feature_flags import log_feature_flags
+from app.utils.metrics import CONTENT_TYPE_LATEST, MetricsMiddleware, render_metrics
+from app.utils.query_profiler import QueryProfilerMiddleware
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +56,8 @@ app.add_middleware(
     allow_headers=["*"],
 )
 app.add_middleware(GZipMiddleware, minimum_size=1000)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryProfilerMiddleware)
 
 
 @app.get("/health")
@@ -60,6 +65,19 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    if not settings.metrics_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    expected = f"Bearer {settings.metrics_token}"
+    provided = request.headers.get("authorization", "")
+    if not hmac.compare_digest(provided.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=401, detail="Invalid metrics token", headers={"WWW-Authenticate": "Bearer"},
+        )
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
+
+
 # Import and include routers after app is created
 from app.api.router import api_router
 from app.api.v2.router import router as api_v2_router
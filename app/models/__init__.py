@@ -24,6 +24,7 @@ from app.models.game_lineup import GameLineup, LineupType
 from app.models.game_event import GameEvent, GameEventType
 from app.models.tour_sync_status import TourSyncStatus
 from app.models.fcms_roster_sync_log import FcmsRosterSyncLog
+from app.models.sync_job import SyncJob, SyncJobUnit
 
 # Legacy migration models
 from app.models.championship import Championship
@@ -74,6 +75,8 @@ __all__ = [
     "GameEventType",
     "TourSyncStatus",
     "FcmsRosterSyncLog",
+    "SyncJob",
+    "SyncJobUnit",
     # Legacy migration models
     "Championship",
     "City",
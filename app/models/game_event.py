@@ -92,6 +92,10 @@ class GameEvent(Base):
     # Telegram message id of the goal text post — used as reply_to target
     # when the video clip is attached asynchronously.
     telegram_message_id: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Claim marker of the per-game outbox while the post is in flight.
+    telegram_sending_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
     telegram_video_sent_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True), nullable=True
     )
@@ -99,6 +103,8 @@ class GameEvent(Base):
     # Goal highlight clip (MinIO object name, resolved to full URL on read).
     # Populated by goal_video_sync_service from Google Drive during live matches.
     video_url: Mapped[str | None] = mapped_column(FileUrlType(), nullable=True)
+    # Poster of an HLS clip; None when the package has no poster.
+    video_poster_url: Mapped[str | None] = mapped_column(FileUrlType(), nullable=True)
 
     # Relationships
     game: Mapped["Game"] = relationship("Game", back_populates="events")
@@ -0,0 +1,71 @@
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.database import Base
+from app.utils.timestamps import utcnow
+
+
+class SyncJob(Base):
+    """A resumable bulk sync job (season backfills, extended-stats resyncs).
+
+    The work is split into ``SyncJobUnit`` rows planned up front; a Celery
+    task drains pending units in time-boxed slices and re-enqueues itself,
+    so a soft time limit or worker restart only costs the unit in flight.
+    """
+
+    __tablename__ = "sync_jobs"
+    __table_args__ = (
+        Index("ix_sync_jobs_status", "status"),
+        Index("ix_sync_jobs_created_at", "created_at"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(50), nullable=False)
+    params: Mapped[dict] = mapped_column(JSONB, default=dict, nullable=False)
+    # pending → running ⇄ paused → completed | failed
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
+    units_total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    units_done: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    units_failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    slices: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    triggered_by: Mapped[str] = mapped_column(String(255), default="admin", nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=utcnow, nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    # Bumped after every unit — a running job with a stale heartbeat lost its
+    # worker and is picked up again by the resume sweep.
+    heartbeat_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    completed_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    units: Mapped[list["SyncJobUnit"]] = relationship(
+        "SyncJobUnit", back_populates="job", cascade="all, delete-orphan",
+        order_by="SyncJobUnit.position",
+    )
+
+
+class SyncJobUnit(Base):
+    """One checkpointed unit of a ``SyncJob`` (a game, a tour, a season step)."""
+
+    __tablename__ = "sync_job_units"
+    __table_args__ = (
+        UniqueConstraint("job_id", "unit_key", name="uq_sync_job_units_job_key"),
+        Index("ix_sync_job_units_job_status", "job_id", "status"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    job_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("sync_jobs.id", ondelete="CASCADE"), nullable=False,
+    )
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    unit_key: Mapped[str] = mapped_column(String(100), nullable=False)
+    # pending | done | failed
+    status: Mapped[str] = mapped_column(String(20), default="pending", nullable=False)
+    attempts: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    result: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    job: Mapped["SyncJob"] = relationship("SyncJob", back_populates="units")
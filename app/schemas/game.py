@@ -200,6 +200,7 @@ class MatchCenterResponse(BaseModel):
     groups: list[MatchCenterDateGroup]
     total: int
     tentative_tour_dates: dict[int, list[str]] = {}
+    next_cursor: str | None = None
 
 
 # Per-endpoint response schemas
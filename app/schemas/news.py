@@ -56,6 +56,7 @@ class NewsListResponse(BaseModel):
     page: int
     per_page: int
     pages: int
+    next_cursor: str | None = None
 
 
 class NewsReactionsResponse(BaseModel):
@@ -28,6 +28,7 @@ class PlayerResponse(PlayerBase):
 class PlayerListResponse(BaseModel):
     items: list[PlayerResponse]
     total: int
+    next_cursor: str | None = None
 
 
 class PlayerPositionsBlock(BaseModel):
@@ -196,6 +197,7 @@ class PlayerStatsTableResponse(BaseModel):
     sort_by: str
     items: list[PlayerStatsTableEntry]
     total: int
+    next_cursor: str | None = None
 
 
 class PlayerTeammateResponse(BaseModel):
@@ -5,8 +5,11 @@ Uses ColorThief library to extract dominant colors from team logos.
 """
 
 import io
-from colorthief import ColorThief
-from PIL import Image
+
+from app.utils.lazy_import import lazy_module
+
+colorthief = lazy_module("colorthief")
+Image = lazy_module("PIL.Image")
 
 
 class ColorPaletteService:
@@ -47,7 +50,7 @@ class ColorPaletteService:
             img_bytes.seek(0)
 
             # Extract colors
-            color_thief = ColorThief(img_bytes)
+            color_thief = colorthief.ColorThief(img_bytes)
 
             if color_count == 1:
                 dominant_color = color_thief.get_color(quality=1)
@@ -3,6 +3,8 @@
 import asyncio
 import logging
 import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any
 
 import httpx
 from tenacity import (
@@ -14,6 +16,7 @@ from tenacity import (
 )
 
 from app.config import get_settings
+from app.utils.outbound_governor import governed_transport
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -42,7 +45,9 @@ class FcmsClient:
             self._client = httpx.AsyncClient(
                 follow_redirects=True,
                 timeout=httpx.Timeout(30.0),
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                transport=governed_transport(
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                ),
             )
         return self._client
 
@@ -254,6 +259,49 @@ class FcmsClient:
             self._client = None
 
 
+class FcmsPrefetch:
+    """FCMS responses fetched concurrently ahead of a sync's DB phase.
+
+    A sync run first calls ``fetch_all`` with every request it will need
+    (bounded by ``fcms_prefetch_concurrency``; the outbound governor paces
+    them to the host budget), then reconciles the DB reading results with
+    ``get`` — so no transaction or savepoint stays open across HTTP calls.
+    ``get`` falls back to calling FCMS directly for keys that were not
+    prefetched (single-game admin syncs). A failed request is stored and
+    re-raised by ``get``, so callers keep their per-item error handling.
+    """
+
+    def __init__(self, concurrency: int | None = None):
+        self.concurrency = concurrency or settings.fcms_prefetch_concurrency
+        self._results: dict[Hashable, Any] = {}
+
+    async def fetch_all(self, requests: dict[Hashable, Callable[[], Awaitable[Any]]]) -> None:
+        gate = asyncio.Semaphore(max(1, self.concurrency))
+
+        async def _one(key: Hashable, call: Callable[[], Awaitable[Any]]) -> None:
+            async with gate:
+                try:
+                    self._results[key] = await call()
+                except Exception as exc:
+                    self._results[key] = exc
+
+        pending = {k: c for k, c in requests.items() if k not in self._results}
+        await asyncio.gather(*(_one(key, call) for key, call in pending.items()))
+
+    def peek(self, key: Hashable) -> Any:
+        """Prefetched result, or None when missing or failed."""
+        result = self._results.get(key)
+        return None if isinstance(result, Exception) else result
+
+    async def get(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        if key not in self._results:
+            return await call()
+        result = self._results[key]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
 # Singleton
 _fcms_client: FcmsClient | None = None
 
@@ -9,6 +9,7 @@ from __future__ import annotations
 
 import logging
 from datetime import date as date_type, timedelta
+from functools import partial
 from typing import Iterable
 
 from sqlalchemy import and_, select
@@ -22,7 +23,7 @@ from app.models import (
     Referee,
     RefereeRole,
 )
-from app.services.fcms_client import FcmsClient
+from app.services.fcms_client import FcmsClient, FcmsPrefetch
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +56,7 @@ class FcmsRefereeSyncService:
     def __init__(self, db: AsyncSession, client: FcmsClient):
         self.db = db
         self.client = client
+        self.prefetched = FcmsPrefetch()
         self._country_cache: dict[str, int | None] = {}
 
     # ── Query helpers ────────────────────────────────────────────────
@@ -94,7 +96,10 @@ class FcmsRefereeSyncService:
             return {"error": f"Game {game_id} not found or no fcms_match_id", **result}
 
         try:
-            allocations = await self.client.get_match_official_allocations(game.fcms_match_id)
+            allocations = await self.prefetched.get(
+                ("allocations", game.fcms_match_id),
+                partial(self.client.get_match_official_allocations, game.fcms_match_id),
+            )
         except Exception as e:
             logger.exception("FCMS matchOfficialAllocations failed game=%d fcms=%d", game_id, game.fcms_match_id)
             return {"error": f"FCMS request failed: {e}", **result}
@@ -267,12 +272,30 @@ class FcmsRefereeSyncService:
 
     # ── Bulk ─────────────────────────────────────────────────────────
 
+    async def prefetch_allocations(self, fcms_match_ids: Iterable[int]) -> None:
+        """Fetch official allocations of many matches concurrently (see ``FcmsPrefetch``)."""
+        await self.prefetched.fetch_all({
+            ("allocations", match_id): partial(self.client.get_match_official_allocations, match_id)
+            for match_id in fcms_match_ids
+        })
+
     async def sync_many(self, game_ids: Iterable[int]) -> dict:
-        """Sync a batch of games, isolating per-game errors via SAVEPOINT."""
+        """Sync a batch of games, isolating per-game errors via SAVEPOINT.
+
+        Allocations are prefetched for the whole batch first, so the per-game
+        savepoints only cover DB work.
+        """
         totals = {
             "games": 0, "added": 0, "updated": 0, "removed": 0,
             "created_referees": 0, "skipped": 0, "errors": 0,
         }
+        game_ids = list(game_ids)
+        match_ids = (await self.db.execute(
+            select(Game.fcms_match_id).where(Game.id.in_(game_ids), Game.fcms_match_id.isnot(None))
+        )).scalars().all()
+        await self.db.commit()  # release the connection for the HTTP phase
+        await self.prefetch_allocations(match_ids)
+
         for gid in game_ids:
             totals["games"] += 1
             try:
@@ -7,9 +7,10 @@ Coaches (role != 1) are excluded from sync entirely.
 
 import hashlib
 import logging
+from functools import partial
 from datetime import date as date_type, datetime, timezone
 
-from sqlalchemy import select, or_, and_
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
@@ -18,7 +19,8 @@ from app.models.fcms_roster_sync_log import FcmsRosterSyncLog
 from app.models.player import Player
 from app.models.player_team import PlayerTeam
 from app.models.team import Team
-from app.services.fcms_client import FcmsClient
+from app.services.fcms_client import FcmsClient, FcmsPrefetch
+from app.services.player_identity import PlayerIdentityIndex
 from app.services.telegram import send_telegram_message
 
 logger = logging.getLogger(__name__)
@@ -82,10 +84,19 @@ def _make_item_key(person_id: int | None, fn_ru: str, ln_ru: str, dob: str) -> s
     return f"hash_{hashlib.md5(raw.encode()).hexdigest()}"
 
 
+def _parse_dob(dob: str | None) -> date_type | None:
+    try:
+        return date_type.fromisoformat(dob) if dob else None
+    except ValueError:
+        return None
+
+
 class FcmsRosterSyncService:
     def __init__(self, db: AsyncSession, client: FcmsClient):
         self.db = db
         self.client = client
+        self.prefetched = FcmsPrefetch()
+        self._identity: PlayerIdentityIndex | None = None
 
     async def sync_all_competitions(self, triggered_by: str = "celery_beat") -> list[dict]:
         """Sync rosters for all configured competitions."""
@@ -93,6 +104,8 @@ class FcmsRosterSyncService:
         comp_map = self._parse_competition_map(settings.fcms_competition_season_map)
         all_logs = []
 
+        await self.prefetch_competitions([comp_id for comp_id, _ in comp_map])
+
         for comp_id, season_id in comp_map:
             comp_name = COMP_NAMES.get(comp_id, f"Competition {comp_id}")
             log = FcmsRosterSyncLog(
@@ -128,9 +141,48 @@ class FcmsRosterSyncService:
 
         return all_logs
 
+    async def prefetch_competitions(self, comp_ids: list[int]) -> None:
+        """Fetch competitors, then players and officials of every local team, concurrently.
+
+        Runs before any sync log or savepoint is opened; ``_sync_competition``
+        then reads the results from ``self.prefetched``.
+        """
+        await self.prefetched.fetch_all({
+            ("competitors", comp_id): partial(self.client.get_competition_competitors, comp_id)
+            for comp_id in comp_ids
+        })
+        # A failed competitors call surfaces again (and fails that competition) in _sync_competition
+        teams_by_comp = {
+            comp_id: [c["teamId"] for c in competitors]
+            for comp_id in comp_ids
+            if (competitors := self.prefetched.peek(("competitors", comp_id))) is not None
+        }
+
+        all_team_ids = {t for ids in teams_by_comp.values() for t in ids}
+        local = set()
+        if all_team_ids:
+            local = set((await self.db.execute(
+                select(Team.fcms_team_id).where(Team.fcms_team_id.in_(all_team_ids))
+            )).scalars())
+            await self.db.commit()  # release the connection for the HTTP phase
+
+        requests = {}
+        for comp_id, team_ids in teams_by_comp.items():
+            for fcms_team_id in team_ids:
+                if fcms_team_id in local:
+                    requests[("players", comp_id, fcms_team_id)] = partial(
+                        self.client.get_competitor_players, comp_id, fcms_team_id
+                    )
+                    requests[("officials", comp_id, fcms_team_id)] = partial(
+                        self.client.get_competitor_officials, comp_id, fcms_team_id
+                    )
+        await self.prefetched.fetch_all(requests)
+
     async def _sync_competition(self, comp_id: int, season_id: int, log: FcmsRosterSyncLog) -> list[dict]:
         """Sync all teams for one competition."""
-        competitors = await self.client.get_competition_competitors(comp_id)
+        competitors = await self.prefetched.get(
+            ("competitors", comp_id), partial(self.client.get_competition_competitors, comp_id)
+        )
         fcms_team_ids = [c["teamId"] for c in competitors]
 
         result = await self.db.execute(
@@ -154,21 +206,36 @@ class FcmsRosterSyncService:
 
         for team in teams:
             try:
+                # FCMS data first (prefetched), so the savepoint never spans an HTTP call
+                fcms_players = await self.prefetched.get(
+                    ("players", comp_id, team.fcms_team_id),
+                    partial(self.client.get_competitor_players, comp_id, team.fcms_team_id),
+                )
+                try:
+                    fcms_officials = await self.prefetched.get(
+                        ("officials", comp_id, team.fcms_team_id),
+                        partial(self.client.get_competitor_officials, comp_id, team.fcms_team_id),
+                    )
+                except Exception:
+                    fcms_officials = None
+                    logger.exception("Failed to fetch coaches for %s", team.name)
+
                 async with self.db.begin_nested():
-                    fcms_players = await self.client.get_competitor_players(comp_id, team.fcms_team_id)
                     changes = await self.sync_team_roster(team, fcms_players, season_id)
 
                     # Coach sync
-                    try:
-                        fcms_officials = await self.client.get_competitor_officials(comp_id, team.fcms_team_id)
-                        coach_changes = await self.sync_team_coaches(team, fcms_officials, season_id)
-                        changes["coach_updates"] = coach_changes
-                    except Exception:
-                        logger.exception("Failed to sync coaches for %s", team.name)
+                    if fcms_officials is not None:
+                        try:
+                            coach_changes = await self.sync_team_coaches(team, fcms_officials, season_id)
+                            changes["coach_updates"] = coach_changes
+                        except Exception:
+                            logger.exception("Failed to sync coaches for %s", team.name)
 
                     all_changes.append(changes)
                     teams_synced += 1
             except Exception as e:
+                # Rolled-back creations/links may be in the identity index — rebuild it
+                self._identity = None
                 has_errors = True
                 all_changes.append({
                     "team_name": team.name,
@@ -313,7 +380,9 @@ class FcmsRosterSyncService:
                 )
             else:
                 # Step 2: global search
-                lp, method = await self._find_globally(fn_ru, ln_ru, fn_en, ln_en, person_id, dob)
+                index = await self._identity_index(season_id)
+                lp_id, method = index.find_global(fn_ru, ln_ru, fn_en, ln_en, person_id, _parse_dob(dob))
+                lp = await self.db.get(Player, lp_id) if lp_id else None
                 if lp:
                     # Remove from local indexes — the player may already
                     # have an active PlayerTeam for this team/season, so
@@ -322,14 +391,8 @@ class FcmsRosterSyncService:
                         lp.id, local_by_fcms, local_by_name, local_by_num
                     )
                     # Step 3: ensure PlayerTeam
-                    pt_result = await self.db.execute(
-                        select(PlayerTeam).where(
-                            PlayerTeam.player_id == lp.id,
-                            PlayerTeam.team_id == team.id,
-                            PlayerTeam.season_id == season_id,
-                        )
-                    )
-                    pt = pt_result.scalars().first()
+                    entry = index.roster_entry(lp.id, team.id, season_id)
+                    pt = await self.db.get(PlayerTeam, entry.id) if entry else None
                     if not pt:
                         pt = PlayerTeam(
                             player_id=lp.id,
@@ -341,6 +404,7 @@ class FcmsRosterSyncService:
                         )
                         self.db.add(pt)
                         await self.db.flush()
+                        index.put_roster(pt)
                         changes["auto_updates"].append({
                             "name": fcms_name,
                             "num": num_str,
@@ -357,6 +421,7 @@ class FcmsRosterSyncService:
                             details.append("снят is_hidden")
                         pt.is_hidden = False
                         pt.number = num
+                        index.put_roster(pt)
                         changes["auto_updates"].append({
                             "name": fcms_name,
                             "num": num_str,
@@ -440,6 +505,8 @@ class FcmsRosterSyncService:
                         pt.position_kz = pos_kz
                         pt.position_en = pos_en
 
+                if player_updates and self._identity is not None:
+                    self._identity.put(lp)
                 if player_updates:
                     existing = [u for u in changes["auto_updates"] if u.get("name") == fcms_name]
                     if existing:
@@ -453,21 +520,11 @@ class FcmsRosterSyncService:
                         })
             elif not lp:
                 # Step 5: not found anywhere — auto-create
+                index = await self._identity_index(season_id)
                 safe_pid = person_id
-                if person_id:
-                    existing = await self.db.execute(
-                        select(Player.id).where(Player.fcms_person_id == person_id)
-                    )
-                    if existing.scalar():
-                        logger.warning("Player fcms_person_id=%s already taken, creating without it", person_id)
-                        safe_pid = None
-
-                dob_parsed = None
-                if dob:
-                    try:
-                        dob_parsed = date_type.fromisoformat(dob)
-                    except ValueError:
-                        pass
+                if person_id and index.by_fcms_person_id(person_id):
+                    logger.warning("Player fcms_person_id=%s already taken, creating without it", person_id)
+                    safe_pid = None
 
                 lp = Player(
                     first_name=fn_ru or fn_en,
@@ -476,10 +533,11 @@ class FcmsRosterSyncService:
                     last_name_en=ln_en or None,
                     fcms_person_id=safe_pid,
                     country_id=country_id,
-                    birthday=dob_parsed,
+                    birthday=_parse_dob(dob),
                 )
                 self.db.add(lp)
                 await self.db.flush()
+                index.put(lp)
 
                 pt_kwargs: dict = {
                     "player_id": lp.id,
@@ -495,6 +553,7 @@ class FcmsRosterSyncService:
                 pt = PlayerTeam(**pt_kwargs)
                 self.db.add(pt)
                 await self.db.flush()
+                index.put_roster(pt)
 
                 matched_player_ids.add(lp.id)
                 changes["new_players"].append({
@@ -594,39 +653,24 @@ class FcmsRosterSyncService:
                         method = "name"
                         break
 
+            index = await self._identity_index(season_id)
             if not lp:
-                # Global search by fcms_person_id
-                if person_id:
-                    r = await self.db.execute(
-                        select(Player).where(Player.fcms_person_id == person_id)
-                    )
-                    lp = r.scalars().first()
-                    if lp:
-                        method = "global_fcms_id"
-                # Global search by name
-                if not lp and ln_ru and fn_ru:
-                    r = await self.db.execute(
-                        select(Player).where(
-                            Player.last_name == ln_ru,
-                            Player.first_name == fn_ru,
-                        )
-                    )
-                    lp = r.scalars().first()
-                    if lp:
-                        method = "global_name"
+                # Global search by fcms_person_id, then by name
+                lp_id = index.by_fcms_person_id(person_id) if person_id else None
+                if lp_id:
+                    method = "global_fcms_id"
+                elif ln_ru and fn_ru and (lp_id := index.by_name(ln_ru, fn_ru)):
+                    method = "global_name"
+                lp = await self.db.get(Player, lp_id) if lp_id else None
 
             details: list[str] = []
 
             if not lp:
                 # Check uniqueness before creating with fcms_person_id
                 safe_pid = person_id
-                if person_id:
-                    existing = await self.db.execute(
-                        select(Player.id).where(Player.fcms_person_id == person_id)
-                    )
-                    if existing.scalar():
-                        logger.warning("Coach fcms_person_id=%s already taken, creating without it", person_id)
-                        safe_pid = None
+                if person_id and index.by_fcms_person_id(person_id):
+                    logger.warning("Coach fcms_person_id=%s already taken, creating without it", person_id)
+                    safe_pid = None
                 lp = Player(
                     first_name=fn_ru or fn_en,
                     last_name=ln_ru or ln_en,
@@ -637,6 +681,7 @@ class FcmsRosterSyncService:
                 )
                 self.db.add(lp)
                 await self.db.flush()
+                index.put(lp)
                 method = "new"
                 details.append("создан")
             else:
@@ -658,20 +703,17 @@ class FcmsRosterSyncService:
                 if country_id and lp.country_id != country_id:
                     details.append(f"страна: {lp.country_id} → {country_id}")
                     lp.country_id = country_id
+                index.put(lp)
 
             matched_ids.add(lp.id)
 
             # Ensure PlayerTeam(role=2)
             if not pt:
-                pt_result = await self.db.execute(
-                    select(PlayerTeam).where(
-                        PlayerTeam.player_id == lp.id,
-                        PlayerTeam.team_id == team.id,
-                        PlayerTeam.season_id == season_id,
-                        PlayerTeam.role == 2,
-                    )
+                entry = next(
+                    (e for e in index.roster(team.id, season_id) if e.player_id == lp.id and e.role == 2),
+                    None,
                 )
-                pt = pt_result.scalars().first()
+                pt = await self.db.get(PlayerTeam, entry.id) if entry else None
 
             if not pt:
                 pt = PlayerTeam(
@@ -686,6 +728,7 @@ class FcmsRosterSyncService:
                 )
                 self.db.add(pt)
                 await self.db.flush()
+                index.put_roster(pt)
                 details.append(f"назначен {position_ru}")
             else:
                 if not pt.is_active:
@@ -720,15 +763,19 @@ class FcmsRosterSyncService:
 
         return changes
 
+    async def _identity_index(self, season_id: int | None = None) -> PlayerIdentityIndex:
+        """Identities of every player (plus the season's rosters), loaded once per run."""
+        if self._identity is None:
+            self._identity = PlayerIdentityIndex()
+        await self._identity.load_players(self.db)
+        if season_id is not None:
+            await self._identity.load_rosters(self.db, season_id)
+        return self._identity
+
     async def _fcms_person_id_taken(self, person_id: int, exclude_player_id: int) -> int | None:
         """Check if fcms_person_id is already used by another player. Returns conflicting player_id or None."""
-        r = await self.db.execute(
-            select(Player.id).where(
-                Player.fcms_person_id == person_id,
-                Player.id != exclude_player_id,
-            )
-        )
-        return r.scalar()
+        owner = (await self._identity_index()).by_fcms_person_id(person_id)
+        return owner if owner != exclude_player_id else None
 
     @staticmethod
     def _remove_from_indexes(
@@ -760,57 +807,6 @@ class FcmsRosterSyncService:
             return local_by_num[num], "number"
         return None, None
 
-    async def _find_globally(self, fn_ru, ln_ru, fn_en, ln_en, person_id, dob):
-        """Find player across entire DB."""
-        if person_id:
-            r = await self.db.execute(select(Player).where(Player.fcms_person_id == person_id))
-            p = r.scalars().first()
-            if p:
-                return p, "global_fcms_id"
-
-        for ln, fn in [(ln_ru, fn_ru), (ln_en, fn_en)]:
-            if ln and fn:
-                r = await self.db.execute(select(Player).where(
-                    or_(
-                        and_(Player.last_name == ln, Player.first_name == fn),
-                        and_(Player.last_name_en == ln, Player.first_name_en == fn),
-                        and_(Player.last_name_kz == ln, Player.first_name_kz == fn),
-                    )
-                ))
-                p = r.scalars().first()
-                if p:
-                    return p, "global_name"
-
-        for ln, fn in [(ln_ru, fn_ru), (ln_en, fn_en)]:
-            if ln and fn:
-                r = await self.db.execute(select(Player).where(
-                    or_(
-                        and_(Player.last_name == fn, Player.first_name == ln),
-                        and_(Player.last_name_en == fn, Player.first_name_en == ln),
-                    )
-                ))
-                p = r.scalars().first()
-                if p:
-                    return p, "global_name_rev"
-
-        if dob and ln_ru:
-            try:
-                dob_parsed = date_type.fromisoformat(dob)
-                r = await self.db.execute(select(Player).where(
-                    Player.birthday == dob_parsed,
-                    or_(
-                        Player.last_name.ilike(f"%{ln_ru}%"),
-                        Player.last_name_en.ilike(f"%{ln_en}%") if ln_en else False,
-                    )
-                ))
-                p = r.scalars().first()
-                if p:
-                    return p, "global_dob+name"
-            except ValueError:
-                pass
-
-        return None, None
-
     _country_cache: dict[str, int | None] = {}
 
     async def _resolve_country(self, iso2: str) -> int | None:
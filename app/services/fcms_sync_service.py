@@ -3,6 +3,7 @@
 import hashlib
 import logging
 from datetime import timedelta
+from functools import partial
 from zoneinfo import ZoneInfo
 
 from sqlalchemy import select, and_, or_
@@ -11,7 +12,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models import Game, GameEvent, GameEventType, GameLineup, GameStatus, LineupType, Player, PlayerTeam, Team
-from app.services.fcms_client import FcmsClient
+from app.services.fcms_client import FcmsClient, FcmsPrefetch
 from app.services.file_storage import FileStorageService
 from app.services.telegram import send_telegram_document, send_telegram_message
 from app.utils.game_event_assists import sync_event_assist
@@ -42,6 +43,7 @@ def _pdf_text_hash(pdf_bytes: bytes) -> str:
         return hashlib.sha256(pdf_bytes).hexdigest()
 
 ALMATY_TZ = ZoneInfo("Asia/Almaty")
+_FCMS_COMPLETED_STATUSES = ("CLOSED", "COMPLETE", "COMPLETED", "FINISHED")
 
 
 class FcmsSyncService:
@@ -50,6 +52,29 @@ class FcmsSyncService:
     def __init__(self, db: AsyncSession, client: FcmsClient):
         self.db = db
         self.client = client
+        self.prefetched = FcmsPrefetch()
+
+    # ── Prefetch (concurrent FCMS calls before the DB phase) ─────────
+
+    async def prefetch_lineups(self, games: list[Game]) -> None:
+        """Pre-match report PDFs of ``games``, fetched concurrently."""
+        await self.prefetched.fetch_all({
+            ("prematch_pdf", g.fcms_match_id): partial(self.client.get_pre_match_report_pdf, g.fcms_match_id)
+            for g in games if g.fcms_match_id
+        })
+
+    async def prefetch_protocols(self, games: list[Game]) -> None:
+        """Match data of ``games``, then report PDFs of those FCMS marks completed."""
+        match_ids = [g.fcms_match_id for g in games if g.fcms_match_id]
+        await self.prefetched.fetch_all({
+            ("match", mid): partial(self.client.get_match, mid) for mid in match_ids
+        })
+        await self.prefetched.fetch_all({
+            ("report_pdf", mid): partial(self.client.get_match_report_pdf, mid)
+            for mid in match_ids
+            if (match := self.prefetched.peek(("match", mid))) is not None
+            and (match.get("status") or "").upper() in _FCMS_COMPLETED_STATUSES
+        })
 
     # ── Query helpers ────────────────────────────────────────────────
 
@@ -111,7 +136,10 @@ class FcmsSyncService:
             return {"error": f"Game {game_id} not found or no fcms_match_id"}
 
         # Download pre-match report PDF
-        pdf_bytes = await self.client.get_pre_match_report_pdf(game.fcms_match_id)
+        pdf_bytes = await self.prefetched.get(
+            ("prematch_pdf", game.fcms_match_id),
+            partial(self.client.get_pre_match_report_pdf, game.fcms_match_id),
+        )
         if pdf_bytes is None:
             logger.info("FCMS pre-match report not available yet for game %d (fcms=%d)", game_id, game.fcms_match_id)
             return {"status": "pdf_not_available_yet"}
@@ -324,14 +352,18 @@ class FcmsSyncService:
             return {"error": f"Game {game_id} not found or no fcms_match_id"}
 
         # Check match status in FCMS
-        match_data = await self.client.get_match(game.fcms_match_id)
+        match_data = await self.prefetched.get(
+            ("match", game.fcms_match_id), partial(self.client.get_match, game.fcms_match_id)
+        )
         fcms_status = (match_data.get("status") or "").upper()
-        if fcms_status not in ("CLOSED", "COMPLETE", "COMPLETED", "FINISHED"):
+        if fcms_status not in _FCMS_COMPLETED_STATUSES:
             logger.debug("FCMS match %d status=%s, not ready for protocol", game.fcms_match_id, fcms_status)
             return {"status": "match_not_completed", "fcms_status": fcms_status}
 
         # Download match report PDF
-        pdf_bytes = await self.client.get_match_report_pdf(game.fcms_match_id)
+        pdf_bytes = await self.prefetched.get(
+            ("report_pdf", game.fcms_match_id), partial(self.client.get_match_report_pdf, game.fcms_match_id)
+        )
         if pdf_bytes is None:
             return {"status": "pdf_not_available_yet"}
 
@@ -448,13 +480,25 @@ class FcmsSyncService:
             return {"error": f"Game {game_id} not found or no fcms_match_id", "added": 0, "updated": 0, "deleted": 0}
 
         # Get match data for competitor IDs
-        match_data = await self.client.get_match(game.fcms_match_id)
+        match_id = game.fcms_match_id
+        match_data = await self.prefetched.get(("match", match_id), partial(self.client.get_match, match_id))
         home_competitor_id = match_data.get("homeCompetitorId")
         away_competitor_id = match_data.get("awayCompetitorId")
 
         if not home_competitor_id or not away_competitor_id:
             return {"error": "Missing competitor IDs in FCMS match data", "added": 0, "updated": 0, "deleted": 0}
 
+        # Both teams' match players and the events, fetched concurrently
+        await self.prefetched.fetch_all({
+            ("match_players", match_id, home_competitor_id): partial(
+                self.client.get_match_players, match_id, home_competitor_id
+            ),
+            ("match_players", match_id, away_competitor_id): partial(
+                self.client.get_match_players, match_id, away_competitor_id
+            ),
+            ("match_events", match_id): partial(self.client.get_match_events, match_id),
+        })
+
         # Build matchPlayerId → personId mapping from both teams
         mp_to_person: dict[int, int] = {}
         mp_to_name: dict[int, str] = {}
@@ -464,7 +508,10 @@ class FcmsSyncService:
             (away_competitor_id, game.away_team_id),
         ):
             try:
-                match_players = await self.client.get_match_players(game.fcms_match_id, comp_id)
+                match_players = await self.prefetched.get(
+                    ("match_players", match_id, comp_id),
+                    partial(self.client.get_match_players, match_id, comp_id),
+                )
             except Exception:
                 logger.warning("Failed to fetch matchPlayers for comp %d game %d", comp_id, game_id, exc_info=True)
                 continue
@@ -493,7 +540,9 @@ class FcmsSyncService:
                 person_to_player[row[1]] = (row[0], f"{row[2] or ''} {row[3] or ''}".strip())
 
         # Fetch events from FCMS
-        fcms_events = await self.client.get_match_events(game.fcms_match_id)
+        fcms_events = await self.prefetched.get(
+            ("match_events", match_id), partial(self.client.get_match_events, match_id)
+        )
 
         # Load existing FCMS events from DB
         result = await self.db.execute(
@@ -377,6 +377,32 @@ class FileStorageService:
         except S3Error:
             return False
 
+    @staticmethod
+    async def delete_prefix(prefix: str) -> bool:
+        """Delete every object under *prefix* (e.g. an HLS package directory).
+
+        Returns False if any removal failed. An empty prefix is refused so a
+        bad caller can never wipe the bucket.
+        """
+        if not prefix or prefix == "/":
+            return False
+        client = get_minio_client()
+        bucket = settings.minio_bucket
+
+        def _delete() -> bool:
+            ok = True
+            for obj in client.list_objects(bucket, prefix=prefix, recursive=True):
+                try:
+                    client.remove_object(bucket, obj.object_name)
+                except S3Error:
+                    ok = False
+            return ok
+
+        try:
+            return await asyncio.to_thread(_delete)
+        except S3Error:
+            return False
+
     @staticmethod
     async def list_files(
         category: str | None = None,
@@ -0,0 +1,45 @@
+"""Cache keys for the public per-game API sections.
+
+``/games/{id}``, ``/games/{id}/lineup``, ``/games/{id}/stats``,
+``/live/events/{id}`` and ``/games/{id}/match-center`` share these entries,
+so an admin edit only has to drop them in one place.
+"""
+
+from app.services.list_counts import invalidate_list_counts
+from app.utils.cache import cache_delete
+
+GAME_API_LANGS = ("kz", "ru", "en")
+
+
+def game_detail_cache_key(game_id: int, lang: str) -> str:
+    return f"game:{game_id}:{lang}"
+
+
+def game_lineup_cache_key(game_id: int, lang: str) -> str:
+    return f"game_lineup:{game_id}:{lang}"
+
+
+def game_stats_cache_key(game_id: int) -> str:
+    return f"game_stats:{game_id}"
+
+
+def game_events_cache_key(game_id: int, lang: str) -> str:
+    return f"events:{game_id}:{lang}"
+
+
+def game_h2h_cache_key(game_id: int, lang: str) -> str:
+    return f"game_h2h:{game_id}:{lang}"
+
+
+def invalidate_game_api_cache(game_id: int) -> None:
+    """Drop every cached section of one game and the /games list totals.
+
+    This process only; TTLs cover the rest.
+    """
+    invalidate_list_counts("games")
+    cache_delete(game_stats_cache_key(game_id))
+    for lang in GAME_API_LANGS:
+        cache_delete(game_detail_cache_key(game_id, lang))
+        cache_delete(game_lineup_cache_key(game_id, lang))
+        cache_delete(game_events_cache_key(game_id, lang))
+        cache_delete(game_h2h_cache_key(game_id, lang))
@@ -99,6 +99,7 @@ class GameLifecycleService:
         await self.db.commit()  # releases FOR UPDATE lock
         await set_live_flag()
         self._enqueue_telegram_start(game_id)
+        await self._refresh_derived_views(game)
 
         # 2. Best-effort sync (outside lock — these have their own commits)
         if can_sync:
@@ -164,6 +165,7 @@ class GameLifecycleService:
             game.live_phase = None
             await self.db.commit()
             self._enqueue_post_finish(game)
+            await self._refresh_derived_views(game)
             return {"game_id": game_id, "action": "finish_live", "repair_tail": True}
 
         # --- normal path: live -> finished ---
@@ -187,6 +189,7 @@ class GameLifecycleService:
 
         self._enqueue_post_finish(game)
         self._enqueue_telegram_finish(game_id)
+        await self._refresh_derived_views(game)
         return {"game_id": game_id, "action": "finish_live"}
 
     async def start_second_half(self, game_id: int) -> dict:
@@ -198,6 +201,7 @@ class GameLifecycleService:
         game.half2_started_at = utcnow()
         game.live_phase = "in_progress"
         await self.db.commit()
+        await self._refresh_derived_views(game)
         return {
             "game_id": game_id,
             "action": "start_second_half",
@@ -226,6 +230,7 @@ class GameLifecycleService:
 
         if was_finished:
             self._enqueue_aggregate_repair(game)
+        await self._refresh_derived_views(game)
 
         return {"game_id": game_id, "action": "reset_to_created"}
 
@@ -238,6 +243,7 @@ class GameLifecycleService:
         game.live_half = None
         game.live_phase = None
         await self.db.commit()
+        await self._refresh_derived_views(game)
         return {"game_id": game_id, "action": "set_postponed"}
 
     async def set_cancelled(self, game_id: int) -> dict:
@@ -249,6 +255,7 @@ class GameLifecycleService:
         game.live_half = None
         game.live_phase = None
         await self.db.commit()
+        await self._refresh_derived_views(game)
         return {"game_id": game_id, "action": "set_cancelled"}
 
     async def set_technical_defeat(self, game_id: int) -> dict:
@@ -262,6 +269,7 @@ class GameLifecycleService:
         game.live_half = None
         game.live_phase = None
         await self.db.commit()
+        await self._refresh_derived_views(game)
         return {"game_id": game_id, "action": "set_technical_defeat"}
 
     # ------------------------------------------------------------------ #
@@ -321,6 +329,18 @@ class GameLifecycleService:
                 "Failed to enqueue post_match_finish_task for game %s", game_id
             )
 
+    async def _refresh_derived_views(self, game: Game) -> None:
+        """Home-widget and season snapshots, both teams' overview aggregates (post-commit)."""
+        from app.services.home_widget_snapshots import enqueue_home_widget_refresh
+        from app.services.season_snapshots import enqueue_season_snapshot_build
+        from app.services.team_overview_aggregates import refresh_team_overview_aggregates
+
+        await enqueue_home_widget_refresh(game.season_id)
+        await enqueue_season_snapshot_build(game.season_id)
+        await refresh_team_overview_aggregates(
+            self.db, game.season_id, [game.home_team_id, game.away_team_id]
+        )
+
     @staticmethod
     def _enqueue_aggregate_repair(game: Game) -> None:
         """Log that season aggregates need manual resync after a reset.
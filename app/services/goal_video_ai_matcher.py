@@ -14,9 +14,10 @@ import logging
 from dataclasses import dataclass
 from typing import Literal
 
-import anthropic
-
 from app.config import get_settings
+from app.utils.lazy_import import lazy_module
+
+anthropic = lazy_module("anthropic")
 
 logger = logging.getLogger(__name__)
 
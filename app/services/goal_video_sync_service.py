@@ -49,7 +49,18 @@ from app.services.goal_video_ai_matcher import (
 from app.services.google_drive_client import DriveFile, get_drive_client
 from app.utils.file_urls import to_object_name
 from app.utils.goal_video_filename import parse_goal_filename
-from app.utils.video_transcode import transcode_mp4, transcode_mp4_paths
+from app.utils.video_transcode import (
+    HLS_MASTER_PLAYLIST,
+    HLS_POSTER,
+    HlsPackageResult,
+    hls_content_type,
+    hls_package_prefix,
+    hls_sibling,
+    is_hls_manifest,
+    package_hls_paths,
+    transcode_mp4,
+    transcode_mp4_paths,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -169,6 +180,12 @@ def _folder_label_for(drive_file: DriveFile) -> str | None:
     return drive_file.parent_name
 
 
+def _is_clip_root_object(object_name: str) -> bool:
+    """``goal_videos/<game>/<file>`` or an HLS package's master playlist."""
+    parts = object_name.split("/")
+    return len(parts) == 3 or (len(parts) == 4 and parts[3] == HLS_MASTER_PLAYLIST)
+
+
 async def _find_processed_record_in_storage(
     file_id: str,
 ) -> ProcessedGoalVideoRecord | None:
@@ -179,6 +196,9 @@ async def _find_processed_record_in_storage(
         client = get_minio_client()
         bucket = get_settings().minio_bucket
         for obj in client.list_objects(bucket, prefix="goal_videos/", recursive=True):
+            if not _is_clip_root_object(obj.object_name):
+                # HLS playlists, segments and posters carry no drive-file-id.
+                continue
             try:
                 stat = client.stat_object(bucket, obj.object_name)
             except Exception:
@@ -191,7 +211,10 @@ async def _find_processed_record_in_storage(
             game_id_raw = metadata.get("x-amz-meta-game-id") or metadata.get("game-id")
             try:
                 game_id = int(game_id_raw) if game_id_raw is not None else int(obj.object_name.split("/", 2)[1])
-                event_id = int(obj.object_name.rsplit("/", 1)[-1].split("-", 1)[0])
+                # Both `<game>/<event>-<hash>.mp4` and the HLS package
+                # `<game>/<event>-<hash>/master.m3u8` carry the event id in
+                # the third path segment.
+                event_id = int(obj.object_name.split("/")[2].split("-", 1)[0])
             except (IndexError, TypeError, ValueError):
                 logger.warning(
                     "processed goal-video metadata is malformed for %s",
@@ -222,7 +245,10 @@ async def _delete_goal_video_object(object_name: str | None) -> bool:
     normalized = to_object_name(object_name)
     if not normalized:
         return False
-    deleted = await FileStorageService.delete_file(normalized)
+    if is_hls_manifest(normalized):
+        deleted = await FileStorageService.delete_prefix(hls_package_prefix(normalized))
+    else:
+        deleted = await FileStorageService.delete_file(normalized)
     if not deleted:
         logger.warning("Failed to delete goal-video object %s", normalized)
     return deleted
@@ -606,6 +632,56 @@ def _object_name_from_path(event: GameEvent, drive_file: DriveFile, path: Path)
     return f"goal_videos/{event.game_id}/{event.id}-{version}.{ext}"
 
 
+def _hls_object_name(event: GameEvent, fallback_path: Path) -> str:
+    """Master-playlist object name for an HLS package.
+
+    The version hash comes from the MP4 fallback so a re-cut clip lands under
+    a fresh prefix, exactly like the single-file naming.
+    """
+    version = _content_hash_from_path(fallback_path)
+    return f"goal_videos/{event.game_id}/{event.id}-{version}/{HLS_MASTER_PLAYLIST}"
+
+
+def _parse_hls_ladder(raw: str) -> tuple[int, ...]:
+    heights: list[int] = []
+    for part in (raw or "").split(","):
+        part = part.strip()
+        if part.isdigit() and int(part) > 0:
+            heights.append(int(part))
+    return tuple(heights)
+
+
+async def _upload_hls_package(
+    package: HlsPackageResult,
+    master_object_name: str,
+    *,
+    drive_file: DriveFile,
+    event: GameEvent,
+) -> None:
+    """Upload every file of an HLS package under the master's prefix.
+
+    The master playlist goes last, so a reader never sees a manifest that
+    points at segments which aren't in MinIO yet. Only the master carries
+    the drive-file-id metadata — that's the object the storage scan in
+    ``_find_processed_record_in_storage`` must resolve to.
+    """
+    prefix = hls_package_prefix(master_object_name)
+    ordered = [f for f in package.files if f != package.master_playlist]
+    ordered.append(package.master_playlist)
+    for path in ordered:
+        relative = path.relative_to(package.output_dir).as_posix()
+        metadata = {"game-id": str(event.game_id)}
+        if path == package.master_playlist:
+            metadata["drive-file-id"] = drive_file.id
+        await FileStorageService.upload_file_from_path(
+            path,
+            object_name=prefix + relative,
+            content_type=hls_content_type(path),
+            category="goal_videos",
+            metadata=metadata,
+        )
+
+
 def _temp_suffix_for(drive_file: DriveFile) -> str:
     if "." in drive_file.name:
         return "." + drive_file.name.rsplit(".", 1)[-1].lower()
@@ -742,7 +818,25 @@ async def _download_and_link(
             return False
 
         final_path = raw_path
-        if settings.goal_video_transcode_enabled and (drive_file.mime_type or "").startswith("video/"):
+        hls_package: HlsPackageResult | None = None
+        is_video = (drive_file.mime_type or "").startswith("video/")
+        if settings.goal_video_transcode_enabled and is_video and settings.goal_video_hls_enabled:
+            try:
+                hls_package = await package_hls_paths(
+                    raw_path,
+                    tmp_dir_path / "hls",
+                    ladder=_parse_hls_ladder(settings.goal_video_hls_ladder),
+                    segment_seconds=settings.goal_video_hls_segment_seconds,
+                    crf=settings.goal_video_transcode_crf,
+                    preset=settings.goal_video_transcode_preset,
+                    threads=settings.goal_video_transcode_threads,
+                )
+            except Exception:
+                logger.exception("HLS packaging failed for %s — falling back to MP4", drive_file.id)
+            if hls_package is not None:
+                final_path = hls_package.fallback_mp4
+
+        if hls_package is None and settings.goal_video_transcode_enabled and is_video:
             try:
                 result = await transcode_mp4_paths(
                     raw_path,
@@ -757,19 +851,30 @@ async def _download_and_link(
                 logger.exception("Transcode step failed for %s — uploading original", drive_file.id)
 
         final_size = final_path.stat().st_size
-        object_name = _object_name_from_path(event, drive_file, final_path)
-        content_type = drive_file.mime_type or "video/mp4"
-        try:
-            await FileStorageService.upload_file_from_path(
-                final_path,
-                object_name=object_name,
-                content_type=content_type,
-                category="goal_videos",
-                metadata={"drive-file-id": drive_file.id, "game-id": str(event.game_id)},
-            )
-        except Exception:
-            logger.exception("MinIO upload failed for event %s", event.id)
-            return False
+        if hls_package is not None:
+            object_name = _hls_object_name(event, final_path)
+            try:
+                await _upload_hls_package(
+                    hls_package, object_name, drive_file=drive_file, event=event,
+                )
+            except Exception:
+                logger.exception("MinIO HLS upload failed for event %s", event.id)
+                await FileStorageService.delete_prefix(hls_package_prefix(object_name))
+                return False
+        else:
+            object_name = _object_name_from_path(event, drive_file, final_path)
+            content_type = drive_file.mime_type or "video/mp4"
+            try:
+                await FileStorageService.upload_file_from_path(
+                    final_path,
+                    object_name=object_name,
+                    content_type=content_type,
+                    category="goal_videos",
+                    metadata={"drive-file-id": drive_file.id, "game-id": str(event.game_id)},
+                )
+            except Exception:
+                logger.exception("MinIO upload failed for event %s", event.id)
+                return False
 
         previous_object_name = await _detach_previous_record(
             db, event, object_name,
@@ -779,6 +884,11 @@ async def _download_and_link(
         )
 
         event.video_url = object_name
+        event.video_poster_url = (
+            hls_sibling(object_name, HLS_POSTER)
+            if hls_package is not None and hls_package.poster is not None
+            else None
+        )
         await db.commit()
 
         if previous_object_name:
@@ -842,6 +952,7 @@ async def _detach_previous_record(
     attached_object_name = to_object_name(previous_event.video_url)
     if attached_object_name == previous_record.object_name:
         previous_event.video_url = None
+        previous_event.video_poster_url = None
         return previous_record.object_name
 
     logger.warning(
@@ -913,6 +1024,7 @@ async def _download_and_link_legacy_bytes(
     )
 
     event.video_url = object_name
+    event.video_poster_url = None
     await db.commit()
 
     if previous_object_name:
@@ -26,10 +26,10 @@ from sqlalchemy.orm import selectinload
 
 from app.models import Game, GameBroadcaster, GameStatus, Season
 from app.schemas.game import HomeMatchesWidgetResponse
+from app.services.reference_data import get_reference_snapshot
 from app.services.season_filters import get_final_stage_ids, get_group_team_ids
 from app.services.season_visibility import is_season_visible_clause
 from app.utils.game_grouping import group_games_by_date
-from app.utils.has_stats import enrich_games_has_stats
 from app.utils.timestamps import to_almaty
 
 logger = logging.getLogger(__name__)
@@ -104,11 +104,9 @@ def _is_playable(
         return False
     return True
 
+# Teams and stadiums are joined from the reference snapshot when grouping.
 _EAGER_OPTIONS = (
-    selectinload(Game.home_team),
-    selectinload(Game.away_team),
     selectinload(Game.season),
-    selectinload(Game.stadium_rel),
     selectinload(Game.stage),
     selectinload(Game.broadcasters).selectinload(GameBroadcaster.broadcaster),
 )
@@ -208,10 +206,10 @@ async def _get_widget_week(
 
     if week_in_progress and anchor_kicked_off:
         # Matchday week is alive — keep the whole anchor week in upcoming.
-        upcoming_groups = _group_widget_games(
-            _by_kickoff(anchor_terminal + anchor_playable_unfinished), lang,
+        upcoming_groups = await _group_widget_games(
+            db, _by_kickoff(anchor_terminal + anchor_playable_unfinished), lang,
         )
-        finished_groups = _group_widget_games(_by_kickoff(prev_terminal), lang)
+        finished_groups = await _group_widget_games(db, _by_kickoff(prev_terminal), lang)
         window_state = "active_round"
         default_tab = "upcoming"
         completed_expires = None
@@ -222,9 +220,9 @@ async def _get_widget_week(
         # post-match window. The upcoming round rides in the upcoming tab so
         # both tabs stay available.
         completed_expires = _completion_expires_for_terminal(prev_terminal, now)
-        finished_groups = _group_widget_games(_by_kickoff(prev_terminal), lang)
-        upcoming_groups = _group_widget_games(
-            _by_kickoff(anchor_terminal + anchor_playable_unfinished), lang,
+        finished_groups = await _group_widget_games(db, _by_kickoff(prev_terminal), lang)
+        upcoming_groups = await _group_widget_games(
+            db, _by_kickoff(anchor_terminal + anchor_playable_unfinished), lang,
         )
         if completed_expires is not None:
             window_state = "completed_window"
@@ -241,8 +239,8 @@ async def _get_widget_week(
         )
         if completed_expires is None:
             return await _fallback(db, season_id, frontend_code, lang)
-        finished_groups = _group_widget_games(
-            _by_kickoff(prev_terminal + anchor_terminal), lang,
+        finished_groups = await _group_widget_games(
+            db, _by_kickoff(prev_terminal + anchor_terminal), lang,
         )
         upcoming_groups = []
         window_state = "completed_window"
@@ -328,8 +326,6 @@ async def _load_date_range(
         .order_by(Game.date.asc(), Game.time.asc())
     )
     games = list(result.scalars().all())
-    if games:
-        await enrich_games_has_stats(db, games)
     return games
 
 
@@ -400,10 +396,15 @@ def _tour_is_fully_terminal(games: list[Game], today: date | None = None) -> boo
     return all(g.status in TERMINAL_STATUSES for g in playable)
 
 
-def _group_widget_games(games: list[Game], lang: str):
+async def _group_widget_games(db: AsyncSession, games: list[Game], lang: str):
     if not games:
         return []
-    return group_games_by_date(games, lang, status_mode="home_widget")
+    refs = await get_reference_snapshot(
+        db,
+        teams=[tid for g in games for tid in (g.home_team_id, g.away_team_id)],
+        stadiums=[g.stadium_id for g in games],
+    )
+    return group_games_by_date(games, lang, status_mode="home_widget", refs=refs)
 
 
 async def _resolve_season(db: AsyncSession, frontend_code: str) -> Season | None:
@@ -479,9 +480,7 @@ async def _fallback(
             .limit(10)
         )
         games = list(result.scalars().all())
-    if games:
-        await enrich_games_has_stats(db, games)
-    groups = _group_widget_games(games, lang)
+    groups = await _group_widget_games(db, games, lang)
     return HomeMatchesWidgetResponse(
         frontend_code=frontend_code,
         season_id=season_id,
@@ -548,8 +547,6 @@ async def _load_tours_for_group(
         .order_by(Game.date.asc(), Game.time.asc())
     )
     games = list(result.scalars().all())
-    if games:
-        await enrich_games_has_stats(db, games)
     return games
 
 
@@ -575,7 +572,7 @@ async def _rule0_first_upcoming_group(
         return _empty(frontend_code, season_id)
     first_tour = int(first_tour)
     games = await _load_tours_for_group(db, season_id, [first_tour], team_ids)
-    upcoming_groups = _group_widget_games(games, lang)
+    upcoming_groups = await _group_widget_games(db, games, lang)
     return HomeMatchesWidgetResponse(
         frontend_code=frontend_code,
         season_id=season_id,
@@ -629,11 +626,11 @@ async def _get_widget_group(
         g.status not in TERMINAL_STATUSES and _is_playable(g, today, hint_tour_anchor)
         for g in hint_games
     ):
-        finished_groups = _group_widget_games(
-            previous_tour_games if _tour_is_fully_terminal(previous_tour_games, today) else [],
+        finished_groups = await _group_widget_games(
+            db, previous_tour_games if _tour_is_fully_terminal(previous_tour_games, today) else [],
             lang,
         )
-        upcoming_groups = _group_widget_games(hint_games, lang)
+        upcoming_groups = await _group_widget_games(db, hint_games, lang)
         return HomeMatchesWidgetResponse(
             frontend_code=frontend_code,
             season_id=season_id,
@@ -650,11 +647,11 @@ async def _get_widget_group(
     # Rule 2: current tour completed, next tour exists
     completed_window_expires_at = _recent_completion_expires(hint_games, now, today)
     if next_games:
-        finished_groups = _group_widget_games(
-            hint_games if _tour_is_fully_terminal(hint_games, today) else [],
+        finished_groups = await _group_widget_games(
+            db, hint_games if _tour_is_fully_terminal(hint_games, today) else [],
             lang,
         )
-        upcoming_groups = _group_widget_games(next_games, lang)
+        upcoming_groups = await _group_widget_games(db, next_games, lang)
         in_completed_window = completed_window_expires_at is not None
         return HomeMatchesWidgetResponse(
             frontend_code=frontend_code,
@@ -671,7 +668,7 @@ async def _get_widget_group(
 
     # Rule 3: no next tour yet, keep finished tour for 24h
     if completed_window_expires_at is not None:
-        finished_groups = _group_widget_games(hint_games, lang)
+        finished_groups = await _group_widget_games(db, hint_games, lang)
         return HomeMatchesWidgetResponse(
             frontend_code=frontend_code,
             season_id=season_id,
@@ -712,14 +709,13 @@ async def _get_widget_final(
     games = list(result.scalars().all())
     if not games:
         return _empty(frontend_code, season_id)
-    await enrich_games_has_stats(db, games)
 
     now = _now_almaty()
     finished = _finished_games(games)
     unfinished = _unfinished_games(games)
 
-    finished_groups = _group_widget_games(finished, lang)
-    upcoming_groups = _group_widget_games(unfinished, lang)
+    finished_groups = await _group_widget_games(db, finished, lang)
+    upcoming_groups = await _group_widget_games(db, unfinished, lang)
 
     has_finished = bool(finished)
     has_upcoming = bool(unfinished)
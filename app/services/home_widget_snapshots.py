@@ -0,0 +1,213 @@
+"""Precomputed home-widget responses.
+
+``get_home_widget`` runs several queries plus the tour heuristics on every
+call, and the homepage is the busiest page we serve. The widget only changes
+when a game of the season changes status or score (or its live minute), when
+a completed window closes, or when the Almaty date rolls over — so it is
+computed in the background and stored in Redis as ready-to-serve JSON bytes,
+one entry per (frontend_code, group, lang). ``read_home_widget`` is the
+request path: one Redis GET.
+
+Each snapshot carries an explicit freshness horizon (``snapshot_ttl``):
+
+- completed window: until ``completed_window_expires_at`` (the 48h window
+  from ``_completion_expires_for_terminal`` / ``_recent_completion_expires``);
+- a live game on the widget: ``LIVE_SNAPSHOT_TTL`` (live sync also refreshes
+  after every pass);
+- otherwise: the next Almaty midnight, capped at ``MAX_SNAPSHOT_TTL`` to bound
+  staleness after writers that do not trigger a refresh (FCMS reschedules).
+
+Redis keeps an entry ``REFRESH_LEAD`` seconds past its horizon; the
+per-minute beat refreshes entries inside that lead, so readers keep hitting
+a snapshot while it is replaced. Lifecycle transitions, live sync and admin
+game edits call ``enqueue_home_widget_refresh(season_id)`` (debounced per
+season). A miss (cold Redis, Redis down) computes inline once per process
+and key, like the old per-request cache.
+"""
+
+import logging
+from collections.abc import Iterable
+from datetime import datetime, time as time_type, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Season
+from app.schemas.game import HomeMatchesWidgetResponse
+from app.services import home_matches
+from app.utils.cache import cache_get_or_compute
+
+logger = logging.getLogger(__name__)
+
+HOME_WIDGET_LANGS = ("kz", "ru", "en")
+# frontend_code -> group variants the homepage requests (2L renders per group + final).
+HOME_WIDGET_VARIANTS: dict[str, tuple[str | None, ...]] = {
+    "pl": (None,),
+    "1l": (None,),
+    "el": (None,),
+    "2l": (None, "A", "B", "final"),
+}
+
+SNAPSHOT_KEY_PREFIX = "qfl:home_widget"
+_REFRESH_PENDING_PREFIX = "qfl:home_widget_refresh"
+LIVE_SNAPSHOT_TTL = 30
+MAX_SNAPSHOT_TTL = 3600
+REFRESH_LEAD = 90
+_REFRESH_PENDING_TTL = 30
+_REFRESH_COUNTDOWN = 1
+# In-process fallback when Redis has no entry.
+_LOCAL_TTL = 10
+
+
+def home_widget_snapshot_key(frontend_code: str, group: str | None, lang: str) -> str:
+    return f"{SNAPSHOT_KEY_PREFIX}:{frontend_code}:{group or ''}:{lang}"
+
+
+def snapshot_ttl(widget: HomeMatchesWidgetResponse, now: datetime) -> int:
+    """Seconds ``widget`` stays correct when nothing on it changes."""
+    if widget.window_state == "completed_window" and widget.completed_window_expires_at:
+        seconds = (widget.completed_window_expires_at - now).total_seconds()
+    elif any(g.status == "live" for group in widget.groups for g in group.games):
+        seconds = LIVE_SNAPSHOT_TTL
+    else:
+        midnight = datetime.combine(
+            now.date() + timedelta(days=1), time_type(0), tzinfo=home_matches.ALMATY_TZ,
+        )
+        seconds = (midnight - now).total_seconds()
+    return max(1, min(MAX_SNAPSHOT_TTL, int(seconds)))
+
+
+async def _redis():
+    try:
+        from app.utils.live_flag import get_redis
+
+        return await get_redis()
+    except Exception:
+        return None
+
+
+async def build_home_widget_snapshot(
+    db: AsyncSession, frontend_code: str, group: str | None, lang: str,
+) -> tuple[bytes, int]:
+    widget = await home_matches.get_home_widget(db, frontend_code, lang, group=group)
+    return widget.model_dump_json().encode(), snapshot_ttl(widget, home_matches._now_almaty())
+
+
+async def _store(key: str, body: bytes, ttl: int) -> None:
+    redis = await _redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(key, body, ex=ttl + REFRESH_LEAD)
+    except Exception:
+        logger.debug("home widget snapshot write failed for %s", key, exc_info=True)
+
+
+async def _is_due(redis, key: str) -> bool:
+    """Missing, or past its freshness horizon (inside the refresh lead)."""
+    try:
+        return await redis.ttl(key) <= REFRESH_LEAD
+    except Exception:
+        return True
+
+
+async def read_home_widget(
+    db: AsyncSession, frontend_code: str, lang: str, *, group: str | None = None,
+) -> bytes:
+    """Ready-to-serve widget JSON: the snapshot, or an inline build on a miss."""
+    key = home_widget_snapshot_key(frontend_code, group, lang)
+    redis = await _redis()
+    if redis is not None:
+        try:
+            body = await redis.get(key)
+        except Exception:
+            body = None
+        if body is not None:
+            return body
+
+    async def _compute() -> bytes:
+        body, ttl = await build_home_widget_snapshot(db, frontend_code, group, lang)
+        await _store(key, body, ttl)
+        return body
+
+    # Coalesces concurrent misses and shields the DB while Redis is down.
+    return await cache_get_or_compute(
+        f"home_widget:{frontend_code}:{group or ''}:{lang}", ttl=_LOCAL_TTL, compute=_compute,
+    )
+
+
+async def frontend_codes_for_season(db: AsyncSession, season_id: int) -> list[str]:
+    code = (
+        await db.execute(select(Season.frontend_code).where(Season.id == season_id))
+    ).scalar_one_or_none()
+    return [code] if code in HOME_WIDGET_VARIANTS else []
+
+
+async def refresh_home_widgets(
+    db: AsyncSession,
+    frontend_codes: Iterable[str] | None = None,
+    *,
+    only_due: bool = False,
+) -> int:
+    """Rebuild and store widget snapshots; returns how many were written.
+
+    ``only_due`` skips entries that are still inside their freshness
+    horizon (the per-minute beat).
+    """
+    redis = await _redis() if only_due else None
+    written = 0
+    for frontend_code in frontend_codes if frontend_codes is not None else HOME_WIDGET_VARIANTS:
+        for group in HOME_WIDGET_VARIANTS.get(frontend_code, (None,)):
+            for lang in HOME_WIDGET_LANGS:
+                key = home_widget_snapshot_key(frontend_code, group, lang)
+                if redis is not None and not await _is_due(redis, key):
+                    continue
+                try:
+                    body, ttl = await build_home_widget_snapshot(db, frontend_code, group, lang)
+                except Exception:
+                    logger.exception("home widget snapshot failed for %s", key)
+                    await db.rollback()
+                    continue
+                await _store(key, body, ttl)
+                written += 1
+    return written
+
+
+def _pending_key(season_id: int | None) -> str:
+    return f"{_REFRESH_PENDING_PREFIX}:{season_id if season_id is not None else 'all'}"
+
+
+async def clear_refresh_pending(season_id: int | None) -> None:
+    """Called by the refresh task before it reads, so later changes enqueue again."""
+    redis = await _redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(_pending_key(season_id))
+    except Exception:
+        pass
+
+
+async def enqueue_home_widget_refresh(season_id: int | None = None) -> None:
+    """Schedule a snapshot rebuild for the season's frontend code (all codes for ``None``).
+
+    Debounced: while a refresh for the season is queued, further calls are
+    no-ops. Never raises — a lost refresh only costs freshness up to the
+    snapshot's horizon.
+    """
+    redis = await _redis()
+    if redis is None:
+        return
+    try:
+        if not await redis.set(_pending_key(season_id), "1", nx=True, ex=_REFRESH_PENDING_TTL):
+            return
+    except Exception:
+        # The Celery broker is this Redis: enqueueing would fail as well.
+        logger.debug("home widget refresh not enqueued: redis unavailable", exc_info=True)
+        return
+    try:
+        from app.tasks.live_tasks import refresh_home_widgets_task
+
+        refresh_home_widgets_task.apply_async(args=[season_id], countdown=_REFRESH_COUNTDOWN)
+    except Exception:
+        logger.exception("Failed to enqueue home widget refresh for season %s", season_id)
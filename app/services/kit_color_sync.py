@@ -30,8 +30,10 @@ from typing import Callable, Iterable
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import aliased
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.models import Game, Team
+from app.utils.bulk_write import bulk_update
 
 logger = logging.getLogger(__name__)
 
@@ -76,10 +78,16 @@ def normalize_team_name(name: str | None) -> str:
     return TEAM_NAME_ALIASES.get(s, s)
 
 
-async def _games_on(db: AsyncSession, on_date: date) -> list[tuple[Game, str, str]]:
+async def _games_on(
+    db: AsyncSession,
+    on_date: date,
+    day_cache: dict[date, list[tuple[Game, str, str]]] | None = None,
+) -> list[tuple[Game, str, str]]:
+    if day_cache is not None and on_date in day_cache:
+        return day_cache[on_date]
     home_t = aliased(Team)
     away_t = aliased(Team)
-    return list(
+    rows = list(
         (
             await db.execute(
                 select(Game, home_t.name, away_t.name)
@@ -89,6 +97,9 @@ async def _games_on(db: AsyncSession, on_date: date) -> list[tuple[Game, str, st
             )
         ).all()
     )
+    if day_cache is not None:
+        day_cache[on_date] = rows
+    return rows
 
 
 async def match_game(
@@ -98,6 +109,7 @@ async def match_game(
     home_name: str,
     away_name: str,
     match_time: time | None = None,
+    day_cache: dict[date, list[tuple[Game, str, str]]] | None = None,
 ) -> Game | None:
     """Find the QFL :class:`Game` for an apps fixture.
 
@@ -106,6 +118,7 @@ async def match_game(
     date, which can drift by a day after postponements) — but only accepts a
     ±1-day result when it is unambiguous across both neighbouring days.  Returns
     ``None`` (without raising) when there is no unambiguous match.
+    ``day_cache`` (optional) memoises the per-date game lookups across calls.
     """
     home_norm = normalize_team_name(home_name)
     away_norm = normalize_team_name(away_name)
@@ -120,7 +133,7 @@ async def match_game(
             and normalize_team_name(away_db_name) == away_norm
         ]
 
-    candidates = _filter(await _games_on(db, match_date))
+    candidates = _filter(await _games_on(db, match_date, day_cache))
 
     if not candidates:
         # ±1 day fallback (postponements). Require a single match overall.
@@ -128,7 +141,9 @@ async def match_game(
 
         neighbour: list[Game] = []
         for delta in (-1, 1):
-            neighbour.extend(_filter(await _games_on(db, match_date + timedelta(days=delta))))
+            neighbour.extend(
+                _filter(await _games_on(db, match_date + timedelta(days=delta), day_cache))
+            )
         if len(neighbour) == 1:
             return neighbour[0]
         return None
@@ -224,17 +239,27 @@ def apply_kit_color(
 
     ``allow_overwrite=False`` only fills the field when it is currently empty.
     """
-    if not is_hex_color(hex_color):
+    change = _kit_color_change(game, side, hex_color, allow_overwrite=allow_overwrite)
+    if change is None:
         return False
+    setattr(game, *change)
+    return True
+
+
+def _kit_color_change(
+    game: Game, side: Side, hex_color: str | None, *, allow_overwrite: bool
+) -> tuple[str, str] | None:
+    """``(attribute, normalised HEX)`` that :func:`apply_kit_color` would set, or None."""
+    if not is_hex_color(hex_color):
+        return None
     hex_color = hex_color.strip().upper()
     attr = "home_kit_color" if side == "home" else "away_kit_color"
     current = getattr(game, attr)
     if current == hex_color:
-        return False
+        return None
     if current and not allow_overwrite:
-        return False
-    setattr(game, attr, hex_color)
-    return True
+        return None
+    return attr, hex_color
 
 
 # ---------------------------------------------------------------------------
@@ -294,13 +319,17 @@ async def sync_kits_for_matches(
 
     ``fetch_png(filename)`` returns the PNG bytes (or ``None``).  HEX results are
     cached per image filename so a colour is computed once even when many
-    matches reuse the same kit.  When ``dry_run`` is True nothing is committed
+    matches reuse the same kit.  Games are looked up once per date and the
+    colours are written with one bulk UPDATE at the end.  When ``dry_run`` is
+    True nothing is committed
     and the DB session is rolled back at the end.  ``on_match`` (optional) is
     called for every record with ``(record, game_or_None, home_hex, away_hex)``
     — used by the import script to print a report.
     """
     result = SyncResult()
     hex_cache: dict[str, str | None] = {}
+    day_cache: dict[date, list[tuple[Game, str, str]]] = {}
+    pending: dict[int, dict] = {}
 
     def _hex_for(image: str | None) -> str | None:
         if not image:
@@ -329,6 +358,7 @@ async def sync_kits_for_matches(
             home_name=rec.home_name,
             away_name=rec.away_name,
             match_time=rec.match_time,
+            day_cache=day_cache,
         )
         if on_match is not None:
             on_match(rec, game, home_hex, away_hex)
@@ -341,10 +371,15 @@ async def sync_kits_for_matches(
         result.matched_games += 1
 
         changed = False
-        if apply_kit_color(game, "home", home_hex, allow_overwrite=allow_overwrite):
-            changed = True
-            result.colors_set += 1
-        if apply_kit_color(game, "away", away_hex, allow_overwrite=allow_overwrite):
+        for side, hex_color in (("home", home_hex), ("away", away_hex)):
+            change = _kit_color_change(game, side, hex_color, allow_overwrite=allow_overwrite)
+            if change is None:
+                continue
+            attr, value = change
+            # Reflect the colour on the instance without dirtying it — the
+            # write happens in bulk below, not as one UPDATE per flush.
+            set_committed_value(game, attr, value)
+            pending.setdefault(game.id, {"id": game.id})[attr] = value
             changed = True
             result.colors_set += 1
         if changed:
@@ -353,5 +388,6 @@ async def sync_kits_for_matches(
     if dry_run:
         await db.rollback()
     else:
+        await bulk_update(db, Game, pending.values())
         await db.commit()
     return result
@@ -0,0 +1,58 @@
+"""Cached totals for paginated public lists.
+
+``/games``, ``/players``, ``/news`` and ``/seasons/{id}/player-stats`` return
+``total`` next to each page. Counting re-runs the page's filters over the
+whole table, on every page a crawler requests; the total only changes when
+the underlying rows do. Counts are cached per (list, filter signature).
+
+``invalidate_list_counts(list_name)`` starts a new generation for that
+list, so admin writes take effect at once in the process that made them;
+other workers and sync tasks are covered by ``LIST_COUNT_TTL``. Free-text
+filters (search) are unbounded, so those totals use ``count_rows`` directly
+and stay out of the shared cache.
+"""
+
+import hashlib
+import json
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import Select
+
+from app.utils.cache import cache_get_or_compute
+
+LIST_COUNT_TTL = 120
+
+_generations: dict[str, int] = {}
+
+
+def list_count_cache_key(list_name: str, filters: dict) -> str:
+    signature = json.dumps(filters, sort_keys=True, default=str, separators=(",", ":"))
+    digest = hashlib.sha1(signature.encode()).hexdigest()[:16]
+    return f"list_count:{list_name}:{_generations.get(list_name, 0)}:{digest}"
+
+
+async def count_rows(db: AsyncSession, query: Select) -> int:
+    """Uncached ``count(*)`` of ``query``."""
+    count_query = select(func.count()).select_from(query.order_by(None).subquery())
+    return (await db.execute(count_query)).scalar() or 0
+
+
+async def cached_count(db: AsyncSession, list_name: str, query: Select, **filters) -> int:
+    """``count(*)`` of ``query``, cached under ``filters``.
+
+    ``filters`` must hold every parameter that shapes ``query``'s WHERE
+    clause (including implicit ones such as today's date).
+    """
+
+    async def _compute() -> bytes:
+        return str(await count_rows(db, query)).encode()
+
+    key = list_count_cache_key(list_name, filters)
+    return int(await cache_get_or_compute(key, ttl=LIST_COUNT_TTL, compute=_compute))
+
+
+def invalidate_list_counts(*list_names: str) -> None:
+    """Drop cached totals of the given lists (this process only; the TTL covers the rest)."""
+    for name in list_names:
+        _generations[name] = _generations.get(name, 0) + 1
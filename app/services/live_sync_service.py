@@ -18,10 +18,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.models import Game, GameEvent, GameEventType, GameLineup, GamePlayerStats, GameTeamStats, GameStatus, LineupType, Team, Player, PlayerTeam
+from app.services.player_identity import PlayerIdentityIndex, sota_ids_of
 from app.services.sota_client import SotaClient
 from app.services.sync.lineup_sync import LineupSyncService
 from app.services.telegram import send_telegram_message
 from app.utils.game_event_assists import is_assist_supported_event_type, sync_event_assist
+from app.utils.has_stats import mark_has_stats
 from app.utils.live_flag import get_redis
 from app.utils.team_name_matcher import TeamNameMatcher
 from app.utils.timestamps import combine_almaty_local_to_utc, ensure_utc, utcnow
@@ -70,6 +72,13 @@ class LiveSyncService:
     def __init__(self, db: AsyncSession, client: SotaClient):
         self.db = db
         self.client = client
+        self._identity: PlayerIdentityIndex | None = None
+
+    def _player_index(self, *, fresh: bool = False) -> PlayerIdentityIndex:
+        """Player identity index of the current sync run (``fresh`` starts a new run)."""
+        if fresh or self._identity is None:
+            self._identity = PlayerIdentityIndex()
+        return self._identity
 
     async def get_games_to_start(self) -> list[Game]:
         """Get games whose scheduled start time is within 1 min ahead or up to 30 min ago."""
@@ -240,6 +249,7 @@ class LiveSyncService:
         fcms_protected = game.lineup_source == "fcms"
         sota_uuid = str(game.sota_id)
         total_lineup = 0
+        index = self._player_index(fresh=True)
         synced_player_ids: dict[int, set[int]] = {}
 
         for side, team_id in (("home", game.home_team_id), ("away", game.away_team_id)):
@@ -268,6 +278,9 @@ class LiveSyncService:
 
             # Extract starters and substitutes using ОСНОВНЫЕ/ЗАПАСНЫЕ markers
             starters, substitutes = self._extract_players(live_data)
+            await index.load_sota_ids(self.db, sota_ids_of(starters + substitutes))
+            if game.season_id:
+                await index.load_rosters(self.db, game.season_id, [team_id])
 
             if fcms_protected:
                 # FCMS lineup is authoritative — only enrich existing records
@@ -307,6 +320,9 @@ class LiveSyncService:
                         )
                     )
             game.lineup_source = "sota_live"
+            if total_lineup:
+                # Same transaction as the rows, like the pregame lineup sync.
+                game.has_lineup = True
         await self.db.commit()
 
         return {
@@ -369,14 +385,14 @@ class LiveSyncService:
             except (ValueError, TypeError):
                 return
             # Check sota_id isn't already used by another player
-            existing = await self.db.execute(
-                select(Player.id).where(Player.sota_id == sota_id)
-            )
-            if existing.scalar_one_or_none() is not None:
+            index = self._player_index()
+            await index.load_sota_ids(self.db, [sota_id])
+            if index.by_sota_id(sota_id) is not None:
                 return
             player = await self.db.get(Player, lineup_row.player_id)
             if player and not player.sota_id:
                 player.sota_id = sota_id
+                index.put(player)
                 logger.info(
                     "Backfilled sota_id for player %s %s (id=%d) from FCMS lineup",
                     player.first_name, player.last_name, player.id,
@@ -456,31 +472,25 @@ class LiveSyncService:
         except (ValueError, TypeError):
             return None
 
-        # Step 1: поиск по sota_id
-        result = await self.db.execute(select(Player).where(Player.sota_id == sota_id))
-        player = result.scalar_one_or_none()
+        # Step 1: поиск по sota_id (индекс обычно уже прогрет вызывающим sync-методом)
+        index = self._player_index()
+        await index.load_sota_ids(self.db, [sota_id])
+        player_id = index.by_sota_id(sota_id)
+        if player_id is not None:
+            return player_id
 
-        if player is not None:
-            return player.id
+        if team_id and season_id:
+            await index.load_rosters(self.db, season_id, [team_id])
 
         # Step 2: поиск по имени в составе команды/сезона.
         # Если игрок создан вручную без sota_id — привязываем его sota_id вместо создания дубля.
         if team_id and season_id and (first_name or last_name):
-            result = await self.db.execute(
-                select(Player)
-                .join(PlayerTeam, PlayerTeam.player_id == Player.id)
-                .where(
-                    PlayerTeam.team_id == team_id,
-                    PlayerTeam.season_id == season_id,
-                    Player.last_name == (last_name or ""),
-                    Player.first_name == (first_name or ""),
-                    Player.sota_id.is_(None),
-                )
-            )
-            existing = result.scalar_one_or_none()
-            if existing is not None:
+            player_id = index.find_unlinked_in_roster(team_id, season_id, first_name, last_name)
+            if player_id is not None:
+                existing = await self.db.get(Player, player_id)
                 existing.sota_id = sota_id
                 await self.db.flush()
+                index.put(existing)
                 logger.info("Linked sota_id to existing player %s (id=%s) by name", f"{first_name} {last_name}", existing.id)
                 return existing.id
 
@@ -494,22 +504,13 @@ class LiveSyncService:
         # совпадает с last_name/last_name_kz/last_name_en у игрока — SOTA
         # периодически меняет UUID игроков (дубликаты на их стороне).
         if shirt_number and team_id and season_id:
-            result = await self.db.execute(
-                select(Player)
-                .join(PlayerTeam, PlayerTeam.player_id == Player.id)
-                .where(
-                    PlayerTeam.team_id == team_id,
-                    PlayerTeam.season_id == season_id,
-                    PlayerTeam.number == shirt_number,
-                    PlayerTeam.is_active == True,  # noqa: E712
-                    PlayerTeam.is_hidden == False,  # noqa: E712
-                )
-            )
-            existing = result.scalars().first()
+            player_id = index.find_by_number(team_id, season_id, shirt_number)
+            existing = await self.db.get(Player, player_id) if player_id is not None else None
             if existing is not None:
                 if existing.sota_id is None:
                     existing.sota_id = sota_id
                     await self.db.flush()
+                    index.put(existing)
                     logger.info(
                         "Linked sota_id to existing player %s (id=%s) by shirt number %s",
                         f"{existing.first_name} {existing.last_name}", existing.id, shirt_number,
@@ -519,6 +520,7 @@ class LiveSyncService:
                     old_sota_id = existing.sota_id
                     existing.sota_id = sota_id
                     await self.db.flush()
+                    index.put(existing)
                     logger.warning(
                         "Rewrote sota_id for player %s (id=%s): %s → %s "
                         "(matched by team=%s season=%s number=%s + last_name)",
@@ -841,6 +843,7 @@ class LiveSyncService:
             game.away_score = max(0, away_score - shootout_away)
 
         # Upsert stats for each team
+        teams_upserted = 0
         for side, team_id in (("home", game.home_team_id), ("away", game.away_team_id)):
             if not team_id:
                 continue
@@ -910,7 +913,10 @@ class LiveSyncService:
                 set_={k: v for k, v in values.items() if k not in ("game_id", "team_id")},
             )
             await self.db.execute(stmt)
+            teams_upserted += 1
 
+        if teams_upserted:
+            await mark_has_stats(self.db, game_id)
         await self.db.commit()
 
         return {
@@ -951,6 +957,7 @@ class LiveSyncService:
         amplua_map = {row.player_id: row.amplua for row in lineup_result.all()}
 
         total_upserted = 0
+        index = self._player_index(fresh=True)
 
         for side, team_id in (("home", game.home_team_id), ("away", game.away_team_id)):
             if not team_id:
@@ -968,6 +975,10 @@ class LiveSyncService:
             if not isinstance(players_data, list):
                 continue
 
+            await index.load_sota_ids(self.db, sota_ids_of(players_data))
+            if game.season_id:
+                await index.load_rosters(self.db, game.season_id, [team_id])
+
             for ep in players_data:
                 sota_id_raw = ep.get("id")
                 if not sota_id_raw:
@@ -1045,6 +1056,8 @@ class LiveSyncService:
                 await self.db.execute(stmt)
                 total_upserted += 1
 
+        if total_upserted:
+            await mark_has_stats(self.db, game_id)
         await self.db.commit()
         return {"game_id": game_id, "players_upserted": total_upserted}
 
@@ -1094,6 +1107,8 @@ class LiveSyncService:
 
         Returns dict with added/updated/deleted counts.
         """
+        self._player_index(fresh=True)
+
         # Load all existing events
         result = await self.db.execute(
             select(GameEvent).where(GameEvent.game_id == game_id)
@@ -1381,13 +1396,9 @@ class LiveSyncService:
         if not player_id:
             return None
 
-        result = await self.db.execute(
-            select(GameLineup.team_id).where(
-                GameLineup.game_id == game_id,
-                GameLineup.player_id == player_id,
-            )
-        )
-        team_ids = {team_id for team_id in result.scalars().all() if team_id is not None}
+        index = self._player_index()
+        await index.load_lineup(self.db, game_id)
+        team_ids = index.lineup_team_ids(game_id, player_id)
         if len(team_ids) == 1:
             return next(iter(team_ids))
         return None
@@ -1448,22 +1459,9 @@ class LiveSyncService:
         if not first_name and not last_name:
             return None
 
-        name_match = self._player_name_match_clause(first_name, last_name)
-
-        query = (
-            select(Player.id)
-            .join(GameLineup, GameLineup.player_id == Player.id)
-            .where(GameLineup.game_id == game_id, name_match)
-        )
-
-        if team_id:
-            query = query.where(GameLineup.team_id == team_id)
-
-        result = await self.db.execute(query)
-        player_ids = {player_id for player_id in result.scalars().all() if player_id is not None}
-        if len(player_ids) == 1:
-            return next(iter(player_ids))
-        return None
+        index = self._player_index()
+        await index.load_lineup(self.db, game_id)
+        return index.find_in_lineup(game_id, first_name, last_name, team_id or None)
 
     async def start_live_tracking(self, game_id: int) -> dict:
         """Start live tracking for a game."""
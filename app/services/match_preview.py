@@ -3,7 +3,6 @@
 import logging
 from datetime import datetime
 
-import anthropic
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -15,6 +14,9 @@ from app.models import Game, GameStatus, Team, Stadium
 from app.models.team_season_stats import TeamSeasonStats
 from app.models.score_table import ScoreTable
 from app.services.weather import format_weather
+from app.utils.lazy_import import lazy_module
+
+anthropic = lazy_module("anthropic")
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -9,10 +9,11 @@ import re
 from dataclasses import dataclass
 from typing import Sequence
 
-from openai import AsyncOpenAI
-
 from app.config import get_settings
 from app.models.news import ArticleType, News
+from app.utils.lazy_import import lazy_module
+
+openai = lazy_module("openai")
 
 logger = logging.getLogger(__name__)
 
@@ -89,9 +90,9 @@ class NewsClassifierService:
         settings = get_settings()
         self.model = settings.openai_model
         self._openai_enabled = bool(settings.openai_api_key)
-        self.client: AsyncOpenAI | None = None
+        self.client: openai.AsyncOpenAI | None = None
         if self._openai_enabled:
-            self.client = AsyncOpenAI(
+            self.client = openai.AsyncOpenAI(
                 api_key=settings.openai_api_key,
                 max_retries=settings.openai_max_retries,
                 timeout=settings.openai_timeout,
@@ -5,9 +5,10 @@ from __future__ import annotations
 import logging
 from typing import Literal
 
-from openai import AsyncOpenAI
-
 from app.config import get_settings
+from app.utils.lazy_import import lazy_module
+
+openai = lazy_module("openai")
 
 logger = logging.getLogger(__name__)
 
@@ -51,9 +52,9 @@ class NewsTranslatorService:
         settings = get_settings()
         self._enabled = bool(settings.openai_api_key)
         self._model = settings.openai_model
-        self._client: AsyncOpenAI | None = None
+        self._client: openai.AsyncOpenAI | None = None
         if self._enabled:
-            self._client = AsyncOpenAI(
+            self._client = openai.AsyncOpenAI(
                 api_key=settings.openai_api_key,
                 max_retries=settings.openai_max_retries,
                 timeout=120,  # translations can be slow for long articles
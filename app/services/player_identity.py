@@ -0,0 +1,316 @@
+"""In-memory player identity index shared by roster and event matching.
+
+FCMS roster sync, SOTA live/lineup sync and SOTA stats sync all resolve
+external player references (FCMS person id, SOTA id, names in three locales,
+date of birth, shirt number in a team-season) to local players. Doing that
+with per-reference SELECTs cost up to five queries per unmatched FCMS player
+and one to three per SOTA lineup/stats entry.
+
+``PlayerIdentityIndex`` loads the identity columns once per sync run and
+answers lookups from dicts. Callers keep it current as they link or create
+players (``put`` / ``put_roster``), so later lookups in the same run see those
+changes. It stores plain ``PlayerIdentity`` records, not ORM objects; callers
+``db.get`` the ``Player`` only when they are about to modify it.
+
+Loading is incremental and idempotent: ``load_players`` (everyone — global
+FCMS matching), ``load_rosters`` (one season, optionally some teams),
+``load_sota_ids`` (what a SOTA payload references) and ``load_lineup`` (one
+game). Names are compared after ``normalize_name`` (trim, casefold, single
+spaces).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.game_lineup import GameLineup
+from app.models.player import Player
+from app.models.player_team import PlayerTeam
+
+_IDENTITY_COLUMNS = (
+    Player.id, Player.sota_id, Player.fcms_person_id,
+    Player.first_name, Player.last_name,
+    Player.first_name_kz, Player.last_name_kz,
+    Player.first_name_en, Player.last_name_en,
+    Player.birthday,
+)
+
+
+def normalize_name(value: str | None) -> str:
+    return " ".join((value or "").split()).casefold()
+
+
+def sota_ids_of(items: Iterable[dict]) -> list[UUID]:
+    """Parsable SOTA player ids (``"id"`` keys) of a lineup/stats payload."""
+    ids = []
+    for item in items:
+        try:
+            ids.append(UUID(str(item["id"])))
+        except (KeyError, ValueError, TypeError):
+            continue
+    return ids
+
+
+@dataclass(slots=True)
+class PlayerIdentity:
+    id: int
+    sota_id: UUID | None
+    fcms_person_id: int | None
+    first_name: str | None
+    last_name: str | None
+    first_name_kz: str | None
+    last_name_kz: str | None
+    first_name_en: str | None
+    last_name_en: str | None
+    birthday: date | None
+
+    @classmethod
+    def from_player(cls, player: Player) -> "PlayerIdentity":
+        return cls(*(getattr(player, column.key) for column in _IDENTITY_COLUMNS))
+
+    def name_pairs(self) -> list[tuple[str, str]]:
+        """ru and en (last, first), normalized, skipping incomplete ones."""
+        pairs = [(self.last_name, self.first_name), (self.last_name_en, self.first_name_en)]
+        return [(normalize_name(ln), normalize_name(fn)) for ln, fn in pairs if ln and fn]
+
+    def first_names(self) -> set[str]:
+        return {normalize_name(n) for n in (self.first_name, self.first_name_kz, self.first_name_en) if n}
+
+    def last_names(self) -> set[str]:
+        return {normalize_name(n) for n in (self.last_name, self.last_name_kz, self.last_name_en) if n}
+
+
+@dataclass(slots=True)
+class RosterEntry:
+    id: int
+    player_id: int
+    team_id: int
+    season_id: int
+    number: int | None
+    role: int | None
+    is_active: bool
+    is_hidden: bool
+
+
+class PlayerIdentityIndex:
+    """Dict-backed player lookups for one sync run (see module docstring)."""
+
+    def __init__(self) -> None:
+        self._players: dict[int, PlayerIdentity] = {}
+        self._by_sota: dict[UUID, int] = {}
+        self._by_fcms: dict[int, int] = {}
+        self._by_name: dict[tuple[str, str], set[int]] = defaultdict(set)  # ru/en (last, first)
+        self._by_name_kz: dict[tuple[str, str], set[int]] = defaultdict(set)
+        self._by_birthday: dict[date, set[int]] = defaultdict(set)
+        self._roster: dict[tuple[int, int], list[RosterEntry]] = defaultdict(list)
+        self._roster_by_player: dict[tuple[int, int, int], RosterEntry] = {}
+        self._lineups: dict[int, list[tuple[int, int]]] = {}
+        self._all_players = False
+        self._sota_checked: set[UUID] = set()
+        self._roster_loaded: set[tuple[int, int | None]] = set()
+
+    # ── loading ──────────────────────────────────────────────────────
+
+    async def _load_identities(self, db: AsyncSession, *criteria) -> None:
+        result = await db.execute(select(*_IDENTITY_COLUMNS).where(*criteria))
+        for row in result.all():
+            if row.id not in self._players:
+                self._index(PlayerIdentity(*row))
+
+    async def load_players(self, db: AsyncSession) -> None:
+        """Every player — needed before global (FCMS) matching."""
+        if not self._all_players:
+            await self._load_identities(db)
+            self._all_players = True
+
+    async def load_sota_ids(self, db: AsyncSession, sota_ids: Iterable[UUID]) -> None:
+        missing = {s for s in sota_ids if s not in self._sota_checked and s not in self._by_sota}
+        if missing and not self._all_players:
+            await self._load_identities(db, Player.sota_id.in_(missing))
+        self._sota_checked |= missing
+
+    async def load_rosters(self, db: AsyncSession, season_id: int, team_ids: Iterable[int] | None = None) -> None:
+        """PlayerTeam rows of a season (optionally only some teams) and their players."""
+        if (season_id, None) in self._roster_loaded:
+            return
+        wanted = None if team_ids is None else {t for t in team_ids if (season_id, t) not in self._roster_loaded}
+        if wanted is not None and not wanted:
+            return
+        criteria = [PlayerTeam.season_id == season_id]
+        if wanted is not None:
+            criteria.append(PlayerTeam.team_id.in_(wanted))
+        result = await db.execute(
+            select(
+                PlayerTeam.id, PlayerTeam.player_id, PlayerTeam.team_id, PlayerTeam.season_id,
+                PlayerTeam.number, PlayerTeam.role, PlayerTeam.is_active, PlayerTeam.is_hidden,
+            ).where(*criteria).order_by(PlayerTeam.id)
+        )
+        entries = [RosterEntry(*row) for row in result.all()]
+        missing = {e.player_id for e in entries if e.player_id not in self._players}
+        if missing and not self._all_players:
+            await self._load_identities(db, Player.id.in_(missing))
+        known = {e.id for (t, sid), bucket in self._roster.items() if sid == season_id for e in bucket}
+        for entry in entries:
+            if entry.id not in known:
+                self.put_roster(entry)
+        if wanted is None:
+            self._roster_loaded.add((season_id, None))
+        else:
+            self._roster_loaded |= {(season_id, t) for t in wanted}
+
+    async def load_lineup(self, db: AsyncSession, game_id: int) -> None:
+        if game_id in self._lineups:
+            return
+        result = await db.execute(
+            select(GameLineup.player_id, GameLineup.team_id).where(GameLineup.game_id == game_id)
+        )
+        self._lineups[game_id] = [(pid, tid) for pid, tid in result.all() if pid is not None]
+        missing = {pid for pid, _ in self._lineups[game_id] if pid not in self._players}
+        if missing and not self._all_players:
+            await self._load_identities(db, Player.id.in_(missing))
+
+    # ── keeping current ──────────────────────────────────────────────
+
+    def put(self, player: Player | PlayerIdentity) -> None:
+        """Insert or re-index a player after it was created or modified."""
+        identity = player if isinstance(player, PlayerIdentity) else PlayerIdentity.from_player(player)
+        old = self._players.get(identity.id)
+        if old is not None:
+            self._unindex(old)
+        self._index(identity)
+
+    def put_roster(self, entry: PlayerTeam | RosterEntry) -> None:
+        if isinstance(entry, PlayerTeam):
+            entry = RosterEntry(
+                entry.id, entry.player_id, entry.team_id, entry.season_id, entry.number,
+                entry.role, entry.is_active is not False, bool(entry.is_hidden),
+            )
+        bucket = self._roster[(entry.team_id, entry.season_id)]
+        bucket[:] = [e for e in bucket if e.id != entry.id] + [entry]
+        key = (entry.player_id, entry.team_id, entry.season_id)
+        current = self._roster_by_player.get(key)
+        if current is None or current.id == entry.id:
+            self._roster_by_player[key] = entry
+
+    def _keys(self, p: PlayerIdentity) -> list[tuple[dict, object]]:
+        keys: list[tuple[dict, object]] = [(self._by_name, key) for key in p.name_pairs()]
+        if p.last_name_kz and p.first_name_kz:
+            keys.append((self._by_name_kz, (normalize_name(p.last_name_kz), normalize_name(p.first_name_kz))))
+        if p.birthday:
+            keys.append((self._by_birthday, p.birthday))
+        return keys
+
+    def _index(self, p: PlayerIdentity) -> None:
+        self._players[p.id] = p
+        if p.sota_id:
+            self._by_sota[p.sota_id] = p.id
+        if p.fcms_person_id:
+            self._by_fcms[p.fcms_person_id] = p.id
+        for index, key in self._keys(p):
+            index[key].add(p.id)
+
+    def _unindex(self, p: PlayerIdentity) -> None:
+        if p.sota_id and self._by_sota.get(p.sota_id) == p.id:
+            del self._by_sota[p.sota_id]
+        if p.fcms_person_id and self._by_fcms.get(p.fcms_person_id) == p.id:
+            del self._by_fcms[p.fcms_person_id]
+        for index, key in self._keys(p):
+            index.get(key, set()).discard(p.id)
+
+    # ── lookups ──────────────────────────────────────────────────────
+
+    def get(self, player_id: int) -> PlayerIdentity | None:
+        return self._players.get(player_id)
+
+    def by_sota_id(self, sota_id: UUID) -> int | None:
+        return self._by_sota.get(sota_id)
+
+    def by_fcms_person_id(self, person_id: int) -> int | None:
+        return self._by_fcms.get(person_id)
+
+    def by_name(self, last_name: str, first_name: str) -> int | None:
+        """Lowest id whose ru, en or kz (last, first) equals the given pair."""
+        key = (normalize_name(last_name), normalize_name(first_name))
+        ids = self._by_name.get(key, set()) | self._by_name_kz.get(key, set())
+        return min(ids) if ids else None
+
+    def roster(self, team_id: int, season_id: int) -> list[RosterEntry]:
+        return self._roster.get((team_id, season_id), [])
+
+    def roster_entry(self, player_id: int, team_id: int, season_id: int) -> RosterEntry | None:
+        return self._roster_by_player.get((player_id, team_id, season_id))
+
+    def find_global(
+        self, fn_ru: str, ln_ru: str, fn_en: str, ln_en: str,
+        person_id: int | None, dob: date | None,
+    ) -> tuple[int | None, str | None]:
+        """Global match in FCMS priority order; returns (player_id, method).
+
+        fcms person id → name (ru/en/kz columns) → reversed name (ru/en) →
+        date of birth + last-name substring. Ties resolve to the lowest
+        player id.
+        """
+        if person_id and person_id in self._by_fcms:
+            return self._by_fcms[person_id], "global_fcms_id"
+
+        for ln, fn in ((ln_ru, fn_ru), (ln_en, fn_en)):
+            if ln and fn and (player_id := self.by_name(ln, fn)):
+                return player_id, "global_name"
+        inputs = [(normalize_name(ln), normalize_name(fn)) for ln, fn in ((ln_ru, fn_ru), (ln_en, fn_en)) if ln and fn]
+        for ln, fn in inputs:
+            ids = self._by_name.get((fn, ln))
+            if ids:
+                return min(ids), "global_name_rev"
+
+        if dob and ln_ru:
+            needle_ru, needle_en = normalize_name(ln_ru), normalize_name(ln_en)
+            for pid in sorted(self._by_birthday.get(dob, ())):
+                p = self._players[pid]
+                if (p.last_name and needle_ru in normalize_name(p.last_name)) or (
+                    needle_en and p.last_name_en and needle_en in normalize_name(p.last_name_en)
+                ):
+                    return pid, "global_dob+name"
+
+        return None, None
+
+    def find_unlinked_in_roster(
+        self, team_id: int, season_id: int, first_name: str | None, last_name: str | None
+    ) -> int | None:
+        """Player of the team-season without a SOTA id whose ru name matches exactly once."""
+        fn, ln = normalize_name(first_name), normalize_name(last_name)
+        ids = {
+            e.player_id for e in self.roster(team_id, season_id)
+            if (p := self._players.get(e.player_id)) is not None and p.sota_id is None
+            and normalize_name(p.first_name) == fn and normalize_name(p.last_name) == ln
+        }
+        return next(iter(ids)) if len(ids) == 1 else None
+
+    def find_by_number(self, team_id: int, season_id: int, number: int) -> int | None:
+        """Active, visible contract with this shirt number in the team-season."""
+        for entry in self.roster(team_id, season_id):
+            if entry.number == number and entry.is_active and not entry.is_hidden:
+                return entry.player_id
+        return None
+
+    def lineup_team_ids(self, game_id: int, player_id: int) -> set[int]:
+        return {tid for pid, tid in self._lineups.get(game_id, ()) if pid == player_id and tid is not None}
+
+    def find_in_lineup(
+        self, game_id: int, first_name: str | None, last_name: str | None, team_id: int | None = None
+    ) -> int | None:
+        """Unique lineup player whose first and last names match in any locale (mixed allowed)."""
+        fn, ln = normalize_name(first_name), normalize_name(last_name)
+        ids = {
+            pid for pid, tid in self._lineups.get(game_id, ())
+            if (team_id is None or tid == team_id)
+            and (p := self._players.get(pid)) is not None
+            and fn in (p.first_names() or {""}) and ln in (p.last_names() or {""})
+        }
+        return next(iter(ids)) if len(ids) == 1 else None
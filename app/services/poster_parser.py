@@ -10,10 +10,11 @@ import base64
 import json
 import logging
 
-import anthropic
-from openai import AsyncOpenAI
-
 from app.config import get_settings
+from app.utils.lazy_import import lazy_module
+
+anthropic = lazy_module("anthropic")
+openai = lazy_module("openai")
 
 logger = logging.getLogger(__name__)
 
@@ -129,7 +130,7 @@ class PosterParserService:
         settings = get_settings()
         self._provider: str | None = None
         self._anthropic: anthropic.AsyncAnthropic | None = None
-        self._openai: AsyncOpenAI | None = None
+        self._openai: openai.AsyncOpenAI | None = None
 
         if settings.anthropic_api_key:
             self._provider = "anthropic"
@@ -142,7 +143,7 @@ class PosterParserService:
         elif settings.openai_api_key:
             self._provider = "openai"
             self._openai_model = "gpt-4o"
-            self._openai = AsyncOpenAI(
+            self._openai = openai.AsyncOpenAI(
                 api_key=settings.openai_api_key,
                 max_retries=settings.openai_max_retries,
                 timeout=120,
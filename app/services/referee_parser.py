@@ -9,10 +9,11 @@ from __future__ import annotations
 import json
 import logging
 
-import anthropic
-from openai import AsyncOpenAI
-
 from app.config import get_settings
+from app.utils.lazy_import import lazy_module
+
+anthropic = lazy_module("anthropic")
+openai = lazy_module("openai")
 
 logger = logging.getLogger(__name__)
 
@@ -99,7 +100,7 @@ class RefereeParserService:
         settings = get_settings()
         self._provider: str | None = None
         self._anthropic: anthropic.AsyncAnthropic | None = None
-        self._openai: AsyncOpenAI | None = None
+        self._openai: openai.AsyncOpenAI | None = None
 
         if settings.anthropic_api_key:
             self._provider = "anthropic"
@@ -112,7 +113,7 @@ class RefereeParserService:
         elif settings.openai_api_key:
             self._provider = "openai"
             self._openai_model = "gpt-4o"
-            self._openai = AsyncOpenAI(
+            self._openai = openai.AsyncOpenAI(
                 api_key=settings.openai_api_key,
                 max_retries=settings.openai_max_retries,
                 timeout=120,
@@ -0,0 +1,232 @@
+"""In-process snapshot of small reference tables.
+
+Teams, clubs, countries, stadiums and championships change a few times a
+week (admin edits), yet almost every public handler joined or
+selectinload-ed them per request. The snapshot keeps plain frozen copies of
+those rows per process so handlers fetch only fact rows (games, stats) and
+join reference data in memory.
+
+Freshness:
+- admin writes call ``bump_reference_version()``, which INCRs a version key in
+  Redis; every process compares it at most every ``_VERSION_CHECK_INTERVAL``
+  seconds and reloads when it moved;
+- a row referenced by a fact row but missing from the snapshot (created by a
+  sync since the last load) triggers one reload;
+- ``_MAX_AGE`` bounds staleness when Redis is unavailable (fail open) or a
+  writer outside the admin API touched the tables.
+
+Ref objects expose the same attribute names as the ORM models, so existing
+builders (``get_localized_field``, ``resolve_team_logo_url``,
+``_build_stadium_info``) accept either. Team logo fallbacks are resolved once
+at load time.
+"""
+
+import asyncio
+import dataclasses
+import logging
+import time
+import weakref
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Championship, Club, Country, Stadium, Team
+from app.models.stadium import FieldType
+from app.utils.team_logo_fallback import resolve_team_logo_url
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_VERSION_KEY = "qfl:refdata:version"
+_VERSION_CHECK_INTERVAL = 5
+_MAX_AGE = 300
+
+
+@dataclass(frozen=True, slots=True)
+class TeamRef:
+    id: int
+    club_id: int | None
+    stadium_id: int | None
+    name: str
+    name_kz: str | None
+    name_en: str | None
+    city: str | None
+    city_kz: str | None
+    city_en: str | None
+    logo_url: str | None
+    primary_color: str | None
+    secondary_color: str | None
+    accent_color: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ClubRef:
+    id: int
+    name: str
+    name_kz: str | None
+    name_en: str | None
+    short_name: str | None
+    logo_url: str | None
+    city_id: int | None
+    stadium_id: int | None
+
+
+@dataclass(frozen=True, slots=True)
+class CountryRef:
+    id: int
+    code: str
+    name: str
+    name_kz: str | None
+    name_en: str | None
+    flag_url: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class StadiumRef:
+    id: int
+    name: str
+    name_kz: str | None
+    name_ru: str | None
+    name_en: str | None
+    city: str | None
+    city_kz: str | None
+    city_ru: str | None
+    city_en: str | None
+    capacity: int | None
+    field_type: FieldType | None
+    address: str | None
+    address_kz: str | None
+    address_en: str | None
+    photo_url: str | None
+
+
+@dataclass(frozen=True, slots=True)
+class ChampionshipRef:
+    id: int
+    name: str
+    name_kz: str | None
+    name_en: str | None
+    short_name: str | None
+    short_name_kz: str | None
+    short_name_en: str | None
+    slug: str | None
+    sort_order: int
+    is_active: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ReferenceSnapshot:
+    version: str | None
+    loaded_at: float
+    teams: dict[int, TeamRef]
+    clubs: dict[int, ClubRef]
+    countries: dict[int, CountryRef]
+    stadiums: dict[int, StadiumRef]
+    championships: dict[int, ChampionshipRef]
+
+    def has_all(self, **ids: Iterable[int | None]) -> bool:
+        """True when every non-null id (``teams=[...]``, ``countries=[...]``) is present."""
+        for table, wanted in ids.items():
+            rows = getattr(self, table)
+            if any(i is not None and i not in rows for i in wanted):
+                return False
+        return True
+
+
+_snapshot: ReferenceSnapshot | None = None
+_checked_at: float = 0
+# One lock per event loop: an asyncio.Lock is bound to the loop it first
+# blocked on, and workers (run_async) and tests start fresh loops.
+_reload_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+
+
+def _reload_lock() -> asyncio.Lock:
+    loop = asyncio.get_running_loop()
+    lock = _reload_locks.get(loop)
+    if lock is None:
+        lock = _reload_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _load_refs(db: AsyncSession, model, ref_cls) -> dict:
+    names = [f.name for f in dataclasses.fields(ref_cls)]
+    result = await db.execute(select(*(getattr(model, name) for name in names)))
+    return {row.id: ref_cls(**row._mapping) for row in result}
+
+
+async def _remote_version() -> str | None:
+    try:
+        from app.utils.live_flag import get_redis
+
+        value = await (await get_redis()).get(REFERENCE_VERSION_KEY)
+    except Exception:
+        return None
+    return value.decode() if isinstance(value, bytes) else (str(value) if value is not None else "0")
+
+
+async def _load_snapshot(db: AsyncSession) -> ReferenceSnapshot:
+    version = await _remote_version()
+    teams = await _load_refs(db, Team, TeamRef)
+    teams = {
+        team_id: dataclasses.replace(team, logo_url=resolve_team_logo_url(team))
+        for team_id, team in teams.items()
+    }
+    return ReferenceSnapshot(
+        version=version,
+        loaded_at=time.monotonic(),
+        teams=teams,
+        clubs=await _load_refs(db, Club, ClubRef),
+        countries=await _load_refs(db, Country, CountryRef),
+        stadiums=await _load_refs(db, Stadium, StadiumRef),
+        championships=await _load_refs(db, Championship, ChampionshipRef),
+    )
+
+
+async def get_reference_snapshot(db: AsyncSession, **required_ids: Iterable[int | None]) -> ReferenceSnapshot:
+    """Current snapshot, reloaded when stale or missing any of ``required_ids``.
+
+    ``required_ids`` are the FK values of the fact rows about to be rendered,
+    keyed by snapshot table: ``get_reference_snapshot(db, teams=[1, 2])``.
+    """
+    global _snapshot, _checked_at
+    snapshot = _snapshot
+    now = time.monotonic()
+    if snapshot is not None and now - _checked_at >= _VERSION_CHECK_INTERVAL:
+        _checked_at = now
+        version = await _remote_version()
+        if version is not None and version != snapshot.version:
+            snapshot = None
+    if snapshot is not None and now - snapshot.loaded_at > _MAX_AGE:
+        snapshot = None
+    required_ids = {table: list(ids) for table, ids in required_ids.items()}
+    if snapshot is not None and snapshot.has_all(**required_ids):
+        return snapshot
+
+    stale = _snapshot
+    async with _reload_lock():
+        # Another request may have reloaded while we waited for the lock.
+        if _snapshot is not stale and _snapshot is not None and _snapshot.has_all(**required_ids):
+            return _snapshot
+        _snapshot = await _load_snapshot(db)
+        _checked_at = time.monotonic()
+        logger.debug("reference snapshot loaded (version %s, %d teams)", _snapshot.version, len(_snapshot.teams))
+        return _snapshot
+
+
+def invalidate_reference_snapshot() -> None:
+    """Drop this process's snapshot; the next request reloads it."""
+    global _snapshot, _checked_at
+    _snapshot = None
+    _checked_at = 0
+
+
+async def bump_reference_version() -> None:
+    """Make every process reload reference data. Call after committing an admin write."""
+    invalidate_reference_snapshot()
+    try:
+        from app.utils.live_flag import get_redis
+
+        await (await get_redis()).incr(REFERENCE_VERSION_KEY)
+    except Exception:
+        logger.warning("reference version bump failed; other processes refresh within %ss", _MAX_AGE)
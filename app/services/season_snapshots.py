@@ -0,0 +1,530 @@
+"""Prebuilt season results grid and brackets.
+
+``/seasons/{id}/results-grid``, ``/seasons/{id}/bracket`` and the bracket of
+``/cup/{id}/overview`` are whole-season renders: every finished game, every
+stage, every cup draw. They change only when a game of the season changes
+status or score, or when a cup draw is edited, so ``build_season_snapshots``
+renders all of them — every grid variant (whole season, each group, final
+stages) and both brackets, in every language — and stores ready-to-serve
+JSON bytes in Redis for a day. The request path is one Redis GET.
+
+Lifecycle transitions, live sync, admin game, cup-draw, stage and
+participant edits call ``enqueue_season_snapshot_build(season_id)``
+(debounced per season); admin team edits enqueue every season of the team,
+and the hourly season aggregate sync enqueues each synced season. The build
+task runs ``rebuild_season_snapshots``, which holds a per-season lock across
+the build so a slower build that read older data never overwrites a newer
+one. A miss (cold Redis, Redis down) renders inline once per process and
+key and, when the season was never built, schedules a build. Misses on
+variants the builder does not know (a group name the season does not have)
+are rendered inline only.
+"""
+
+import json
+import logging
+import time
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models import Game, GameStatus, ScoreTable, Season, SeasonParticipant, Stage, Team
+from app.schemas.playoff_bracket import PlayoffBracketResponse
+from app.schemas.stats import ResultsGridResponse, TeamResultsGridEntry
+from app.services.cup_draw import build_bracket_from_cup_draws
+from app.services.cup_rounds import build_playoff_bracket_from_rounds, build_schedule_rounds
+from app.services.season_filters import get_final_stage_ids, get_group_team_ids
+from app.utils.cache import cache_get_or_compute
+from app.utils.fast_json import dumps
+from app.utils.redis_lock import acquire_token_lock, release_token_lock
+from app.utils.localization import get_localized_field
+from app.utils.team_logo_fallback import resolve_team_logo_url
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_LANGS = ("kz", "ru", "en")
+SNAPSHOT_KEY_PREFIX = "qfl:season_snapshot"
+_BUILD_PENDING_PREFIX = "qfl:season_snapshot_build"
+_BUILD_PENDING_TTL = 30
+_BUILD_COUNTDOWN = 1
+_BUILD_LOCK_PREFIX = "qfl:season_snapshot_lock"
+# Outlives the build task's hard time limit.
+_BUILD_LOCK_TTL = 180
+_BUILD_BUSY_COUNTDOWN = 5
+# The hourly season aggregate sync rebuilds well within this; seasons it does
+# not cover are rebuilt on the first miss after expiry.
+_SNAPSHOT_TTL = 24 * 3600
+# In-process fallback when Redis has no entry.
+_LOCAL_TTL = 10
+
+RESULTS_GRID = "results_grid"
+SEASON_BRACKET = "bracket"
+CUP_BRACKET = "cup_bracket"
+
+_PLAYOFF_ROUND_ORDER = {
+    round_key: index
+    for index, round_key in enumerate(["1_32", "1_16", "1_8", "1_4", "1_2", "3rd_place", "final"])
+}
+
+
+def grid_variant(group: str | None = None, final: bool = False) -> str:
+    if final:
+        return "final"
+    return f"group:{group}" if group else ""
+
+
+def _grid_args(variant: str) -> tuple[str | None, bool]:
+    """``(group, final)`` of a grid variant."""
+    if variant == "final":
+        return None, True
+    return (variant.removeprefix("group:") or None), False
+
+
+def season_snapshot_key(season_id: int, kind: str, variant: str, lang: str) -> str:
+    return f"{SNAPSHOT_KEY_PREFIX}:{season_id}:{kind}:{variant}:{lang}"
+
+
+def _manifest_key(season_id: int) -> str:
+    """Keys written by the last build; also marks the season as built."""
+    return f"{SNAPSHOT_KEY_PREFIX}:{season_id}:manifest"
+
+
+async def _redis():
+    try:
+        from app.utils.live_flag import get_redis
+
+        return await get_redis()
+    except Exception:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Renders
+# ---------------------------------------------------------------------------
+
+async def render_results_grid(
+    db: AsyncSession,
+    season_id: int,
+    lang: str,
+    *,
+    group: str | None = None,
+    final: bool = False,
+) -> ResultsGridResponse:
+    """W/D/L for each team in each tour (whole season, one group, or final stages)."""
+    empty = ResultsGridResponse(season_id=season_id, total_tours=0, teams=[])
+
+    # Resolve group team_ids if group filter is specified
+    group_team_ids: list[int] | None = None
+    if group:
+        group_team_ids = await get_group_team_ids(db, season_id, group)
+        if not group_team_ids:
+            return empty
+
+    final_stage_ids_list: list[int] | None = None
+    if final:
+        final_stage_ids_list = await get_final_stage_ids(db, season_id)
+        if not final_stage_ids_list:
+            return empty
+
+    # Get teams from score_table (sorted by position) for stable ordering
+    score_query = (
+        select(ScoreTable)
+        .where(ScoreTable.season_id == season_id)
+        .options(selectinload(ScoreTable.team))
+    )
+    if group_team_ids is not None:
+        score_query = score_query.where(ScoreTable.team_id.in_(group_team_ids))
+    score_query = score_query.order_by(ScoreTable.position)
+
+    score_result = await db.execute(score_query)
+    score_entries = score_result.scalars().all()
+
+    # Get all played games for the selected phase
+    games_query = (
+        select(Game)
+        .where(
+            Game.season_id == season_id,
+            Game.status.in_([GameStatus.finished, GameStatus.technical_defeat]),
+            Game.tour.isnot(None),
+        )
+    )
+    if group_team_ids is not None:
+        games_query = games_query.where(
+            Game.home_team_id.in_(group_team_ids),
+            Game.away_team_id.in_(group_team_ids),
+        )
+    if final_stage_ids_list is not None:
+        games_query = games_query.where(Game.stage_id.in_(final_stage_ids_list))
+    games_query = games_query.order_by(Game.tour)
+
+    games_result = await db.execute(games_query)
+    games = games_result.scalars().all()
+
+    if not score_entries and not games:
+        return empty
+
+    # Find max tour from ALL matches (including upcoming) so the tour slider
+    # shows the full season, not just played tours.
+    season = await db.get(Season, season_id)
+    all_tours_max = await db.scalar(
+        select(func.max(Game.tour)).where(
+            Game.season_id == season_id,
+            Game.tour.isnot(None),
+        )
+    )
+    max_tour = (
+        (season.total_rounds if season and season.total_rounds else None)
+        or all_tours_max
+        or max((g.tour for g in games), default=0)
+    )
+
+    score_by_team_id: dict[int, ScoreTable] = {
+        entry.team_id: entry for entry in score_entries
+    }
+    played_team_ids: set[int] = {
+        team_id
+        for game in games
+        for team_id in (game.home_team_id, game.away_team_id)
+        if team_id is not None
+    }
+
+    if final_stage_ids_list is not None:
+        ordered_team_ids = [entry.team_id for entry in score_entries if entry.team_id in played_team_ids]
+        remaining_ids = sorted(played_team_ids - set(ordered_team_ids))
+        ordered_team_ids.extend(remaining_ids)
+    elif score_entries:
+        ordered_team_ids = [entry.team_id for entry in score_entries]
+    else:
+        ordered_team_ids = sorted(played_team_ids)
+
+    if not ordered_team_ids:
+        return ResultsGridResponse(season_id=season_id, total_tours=max_tour, teams=[])
+
+    # Build results dict: team_id -> [result for each tour]
+    team_results: dict[int, list[str | None]] = {
+        team_id: [None] * max_tour
+        for team_id in ordered_team_ids
+    }
+
+    # Fill in results from games
+    for game in games:
+        tour_idx = game.tour - 1
+        home_id = game.home_team_id
+        away_id = game.away_team_id
+
+        if game.home_score > game.away_score:
+            home_result, away_result = "W", "L"
+        elif game.home_score < game.away_score:
+            home_result, away_result = "L", "W"
+        else:
+            home_result, away_result = "D", "D"
+
+        if home_id in team_results and tour_idx < len(team_results[home_id]):
+            team_results[home_id][tour_idx] = home_result
+        if away_id in team_results and tour_idx < len(team_results[away_id]):
+            team_results[away_id][tour_idx] = away_result
+
+    missing_team_ids = [
+        team_id
+        for team_id in ordered_team_ids
+        if score_by_team_id.get(team_id) is None or score_by_team_id[team_id].team is None
+    ]
+    teams_lookup: dict[int, Team] = {}
+    if missing_team_ids:
+        teams_result = await db.execute(
+            select(Team).where(Team.id.in_(missing_team_ids))
+        )
+        teams_lookup = {team.id: team for team in teams_result.scalars().all()}
+
+    # Build response
+    phase_filtered = group_team_ids is not None or final_stage_ids_list is not None
+    teams = []
+    for idx, team_id in enumerate(ordered_team_ids, 1):
+        score_entry = score_by_team_id.get(team_id)
+        team = score_entry.team if score_entry and score_entry.team else teams_lookup.get(team_id)
+        position = (
+            idx
+            if phase_filtered
+            else (score_entry.position if score_entry and score_entry.position is not None else idx)
+        )
+        teams.append(
+            TeamResultsGridEntry(
+                position=position,
+                team_id=team_id,
+                team_name=get_localized_field(team, "name", lang) if team else None,
+                team_logo=resolve_team_logo_url(team),
+                results=team_results.get(team_id, []),
+            )
+        )
+
+    return ResultsGridResponse(season_id=season_id, total_tours=max_tour, teams=teams)
+
+
+async def _load_bracket_inputs(db: AsyncSession, season_id: int) -> tuple[list[Stage], list[Game]]:
+    stage_result = await db.execute(
+        select(Stage)
+        .where(Stage.season_id == season_id)
+        .order_by(Stage.sort_order, Stage.id)
+    )
+    games_result = await db.execute(
+        select(Game)
+        .where(Game.season_id == season_id)
+        .options(
+            selectinload(Game.home_team),
+            selectinload(Game.away_team),
+            selectinload(Game.stage),
+        )
+        .order_by(Game.date, Game.time, Game.id)
+    )
+    return list(stage_result.scalars().all()), list(games_result.scalars().all())
+
+
+def _season_bracket(
+    season_id: int, stages: list[Stage], games: list[Game], lang: str,
+) -> PlayoffBracketResponse:
+    rounds = build_schedule_rounds(games=games, stages=stages, lang=lang, include_games=True)
+    bracket = build_playoff_bracket_from_rounds(season_id, rounds)
+    return bracket or PlayoffBracketResponse(season_id=season_id, rounds=[])
+
+
+def _team_ids_key(entry) -> str:
+    team_ids = set()
+    if entry.game and entry.game.home_team:
+        team_ids.add(entry.game.home_team.id)
+    if entry.game and entry.game.away_team:
+        team_ids.add(entry.game.away_team.id)
+    return str(frozenset(team_ids))
+
+
+async def _cup_bracket(
+    db: AsyncSession, season_id: int, stages: list[Stage], games: list[Game], lang: str,
+) -> PlayoffBracketResponse | None:
+    """Game-based playoff rounds merged with published cup-draw rounds."""
+    rounds = build_schedule_rounds(games, stages, lang, include_games=True)
+    game_bracket = build_playoff_bracket_from_rounds(season_id, rounds)
+    draw_bracket = await build_bracket_from_cup_draws(db, season_id, lang)
+
+    if game_bracket and game_bracket.rounds and draw_bracket and draw_bracket.rounds:
+        # round_name -> {team-id set: draw entry}
+        draw_round_map = {
+            dr.round_name: {_team_ids_key(de): de for de in dr.entries}
+            for dr in draw_bracket.rounds
+        }
+
+        # Enrich game entries with draw side/sort_order
+        for gr in game_bracket.rounds:
+            draw_entries = draw_round_map.get(gr.round_name, {})
+            for ge in gr.entries:
+                draw_entry = draw_entries.get(_team_ids_key(ge))
+                if draw_entry is not None:
+                    ge.side = draw_entry.side
+                    ge.sort_order = draw_entry.sort_order
+
+        # Merge: game rounds (now enriched) + draw-only rounds, in playoff order
+        game_round_keys = {r.round_name for r in game_bracket.rounds}
+        merged_rounds = list(game_bracket.rounds)
+        merged_rounds.extend(dr for dr in draw_bracket.rounds if dr.round_name not in game_round_keys)
+        merged_rounds.sort(key=lambda r: _PLAYOFF_ROUND_ORDER.get(r.round_name, 999))
+        return PlayoffBracketResponse(season_id=season_id, rounds=merged_rounds)
+    if game_bracket and game_bracket.rounds:
+        return game_bracket
+    return draw_bracket
+
+
+async def _render(
+    db: AsyncSession, season_id: int, kind: str, variant: str, lang: str,
+) -> bytes:
+    if kind == RESULTS_GRID:
+        group, final = _grid_args(variant)
+        return dumps(await render_results_grid(db, season_id, lang, group=group, final=final))
+    stages, games = await _load_bracket_inputs(db, season_id)
+    if kind == SEASON_BRACKET:
+        return dumps(_season_bracket(season_id, stages, games, lang))
+    if kind == CUP_BRACKET:
+        bracket = await _cup_bracket(db, season_id, stages, games, lang)
+        return dumps(bracket) if bracket else b"null"
+    raise ValueError(f"unknown season snapshot kind: {kind}")
+
+
+# ---------------------------------------------------------------------------
+# Build / read
+# ---------------------------------------------------------------------------
+
+async def _grid_variants(db: AsyncSession, season_id: int) -> list[str]:
+    group_names = (
+        await db.execute(
+            select(SeasonParticipant.group_name)
+            .where(
+                SeasonParticipant.season_id == season_id,
+                SeasonParticipant.group_name.isnot(None),
+            )
+            .distinct()
+        )
+    ).scalars().all()
+    variants = [grid_variant()]
+    variants.extend(grid_variant(group=name) for name in sorted(group_names) if name)
+    if await get_final_stage_ids(db, season_id):
+        variants.append(grid_variant(final=True))
+    return variants
+
+
+async def build_season_snapshots(db: AsyncSession, season_id: int) -> int:
+    """Render and store every snapshot of the season; returns how many were written.
+
+    Never raises: a failed build leaves the previous snapshots in place.
+    """
+    started = time.perf_counter()
+    try:
+        rendered: dict[str, bytes] = {}
+        for variant in await _grid_variants(db, season_id):
+            group, final = _grid_args(variant)
+            for lang in SNAPSHOT_LANGS:
+                grid = await render_results_grid(db, season_id, lang, group=group, final=final)
+                rendered[season_snapshot_key(season_id, RESULTS_GRID, variant, lang)] = dumps(grid)
+
+        stages, games = await _load_bracket_inputs(db, season_id)
+        for lang in SNAPSHOT_LANGS:
+            rendered[season_snapshot_key(season_id, SEASON_BRACKET, "", lang)] = dumps(
+                _season_bracket(season_id, stages, games, lang)
+            )
+            cup_bracket = await _cup_bracket(db, season_id, stages, games, lang)
+            rendered[season_snapshot_key(season_id, CUP_BRACKET, "", lang)] = (
+                dumps(cup_bracket) if cup_bracket else b"null"
+            )
+    except Exception:
+        logger.exception("season snapshot build failed for season %s", season_id)
+        await db.rollback()
+        return 0
+
+    written = await _store(season_id, rendered)
+    logger.info(
+        "season_snapshots_built season_id=%s written=%s duration_ms=%.1f",
+        season_id, written, (time.perf_counter() - started) * 1000,
+    )
+    return written
+
+
+async def _store(season_id: int, rendered: dict[str, bytes]) -> int:
+    redis = await _redis()
+    if redis is None:
+        return 0
+    manifest_key = _manifest_key(season_id)
+    try:
+        previous = await redis.get(manifest_key)
+        for key, body in rendered.items():
+            await redis.set(key, body, ex=_SNAPSHOT_TTL)
+        # Variants that no longer exist (a group renamed, final stages removed).
+        stale = set(json.loads(previous)) - rendered.keys() if previous else set()
+        if stale:
+            await redis.delete(*stale)
+        await redis.set(manifest_key, json.dumps(sorted(rendered)), ex=_SNAPSHOT_TTL)
+    except Exception:
+        logger.warning("season snapshot write failed for season %s", season_id, exc_info=True)
+        return 0
+    return len(rendered)
+
+
+async def read_season_snapshot(
+    db: AsyncSession, season_id: int, kind: str, lang: str, *, variant: str = "",
+) -> bytes:
+    """Ready-to-serve JSON for one snapshot, or an inline render on a miss."""
+    key = season_snapshot_key(season_id, kind, variant, lang)
+    redis = await _redis()
+    if redis is not None:
+        try:
+            body = await redis.get(key)
+            if body is not None:
+                return body
+            if await redis.get(_manifest_key(season_id)) is None:
+                await enqueue_season_snapshot_build(season_id)
+        except Exception:
+            pass
+
+    # Coalesces concurrent misses and shields the DB while Redis is down.
+    return await cache_get_or_compute(
+        f"season_snapshot:{season_id}:{kind}:{variant}:{lang}",
+        ttl=_LOCAL_TTL,
+        compute=lambda: _render(db, season_id, kind, variant, lang),
+    )
+
+
+def _pending_key(season_id: int) -> str:
+    return f"{_BUILD_PENDING_PREFIX}:{season_id}"
+
+
+async def clear_build_pending(season_id: int) -> None:
+    """Called by the build task before it reads, so later changes enqueue again."""
+    redis = await _redis()
+    if redis is None:
+        return
+    try:
+        await redis.delete(_pending_key(season_id))
+    except Exception:
+        pass
+
+
+async def enqueue_season_snapshot_build(season_id: int | None) -> None:
+    """Schedule ``build_season_snapshots`` for the season.
+
+    Debounced: while a build for the season is queued, further calls are
+    no-ops. Never raises — a lost build leaves the previous snapshots until
+    the next change or season sync.
+    """
+    if season_id is None:
+        return
+    redis = await _redis()
+    if redis is None:
+        return
+    try:
+        if not await redis.set(_pending_key(season_id), "1", nx=True, ex=_BUILD_PENDING_TTL):
+            return
+    except Exception:
+        # The Celery broker is this Redis: enqueueing would fail as well.
+        logger.debug("season snapshot build not enqueued: redis unavailable", exc_info=True)
+        return
+    _schedule_build(season_id, _BUILD_COUNTDOWN)
+
+
+async def enqueue_team_season_snapshot_builds(db: AsyncSession, team_id: int) -> None:
+    """Rebuild every season the team takes part in; its name and logo are in the snapshots."""
+    result = await db.execute(
+        select(SeasonParticipant.season_id)
+        .where(SeasonParticipant.team_id == team_id)
+        .union(
+            select(Game.season_id).where(
+                or_(Game.home_team_id == team_id, Game.away_team_id == team_id),
+                Game.season_id.is_not(None),
+            )
+        )
+    )
+    for season_id in sorted(result.scalars().all()):
+        await enqueue_season_snapshot_build(season_id)
+
+
+def _schedule_build(season_id: int, countdown: int) -> None:
+    try:
+        from app.tasks.sync_tasks import build_season_snapshots_task
+
+        build_season_snapshots_task.apply_async(args=[season_id], countdown=countdown)
+    except Exception:
+        logger.exception("Failed to enqueue season snapshot build for season %s", season_id)
+
+
+async def rebuild_season_snapshots(db: AsyncSession, season_id: int) -> int | None:
+    """Build task body: ``build_season_snapshots`` under the season's build lock.
+
+    Returns None when another build of the season holds the lock; the task
+    is then rescheduled (its pending flag is still set, so enqueueing would
+    be a no-op).
+    """
+    lock_key = f"{_BUILD_LOCK_PREFIX}:{season_id}"
+    token = await acquire_token_lock(lock_key, _BUILD_LOCK_TTL)
+    if token is None:
+        _schedule_build(season_id, _BUILD_BUSY_COUNTDOWN)
+        return None
+    try:
+        # Before reading: a change committed from here on enqueues a new build.
+        await clear_build_pending(season_id)
+        return await build_season_snapshots(db, season_id)
+    finally:
+        await release_token_lock(lock_key, token)
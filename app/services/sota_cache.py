@@ -0,0 +1,244 @@
+"""Response cache for ``SotaClient``.
+
+Most SOTA payloads change a few times a day at most, yet several sync tasks
+(and repeated admin ``/sync/*`` runs) fetch the same season/team/player
+documents within minutes of each other. Each cacheable endpoint has a TTL;
+entries are stored in Redis per (endpoint, url, params, language) so every
+worker shares them.
+
+* Fresh entry (younger than the endpoint TTL) → served without a request.
+* Stale entry with an ``ETag`` / ``Last-Modified`` → conditional GET; a 304
+  refreshes the entry's age and reuses the stored body.
+* Identical concurrent calls in one process share a single in-flight request.
+
+Redis errors fail open (straight to SOTA). Per-endpoint counters (hit, miss,
+revalidated, coalesced) are kept in-process and mirrored to a Redis hash so
+``GET /admin/ops/sota-cache`` can show totals across workers.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "qfl:sota:http"
+STATS_KEY = f"{KEY_PREFIX}:stats"
+
+# Seconds an entry is served without asking SOTA. 0 = never cached.
+# Per-game endpoints stay short: extended-stats resyncs exist precisely
+# because SOTA fills game data in late, so a retry must see new data.
+DEFAULT_TTLS: dict[str, int] = {
+    "tournaments": 86400,
+    "seasons": 86400,
+    "teams": 21600,
+    "players": 3600,
+    "games": 120,
+    "score_table": 300,
+    "best_players": 600,
+    "team_season_stats": 600,
+    "team_season_stats_v2": 600,
+    "player_season_stats": 600,
+    "player_game_stats_v2": 60,
+    "player_game_stats_v2_by_tour": 60,
+    "team_of_week": 600,
+    "game_player_stats": 60,
+    "game_team_stats": 60,
+    "pre_game_lineup": 0,
+}
+
+# How long a stale entry with validators is kept around for revalidation.
+REVALIDATE_WINDOW_SECONDS = 86400
+
+NOT_MODIFIED = object()
+
+
+@dataclass
+class CachedResponse:
+    body: Any
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+# ``loader(conditional_headers)`` performs the request and returns either a
+# CachedResponse or NOT_MODIFIED (only possible when headers were sent).
+Loader = Callable[[dict[str, str]], Awaitable["CachedResponse | object"]]
+
+
+def parse_ttl_overrides(raw: str) -> dict[str, int]:
+    """``"games=60,score_table=0"`` → ``{"games": 60, "score_table": 0}``."""
+    overrides: dict[str, int] = {}
+    for part in raw.split(","):
+        name, sep, value = part.strip().partition("=")
+        if not sep:
+            continue
+        try:
+            overrides[name.strip()] = max(0, int(value))
+        except ValueError:
+            logger.warning("Ignoring invalid SOTA cache TTL override %r", part)
+    return overrides
+
+
+def cache_key(endpoint: str, url: str, params: dict | None, language: str) -> str:
+    canonical = json.dumps(
+        [url, sorted((params or {}).items()), language], default=str, separators=(",", ":")
+    )
+    digest = hashlib.sha1(canonical.encode()).hexdigest()
+    return f"{KEY_PREFIX}:{endpoint}:{digest}"
+
+
+class SotaResponseCache:
+    def __init__(
+        self,
+        ttls: dict[str, int] | None = None,
+        *,
+        enabled: bool = True,
+        redis_getter: Callable[[], Awaitable[Any]] | None = None,
+    ):
+        self.ttls = {**DEFAULT_TTLS, **(ttls or {})}
+        self.enabled = enabled
+        self._redis_getter = redis_getter
+        self._inflight: dict[str, asyncio.Task] = {}
+        self._stats: dict[str, Counter] = {}
+
+    # ---- public API -------------------------------------------------------
+
+    async def fetch(
+        self,
+        endpoint: str,
+        url: str,
+        params: dict | None,
+        language: str,
+        loader: Loader,
+    ) -> Any:
+        ttl = self.ttls.get(endpoint, 0)
+        if not self.enabled or ttl <= 0:
+            response = await loader({})
+            return response.body
+
+        key = cache_key(endpoint, url, params, language)
+        task = self._inflight.get(key)
+        if task is not None:
+            await self._count(endpoint, "coalesced")
+            # Callers post-process bodies in place; don't share the object.
+            return copy.deepcopy(await asyncio.shield(task))
+
+        task = asyncio.ensure_future(self._fetch(endpoint, key, ttl, loader))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        # shield: a cancelled caller must not cancel the request others share.
+        return await asyncio.shield(task)
+
+    def local_stats(self) -> dict[str, dict[str, int]]:
+        return {endpoint: dict(counts) for endpoint, counts in sorted(self._stats.items())}
+
+    async def shared_stats(self) -> dict[str, dict[str, int]]:
+        """Counters aggregated across workers (empty if Redis is unavailable)."""
+        redis = await self._redis()
+        if redis is None:
+            return {}
+        try:
+            raw = await redis.hgetall(STATS_KEY)
+        except Exception:
+            logger.debug("SOTA cache: stats read failed", exc_info=True)
+            return {}
+        stats: dict[str, dict[str, int]] = {}
+        for field, value in raw.items():
+            field = field.decode() if isinstance(field, bytes) else field
+            endpoint, _, outcome = field.rpartition(":")
+            stats.setdefault(endpoint, {})[outcome] = int(value)
+        return dict(sorted(stats.items()))
+
+    async def clear(self, endpoint: str | None = None) -> int:
+        """Drop cached bodies (all, or one endpoint). Returns keys deleted."""
+        redis = await self._redis()
+        if redis is None:
+            return 0
+        pattern = f"{KEY_PREFIX}:{endpoint or '*'}:*"
+        deleted = 0
+        async for key in redis.scan_iter(match=pattern, count=500):
+            deleted += await redis.delete(key)
+        return deleted
+
+    # ---- internals --------------------------------------------------------
+
+    async def _fetch(self, endpoint: str, key: str, ttl: int, loader: Loader) -> Any:
+        entry = await self._load(key)
+        now = time.time()
+
+        if entry is not None and now - entry["stored_at"] < ttl:
+            await self._count(endpoint, "hit")
+            return entry["body"]
+
+        conditional: dict[str, str] = {}
+        if entry is not None:
+            if entry.get("etag"):
+                conditional["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                conditional["If-Modified-Since"] = entry["last_modified"]
+
+        response = await loader(conditional)
+        if response is NOT_MODIFIED:
+            await self._count(endpoint, "revalidated")
+            await self._store(key, ttl, {**entry, "stored_at": now})
+            return entry["body"]
+
+        await self._count(endpoint, "miss")
+        await self._store(key, ttl, {
+            "body": response.body,
+            "etag": response.etag,
+            "last_modified": response.last_modified,
+            "stored_at": now,
+        })
+        return response.body
+
+    async def _redis(self):
+        try:
+            if self._redis_getter is not None:
+                return await self._redis_getter()
+            from app.utils.live_flag import get_redis
+
+            return await get_redis()
+        except Exception:
+            logger.debug("SOTA cache: redis unavailable", exc_info=True)
+            return None
+
+    async def _load(self, key: str) -> dict | None:
+        redis = await self._redis()
+        if redis is None:
+            return None
+        try:
+            raw = await redis.get(key)
+            return json.loads(raw) if raw else None
+        except Exception:
+            logger.debug("SOTA cache: read failed for %s", key, exc_info=True)
+            return None
+
+    async def _store(self, key: str, ttl: int, entry: dict) -> None:
+        redis = await self._redis()
+        if redis is None:
+            return
+        keep = ttl + REVALIDATE_WINDOW_SECONDS if entry.get("etag") or entry.get("last_modified") else ttl
+        try:
+            await redis.set(key, json.dumps(entry, default=str), ex=keep)
+        except Exception:
+            logger.debug("SOTA cache: write failed for %s", key, exc_info=True)
+
+    async def _count(self, endpoint: str, outcome: str) -> None:
+        self._stats.setdefault(endpoint, Counter())[outcome] += 1
+        redis = await self._redis()
+        if redis is None:
+            return
+        try:
+            await redis.hincrby(STATS_KEY, f"{endpoint}:{outcome}", 1)
+        except Exception:
+            pass
@@ -13,6 +13,13 @@ from tenacity import (
 )
 
 from app.config import get_settings
+from app.utils.outbound_governor import governed_transport
+from app.services.sota_cache import (
+    NOT_MODIFIED,
+    CachedResponse,
+    SotaResponseCache,
+    parse_ttl_overrides,
+)
 
 settings = get_settings()
 logger = logging.getLogger(__name__)
@@ -39,6 +46,10 @@ class SotaClient:
         self.token_expires_at: datetime | None = None
         self._client: httpx.AsyncClient | None = None
         self._auth_lock = asyncio.Lock()
+        self.cache = SotaResponseCache(
+            parse_ttl_overrides(settings.sota_cache_ttl_overrides),
+            enabled=settings.sota_cache_enabled,
+        )
 
     async def _get_client(self) -> httpx.AsyncClient:
         """Get or create the singleton httpx client with connection pooling."""
@@ -46,7 +57,9 @@ class SotaClient:
             self._client = httpx.AsyncClient(
                 follow_redirects=True,
                 timeout=httpx.Timeout(30.0),
-                limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                transport=governed_transport(
+                    limits=httpx.Limits(max_connections=10, max_keepalive_connections=5),
+                ),
             )
         return self._client
 
@@ -65,12 +78,15 @@ class SotaClient:
         params: dict | None = None,
         json: dict | None = None,
         timeout: float = 30.0,
+        allow_not_modified: bool = False,
     ) -> httpx.Response:
         """
         Make an HTTP request with automatic retry on transient failures.
 
         Retries up to 3 times with exponential backoff (2s, 4s, 8s...)
         on connection timeouts, read timeouts, and connection errors.
+        ``allow_not_modified`` returns a 304 to the caller (conditional GET)
+        instead of raising.
         """
         method_upper = method.upper()
         request_kwargs: dict[str, Any] = {
@@ -83,6 +99,8 @@ class SotaClient:
 
         client = await self._get_client()
         response = await client.request(method_upper, url, **request_kwargs)
+        if allow_not_modified and response.status_code == 304:
+            return response
         response.raise_for_status()
         return response
 
@@ -147,28 +165,61 @@ class SotaClient:
 
         return results
 
+    async def _get_json_cached(
+        self, endpoint: str, url: str, language: str = "ru", params: dict | None = None
+    ) -> Any:
+        """GET a JSON document through the response cache (see sota_cache)."""
+        async def load(conditional: dict[str, str]):
+            response = await self._make_request(
+                "get",
+                url,
+                headers={**self.get_headers(language), **conditional},
+                params=params,
+                allow_not_modified=bool(conditional),
+            )
+            if response.status_code == 304:
+                return NOT_MODIFIED
+            return CachedResponse(
+                response.json(),
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified"),
+            )
+
+        return await self.cache.fetch(endpoint, url, params, language, load)
+
+    async def _get_paginated_cached(
+        self, endpoint: str, url: str, language: str = "ru", params: dict | None = None
+    ) -> list[dict[str, Any]]:
+        """Paginated GET through the cache — TTL only, pages carry no validators."""
+        async def load(_conditional: dict[str, str]):
+            return CachedResponse(
+                await self._get_paginated(url, headers=self.get_headers(language), params=params)
+            )
+
+        return await self.cache.fetch(endpoint, url, params, language, load)
+
     # ==================== Endpoints requiring authentication ====================
 
     async def get_tournaments(self, language: str = "ru") -> list[dict[str, Any]]:
         """Get all tournaments."""
         await self.ensure_authenticated()
-        return await self._get_paginated(
-            f"{self.BASE_URL}/public/v1/tournaments/", headers=self.get_headers(language)
+        return await self._get_paginated_cached(
+            "tournaments", f"{self.BASE_URL}/public/v1/tournaments/", language
         )
 
     async def get_seasons(self, language: str = "ru") -> list[dict[str, Any]]:
         """Get all seasons."""
         await self.ensure_authenticated()
-        return await self._get_paginated(
-            f"{self.BASE_URL}/public/v1/seasons/", headers=self.get_headers(language)
+        return await self._get_paginated_cached(
+            "seasons", f"{self.BASE_URL}/public/v1/seasons/", language
         )
 
     async def get_teams(self, season_id: int | None = None, language: str = "ru") -> list[dict[str, Any]]:
         """Get teams, optionally filtered by season."""
         await self.ensure_authenticated()
         params = {"season_id": season_id} if season_id else None
-        return await self._get_paginated(
-            f"{self.BASE_URL}/public/v1/teams/", headers=self.get_headers(language), params=params
+        return await self._get_paginated_cached(
+            "teams", f"{self.BASE_URL}/public/v1/teams/", language, params=params
         )
 
     async def get_players(
@@ -179,28 +230,28 @@ class SotaClient:
         params = {"season_id": season_id}
         if team_id:
             params["team_id"] = team_id
-        return await self._get_paginated(
-            f"{self.BASE_URL}/public/v1/players/", headers=self.get_headers(language), params=params
+        return await self._get_paginated_cached(
+            "players", f"{self.BASE_URL}/public/v1/players/", language, params=params
         )
 
     async def get_games(self, season_id: int, language: str = "ru") -> list[dict[str, Any]]:
         """Get all games for a season."""
         await self.ensure_authenticated()
-        return await self._get_paginated(
+        return await self._get_paginated_cached(
+            "games",
             f"{self.BASE_URL}/public/v1/games/",
-            headers=self.get_headers(language),
+            language,
             params={"season_id": season_id},
         )
 
     async def get_score_table(self, season_id: int, language: str = "ru") -> dict[str, Any]:
         """Get league table for a season."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        return await self._get_json_cached(
+            "score_table",
             f"{self.BASE_URL}/public/v1/seasons/{season_id}/score_table/",
-            headers=self.get_headers(language),
+            language,
         )
-        return response.json()
 
     async def get_best_players(
         self, season_id: int, metric: str, max_players: int = 100,
@@ -208,13 +259,12 @@ class SotaClient:
     ) -> list[dict]:
         """Get top players by metric (e.g. 'goal', 'goal_pass') for a season."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        data = await self._get_json_cached(
+            "best_players",
             f"{self.BASE_URL}/public/v1/seasons/{season_id}/best_players/",
-            headers=self.get_headers(language),
+            language,
             params={"metrics": metric, "max": max_players},
         )
-        data = response.json()
         return data.get("data", {}).get("players", [])
 
     async def get_team_season_stats(
@@ -222,26 +272,24 @@ class SotaClient:
     ) -> dict[str, Any]:
         """Get team statistics for a season (v1 - basic stats)."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        return await self._get_json_cached(
+            "team_season_stats",
             f"{self.BASE_URL}/public/v1/teams/{team_id}/season_stats/",
-            headers=self.get_headers(language),
+            language,
             params={"season_id": season_id},
         )
-        return response.json()
 
     async def get_team_season_stats_v2(
         self, team_id: int, season_id: int, language: str = "ru"
     ) -> dict[str, Any]:
         """Get detailed team statistics for a season (v2 - 92 metrics)."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        data = await self._get_json_cached(
+            "team_season_stats_v2",
             f"{self.BASE_URL}/public/v2/teams/{team_id}/season_stats/",
-            headers=self.get_headers(language),
+            language,
             params={"season_id": season_id},
         )
-        data = response.json()
 
         # Convert array of {key, value, name} to dict {key: value}
         stats_list = data.get("data", {}).get("stats", [])
@@ -253,13 +301,12 @@ class SotaClient:
     ) -> dict[str, Any]:
         """GET /v2/players/{player_id}/game_stats/?game_id={game_id} — 50 metrics."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        data = await self._get_json_cached(
+            "player_game_stats_v2",
             f"{self.BASE_URL}/public/v2/players/{player_id}/game_stats/",
-            headers=self.get_headers(language),
+            language,
             params={"game_id": game_id},
         )
-        data = response.json()
         stats_list = data.get("data", {}).get("stats", [])
         return {s["key"]: s["value"] for s in stats_list if "key" in s}
 
@@ -268,13 +315,12 @@ class SotaClient:
     ) -> dict[str, Any]:
         """GET /v2/players/{player_id}/game_stats/?season_id={season_id}&tour={tour}."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        data = await self._get_json_cached(
+            "player_game_stats_v2_by_tour",
             f"{self.BASE_URL}/public/v2/players/{player_id}/game_stats/",
-            headers=self.get_headers(language),
+            language,
             params={"season_id": season_id, "tour": tour},
         )
-        data = response.json()
         stats_list = data.get("data", {}).get("stats", [])
         return {s["key"]: s["value"] for s in stats_list if "key" in s}
 
@@ -283,13 +329,12 @@ class SotaClient:
     ) -> dict[str, Any]:
         """Get player statistics for a season (v2 - 50+ metrics)."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        data = await self._get_json_cached(
+            "player_season_stats",
             f"{self.BASE_URL}/public/v2/players/{player_id}/season_stats/",
-            headers=self.get_headers(language),
+            language,
             params={"season_id": season_id},
         )
-        data = response.json()
 
         # Convert array of {key, value, name} to dict {key: value}
         stats_list = data.get("data", {}).get("stats", [])
@@ -307,25 +352,23 @@ class SotaClient:
     ) -> dict[str, Any]:
         """Get team of the week for a season and tour."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        return await self._get_json_cached(
+            "team_of_week",
             f"{self.BASE_URL}/public/v1/seasons/{season_id}/team_of_week",
-            headers=self.get_headers(language),
+            language,
             params={"tour": tour},
         )
-        return response.json()
 
     # ==================== Game stats endpoints ====================
 
     async def get_game_player_stats(self, game_id: str, language: str = "ru") -> list[dict[str, Any]]:
         """Get player statistics for a game."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        data = await self._get_json_cached(
+            "game_player_stats",
             f"{self.BASE_URL}/public/v1/games/{game_id}/players/",
-            headers=self.get_headers(language),
+            language,
         )
-        data = response.json()
         if isinstance(data, list):
             return data
         if isinstance(data, dict):
@@ -338,12 +381,11 @@ class SotaClient:
     async def get_game_team_stats(self, game_id: str, language: str = "ru") -> list[dict[str, Any]]:
         """Get team statistics for a game."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        data = await self._get_json_cached(
+            "game_team_stats",
             f"{self.BASE_URL}/public/v1/games/{game_id}/teams/",
-            headers=self.get_headers(language),
+            language,
         )
-        data = response.json()
         if isinstance(data, list):
             return data
         if isinstance(data, dict):
@@ -362,12 +404,11 @@ class SotaClient:
     async def get_pre_game_lineup(self, game_id: str, language: str = "ru") -> dict[str, Any]:
         """Get pre-game lineup data including referees, coaches, and player lineups."""
         await self.ensure_authenticated()
-        response = await self._make_request(
-            "get",
+        return await self._get_json_cached(
+            "pre_game_lineup",
             f"{self.BASE_URL}/public/v1/games/{game_id}/pre_game_lineup/",
-            headers=self.get_headers(language),
+            language,
         )
-        return response.json()
 
     # ==================== VSporte endpoints ====================
 
@@ -10,6 +10,7 @@ Services:
 - GameSyncService: Games, events, lineups, formations
 - StatsSyncService: Team season statistics
 - SyncOrchestrator: Coordinates full sync operations
+- SyncDagExecutor: Runs dependency-declared sync steps concurrently
 """
 from app.services.sync.base import (
     BaseSyncService,
@@ -27,7 +28,8 @@ from app.services.sync.lineup_sync import LineupSyncService
 from app.services.sync.stats_sync import StatsSyncService
 from app.services.sync.team_of_week_sync import TeamOfWeekSyncService
 from app.services.sync.player_tour_stats_sync import PlayerTourStatsSyncService
-from app.services.sync.orchestrator import SyncOrchestrator
+from app.services.sync.dag import SyncDagExecutor, SyncDagReport, SyncNode
+from app.services.sync.orchestrator import SyncOrchestrator, run_full_sync_dag
 
 __all__ = [
     # Base
@@ -48,4 +50,9 @@ __all__ = [
     "TeamOfWeekSyncService",
     "PlayerTourStatsSyncService",
     "SyncOrchestrator",
+    # Parallel execution
+    "SyncDagExecutor",
+    "SyncDagReport",
+    "SyncNode",
+    "run_full_sync_dag",
 ]
@@ -0,0 +1,228 @@
+"""Dependency-aware executor for multi-season sync runs.
+
+A sync run is described as a set of ``SyncNode``s. Each node declares the
+nodes it depends on; nodes whose dependencies are satisfied run concurrently.
+Two global caps bound the fan-out:
+
+* ``sota_concurrency`` — nodes that talk to sota.id (``uses_sota=True``);
+* ``db_concurrency`` — every node, since each one checks out its own
+  connection. Keep it below the worker pool size (pool_size + max_overflow)
+  so a parallel run can't starve the other tasks in the same process.
+
+Every node runs in its own session and transaction (same isolation rule as
+``sync_tasks._run_isolated``): a failure rolls back only that node, and its
+dependents are reported as skipped instead of running on half-synced data.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+NodeStatus = str  # "ok" | "failed" | "skipped"
+
+DEFAULT_SOTA_CONCURRENCY = 4
+DEFAULT_DB_CONCURRENCY = 4
+
+
+@dataclass(frozen=True)
+class SyncNode:
+    """One unit of a sync run.
+
+    ``run`` receives a fresh session; the executor commits on success and
+    rolls back on failure, so ``run`` should not commit unless it needs
+    intermediate durability.
+    """
+    name: str
+    run: Callable[[AsyncSession | None], Awaitable[Any]]
+    deps: tuple[str, ...] = ()
+    uses_sota: bool = True
+    # False → ``run(None)``: the node opens its own sessions (multi-step
+    # bundles that already isolate each sub-step). Still counts against the
+    # DB cap since it holds at least one connection while running.
+    managed_session: bool = True
+
+
+@dataclass
+class SyncNodeReport:
+    name: str
+    status: NodeStatus
+    deps: tuple[str, ...] = ()
+    started_at: float | None = None  # seconds since run start
+    wait_seconds: float = 0.0  # time spent queued behind the concurrency caps
+    duration_seconds: float = 0.0
+    result: Any = None
+    error: str | None = None
+    exception: BaseException | None = field(default=None, repr=False)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "status": self.status,
+            "deps": list(self.deps),
+            "started_at": round(self.started_at, 3) if self.started_at is not None else None,
+            "wait_seconds": round(self.wait_seconds, 3),
+            "duration_seconds": round(self.duration_seconds, 3),
+            "result": self.result,
+            "error": self.error,
+        }
+
+
+@dataclass
+class SyncDagReport:
+    nodes: list[SyncNodeReport] = field(default_factory=list)
+    total_seconds: float = 0.0
+
+    @property
+    def failed(self) -> list[str]:
+        return [n.name for n in self.nodes if n.status == "failed"]
+
+    def first_exception(self, exc_type: type[BaseException]) -> BaseException | None:
+        for node in self.nodes:
+            if isinstance(node.exception, exc_type):
+                return node.exception
+        return None
+
+    def result_of(self, name: str) -> Any:
+        for node in self.nodes:
+            if node.name == name:
+                return node.result
+        return None
+
+    def as_dict(self) -> dict[str, Any]:
+        counts: dict[str, int] = {"ok": 0, "failed": 0, "skipped": 0}
+        for node in self.nodes:
+            counts[node.status] = counts.get(node.status, 0) + 1
+        return {
+            "total_seconds": round(self.total_seconds, 3),
+            # Sum of node durations / wall time — how much the run overlapped.
+            "parallelism": round(
+                sum(n.duration_seconds for n in self.nodes) / self.total_seconds, 2
+            ) if self.total_seconds > 0 else 0.0,
+            "counts": counts,
+            "nodes": [n.as_dict() for n in self.nodes],
+        }
+
+
+def _validate(nodes: Iterable[SyncNode]) -> dict[str, SyncNode]:
+    by_name: dict[str, SyncNode] = {}
+    for node in nodes:
+        if node.name in by_name:
+            raise ValueError(f"Duplicate sync node {node.name!r}")
+        by_name[node.name] = node
+    for node in by_name.values():
+        missing = [d for d in node.deps if d not in by_name]
+        if missing:
+            raise ValueError(f"Sync node {node.name!r} depends on unknown {missing}")
+
+    # Kahn's algorithm — reject cycles up front instead of deadlocking.
+    indegree = {name: len(node.deps) for name, node in by_name.items()}
+    ready = [name for name, deg in indegree.items() if deg == 0]
+    seen = 0
+    while ready:
+        current = ready.pop()
+        seen += 1
+        for node in by_name.values():
+            if current in node.deps:
+                indegree[node.name] -= 1
+                if indegree[node.name] == 0:
+                    ready.append(node.name)
+    if seen != len(by_name):
+        raise ValueError("Sync DAG contains a cycle")
+    return by_name
+
+
+class SyncDagExecutor:
+    """Run ``SyncNode``s respecting dependencies and global concurrency caps."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] | Callable[[], Any],
+        *,
+        sota_concurrency: int = DEFAULT_SOTA_CONCURRENCY,
+        db_concurrency: int = DEFAULT_DB_CONCURRENCY,
+    ):
+        self.session_factory = session_factory
+        self._sota_sem = asyncio.Semaphore(max(1, sota_concurrency))
+        self._db_sem = asyncio.Semaphore(max(1, db_concurrency))
+
+    async def run(self, nodes: Iterable[SyncNode]) -> SyncDagReport:
+        by_name = _validate(nodes)
+        reports = {
+            name: SyncNodeReport(name=name, status="pending", deps=node.deps)
+            for name, node in by_name.items()
+        }
+        done: dict[str, asyncio.Event] = {name: asyncio.Event() for name in by_name}
+        run_started = time.monotonic()
+
+        async def _run_node(node: SyncNode) -> None:
+            report = reports[node.name]
+            try:
+                for dep in node.deps:
+                    await done[dep].wait()
+                failed_deps = [d for d in node.deps if reports[d].status != "ok"]
+                if failed_deps:
+                    report.status = "skipped"
+                    report.error = f"upstream not ok: {', '.join(failed_deps)}"
+                    return
+
+                queued_at = time.monotonic()
+                # Fixed acquisition order (SOTA, then DB) — no lock-order deadlock.
+                async with AsyncExitStack() as stack:
+                    if node.uses_sota:
+                        await stack.enter_async_context(self._sota_sem)
+                    await stack.enter_async_context(self._db_sem)
+                    started = time.monotonic()
+                    report.wait_seconds = started - queued_at
+                    report.started_at = started - run_started
+                    try:
+                        report.result = await self._run_in_session(node)
+                        report.status = "ok"
+                    except Exception as exc:
+                        report.status = "failed"
+                        report.error = f"{type(exc).__name__}: {exc}"
+                        report.exception = exc
+                        if isinstance(exc, OperationalError):
+                            # Lock timeout / deadlock — expected under
+                            # contention, the caller decides whether to retry.
+                            logger.warning("sync node %s hit DB contention: %s", node.name, exc)
+                        else:
+                            logger.exception("sync node %s failed", node.name)
+                    finally:
+                        report.duration_seconds = time.monotonic() - started
+            finally:
+                done[node.name].set()
+
+        await asyncio.gather(*(_run_node(node) for node in by_name.values()))
+
+        report = SyncDagReport(
+            nodes=list(reports.values()),
+            total_seconds=time.monotonic() - run_started,
+        )
+        logger.info(
+            "sync_dag done: %d nodes in %.1fs (failed=%s)",
+            len(report.nodes), report.total_seconds, report.failed,
+        )
+        return report
+
+    async def _run_in_session(self, node: SyncNode) -> Any:
+        if not node.managed_session:
+            return await node.run(None)
+        async with self.session_factory() as db:
+            try:
+                result = await node.run(db)
+                await db.commit()
+                return result
+            except Exception:
+                await db.rollback()
+                raise
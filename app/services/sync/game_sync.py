@@ -7,7 +7,7 @@ import asyncio
 import logging
 from uuid import UUID
 
-from sqlalchemy import select, or_, update
+from sqlalchemy import select, or_
 from sqlalchemy.dialects.postgresql import insert
 
 from app.models import (
@@ -18,9 +18,13 @@ from app.services.sync.base import (
     BaseSyncService, parse_date, parse_time,
     GAME_PLAYER_STATS_FIELDS, GAME_TEAM_STATS_FIELDS,
 )
+from app.services.player_identity import PlayerIdentityIndex, sota_ids_of
+from app.services.home_widget_snapshots import enqueue_home_widget_refresh
 from app.services.season_visibility import get_current_season_id
 from app.utils.team_name_matcher import TeamNameMatcher, normalize_team_name, _collect_team_names
+from app.utils.bulk_write import bulk_update
 from app.utils.game_event_assists import is_assist_supported_event_type, sync_event_assist
+from app.utils.has_stats import mark_has_stats
 from app.utils.timestamps import utcnow
 
 logger = logging.getLogger(__name__)
@@ -53,6 +57,15 @@ class GameSyncService(BaseSyncService):
         """
         games_data = await self.client.get_games(season_id)
         count = 0
+        existing = {
+            row.id: row
+            for row in await self.db.execute(
+                select(Game.id, Game.date, Game.time, Game.home_score, Game.away_score).where(
+                    Game.id.in_([UUID(g["id"]) for g in games_data])
+                )
+            )
+        }
+        changed_seasons: set[int] = set()
 
         for g in games_data:
             game_id = UUID(g["id"])
@@ -77,7 +90,6 @@ class GameSyncService(BaseSyncService):
                 away_team_id=away_team.get("id") if away_team else None,
                 home_score=home_team.get("score") if home_team else None,
                 away_score=away_team.get("score") if away_team else None,
-                has_stats=g.get("has_stats", False),
                 stadium_id=stadium_id,
                 visitors=g.get("visitors"),
                 updated_at=utcnow(),
@@ -90,7 +102,6 @@ class GameSyncService(BaseSyncService):
                     "tour": stmt.excluded.tour,
                     "home_score": stmt.excluded.home_score,
                     "away_score": stmt.excluded.away_score,
-                    "has_stats": stmt.excluded.has_stats,
                     "stadium_id": stmt.excluded.stadium_id,
                     "visitors": stmt.excluded.visitors,
                     "updated_at": stmt.excluded.updated_at,
@@ -98,8 +109,20 @@ class GameSyncService(BaseSyncService):
             )
             await self.db.execute(stmt)
             count += 1
+            previous = existing.get(game_id)
+            incoming = (
+                parse_date(g["date"]), parse_time(g.get("time")),
+                home_team.get("score") if home_team else None,
+                away_team.get("score") if away_team else None,
+            )
+            if previous is None or tuple(previous[1:]) != incoming:
+                changed_seasons.add(g.get("season_id") or season_id)
 
         await self.db.commit()
+        # Reschedules and score corrections reach the homepage widgets now,
+        # not when their snapshot expires.
+        for changed_season_id in sorted(changed_seasons):
+            await enqueue_home_widget_refresh(changed_season_id)
         logger.info(f"Synced {count} games for season {season_id}")
         return count
 
@@ -242,11 +265,14 @@ class GameSyncService(BaseSyncService):
 
         # Sync player stats
         player_count = 0
+        index = PlayerIdentityIndex()
+        await index.load_sota_ids(self.db, sota_ids_of(stats_data.get("players", [])))
         for ps in stats_data.get("players", []):
             player_id = await self._get_or_create_player_by_sota(
                 ps.get("id"),
                 ps.get("first_name"),
                 ps.get("last_name"),
+                index=index,
             )
             if player_id is None:
                 continue
@@ -307,6 +333,8 @@ class GameSyncService(BaseSyncService):
             await self.db.execute(stmt)
             player_count += 1
 
+        if team_count or player_count:
+            await mark_has_stats(self.db, game_id)
         await self.db.commit()
         logger.info(f"Synced game stats for {game_id}: {team_count} teams, {player_count} players")
 
@@ -601,13 +629,15 @@ class GameSyncService(BaseSyncService):
                     updates[row_id] = {**base, "em_stats": em_data}
             await asyncio.sleep(0.2)
 
-        # Phase C — write in ascending row-id order (deterministic lock order).
+        # Phase C — one bulk UPDATE; row locks taken in ascending row-id order
+        # (deterministic lock order).
         if not updates:
             return 0
-        for row_id in sorted(updates):
-            await self.db.execute(
-                update(GamePlayerStats).where(GamePlayerStats.id == row_id).values(extra_stats=updates[row_id])
-            )
+        await bulk_update(
+            self.db, GamePlayerStats,
+            [{"id": row_id, "extra_stats": updates[row_id]} for row_id in sorted(updates)],
+            lock_in_key_order=True,
+        )
         await self.db.commit()
         return len(updates)
 
@@ -659,13 +689,15 @@ class GameSyncService(BaseSyncService):
                 updates.append((row_id, values))
             await asyncio.sleep(0.2)
 
-        # Phase C — write in ascending row-id order (deterministic lock order).
+        # Phase C — one bulk UPDATE; row locks taken in ascending row-id order
+        # (deterministic lock order).
         if not updates:
             return 0
-        for row_id, values in sorted(updates, key=lambda u: u[0]):
-            await self.db.execute(
-                update(GamePlayerStats).where(GamePlayerStats.id == row_id).values(**values)
-            )
+        await bulk_update(
+            self.db, GamePlayerStats,
+            [{"id": row_id, **values} for row_id, values in updates],
+            lock_in_key_order=True,
+        )
         await self.db.commit()
         return len(updates)
 
@@ -674,6 +706,7 @@ class GameSyncService(BaseSyncService):
         sota_id_raw: str | None,
         first_name: str | None,
         last_name: str | None,
+        index: PlayerIdentityIndex | None = None,
     ) -> int | None:
         if not sota_id_raw:
             return None
@@ -683,11 +716,11 @@ class GameSyncService(BaseSyncService):
         except (ValueError, TypeError):
             return None
 
-        result = await self.db.execute(select(Player).where(Player.sota_id == sota_id))
-        player = result.scalar_one_or_none()
-
-        if player is not None:
-            return player.id
+        index = index or PlayerIdentityIndex()
+        await index.load_sota_ids(self.db, [sota_id])
+        player_id = index.by_sota_id(sota_id)
+        if player_id is not None:
+            return player_id
 
         player = Player(
             sota_id=sota_id,
@@ -697,6 +730,7 @@ class GameSyncService(BaseSyncService):
         )
         self.db.add(player)
         await self.db.flush()
+        index.put(player)
         return player.id
 
     def _event_signature(self, event_type_value: str, half: int, minute: int,
@@ -1249,31 +1283,34 @@ class GameSyncService(BaseSyncService):
     async def backfill_player_stats_from_extra(self, season_id: int) -> int:
         """Fill minutes_played and pass_accuracy from extra_stats JSONB."""
         result = await self.db.execute(
-            select(GamePlayerStats)
+            select(
+                GamePlayerStats.id,
+                GamePlayerStats.minutes_played,
+                GamePlayerStats.pass_accuracy,
+                GamePlayerStats.extra_stats,
+            )
             .join(Game, GamePlayerStats.game_id == Game.id)
             .where(
                 Game.season_id == season_id,
                 GamePlayerStats.extra_stats.isnot(None),
             )
         )
-        rows = result.scalars().all()
-        updated = 0
-        for ps in rows:
-            changed = False
+        updates: list[dict] = []
+        for ps in result.all():
+            row: dict = {"id": ps.id}
             ex = ps.extra_stats or {}
             if ps.minutes_played is None and ex.get("time_on_field_total"):
                 try:
-                    ps.minutes_played = int(ex["time_on_field_total"])
-                    changed = True
+                    row["minutes_played"] = int(ex["time_on_field_total"])
                 except (ValueError, TypeError):
                     pass
             if ps.pass_accuracy is None and ex.get("pass_ratio"):
                 try:
-                    ps.pass_accuracy = float(ex["pass_ratio"])
-                    changed = True
+                    row["pass_accuracy"] = float(ex["pass_ratio"])
                 except (ValueError, TypeError):
                     pass
-            if changed:
-                updated += 1
+            if len(row) > 1:
+                updates.append(row)
+        updated = await bulk_update(self.db, GamePlayerStats, updates)
         await self.db.commit()
         return updated
@@ -8,10 +8,11 @@ import logging
 from typing import Any
 
 from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.models.season import Season
 from app.services.sota_client import SotaClient, get_sota_client
+from app.services.sync.dag import SyncDagExecutor, SyncDagReport, SyncNode
 from app.services.sync.player_sync import PlayerSyncService
 from app.services.sync.game_sync import GameSyncService
 from app.services.sync.lineup_sync import LineupSyncService
@@ -205,6 +206,36 @@ class SyncOrchestrator:
         logger.info(f"Full sync complete for season {season_id}: {results}")
         return results
 
+    @staticmethod
+    def full_sync_nodes(
+        season_id: int,
+        *,
+        force: bool = False,
+        client: SotaClient | None = None,
+    ) -> list[SyncNode]:
+        """The ``full_sync`` steps for one season as DAG nodes.
+
+        Aggregates and best players only need games in place; best players
+        overwrites goal/assist columns on player_season_stats, so it must run
+        after the player-stats step that (re)creates those rows.
+        """
+        def step(method_name: str):
+            async def _run(db: AsyncSession):
+                orchestrator = SyncOrchestrator(db, client)
+                return await getattr(orchestrator, method_name)(season_id, force=force)
+            return _run
+
+        prefix = f"season:{season_id}"
+        games = f"{prefix}:games"
+        player_stats = f"{prefix}:player_season_stats"
+        return [
+            SyncNode(games, step("sync_games")),
+            SyncNode(f"{prefix}:team_season_stats", step("sync_team_season_stats"), deps=(games,)),
+            SyncNode(player_stats, step("sync_player_stats"), deps=(games,)),
+            SyncNode(f"{prefix}:best_players", step("sync_best_players"), deps=(player_stats,)),
+            SyncNode(f"{prefix}:team_of_week", step("sync_team_of_week"), deps=(games,)),
+        ]
+
     async def sync_live_stats(self, season_id: int, game_ids: list[int]) -> dict[str, int]:
         stats_synced = 0
         for game_id in game_ids:
@@ -212,3 +243,48 @@ class SyncOrchestrator:
             stats_synced += 1
 
         return {"games_stats_synced": stats_synced}
+
+
+async def run_full_sync_dag(
+    season_ids: list[int],
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    force: bool = False,
+    sota_concurrency: int | None = None,
+    db_concurrency: int | None = None,
+) -> dict[str, Any]:
+    """Full sync for several seasons at once through ``SyncDagExecutor``.
+
+    Seasons are independent of each other, so their chains interleave under
+    the global SOTA/DB caps. Returns the per-node timing report plus the
+    list of seasons skipped because sync is disabled.
+    """
+    from app.config import get_settings
+
+    settings = get_settings()
+    skipped: list[int] = []
+    active: list[int] = []
+    async with session_factory() as db:
+        orchestrator = SyncOrchestrator(db)
+        for season_id in dict.fromkeys(season_ids):
+            if force or await orchestrator.is_sync_enabled(season_id):
+                active.append(season_id)
+            else:
+                skipped.append(season_id)
+
+    client = get_sota_client()
+    nodes: list[SyncNode] = []
+    for season_id in active:
+        nodes.extend(SyncOrchestrator.full_sync_nodes(season_id, force=force, client=client))
+
+    executor = SyncDagExecutor(
+        session_factory,
+        sota_concurrency=sota_concurrency or settings.sync_dag_sota_concurrency,
+        db_concurrency=db_concurrency or settings.sync_dag_db_concurrency,
+    )
+    report: SyncDagReport = await executor.run(nodes)
+    return {
+        "seasons": active,
+        "skipped_seasons": skipped,
+        **report.as_dict(),
+    }
@@ -10,7 +10,6 @@ import logging
 from typing import Any
 
 from sqlalchemy import select, func
-from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import selectinload
 
 from app.models.game import Game
@@ -20,6 +19,7 @@ from app.models.player_team import PlayerTeam
 from app.models.team import Team
 from app.models.team_of_week import TeamOfWeek
 from app.services.sync.base import BaseSyncService
+from app.utils.bulk_write import bulk_upsert
 from app.utils.file_urls import resolve_file_url
 
 logger = logging.getLogger(__name__)
@@ -413,7 +413,6 @@ class TeamOfWeekSyncService(BaseSyncService):
             f"(SOTA {sota_season_id}), {len(tour_keys)} tours"
         )
 
-        tours_synced = 0
         tours_skipped = 0
         tours_empty = 0
 
@@ -471,7 +470,8 @@ class TeamOfWeekSyncService(BaseSyncService):
                         }
                 ru_names_by_tour[tour_key] = names
 
-        # Phase 4: map and upsert
+        # Phase 4: map, then upsert every tour/locale in one statement
+        rows: list[dict[str, Any]] = []
         for (tour_key, locale), sota_data in fetched.items():
             enrichment = enrichment_by_tour.get(tour_key, {})
             ru_names = ru_names_by_tour.get(tour_key) if locale != "ru" else None
@@ -483,22 +483,18 @@ class TeamOfWeekSyncService(BaseSyncService):
                 tours_empty += 1
                 continue
 
-            stmt = pg_insert(TeamOfWeek).values(
-                season_id=season_id,
-                tour_key=tour_key,
-                locale=locale,
-                scheme=scheme,
-                payload=payload,
-            )
-            stmt = stmt.on_conflict_do_update(
-                constraint="uq_team_of_week_season_tour_locale",
-                set_={
-                    "scheme": stmt.excluded.scheme,
-                    "payload": stmt.excluded.payload,
-                },
-            )
-            await self.db.execute(stmt)
-            tours_synced += 1
+            rows.append({
+                "season_id": season_id,
+                "tour_key": tour_key,
+                "locale": locale,
+                "scheme": scheme,
+                "payload": payload,
+            })
+        tours_synced = await bulk_upsert(
+            self.db, TeamOfWeek, rows,
+            index_elements=["season_id", "tour_key", "locale"],
+            update_columns=["scheme", "payload"],
+        )
 
         await self.db.commit()
         result = {
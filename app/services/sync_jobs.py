@@ -0,0 +1,382 @@
+"""Checkpointed, resumable bulk sync jobs.
+
+Season-wide backfills don't fit in one Celery invocation (600s soft limit)
+and used to restart from scratch after a time limit or worker restart. A job
+is now planned up front as an ordered list of units (one game, one tour, one
+season aggregate step), persisted in ``sync_job_units``. ``run_job_slice``
+drains pending units for a bounded time budget, checkpointing each unit in
+its own transaction; the Celery wrapper re-enqueues the job until nothing is
+left.
+
+Unit runners must be idempotent — a unit interrupted mid-flight is simply
+run again on resume. ``attempts`` is bumped *before* a unit runs, so a unit
+that keeps killing its worker is given up after ``max_attempts`` instead of
+looping forever.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.sync_job import SyncJob, SyncJobUnit
+from app.utils.timestamps import utcnow
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_PAUSED = "paused"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+TERMINAL_JOB_STATUSES = (JOB_COMPLETED, JOB_FAILED)
+
+UNIT_PENDING = "pending"
+UNIT_DONE = "done"
+UNIT_FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class UnitContext:
+    job_id: int
+    params: dict[str, Any]
+    unit_key: str
+    session_factory: async_sessionmaker[AsyncSession]
+
+
+@dataclass(frozen=True)
+class SyncJobKind:
+    """How to plan and run one kind of bulk job.
+
+    ``plan`` returns the ordered unit keys for the given params; ``run_unit``
+    performs one unit (opening its own sessions) and returns a JSON-able
+    result that is stored on the unit row. ``on_complete`` (optional) runs
+    once when the last unit is checkpointed.
+    """
+    name: str
+    plan: Callable[[AsyncSession, dict[str, Any]], Awaitable[list[str]]]
+    run_unit: Callable[[UnitContext], Awaitable[dict[str, Any] | None]]
+    on_complete: Callable[[SyncJob], Awaitable[None]] | None = None
+    max_attempts: int = 3
+
+
+_KINDS: dict[str, SyncJobKind] = {}
+
+
+def register_job_kind(kind: SyncJobKind) -> SyncJobKind:
+    _KINDS[kind.name] = kind
+    return kind
+
+
+def get_job_kind(name: str) -> SyncJobKind:
+    try:
+        return _KINDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown sync job kind {name!r}") from None
+
+
+def registered_job_kinds() -> list[str]:
+    return sorted(_KINDS)
+
+
+# ---------------------------------------------------------------------------
+# Lifecycle
+# ---------------------------------------------------------------------------
+
+async def create_job(
+    db: AsyncSession,
+    kind_name: str,
+    params: dict[str, Any],
+    *,
+    triggered_by: str = "admin",
+) -> SyncJob:
+    """Plan a job and persist it with all units pending. Caller commits."""
+    kind = get_job_kind(kind_name)
+    unit_keys = list(dict.fromkeys(await kind.plan(db, params)))
+    job = SyncJob(
+        kind=kind_name,
+        params=params,
+        status=JOB_PENDING if unit_keys else JOB_COMPLETED,
+        units_total=len(unit_keys),
+        triggered_by=triggered_by,
+        completed_at=None if unit_keys else utcnow(),
+    )
+    db.add(job)
+    await db.flush()
+    db.add_all(
+        SyncJobUnit(job_id=job.id, position=i, unit_key=key)
+        for i, key in enumerate(unit_keys)
+    )
+    await db.flush()
+    return job
+
+
+async def pause_job(db: AsyncSession, job_id: int) -> SyncJob | None:
+    """Request a pause; the running slice stops after its current unit."""
+    job = await db.get(SyncJob, job_id)
+    if job is not None and job.status in (JOB_PENDING, JOB_RUNNING):
+        job.status = JOB_PAUSED
+    return job
+
+
+async def resume_job(db: AsyncSession, job_id: int, *, retry_failed: bool = False) -> SyncJob | None:
+    """Make a paused (or finished-with-failures) job runnable again.
+
+    ``retry_failed`` resets given-up units to pending with a fresh attempt
+    budget. Caller commits and enqueues the slice task.
+    """
+    job = await db.get(SyncJob, job_id)
+    if job is None:
+        return None
+    if retry_failed:
+        await db.execute(
+            update(SyncJobUnit)
+            .where(SyncJobUnit.job_id == job_id, SyncJobUnit.status == UNIT_FAILED)
+            .values(status=UNIT_PENDING, attempts=0, error=None, finished_at=None)
+        )
+        job.units_failed = 0
+    if job.status == JOB_PAUSED or (retry_failed and job.status in TERMINAL_JOB_STATUSES):
+        job.status = JOB_PENDING
+        job.completed_at = None
+        job.error_message = None
+    return job
+
+
+async def find_stale_jobs(db: AsyncSession, *, stale_after: timedelta) -> list[int]:
+    """Running/pending jobs whose worker went away (restart, hard time limit)."""
+    cutoff = utcnow() - stale_after
+    result = await db.execute(
+        select(SyncJob.id).where(
+            SyncJob.status.in_((JOB_PENDING, JOB_RUNNING)),
+            func.coalesce(SyncJob.heartbeat_at, SyncJob.created_at) < cutoff,
+        )
+    )
+    return list(result.scalars().all())
+
+
+async def job_summary(db: AsyncSession, job_id: int, *, failed_limit: int = 20) -> dict[str, Any] | None:
+    job = await db.get(SyncJob, job_id)
+    if job is None:
+        return None
+    failed = await db.execute(
+        select(SyncJobUnit.unit_key, SyncJobUnit.attempts, SyncJobUnit.error)
+        .where(SyncJobUnit.job_id == job_id, SyncJobUnit.status == UNIT_FAILED)
+        .order_by(SyncJobUnit.position)
+        .limit(failed_limit)
+    )
+    next_units = await _next_pending_units(db, [job_id])
+    return _summary(job, next_units.get(job_id), failed)
+
+
+async def list_job_summaries(db: AsyncSession, *, limit: int) -> list[dict[str, Any]]:
+    """Newest jobs first, without failed units — two queries for the whole page."""
+    result = await db.execute(select(SyncJob).order_by(SyncJob.id.desc()).limit(limit))
+    jobs = list(result.scalars().all())
+    next_units = await _next_pending_units(db, [job.id for job in jobs])
+    return [_summary(job, next_units.get(job.id), []) for job in jobs]
+
+
+async def _next_pending_units(db: AsyncSession, job_ids: list[int]) -> dict[int, str]:
+    """Key of the first pending unit of each job (jobs with none are absent)."""
+    if not job_ids:
+        return {}
+    first = (
+        select(SyncJobUnit.job_id, func.min(SyncJobUnit.position).label("position"))
+        .where(SyncJobUnit.job_id.in_(job_ids), SyncJobUnit.status == UNIT_PENDING)
+        .group_by(SyncJobUnit.job_id)
+        .subquery()
+    )
+    result = await db.execute(
+        select(SyncJobUnit.job_id, SyncJobUnit.unit_key).join(
+            first,
+            (SyncJobUnit.job_id == first.c.job_id) & (SyncJobUnit.position == first.c.position),
+        )
+    )
+    return {row.job_id: row.unit_key for row in result}
+
+
+def _summary(job: SyncJob, next_unit: str | None, failed) -> dict[str, Any]:
+    return {
+        "id": job.id,
+        "kind": job.kind,
+        "params": job.params,
+        "status": job.status,
+        "units_total": job.units_total,
+        "units_done": job.units_done,
+        "units_failed": job.units_failed,
+        "units_pending": job.units_total - job.units_done - job.units_failed,
+        "next_unit": next_unit,
+        "slices": job.slices,
+        "error_message": job.error_message,
+        "triggered_by": job.triggered_by,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "heartbeat_at": job.heartbeat_at,
+        "completed_at": job.completed_at,
+        "failed_units": [
+            {"unit_key": row.unit_key, "attempts": row.attempts, "error": row.error}
+            for row in failed
+        ],
+    }
+
+
+async def completed_unit_results(
+    db: AsyncSession, job_id: int, *, prefix: str,
+) -> dict[str, dict[str, Any]]:
+    """Results of done units whose key starts with ``prefix`` (for fan-in units)."""
+    result = await db.execute(
+        select(SyncJobUnit.unit_key, SyncJobUnit.result).where(
+            SyncJobUnit.job_id == job_id,
+            SyncJobUnit.status == UNIT_DONE,
+            SyncJobUnit.unit_key.startswith(prefix),
+        )
+    )
+    return {row.unit_key: row.result or {} for row in result}
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+async def run_job_slice(
+    job_id: int,
+    *,
+    session_factory: async_sessionmaker[AsyncSession],
+    budget_seconds: float,
+) -> str:
+    """Run pending units until the budget is spent, the job is paused, or done.
+
+    Returns the job status afterwards; ``"running"`` means units remain and
+    the caller should schedule another slice.
+    """
+    slice_started = time.monotonic()
+
+    async with session_factory() as db:
+        job = await db.get(SyncJob, job_id)
+        if job is None:
+            logger.warning("sync job %s not found", job_id)
+            return JOB_FAILED
+        if job.status not in (JOB_PENDING, JOB_RUNNING):
+            return job.status
+        kind = get_job_kind(job.kind)
+        params = dict(job.params or {})
+        now = utcnow()
+        job.status = JOB_RUNNING
+        job.started_at = job.started_at or now
+        job.heartbeat_at = now
+        job.slices += 1
+        await db.commit()
+
+    units_run = 0
+    while time.monotonic() - slice_started < budget_seconds:
+        # Claim the next unit: re-read the job so a pause lands between units.
+        async with session_factory() as db:
+            job = await db.get(SyncJob, job_id)
+            if job is None or job.status != JOB_RUNNING:
+                return job.status if job is not None else JOB_FAILED
+            unit = await db.scalar(
+                select(SyncJobUnit)
+                .where(SyncJobUnit.job_id == job_id, SyncJobUnit.status == UNIT_PENDING)
+                .order_by(SyncJobUnit.position)
+                .limit(1)
+            )
+            if unit is None:
+                await _finish_job(db, job, kind)
+                return job.status
+            unit_id = unit.id
+            unit_key = unit.unit_key
+            unit.attempts += 1
+            attempts = unit.attempts
+            job.heartbeat_at = utcnow()
+            await db.commit()
+
+        if attempts > kind.max_attempts:
+            await _checkpoint_unit(
+                session_factory, job_id, unit_id,
+                status=UNIT_FAILED,
+                error=f"gave up after {kind.max_attempts} attempts (worker lost mid-unit)",
+            )
+            continue
+
+        ctx = UnitContext(
+            job_id=job_id, params=params, unit_key=unit_key, session_factory=session_factory,
+        )
+        unit_started = time.monotonic()
+        try:
+            result = await kind.run_unit(ctx)
+        except Exception as exc:
+            logger.warning(
+                "sync job %s unit %s failed (attempt %d/%d): %s",
+                job_id, unit_key, attempts, kind.max_attempts, exc,
+            )
+            await _checkpoint_unit(
+                session_factory, job_id, unit_id,
+                status=UNIT_FAILED if attempts >= kind.max_attempts else UNIT_PENDING,
+                error=f"{type(exc).__name__}: {exc}",
+            )
+            continue
+
+        await _checkpoint_unit(
+            session_factory, job_id, unit_id, status=UNIT_DONE, result=result,
+        )
+        units_run += 1
+        logger.info(
+            "sync job %s unit %s done in %.1fs",
+            job_id, unit_key, time.monotonic() - unit_started,
+        )
+
+    logger.info(
+        "sync job %s slice budget spent after %d units (%.0fs)",
+        job_id, units_run, time.monotonic() - slice_started,
+    )
+    return JOB_RUNNING
+
+
+async def _checkpoint_unit(
+    session_factory: async_sessionmaker[AsyncSession],
+    job_id: int,
+    unit_id: int,
+    *,
+    status: str,
+    result: dict[str, Any] | None = None,
+    error: str | None = None,
+) -> None:
+    async with session_factory() as db:
+        unit = await db.get(SyncJobUnit, unit_id)
+        job = await db.get(SyncJob, job_id)
+        now = utcnow()
+        unit.status = status
+        unit.error = error
+        if status == UNIT_DONE:
+            unit.result = result
+            unit.finished_at = now
+            job.units_done += 1
+        elif status == UNIT_FAILED:
+            unit.finished_at = now
+            job.units_failed += 1
+        job.heartbeat_at = now
+        await db.commit()
+
+
+async def _finish_job(db: AsyncSession, job: SyncJob, kind: SyncJobKind) -> None:
+    job.status = JOB_COMPLETED
+    job.completed_at = utcnow()
+    if job.units_failed:
+        job.error_message = f"{job.units_failed} of {job.units_total} units failed"
+    await db.commit()
+    logger.info(
+        "sync job %s (%s) completed: %d done, %d failed",
+        job.id, job.kind, job.units_done, job.units_failed,
+    )
+    if kind.on_complete is not None:
+        try:
+            await kind.on_complete(job)
+        except Exception:
+            logger.exception("sync job %s on_complete hook failed", job.id)
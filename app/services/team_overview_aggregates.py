@@ -0,0 +1,240 @@
+"""Per-team, per-season aggregates behind ``/teams/{id}/overview``.
+
+The overview used to load every game of the team in the season, enrich all
+of them with ``has_stats``, rank every player of the squad and read
+``TeamSeasonStats`` on each cache miss — and its cache key carried
+``fixtures_limit``/``leaders_limit``, so the same data was rebuilt for every
+limit combination.
+
+The language-independent part is now kept as a small JSON record in Redis,
+one per (season, team):
+
+- ``summary``: ``TeamOverviewSummary`` fields (``TeamSeasonStats``, or the
+  W/D/L fallback computed from finished games);
+- ``form_game_ids``: the last five finished games, newest first (the first
+  one is ``recent_match``);
+- ``upcoming_game_ids``: the next ``MAX_FIXTURES`` games;
+- ``leaders``: candidate player ids per metric, ranked, with ties at the
+  cut-off kept so the endpoint's localized name tie-break still picks the
+  same players.
+
+The endpoint loads only those games and players and slices by limit at
+response time. Records are rebuilt for the two teams of a game on lifecycle
+transitions and admin edits, and for the whole season after a stats sync
+(``refresh_team_overview_aggregates``); ``AGGREGATE_TTL`` bounds staleness
+after writers that do not (FCMS schedule sync). A miss builds inline.
+"""
+
+import json
+import logging
+from collections.abc import Callable, Iterable
+
+from sqlalchemy import or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import Game, PlayerSeasonStats, PlayerTeam, TeamSeasonStats
+from app.schemas.team import TeamOverviewSummary
+from app.services.team_overview import _compute_summary_from_games, _safe_int
+
+logger = logging.getLogger(__name__)
+
+AGGREGATE_KEY_PREFIX = "qfl:team_overview"
+AGGREGATE_TTL = 3600
+# Upper bounds of the endpoint's fixtures_limit / leaders_limit.
+MAX_FIXTURES = 10
+MAX_LEADERS = 20
+FORM_LENGTH = 5
+
+# leaders key -> (metric, candidates kept)
+_RANKED_LEADERS: dict[str, tuple[str, int]] = {
+    "goal": ("goal", MAX_LEADERS),
+    "goal_pass": ("goal_pass", MAX_LEADERS),
+    "passes": ("passes", 1),
+    "games_played": ("games_played", 1),
+    "red_cards": ("red_cards", 1),
+}
+# leaders key -> (PlayerTeam.amplua, metric); "games_starting" is the GK order.
+_POSITION_LEADERS: dict[str, tuple[int, str]] = {
+    "gk": (1, "games_starting"),
+    "def": (2, "passes"),
+    "mid": (3, "passes"),
+    "fwd": (4, "shot"),
+}
+
+
+def team_overview_aggregate_key(season_id: int, team_id: int) -> str:
+    return f"{AGGREGATE_KEY_PREFIX}:{season_id}:{team_id}"
+
+
+async def _redis():
+    try:
+        from app.utils.live_flag import get_redis
+
+        return await get_redis()
+    except Exception:
+        return None
+
+
+def _top_ids(rows: list[dict], key: Callable[[dict], tuple], limit: int) -> list[int]:
+    """Player ids of the ``limit`` best rows, plus any tied with the last one."""
+    ranked = sorted(rows, key=key, reverse=True)
+    if len(ranked) > limit:
+        cutoff = key(ranked[limit - 1])
+        ranked = [row for row in ranked if key(row) >= cutoff]
+    return [row["player_id"] for row in ranked]
+
+
+async def _build_summary(db: AsyncSession, team_id: int, season_id: int, finished: list) -> dict:
+    stats = (
+        await db.execute(
+            select(TeamSeasonStats).where(
+                TeamSeasonStats.team_id == team_id,
+                TeamSeasonStats.season_id == season_id,
+            )
+        )
+    ).scalar_one_or_none()
+    if stats is None:
+        return _compute_summary_from_games(team_id, finished).model_dump()
+
+    goals_scored = _safe_int(stats.goal)
+    goals_conceded = _safe_int(stats.goals_conceded)
+    goal_difference = (
+        _safe_int(stats.goals_difference)
+        if stats.goals_difference is not None
+        else goals_scored - goals_conceded
+    )
+    return TeamOverviewSummary(
+        games_played=_safe_int(stats.games_played),
+        win=_safe_int(stats.win),
+        draw=_safe_int(stats.draw),
+        match_loss=_safe_int(stats.match_loss),
+        goal=goals_scored,
+        goals_conceded=goals_conceded,
+        goal_difference=goal_difference,
+        points=_safe_int(stats.points),
+    ).model_dump()
+
+
+async def _build_leaders(db: AsyncSession, team_id: int, season_id: int) -> dict[str, list[int]]:
+    contract_amplua_subq = (
+        select(PlayerTeam.amplua)
+        .where(
+            PlayerTeam.player_id == PlayerSeasonStats.player_id,
+            PlayerTeam.team_id == PlayerSeasonStats.team_id,
+            PlayerTeam.season_id == PlayerSeasonStats.season_id,
+        )
+        .limit(1)
+        .correlate(PlayerSeasonStats)
+        .scalar_subquery()
+    )
+    result = await db.execute(
+        select(
+            PlayerSeasonStats.player_id,
+            PlayerSeasonStats.goal,
+            PlayerSeasonStats.goal_pass,
+            PlayerSeasonStats.passes,
+            PlayerSeasonStats.games_played,
+            PlayerSeasonStats.red_cards,
+            PlayerSeasonStats.shot,
+            PlayerSeasonStats.games_starting,
+            contract_amplua_subq.label("amplua"),
+        ).where(
+            PlayerSeasonStats.season_id == season_id,
+            PlayerSeasonStats.team_id == team_id,
+        )
+    )
+    rows = []
+    for row in result.all():
+        values = {name: _safe_int(value) for name, value in row._mapping.items()}
+        values["amplua"] = row.amplua
+        rows.append(values)
+
+    leaders: dict[str, list[int]] = {}
+    for name, (metric, limit) in _RANKED_LEADERS.items():
+        leaders[name] = _top_ids(rows, lambda row, m=metric: (row[m], row["games_played"]), limit)
+    for name, (amplua, metric) in _POSITION_LEADERS.items():
+        group = [row for row in rows if row["amplua"] == amplua]
+        if metric == "games_starting":
+            leaders[name] = _top_ids(group, lambda row: (row["games_starting"],), 1)
+        else:
+            leaders[name] = _top_ids(group, lambda row, m=metric: (row[m], row["games_played"]), 1)
+    return leaders
+
+
+async def build_team_overview_aggregate(db: AsyncSession, team_id: int, season_id: int) -> dict:
+    games = (
+        await db.execute(
+            select(Game)
+            .where(
+                Game.season_id == season_id,
+                or_(Game.home_team_id == team_id, Game.away_team_id == team_id),
+            )
+            .order_by(Game.date.desc(), Game.time.desc())
+        )
+    ).scalars().all()
+    finished = [g for g in games if g.home_score is not None and g.away_score is not None]
+    upcoming = sorted(
+        (g for g in games if g.home_score is None or g.away_score is None),
+        key=lambda game: (game.date, game.time.isoformat() if game.time else ""),
+    )
+    return {
+        "summary": await _build_summary(db, team_id, season_id, finished),
+        "form_game_ids": [g.id for g in finished[:FORM_LENGTH]],
+        "upcoming_game_ids": [g.id for g in upcoming[:MAX_FIXTURES]],
+        "leaders": await _build_leaders(db, team_id, season_id),
+    }
+
+
+async def _store(season_id: int, team_id: int, aggregate: dict) -> None:
+    redis = await _redis()
+    if redis is None:
+        return
+    try:
+        await redis.set(
+            team_overview_aggregate_key(season_id, team_id),
+            json.dumps(aggregate, separators=(",", ":")),
+            ex=AGGREGATE_TTL,
+        )
+    except Exception:
+        logger.debug("team overview aggregate write failed for %s/%s", season_id, team_id, exc_info=True)
+
+
+async def get_team_overview_aggregate(db: AsyncSession, team_id: int, season_id: int) -> dict:
+    """The stored aggregate, or a fresh build (stored for the next reader)."""
+    redis = await _redis()
+    if redis is not None:
+        try:
+            raw = await redis.get(team_overview_aggregate_key(season_id, team_id))
+        except Exception:
+            raw = None
+        if raw is not None:
+            return json.loads(raw)
+
+    aggregate = await build_team_overview_aggregate(db, team_id, season_id)
+    await _store(season_id, team_id, aggregate)
+    return aggregate
+
+
+async def refresh_team_overview_aggregates(
+    db: AsyncSession,
+    season_id: int,
+    team_ids: Iterable[int] | None = None,
+) -> int:
+    """Rebuild and store the aggregates of ``team_ids`` (every team with a game
+    in the season for ``None``); returns how many were written. Never raises.
+    """
+    try:
+        if team_ids is None:
+            rows = await db.execute(
+                select(Game.home_team_id, Game.away_team_id).where(Game.season_id == season_id)
+            )
+            team_ids = {team_id for row in rows.all() for team_id in row if team_id is not None}
+        written = 0
+        for team_id in sorted({team_id for team_id in team_ids if team_id is not None}):
+            await _store(season_id, team_id, await build_team_overview_aggregate(db, team_id, season_id))
+            written += 1
+        return written
+    except Exception:
+        logger.exception("Team overview aggregate refresh failed for season %s", season_id)
+        await db.rollback()
+        return 0
@@ -3,6 +3,7 @@ import logging
 import httpx
 
 from app.config import get_settings
+from app.utils.metrics import observe_outbound
 
 logger = logging.getLogger(__name__)
 
@@ -32,11 +33,13 @@ async def send_telegram_document(file_bytes: bytes, filename: str, caption: str
     url = f"https://api.telegram.org/bot{settings.telegram_bot_token}/sendDocument"
     try:
         async with httpx.AsyncClient(timeout=30) as client:
-            resp = await client.post(
-                url,
-                data={"chat_id": settings.telegram_chat_id, "caption": caption, "parse_mode": "HTML"},
-                files={"document": (filename, file_bytes, "application/pdf")},
-            )
+            with observe_outbound("api.telegram.org") as call:
+                resp = await client.post(
+                    url,
+                    data={"chat_id": settings.telegram_chat_id, "caption": caption, "parse_mode": "HTML"},
+                    files={"document": (filename, file_bytes, "application/pdf")},
+                )
+                call.status(resp.status_code)
             if resp.status_code != 200:
                 logger.error("Telegram sendDocument error %s: %s", resp.status_code, resp.text[:200])
     except Exception:
@@ -59,7 +62,9 @@ async def send_telegram_message(text: str) -> None:
     }
     try:
         async with httpx.AsyncClient(timeout=10) as client:
-            resp = await client.post(url, json=payload)
+            with observe_outbound("api.telegram.org") as call:
+                resp = await client.post(url, json=payload)
+                call.status(resp.status_code)
             if resp.status_code != 200:
                 logger.error("Telegram API error %s: %s", resp.status_code, resp.text[:200])
     except Exception:
@@ -90,7 +95,9 @@ async def send_public_telegram_message(text: str) -> bool:
         "disable_web_page_preview": False,
     }
     async with httpx.AsyncClient(timeout=10) as client:
-        resp = await client.post(url, json=payload)
+        with observe_outbound("api.telegram.org") as call:
+            resp = await client.post(url, json=payload)
+            call.status(resp.status_code)
         if resp.status_code == 200:
             return True
         logger.error(
@@ -15,7 +15,7 @@ from dataclasses import dataclass
 from collections import OrderedDict, defaultdict
 from datetime import date, datetime, time, timedelta
 
-from sqlalchemy import select
+from sqlalchemy import or_, select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
@@ -38,9 +38,10 @@ from app.models.season import Season
 from app.models.championship import Championship
 from app.models.stadium import Stadium
 from app.services.telegram_user_client import send_public_user_message as send_public_telegram_message
-from app.services.telegram_user_client import send_public_user_photo
+from app.services.telegram_user_client import PublicTelegramSender, send_public_user_photo
 from app.utils.localization import get_localized_field
 from app.utils.timestamps import utcnow
+from app.utils.video_transcode import HLS_FALLBACK_MP4, hls_sibling
 
 logger = logging.getLogger(__name__)
 
@@ -890,24 +891,7 @@ RED_TYPES = {GameEventType.red_card, GameEventType.second_yellow}
 POSTABLE_EVENT_TYPES = GOAL_TYPES | RED_TYPES
 
 
-async def post_game_event(db: AsyncSession, event_id: int) -> bool:
-    q = (
-        select(GameEvent)
-        .where(GameEvent.id == event_id)
-        .options(
-            selectinload(GameEvent.game).selectinload(Game.home_team),
-            selectinload(GameEvent.game).selectinload(Game.away_team),
-        )
-    )
-    event = (await db.execute(q)).scalar_one_or_none()
-    if event is None or event.telegram_sent_at is not None:
-        return False
-    if event.event_type not in POSTABLE_EVENT_TYPES:
-        return False
-
-    game = event.game
-    if game is None:
-        return False
+def _game_event_text(event: GameEvent, game: Game) -> str:
     # Tight score variant for goal/card cards: "{H} «H» 1:0«A» {A}"
     home_e = _team_emoji(game.home_team)
     away_e = _team_emoji(game.away_team)
@@ -922,17 +906,50 @@ async def post_game_event(db: AsyncSession, event_id: int) -> bool:
 
     if event.event_type in GOAL_TYPES:
         tag = _goal_tag(event)
-        text = (
+        return (
             f"{GOAL_EMOJI_HTML}ГООООЛ\n\n"
             f"{scorer_team_emoji} <b>{surname}</b> {event.minute}'{tag}\n\n"
             f"{score}"
         )
-    else:  # red / second_yellow
-        text = (
-            f"🟥ҚЫЗЫЛ\n\n"
-            f"{scorer_team_emoji} {surname} {event.minute}'\n\n"
-            f"{score}"
+    # red / second_yellow
+    return (
+        f"🟥ҚЫЗЫЛ\n\n"
+        f"{scorer_team_emoji} {surname} {event.minute}'\n\n"
+        f"{score}"
+    )
+
+
+def _enqueue_goal_video(event: GameEvent) -> None:
+    """If the clip is already there, queue the video attach on its dedicated worker."""
+    if not getattr(event, "video_url", None):
+        return
+    try:
+        from app.tasks.telegram_tasks import post_goal_video_task
+
+        post_goal_video_task.delay(event.id)
+    except Exception:
+        logger.exception("failed to enqueue goal video for event %s", event.id)
+
+
+async def post_game_event(db: AsyncSession, event_id: int) -> bool:
+    q = (
+        select(GameEvent)
+        .where(GameEvent.id == event_id)
+        .options(
+            selectinload(GameEvent.game).selectinload(Game.home_team),
+            selectinload(GameEvent.game).selectinload(Game.away_team),
         )
+    )
+    event = (await db.execute(q)).scalar_one_or_none()
+    if event is None or event.telegram_sent_at is not None:
+        return False
+    if event.event_type not in POSTABLE_EVENT_TYPES:
+        return False
+
+    game = event.game
+    if game is None:
+        return False
+    text = _game_event_text(event, game)
 
     # Reply-thread the goal/card under the match's lineup post.
     reply_to = game.lineup_telegram_message_id
@@ -947,16 +964,121 @@ async def post_game_event(db: AsyncSession, event_id: int) -> bool:
     event.telegram_message_id = msg_id
     await db.commit()
 
-    # If video already present, queue the video attach on its dedicated worker.
-    if getattr(event, "video_url", None):
-        try:
-            from app.tasks.telegram_tasks import post_goal_video_task
+    _enqueue_goal_video(event)
+    return True
 
-            post_goal_video_task.delay(event.id)
-        except Exception:
-            logger.exception("failed to enqueue goal video for event %s", event.id)
 
-    return True
+# A claim older than this belongs to a run that died mid-send (FloodWait
+# sleeps are capped at 60s), so another run may take the event over.
+EVENT_CLAIM_TIMEOUT = timedelta(minutes=5)
+
+
+async def _claim_next_event(
+    db: AsyncSession, game_id: int, skipped: set[int],
+) -> GameEvent | None:
+    """Mark the oldest unsent, unclaimed postable event as being sent, and commit.
+
+    The claim is a compare-and-set on ``telegram_sending_at``: a concurrent
+    run that picked the same row updates nothing and moves on to the next.
+    """
+    while True:
+        now = utcnow()
+        claimable = (
+            GameEvent.telegram_sent_at.is_(None),
+            or_(
+                GameEvent.telegram_sending_at.is_(None),
+                GameEvent.telegram_sending_at < now - EVENT_CLAIM_TIMEOUT,
+            ),
+        )
+        stmt = (
+            select(GameEvent)
+            .where(
+                GameEvent.game_id == game_id,
+                GameEvent.event_type.in_(POSTABLE_EVENT_TYPES),
+                *claimable,
+            )
+            .order_by(GameEvent.half, GameEvent.minute, GameEvent.id)
+            .limit(1)
+        )
+        if skipped:
+            stmt = stmt.where(GameEvent.id.notin_(skipped))
+        event = (await db.execute(stmt)).scalar_one_or_none()
+        if event is None:
+            await db.commit()
+            return None
+        claimed = await db.execute(
+            update(GameEvent)
+            .where(GameEvent.id == event.id, *claimable)
+            .values(telegram_sending_at=now)
+        )
+        await db.commit()
+        if claimed.rowcount == 1:
+            return event
+        skipped.add(event.id)
+
+
+async def _release_event_claim(db: AsyncSession, event_id: int) -> None:
+    await db.execute(
+        update(GameEvent).where(GameEvent.id == event_id).values(telegram_sending_at=None)
+    )
+    await db.commit()
+
+
+async def post_game_events(
+    db: AsyncSession,
+    game_id: int,
+    sender: PublicTelegramSender,
+) -> int:
+    """Per-game outbox: post every unsent goal/card event of one game.
+
+    Events are claimed one at a time, oldest first, by setting
+    ``telegram_sending_at`` in a short transaction; a concurrent run for the
+    same game skips claimed rows instead of posting them twice. No
+    transaction is open while Telegram is called: the result is written in
+    a second short transaction as soon as Telegram accepts the post, so a
+    failure later in the batch never re-posts earlier events. The game and
+    teams are loaded once for the whole batch and every message goes
+    through ``sender``'s single connection. Returns the number of events
+    posted.
+    """
+    game = (
+        await db.execute(
+            select(Game)
+            .where(Game.id == game_id)
+            .options(selectinload(Game.home_team), selectinload(Game.away_team))
+        )
+    ).scalar_one_or_none()
+    await db.commit()
+    if game is None:
+        return 0
+
+    posted = 0
+    skipped: set[int] = set()
+    while (event := await _claim_next_event(db, game_id, skipped)) is not None:
+        try:
+            # Reply-thread the goal/card under the match's lineup post.
+            msg_id = await sender.send(
+                _game_event_text(event, game), reply_to=game.lineup_telegram_message_id,
+            )
+        except Exception:
+            # Release the claim so the task's retry posts it right away
+            # instead of waiting out EVENT_CLAIM_TIMEOUT.
+            await _release_event_claim(db, event.id)
+            raise
+        if not msg_id:
+            # Rejected or posting disabled — release it for the next cycle.
+            skipped.add(event.id)
+            await _release_event_claim(db, event.id)
+            continue
+        await db.execute(
+            update(GameEvent)
+            .where(GameEvent.id == event.id)
+            .values(telegram_sent_at=utcnow(), telegram_message_id=msg_id, telegram_sending_at=None)
+        )
+        await db.commit()
+        posted += 1
+        _enqueue_goal_video(event)
+    return posted
 
 
 async def _load_goal_video_event(db: AsyncSession, event_id: int) -> GameEvent | None:
@@ -1039,7 +1161,9 @@ async def post_goal_video(db: AsyncSession, event_id: int) -> bool:
     event = await _load_goal_video_event(db, event_id)
     if event is None:
         return False
-    video_url = getattr(event, "video_url", None)
+    # HLS packages store the master playlist; Telegram needs the single-file
+    # MP4 fallback that sits next to it.
+    video_url = hls_sibling(getattr(event, "video_url", None), HLS_FALLBACK_MP4)
     if not video_url:
         return False
 
@@ -1143,7 +1267,6 @@ async def post_pregame_lineup(db: AsyncSession, game_id: int) -> bool:
     import tempfile
     from pathlib import Path
     from app.services.lineup_renderer import render_lineup_field_png
-    from app.services.telegram_user_client import send_public_user_photo
 
     q = (
         select(Game)
@@ -14,17 +14,17 @@ import html as _html_lib
 import logging
 import os
 import re
+import time
 from typing import Iterable
 
-from telethon import TelegramClient, errors as tg_errors
-from telethon.tl.types import (
-    MessageEntityBold,
-    MessageEntityCustomEmoji,
-    MessageEntityItalic,
-    MessageEntityTextUrl,
-)
-
 from app.config import get_settings
+from app.utils.lazy_import import lazy_module
+from app.utils.metrics import observe_outbound
+
+# Telethon costs ~0.5s to import; only the telegram queue ever needs it.
+telethon = lazy_module("telethon")
+tg_errors = lazy_module("telethon.errors")
+tg_types = lazy_module("telethon.tl.types")
 
 
 class TelegramTransientError(Exception):
@@ -61,7 +61,7 @@ def _parse_tg_emoji_html(text_html: str):
             content = m.group("et")
             utf16_len = len(content.encode("utf-16-le")) // 2
             entities.append(
-                MessageEntityCustomEmoji(
+                tg_types.MessageEntityCustomEmoji(
                     offset=utf16_off, length=utf16_len, document_id=int(m.group("eid"))
                 )
             )
@@ -69,18 +69,18 @@ def _parse_tg_emoji_html(text_html: str):
             content = m.group("at")
             utf16_len = len(content.encode("utf-16-le")) // 2
             entities.append(
-                MessageEntityTextUrl(
+                tg_types.MessageEntityTextUrl(
                     offset=utf16_off, length=utf16_len, url=m.group("href")
                 )
             )
         elif m.group("bt") is not None:
             content = m.group("bt")
             utf16_len = len(content.encode("utf-16-le")) // 2
-            entities.append(MessageEntityBold(offset=utf16_off, length=utf16_len))
+            entities.append(tg_types.MessageEntityBold(offset=utf16_off, length=utf16_len))
         else:
             content = m.group("it")
             utf16_len = len(content.encode("utf-16-le")) // 2
-            entities.append(MessageEntityItalic(offset=utf16_off, length=utf16_len))
+            entities.append(tg_types.MessageEntityItalic(offset=utf16_off, length=utf16_len))
         out.append(content)
         last_end = m.end()
     out.append(text_html[last_end:])
@@ -115,19 +115,20 @@ async def send_public_user_photo(
 
     caption_text, entities = _parse_tg_emoji_html(caption_html or "")
     chat_id = _resolve_chat_id(chat_raw)
-    client = TelegramClient(session, int(api_id), api_hash)
+    client = telethon.TelegramClient(session, int(api_id), api_hash)
     try:
         await client.connect()
         if not await client.is_user_authorized():
             logger.error("Telethon session not authorized")
             return None
-        msg = await client.send_file(
-            chat_id,
-            photo_path,
-            caption=caption_text,
-            formatting_entities=entities if entities else None,
-            reply_to=reply_to,
-        )
+        with observe_outbound("telegram-mtproto"):
+            msg = await client.send_file(
+                chat_id,
+                photo_path,
+                caption=caption_text,
+                formatting_entities=entities if entities else None,
+                reply_to=reply_to,
+            )
         return msg.id if msg else None
     except (
         tg_errors.FloodWaitError,
@@ -173,20 +174,21 @@ async def edit_public_user_message_media(
 
     caption_text, entities = _parse_tg_emoji_html(caption_html or "")
     chat_id = _resolve_chat_id(chat_raw)
-    client = TelegramClient(session, int(api_id), api_hash)
+    client = telethon.TelegramClient(session, int(api_id), api_hash)
     try:
         await client.connect()
         if not await client.is_user_authorized():
             logger.error("Telethon session not authorized")
             return False
-        await client.edit_message(
-            chat_id,
-            message_id,
-            caption_text,
-            file=file_path,
-            formatting_entities=entities if entities else None,
-            supports_streaming=True,
-        )
+        with observe_outbound("telegram-mtproto"):
+            await client.edit_message(
+                chat_id,
+                message_id,
+                caption_text,
+                file=file_path,
+                formatting_entities=entities if entities else None,
+                supports_streaming=True,
+            )
         return True
     except (
         tg_errors.FloodWaitError,
@@ -233,18 +235,19 @@ async def send_public_user_message(
     text, entities = _parse_tg_emoji_html(text_html)
     chat_id = _resolve_chat_id(chat_raw)
 
-    client = TelegramClient(session, int(api_id), api_hash)
+    client = telethon.TelegramClient(session, int(api_id), api_hash)
     try:
         await client.connect()
         if not await client.is_user_authorized():
             logger.error("Telethon session not authorized")
             return None
-        msg = await client.send_message(
-            chat_id,
-            text,
-            formatting_entities=entities if entities else None,
-            reply_to=reply_to,
-        )
+        with observe_outbound("telegram-mtproto"):
+            msg = await client.send_message(
+                chat_id,
+                text,
+                formatting_entities=entities if entities else None,
+                reply_to=reply_to,
+            )
         return msg.id if msg else None
     except (
         tg_errors.FloodWaitError,
@@ -264,3 +267,117 @@ async def send_public_user_message(
         return None
     finally:
         await client.disconnect()
+
+
+# Telegram allows ~20 messages per minute into one group/channel; keep posts to
+# the same chat at least this far apart (per worker process).
+PER_CHAT_MIN_INTERVAL = 3.0
+# FloodWait ("retry after N seconds") up to this long is slept through inline;
+# longer waits surface as TelegramTransientError so Celery retries later.
+MAX_INLINE_FLOOD_WAIT = 60
+
+_last_sent_at: dict[int | str, float] = {}
+
+
+class PublicTelegramSender:
+    """One Telethon connection reused for a batch of public posts.
+
+    ``send_public_user_message`` connects and disconnects per message; a burst
+    of goal/card posts for one game goes through a single sender instead.
+    Posts to the same chat are spaced by ``PER_CHAT_MIN_INTERVAL`` and a
+    FloodWait is honoured (slept through once when short enough).
+
+    Usage::
+
+        async with PublicTelegramSender() as sender:
+            msg_id = await sender.send(text_html, reply_to=...)
+
+    ``send`` returns None when public posting is disabled/unconfigured or the
+    message was rejected permanently; transient failures raise
+    TelegramTransientError.
+    """
+
+    def __init__(self) -> None:
+        self._client: telethon.TelegramClient | None = None
+        self._chat_id: int | str | None = None
+        self.sent = 0
+        self.flood_waited = 0.0
+
+    async def __aenter__(self) -> "PublicTelegramSender":
+        settings = get_settings()
+        if not settings.telegram_public_posts_enabled:
+            return self
+        chat_raw = settings.telegram_public_chat_id or settings.telegram_chat_id
+        api_id = os.environ.get("TELETHON_API_ID")
+        api_hash = os.environ.get("TELETHON_API_HASH")
+        session = os.environ.get("TELETHON_SESSION_PATH", ".telethon_qfl_session")
+        if not (chat_raw and api_id and api_hash):
+            return self
+
+        client = telethon.TelegramClient(session, int(api_id), api_hash)
+        try:
+            await client.connect()
+            if not await client.is_user_authorized():
+                logger.error("Telethon session not authorized")
+                await client.disconnect()
+                return self
+        except (ConnectionError, OSError, asyncio.TimeoutError) as e:
+            await client.disconnect()
+            raise TelegramTransientError(str(e)) from e
+        self._client = client
+        self._chat_id = _resolve_chat_id(chat_raw)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        if self._client is not None:
+            await self._client.disconnect()
+            self._client = None
+
+    async def _wait_for_chat_slot(self) -> None:
+        last = _last_sent_at.get(self._chat_id)
+        if last is not None:
+            wait = last + PER_CHAT_MIN_INTERVAL - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    async def send(self, text_html: str, reply_to: int | None = None) -> int | None:
+        if self._client is None:
+            return None
+        text, entities = _parse_tg_emoji_html(text_html)
+        for attempt in range(2):
+            await self._wait_for_chat_slot()
+            try:
+                with observe_outbound("telegram-mtproto"):
+                    msg = await self._client.send_message(
+                        self._chat_id,
+                        text,
+                        formatting_entities=entities if entities else None,
+                        reply_to=reply_to,
+                    )
+            except tg_errors.FloodWaitError as e:
+                _last_sent_at[self._chat_id] = time.monotonic()
+                if attempt == 0 and e.seconds <= MAX_INLINE_FLOOD_WAIT:
+                    logger.warning("Telegram flood wait %ss, retrying once", e.seconds)
+                    self.flood_waited += e.seconds
+                    await asyncio.sleep(e.seconds)
+                    continue
+                raise TelegramTransientError(str(e)) from e
+            except (
+                tg_errors.ServerError,
+                tg_errors.TimedOutError,
+                tg_errors.NetworkMigrateError,
+                tg_errors.PhoneMigrateError,
+                tg_errors.RPCError,
+                ConnectionError,
+                OSError,
+                asyncio.TimeoutError,
+            ) as e:
+                logger.warning("Telethon send_message transient error: %s", e)
+                raise TelegramTransientError(str(e)) from e
+            except Exception:
+                logger.exception("Telethon send_message permanent failure")
+                return None
+            _last_sent_at[self._chat_id] = time.monotonic()
+            self.sent += 1
+            return msg.id if msg else None
+        return None
@@ -1,13 +1,16 @@
 """Ticket search service — finds ticket URLs via Serper (Google Search)."""
 
 import asyncio
+import json
 import logging
 import re
+import time
+from collections import Counter
+from contextlib import asynccontextmanager
 from datetime import date, datetime, timedelta
 from typing import NamedTuple
 from urllib.parse import urlparse, unquote
 
-import anthropic
 import httpx
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception
 from sqlalchemy import select
@@ -17,8 +20,12 @@ from sqlalchemy.orm import selectinload
 from app.models import Game, GameStatus, Team
 from app.models.season import Season
 from app.services.telegram import send_telegram_message
+from app.utils.lazy_import import lazy_module
+from app.utils.outbound_governor import governed_transport
 from app.utils.timestamps import ensure_utc, utcnow
 
+anthropic = lazy_module("anthropic")
+
 # Only search tickets for these championships (Premier League, Cup)
 _TICKET_CHAMPIONSHIP_IDS = {1, 3}
 
@@ -770,7 +777,6 @@ async def _enrich_with_instagram_captions(
     enriched: list[dict] = []
     for link in candidates:
         caption = await _scrape_caption(link, api_key, client)
-        await asyncio.sleep(1.0)  # rate limit between scrape calls
         if not caption:
             continue
         logger.info("Scraped IG caption for %s (%d chars)", link, len(caption))
@@ -874,7 +880,6 @@ async def _enrich_with_telegram(
         try:
             tg_query = _build_telegram_query(home_name, away_name)
             tg_results = await _search_serper(tg_query, serper_key, client)
-            await asyncio.sleep(1.0)
             for r in tg_results:
                 _collect(r.get("link", ""))
         except SerperAuthError:
@@ -910,8 +915,356 @@ async def _enrich_with_telegram(
     return enriched
 
 
+
+
+# Stage-1 AI rejections are remembered across runs (the search re-runs twice a
+# day for five match dates); a yes/no on URL + title for a fixed fixture does
+# not change. Acceptances are not stored — the AI helper also answers "yes" on
+# errors, and an accepted URL ends the game's search anyway.
+_AI_REJECTED_KEY = "qfl:tickets:ai-rejected:{game_id}"
+_AI_REJECTED_TTL = 7 * 24 * 3600
+
+
+class _ProviderLimiter:
+    """Concurrency cap plus a minimum spacing between call starts for one provider."""
+
+    def __init__(self, concurrency: int, rate_per_second: float = 0.0):
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._interval = 1.0 / rate_per_second if rate_per_second > 0 else 0.0
+        self._lock = asyncio.Lock()
+        self._next_start = 0.0
+
+    @asynccontextmanager
+    async def slot(self):
+        async with self._semaphore:
+            if self._interval:
+                async with self._lock:
+                    now = time.monotonic()
+                    start = max(now, self._next_start)
+                    self._next_start = start + self._interval
+                if start > now:
+                    await asyncio.sleep(start - now)
+            yield
+
+
+class _TicketSearchRun:
+    """State shared by all games of one ``search_and_update_tickets`` run.
+
+    Stands in for the httpx client in the helpers above: GETs (club websites,
+    t.me channel feeds) and Serper POSTs go through a per-provider limiter and
+    are cached by URL (+ body) for the run, so a club's channel or website is
+    fetched once however many of its games are searched. Concurrent identical
+    requests share one call. Server errors and exceptions are not cached.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, settings):
+        self._client = client
+        self.settings = settings
+        self.limiters = {
+            "serper": _ProviderLimiter(
+                settings.ticket_search_concurrency, settings.ticket_serper_rps,
+            ),
+            "web": _ProviderLimiter(settings.ticket_search_concurrency),
+            "glm": _ProviderLimiter(settings.ticket_glm_concurrency),
+        }
+        self._responses: dict[tuple, asyncio.Task] = {}
+        self._verdicts: dict[tuple, bool] = {}
+        self.stats: Counter = Counter()
+        self.auth_error: SerperAuthError | None = None
+
+    async def get(self, url: str, **kwargs) -> httpx.Response:
+        return await self._cached(
+            ("GET", url), "web", lambda: self._client.get(url, **kwargs),
+        )
+
+    async def post(self, url: str, **kwargs) -> httpx.Response:
+        body = json.dumps(kwargs.get("json"), sort_keys=True, ensure_ascii=False)
+        return await self._cached(
+            ("POST", url, body), "serper", lambda: self._client.post(url, **kwargs),
+        )
+
+    async def _cached(self, key: tuple, provider: str, call) -> httpx.Response:
+        task = self._responses.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._limited(provider, call))
+            # Keep a cancelled waiter from leaving an unretrieved exception behind.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._responses[key] = task
+            self.stats[f"{provider}_requests"] += 1
+        else:
+            self.stats[f"{provider}_cache_hits"] += 1
+        try:
+            resp = await asyncio.shield(task)
+        except Exception:
+            self._forget(key, task)
+            raise
+        if resp.status_code >= 500 or resp.status_code == 429:
+            self._forget(key, task)
+        return resp
+
+    def _forget(self, key: tuple, task: asyncio.Task) -> None:
+        if self._responses.get(key) is task:
+            del self._responses[key]
+
+    async def _limited(self, provider: str, call) -> httpx.Response:
+        async with self.limiters[provider].slot():
+            return await call()
+
+    # ---- AI verdicts, keyed by URL + game -----------------------------------
+
+    async def url_verdict(self, cand: TicketMatch, game: Game, home: str, away: str) -> bool:
+        key = ("url", cand.url, game.id)
+        if key in self._verdicts:
+            self.stats["ai_cache_hits"] += 1
+            return self._verdicts[key]
+        if await self._rejected_before(game.id, cand.url):
+            self.stats["ai_cache_hits"] += 1
+            self._verdicts[key] = False
+            return False
+        async with self.limiters["glm"].slot():
+            verdict = await _ai_validate_ticket_url(
+                cand.url, cand.title, cand.snippet, home, away, game.date,
+            )
+        self.stats["ai_calls"] += 1
+        self._verdicts[key] = verdict
+        if not verdict:
+            await self._remember_rejection(game.id, cand.url)
+        return verdict
+
+    async def page_verdict(self, url: str, game: Game, home: str, away: str) -> bool:
+        key = ("page", url, game.id)
+        if key in self._verdicts:
+            self.stats["ai_cache_hits"] += 1
+            return self._verdicts[key]
+        async with self.limiters["glm"].slot():
+            verdict = await _ai_validate_ticket_page(
+                url, home, away, self.settings.serper_api_key, self,
+            )
+        self.stats["ai_calls"] += 1
+        self._verdicts[key] = verdict
+        return verdict
+
+    async def _rejected_before(self, game_id: int, url: str) -> bool:
+        try:
+            from app.utils.live_flag import get_redis
+
+            redis = await get_redis()
+            return bool(await redis.sismember(_AI_REJECTED_KEY.format(game_id=game_id), url))
+        except Exception:
+            return False
+
+    async def _remember_rejection(self, game_id: int, url: str) -> None:
+        try:
+            from app.utils.live_flag import get_redis
+
+            redis = await get_redis()
+            key = _AI_REJECTED_KEY.format(game_id=game_id)
+            await redis.sadd(key, url)
+            await redis.expire(key, _AI_REJECTED_TTL)
+        except Exception:
+            logger.debug("Could not store AI ticket rejection", exc_info=True)
+
+
+async def _search_game(run: _TicketSearchRun, game: Game) -> str:
+    """Search tickets for one game; mutates the ORM object, returns the outcome.
+
+    Outcomes: "updated", "free_entry", "searched" (nothing found) or "skipped".
+    SerperAuthError propagates so the caller can stop the whole run.
+    """
+    settings = run.settings
+    serper_key = settings.serper_api_key
+
+    # Skip if recently searched
+    fetched_at = ensure_utc(game.ticket_url_fetched_at)
+    if fetched_at and fetched_at.date() == date.today():
+        return "skipped"
+
+    home_team = game.home_team
+    away_team = game.away_team
+    if not home_team or not away_team:
+        return "skipped"
+
+    # Home club's official socials from DB (clubs.social_links JSONB)
+    club = getattr(home_team, "club", None)
+    socials = (club.social_links or {}) if club else {}
+    club_telegram_url = socials.get("telegram")
+
+    query = _build_search_query(home_team.name, away_team.name, game.date)
+    # Also search team Instagram posts for ticket/free entry info
+    ig_query = _build_instagram_query(home_team.name, away_team.name, game.date)
+    # Also search the indexed Yandex.Afisha event page — catches matches
+    # sold only via the embedded Afisha widget (opaque, non-indexed URL).
+    afisha_query = _build_afisha_query(home_team.name, away_team.name)
+    organic, ig_organic, afisha_organic = await asyncio.gather(
+        _search_serper(query, serper_key, run),
+        _search_serper(ig_query, serper_key, run),
+        _search_serper(afisha_query, serper_key, run),
+    )
+
+    # Merge results: general search + Instagram + Afisha event page
+    all_organic = organic + ig_organic + afisha_organic
+
+    # Deep-read full Instagram captions — Google snippets truncate the
+    # free-entry phrase / ticket link that lives deeper in the caption.
+    if settings.ticket_ig_scrape_enabled:
+        enriched = await _enrich_with_instagram_captions(
+            all_organic, home_team.name, serper_key,
+            run, settings.ticket_ig_scrape_max_posts,
+        )
+        all_organic = all_organic + enriched
+
+    # Deep-read the club's Telegram channel — many clubs post free-entry
+    # and ticket info there only; t.me/s/ is reliably scrapable.
+    if settings.ticket_telegram_scrape_enabled:
+        tg_enriched = await _enrich_with_telegram(
+            all_organic, home_team.name, away_team.name,
+            serper_key, run, game.date,
+            settings.ticket_telegram_scrape_max_channels,
+            known_channel_url=club_telegram_url,
+        )
+        all_organic = all_organic + tg_enriched
+
+    # Check for free entry in all results
+    is_free = _detect_free_entry(all_organic, home_team.name, game.date)
+
+    # If search didn't detect free entry, check home team's website
+    if not is_free and home_team.website:
+        is_free = await _check_team_website_free_entry(
+            home_team.website, home_team.name, away_team.name, run,
+        )
+
+    if is_free:
+        game.is_free_entry = True
+        game.ticket_url_fetched_at = utcnow()
+        logger.info(
+            "Detected free entry for game %s (%s vs %s)",
+            game.id, home_team.name, away_team.name,
+        )
+        await send_telegram_message(
+            "\U0001f3df Свободный вход\n\n"
+            f"\u26bd Матч: {home_team.name} — {away_team.name}\n"
+            f"\U0001f4c5 Дата: {game.date}"
+        )
+        return "free_entry"
+
+    candidates = _extract_ticket_urls(
+        all_organic, home_team.name, away_team.name, game.date,
+    )
+    # AI-validate candidates in result order; take the first accepted.
+    # Rejecting one must not abort the search — keep trying the rest.
+    match = None
+    # cap AI checks per game — Serper rarely returns >a few real ticket pages
+    for cand in candidates[:6]:
+        if not await run.url_verdict(cand, game, home_team.name, away_team.name):
+            logger.info("AI rejected ticket URL for game %s: %s", game.id, cand.url)
+            continue
+        # Stage 2: scrape the page and confirm tickets are
+        # actually on sale (stage 1 only saw URL/title/snippet,
+        # so it can't tell a live sale from an info-only stub).
+        if not await run.page_verdict(cand.url, game, home_team.name, away_team.name):
+            logger.info(
+                "AI rejected ticket PAGE (no active sale) for game %s: %s",
+                game.id, cand.url,
+            )
+            continue
+        match = cand
+        break
+    # Fallback: no search candidate — scan the club's own site for
+    # its ticket portal (catches clubs selling only via tickets.<club>).
+    if match is None and home_team.website:
+        portal_url = await _find_ticket_url_on_website(
+            home_team.website, home_team.name, away_team.name, game.date, run,
+        )
+        # Same stage-2 page check — a club site may link to an
+        # info-only stub (right teams, but no active sale).
+        if portal_url and not await run.page_verdict(
+            portal_url, game, home_team.name, away_team.name,
+        ):
+            logger.info(
+                "AI rejected club portal PAGE (no active sale) for game %s: %s",
+                game.id, portal_url,
+            )
+            portal_url = None
+        if portal_url:
+            game.ticket_url = portal_url
+            game.ticket_url_fetched_at = utcnow()
+            logger.info(
+                "Found club ticket portal for game %s (%s vs %s): %s",
+                game.id, home_team.name, away_team.name, portal_url,
+            )
+            await send_telegram_message(
+                "\U0001f3df Билеты найдены (сайт клуба)\n\n"
+                f"⚽ Матч: {home_team.name} — {away_team.name}\n"
+                f"\U0001f4c5 Дата: {game.date}\n"
+                f'\U0001f517 Ссылка: <a href="{portal_url}">Купить билеты</a>'
+            )
+            return "updated"
+    if match is None and candidates and not game.ticket_url_fetched_at:
+        # All candidates rejected — notify once (avoid spam every 3h)
+        first = candidates[0]
+        await send_telegram_message(
+            "\u274c <b>AI отверг билет</b>\n\n"
+            f"\u26bd Матч: {home_team.name} — {away_team.name}\n"
+            f"\U0001f4c5 Дата: {game.date}\n"
+            f"\U0001f517 URL: {first.url}\n"
+            f"\U0001f4dd {first.title}\n"
+            f"(проверено кандидатов: {len(candidates)})"
+        )
+    game.ticket_url_fetched_at = utcnow()
+    if match is None:
+        return "searched"
+
+    game.ticket_url = match.url
+    logger.info(
+        "Found ticket URL for game %s (%s vs %s): %s",
+        game.id, home_team.name, away_team.name, match.url,
+    )
+    await send_telegram_message(
+        "\U0001f3df Билеты найдены\n\n"
+        f"\u26bd Матч: {home_team.name} — {away_team.name}\n"
+        f"\U0001f4c5 Дата: {game.date}\n"
+        f'\U0001f517 Ссылка: <a href="{match.url}">Купить билеты</a>'
+    )
+    return "updated"
+
+
+async def _run_game(run: _TicketSearchRun, game: Game, slots: asyncio.Semaphore) -> str:
+    """``_search_game`` under the per-run game cap; turns failures into outcomes."""
+    async with slots:
+        if run.auth_error is not None:
+            return "aborted"
+        try:
+            return await _search_game(run, game)
+        except SerperAuthError as e:
+            if run.auth_error is None:
+                run.auth_error = e
+                logger.error(
+                    "Serper API key invalid — aborting ticket search for all remaining games"
+                )
+                await send_telegram_message(
+                    "\u26a0\ufe0f <b>Serper API сломан</b>\n\n"
+                    f"Ошибка: {e}\n"
+                    "Поиск билетов остановлен. Нужно обновить API ключ."
+                )
+            return "aborted"
+        except Exception:
+            logger.warning(
+                "Ticket search failed for game %s (%s vs %s)",
+                game.id,
+                getattr(game.home_team, "name", None),
+                getattr(game.away_team, "name", None),
+                exc_info=True,
+            )
+            return "error"
+
+
 async def search_and_update_tickets(db: AsyncSession) -> dict:
-    """Search for ticket URLs for upcoming games and store results."""
+    """Search for ticket URLs for upcoming games and store results.
+
+    Games are searched concurrently (``ticket_search_concurrency`` at a time);
+    provider limiters in ``_TicketSearchRun`` pace the outbound calls, so a
+    run's duration follows the Serper/GLM budgets rather than the game count.
+    """
     from app.config import get_settings
     settings = get_settings()
 
@@ -950,211 +1303,20 @@ async def search_and_update_tickets(db: AsyncSession) -> dict:
     )
     games = result.scalars().all()
 
-    updated = 0
-    free_entry = 0
-    searched = 0
-    skipped = 0
-    errors = 0
-
-    async with httpx.AsyncClient(timeout=15) as client:
-        for game in games:
-            # Skip if recently searched
-            fetched_at = ensure_utc(game.ticket_url_fetched_at)
-            if fetched_at and fetched_at.date() == today:
-                skipped += 1
-                continue
+    async with httpx.AsyncClient(timeout=15, transport=governed_transport()) as client:
+        run = _TicketSearchRun(client, settings)
+        slots = asyncio.Semaphore(max(1, settings.ticket_search_concurrency))
+        outcomes = Counter(await asyncio.gather(
+            *(_run_game(run, game, slots) for game in games)
+        ))
 
-            home_team = game.home_team
-            away_team = game.away_team
-            if not home_team or not away_team:
-                skipped += 1
-                continue
-
-            # Home club's official socials from DB (clubs.social_links JSONB)
-            club = getattr(home_team, "club", None)
-            socials = (club.social_links or {}) if club else {}
-            club_telegram_url = socials.get("telegram")
-
-            try:
-                query = _build_search_query(home_team.name, away_team.name, game.date)
-                organic = await _search_serper(query, settings.serper_api_key, client)
-
-                # Also search team Instagram posts for ticket/free entry info
-                ig_query = _build_instagram_query(home_team.name, away_team.name, game.date)
-                await asyncio.sleep(1.0)  # rate limit between requests
-                ig_organic = await _search_serper(ig_query, settings.serper_api_key, client)
-
-                # Also search the indexed Yandex.Afisha event page — catches matches
-                # sold only via the embedded Afisha widget (opaque, non-indexed URL).
-                afisha_query = _build_afisha_query(home_team.name, away_team.name)
-                await asyncio.sleep(1.0)  # rate limit between requests
-                afisha_organic = await _search_serper(
-                    afisha_query, settings.serper_api_key, client
-                )
-
-                # Merge results: general search + Instagram + Afisha event page
-                all_organic = organic + ig_organic + afisha_organic
-
-                # Deep-read full Instagram captions — Google snippets truncate the
-                # free-entry phrase / ticket link that lives deeper in the caption.
-                if settings.ticket_ig_scrape_enabled:
-                    enriched = await _enrich_with_instagram_captions(
-                        all_organic, home_team.name, settings.serper_api_key,
-                        client, settings.ticket_ig_scrape_max_posts,
-                    )
-                    all_organic = all_organic + enriched
-
-                # Deep-read the club's Telegram channel — many clubs post free-entry
-                # and ticket info there only; t.me/s/ is reliably scrapable.
-                if settings.ticket_telegram_scrape_enabled:
-                    tg_enriched = await _enrich_with_telegram(
-                        all_organic, home_team.name, away_team.name,
-                        settings.serper_api_key, client, game.date,
-                        settings.ticket_telegram_scrape_max_channels,
-                        known_channel_url=club_telegram_url,
-                    )
-                    all_organic = all_organic + tg_enriched
-
-                # Check for free entry in all results
-                is_free = _detect_free_entry(all_organic, home_team.name, game.date)
-
-                # If search didn't detect free entry, check home team's website
-                if not is_free and home_team.website:
-                    is_free = await _check_team_website_free_entry(
-                        home_team.website, home_team.name, away_team.name, client,
-                    )
-
-                if is_free:
-                    game.is_free_entry = True
-                    free_entry += 1
-                    logger.info(
-                        "Detected free entry for game %s (%s vs %s)",
-                        game.id, home_team.name, away_team.name,
-                    )
-                    await send_telegram_message(
-                        "\U0001f3df Свободный вход\n\n"
-                        f"\u26bd Матч: {home_team.name} — {away_team.name}\n"
-                        f"\U0001f4c5 Дата: {game.date}"
-                    )
-                else:
-                    candidates = _extract_ticket_urls(
-                        all_organic, home_team.name, away_team.name, game.date,
-                    )
-                    # AI-validate candidates in result order; take the first accepted.
-                    # Rejecting one must not abort the search — keep trying the rest.
-                    match = None
-                    # cap AI checks per game — Serper rarely returns >a few real ticket pages
-                    for cand in candidates[:6]:
-                        is_valid = await _ai_validate_ticket_url(
-                            cand.url, cand.title, cand.snippet,
-                            home_team.name, away_team.name, game.date,
-                        )
-                        if not is_valid:
-                            logger.info(
-                                "AI rejected ticket URL for game %s: %s",
-                                game.id, cand.url,
-                            )
-                            continue
-                        # Stage 2: scrape the page and confirm tickets are
-                        # actually on sale (stage 1 only saw URL/title/snippet,
-                        # so it can't tell a live sale from an info-only stub).
-                        page_ok = await _ai_validate_ticket_page(
-                            cand.url, home_team.name, away_team.name,
-                            settings.serper_api_key, client,
-                        )
-                        if not page_ok:
-                            logger.info(
-                                "AI rejected ticket PAGE (no active sale) for game %s: %s",
-                                game.id, cand.url,
-                            )
-                            continue
-                        match = cand
-                        break
-                    # Fallback: no search candidate — scan the club's own site for
-                    # its ticket portal (catches clubs selling only via tickets.<club>).
-                    if match is None and home_team.website:
-                        portal_url = await _find_ticket_url_on_website(
-                            home_team.website, home_team.name, away_team.name,
-                            game.date, client,
-                        )
-                        # Same stage-2 page check — a club site may link to an
-                        # info-only stub (right teams, but no active sale).
-                        if portal_url and not await _ai_validate_ticket_page(
-                            portal_url, home_team.name, away_team.name,
-                            settings.serper_api_key, client,
-                        ):
-                            logger.info(
-                                "AI rejected club portal PAGE (no active sale) for game %s: %s",
-                                game.id, portal_url,
-                            )
-                            portal_url = None
-                        if portal_url:
-                            game.ticket_url = portal_url
-                            updated += 1
-                            logger.info(
-                                "Found club ticket portal for game %s (%s vs %s): %s",
-                                game.id, home_team.name, away_team.name, portal_url,
-                            )
-                            await send_telegram_message(
-                                "\U0001f3df Билеты найдены (сайт клуба)\n\n"
-                                f"⚽ Матч: {home_team.name} — {away_team.name}\n"
-                                f"\U0001f4c5 Дата: {game.date}\n"
-                                f'\U0001f517 Ссылка: <a href="{portal_url}">Купить билеты</a>'
-                            )
-                            game.ticket_url_fetched_at = utcnow()
-                            searched += 1
-                            await asyncio.sleep(1.0)
-                            continue
-                    if match is None and candidates and not game.ticket_url_fetched_at:
-                        # All candidates rejected — notify once (avoid spam every 3h)
-                        first = candidates[0]
-                        await send_telegram_message(
-                            "\u274c <b>AI отверг билет</b>\n\n"
-                            f"\u26bd Матч: {home_team.name} — {away_team.name}\n"
-                            f"\U0001f4c5 Дата: {game.date}\n"
-                            f"\U0001f517 URL: {first.url}\n"
-                            f"\U0001f4dd {first.title}\n"
-                            f"(проверено кандидатов: {len(candidates)})"
-                        )
-                    if match:
-                        game.ticket_url = match.url
-                        updated += 1
-                        logger.info(
-                            "Found ticket URL for game %s (%s vs %s): %s",
-                            game.id, home_team.name, away_team.name, match.url,
-                        )
-                        await send_telegram_message(
-                            "\U0001f3df Билеты найдены\n\n"
-                            f"\u26bd Матч: {home_team.name} — {away_team.name}\n"
-                            f"\U0001f4c5 Дата: {game.date}\n"
-                            f'\U0001f517 Ссылка: <a href="{match.url}">Купить билеты</a>'
-                        )
-
-                game.ticket_url_fetched_at = utcnow()
-                searched += 1
-
-                # Rate limit: Serper allows ~1 req/sec
-                await asyncio.sleep(1.0)
-
-            except SerperAuthError as e:
-                logger.error(
-                    "Serper API key invalid — aborting ticket search for all remaining games"
-                )
-                await send_telegram_message(
-                    "\u26a0\ufe0f <b>Serper API сломан</b>\n\n"
-                    f"Ошибка: {e}\n"
-                    "Поиск билетов остановлен. Нужно обновить API ключ."
-                )
-                errors += len(games) - searched - skipped
-                break
-            except Exception:
-                logger.warning(
-                    "Ticket search failed for game %s (%s vs %s)",
-                    game.id, home_team.name, away_team.name, exc_info=True,
-                )
-                errors += 1
+    if run.stats:
+        logger.info("Ticket search provider usage: %s", dict(run.stats))
 
     return {
-        "updated": updated, "free_entry": free_entry,
-        "searched": searched, "skipped": skipped, "errors": errors,
+        "updated": outcomes["updated"],
+        "free_entry": outcomes["free_entry"],
+        "searched": outcomes["updated"] + outcomes["free_entry"] + outcomes["searched"],
+        "skipped": outcomes["skipped"],
+        "errors": outcomes["error"] + outcomes["aborted"],
     }
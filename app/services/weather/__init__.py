@@ -7,6 +7,9 @@ Strategy:
     (refreshed every 3 hours). Forecast respects ``game.time`` so the
     preview shows expected weather at kickoff, not "now" weather.
   - METAR failures fall back to Open-Meteo automatically.
+  - Each refresh fetches a location once: METAR once per station, one
+    hourly forecast per geocoded city shared by every game played there,
+    written back with a single bulk UPDATE.
 
 Public API (kept stable for callers):
   * :func:`format_weather` — render the temperature+condition string.
@@ -17,6 +20,7 @@ Public API (kept stable for callers):
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from datetime import date, datetime, timedelta, timezone
 
@@ -27,10 +31,12 @@ from sqlalchemy.orm import selectinload
 
 from app.data.icao_mapping import icao_for_city
 from app.models import Game, GameStatus, Stadium
+from app.utils.bulk_write import bulk_update
+from app.utils.outbound_governor import governed_transport
 from app.utils.timestamps import ensure_utc, utcnow
 
 from .metar import fetch_metar
-from .openmeteo import fetch_forecast, geocode_city
+from .openmeteo import fetch_hourly_forecast, forecast_for_kickoff, geocode_city, location_key
 
 logger = logging.getLogger(__name__)
 
@@ -66,66 +72,105 @@ def _city_for_stadium(stadium: Stadium) -> str | None:
     return stadium.city_en or stadium.city or stadium.city_ru or stadium.city_kz
 
 
-async def _refresh_one(
-    game: Game,
+async def _metar_once(
+    icao: str,
+    client: httpx.AsyncClient,
+    observed: dict[str, tuple[int, str] | None],
+) -> tuple[int, str] | None:
+    """METAR for a station, fetched at most once per refresh run."""
+    if icao not in observed:
+        try:
+            observed[icao] = await fetch_metar(icao, client)
+        except Exception:
+            logger.warning("METAR fetch failed (icao=%s)", icao, exc_info=True)
+            observed[icao] = None
+    return observed[icao]
+
+
+async def _refresh_games(
+    db: AsyncSession,
+    games: list[Game],
     *,
     client: httpx.AsyncClient,
-    prefer_metar: bool,
-) -> str:
-    """Refresh weather for a single game; returns 'updated' | 'skipped' | 'error'."""
-    stadium: Stadium | None = game.stadium_rel
-    if not stadium:
-        return "skipped"
-
-    city = _city_for_stadium(stadium)
-    if not city:
-        return "skipped"
-
-    weather: tuple[int, str] | None = None
-    source: str | None = None
-
-    if prefer_metar:
-        icao = icao_for_city(city) or icao_for_city(stadium.city or "")
-        if icao:
-            try:
-                weather = await fetch_metar(icao, client)
+) -> dict:
+    """Refresh weather for ``games``, fetching each location only once.
+
+    Live games try METAR first (one request per ICAO station). Everything
+    else — and METAR misses — is grouped by city → geocoded coordinates, so
+    all games at the same stadium/city are filled from a single hourly
+    forecast. Results are written with one bulk UPDATE.
+    """
+    counts = {"updated": 0, "skipped": 0, "errors": 0}
+    results: dict[int, tuple[int, str]] = {}
+    observed: dict[str, tuple[int, str] | None] = {}
+    by_city: dict[str, list[Game]] = {}
+
+    for game in games:
+        stadium: Stadium | None = game.stadium_rel
+        city = _city_for_stadium(stadium) if stadium else None
+        if not city:
+            counts["skipped"] += 1
+            continue
+        if game.status == GameStatus.live:
+            icao = icao_for_city(city) or icao_for_city(stadium.city or "")
+            if icao:
+                weather = await _metar_once(icao, client, observed)
                 if weather:
-                    source = f"metar:{icao}"
-            except Exception:
-                logger.warning(
-                    "METAR fetch failed for game %s (icao=%s)", game.id, icao,
-                    exc_info=True,
-                )
-
-    if weather is None:
+                    results[game.id] = weather
+                    continue
+        by_city.setdefault(city, []).append(game)
+
+    by_location: dict[tuple[float, float], list[Game]] = {}
+    for city, city_games in by_city.items():
         try:
             coords = await geocode_city(city, client)
-            if not coords:
-                logger.warning("Geocoding failed for city=%s (game %s)", city, game.id)
-                return "skipped"
-            lat, lon = coords
-            weather = await fetch_forecast(lat, lon, game.date, game.time, client)
-            if weather:
-                source = "open-meteo"
         except Exception:
-            logger.warning(
-                "Forecast fetch failed for game %s, city=%s", game.id, city,
-                exc_info=True,
-            )
-            return "error"
-
-    if weather is None:
-        return "skipped"
-
-    temp, condition = weather
-    game.weather_temp = temp
-    game.weather_condition = condition
-    game.weather_fetched_at = utcnow()
-    logger.debug(
-        "Weather updated game=%s city=%s source=%s temp=%s condition=%s",
-        game.id, city, source, temp, condition,
+            logger.warning("Geocoding request failed for city=%s", city, exc_info=True)
+            counts["errors"] += len(city_games)
+            continue
+        if not coords:
+            logger.warning("Geocoding failed for city=%s (%d games)", city, len(city_games))
+            counts["skipped"] += len(city_games)
+            continue
+        by_location.setdefault(location_key(*coords), []).extend(city_games)
+
+    locations = list(by_location)
+    forecasts = await asyncio.gather(
+        *(fetch_hourly_forecast(lat, lon, client) for lat, lon in locations),
+        return_exceptions=True,
+    )
+    for location, hourly in zip(locations, forecasts):
+        location_games = by_location[location]
+        if isinstance(hourly, BaseException):
+            logger.warning("Forecast fetch failed for %s: %s", location, hourly)
+            counts["errors"] += len(location_games)
+            continue
+        for game in location_games:
+            weather = forecast_for_kickoff(hourly, game.date, game.time)
+            if weather:
+                results[game.id] = weather
+            else:
+                counts["skipped"] += 1
+
+    if results:
+        fetched_at = utcnow()
+        await bulk_update(db, Game, [
+            {
+                "id": game_id,
+                "weather_temp": temp,
+                "weather_condition": condition,
+                "weather_fetched_at": fetched_at,
+            }
+            for game_id, (temp, condition) in results.items()
+        ])
+    counts["updated"] = len(results)
+    counts["locations"] = len(locations)
+    counts["stations"] = len(observed)
+    logger.info(
+        "Weather refresh: %d games from %d forecast locations + %d METAR stations",
+        len(results), len(locations), len(observed),
     )
-    return "updated"
+    return counts
 
 
 async def fetch_and_update_weather(db: AsyncSession) -> dict:
@@ -161,26 +206,18 @@ async def fetch_and_update_weather(db: AsyncSession) -> dict:
     )
     games = result.scalars().all()
 
-    counts = {"updated": 0, "skipped": 0, "errors": 0}
-
-    async with httpx.AsyncClient(timeout=10) as client:
-        for game in games:
-            fetched = ensure_utc(game.weather_fetched_at)
-            is_live = game.status == GameStatus.live
-            if not is_live and fetched and fetched > fresh_threshold:
-                counts["skipped"] += 1
-                continue
-
-            outcome = await _refresh_one(
-                game, client=client, prefer_metar=is_live,
-            )
-            if outcome == "updated":
-                counts["updated"] += 1
-            elif outcome == "error":
-                counts["errors"] += 1
-            else:
-                counts["skipped"] += 1
-
+    stale: list[Game] = []
+    skipped = 0
+    for game in games:
+        fetched = ensure_utc(game.weather_fetched_at)
+        if game.status != GameStatus.live and fetched and fetched > fresh_threshold:
+            skipped += 1
+        else:
+            stale.append(game)
+
+    async with httpx.AsyncClient(timeout=10, transport=governed_transport()) as client:
+        counts = await _refresh_games(db, stale, client=client)
+    counts["skipped"] += skipped
     return counts
 
 
@@ -205,25 +242,18 @@ async def fetch_and_update_live_weather(db: AsyncSession) -> dict:
     )
     games = result.scalars().all()
 
-    counts = {"updated": 0, "skipped": 0, "errors": 0}
-
-    async with httpx.AsyncClient(timeout=10) as client:
-        for game in games:
-            fetched = ensure_utc(game.weather_fetched_at)
-            if fetched and fetched > fresh_threshold:
-                counts["skipped"] += 1
-                continue
-
-            outcome = await _refresh_one(
-                game, client=client, prefer_metar=True,
-            )
-            if outcome == "updated":
-                counts["updated"] += 1
-            elif outcome == "error":
-                counts["errors"] += 1
-            else:
-                counts["skipped"] += 1
-
+    stale: list[Game] = []
+    skipped = 0
+    for game in games:
+        fetched = ensure_utc(game.weather_fetched_at)
+        if fetched and fetched > fresh_threshold:
+            skipped += 1
+        else:
+            stale.append(game)
+
+    async with httpx.AsyncClient(timeout=10, transport=governed_transport()) as client:
+        counts = await _refresh_games(db, stale, client=client)
+    counts["skipped"] += skipped
     return counts
 
 
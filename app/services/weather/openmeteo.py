@@ -6,6 +6,7 @@ and as a fallback when METAR is unavailable.
 
 from __future__ import annotations
 
+import json
 import logging
 from datetime import date, datetime, time
 
@@ -29,9 +30,20 @@ _WMO_TO_CONDITION: dict[int, str] = {
     95: "thunderstorm", 96: "thunderstorm", 99: "thunderstorm",
 }
 
-# Bounded geocoding cache: city_name → (lat, lon) | None. Max 128 entries.
+# Geocodes don't change: positive results are kept forever (in-process and in
+# a Redis hash shared by workers). Misses are only remembered in-process, so a
+# fixed stadium city spelling is picked up after a worker restart.
 _geocode_cache: dict[str, tuple[float, float] | None] = {}
-_GEOCODE_CACHE_MAX = 128
+_GEOCODE_REDIS_KEY = "qfl:weather:geocode"
+
+# One hourly forecast covers every kickoff at a location for 16 days; cached
+# per (rounded) coordinates for an hour so the 3h and 15min beats and every
+# game at the same stadium/city share it.
+FORECAST_TTL_SECONDS = 3600
+_FORECAST_REDIS_PREFIX = "qfl:weather:forecast"
+
+# (local Asia/Almaty hour, temperature °C, WMO code)
+HourlyForecast = list[tuple[datetime, float, int]]
 
 
 def _is_retryable(exc: BaseException) -> bool:
@@ -42,35 +54,69 @@ def _is_retryable(exc: BaseException) -> bool:
     return False
 
 
+async def _redis():
+    try:
+        from app.utils.live_flag import get_redis
+
+        return await get_redis()
+    except Exception:
+        return None
+
+
+def _city_key(city: str) -> str:
+    return city.strip().lower()
+
+
+def location_key(lat: float, lon: float) -> tuple[float, float]:
+    """Coordinates rounded to ~1 km — Open-Meteo's grid is coarser anyway."""
+    return round(lat, 2), round(lon, 2)
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=1, max=10),
     retry=retry_if_exception(_is_retryable),
     reraise=True,
 )
-async def geocode_city(city: str, client: httpx.AsyncClient) -> tuple[float, float] | None:
-    """Geocode a city name via Open-Meteo geocoding API. Returns (lat, lon) or None."""
-    if city in _geocode_cache:
-        return _geocode_cache[city]
-
+async def _request_geocode(city: str, client: httpx.AsyncClient) -> tuple[float, float] | None:
     resp = await client.get(
         "https://geocoding-api.open-meteo.com/v1/search",
         params={"name": city, "count": 1, "language": "en"},
     )
     resp.raise_for_status()
-    data = resp.json()
-    results = data.get("results")
-
-    if len(_geocode_cache) >= _GEOCODE_CACHE_MAX:
-        _geocode_cache.clear()
-
+    results = resp.json().get("results")
     if not results:
-        _geocode_cache[city] = None
         return None
+    return results[0]["latitude"], results[0]["longitude"]
 
-    lat, lon = results[0]["latitude"], results[0]["longitude"]
-    _geocode_cache[city] = (lat, lon)
-    return lat, lon
+
+async def geocode_city(city: str, client: httpx.AsyncClient) -> tuple[float, float] | None:
+    """Geocode a city name via Open-Meteo geocoding API. Returns (lat, lon) or None."""
+    key = _city_key(city)
+    if key in _geocode_cache:
+        return _geocode_cache[key]
+
+    redis = await _redis()
+    if redis is not None:
+        try:
+            stored = await redis.hget(_GEOCODE_REDIS_KEY, key)
+            if stored:
+                if isinstance(stored, bytes):
+                    stored = stored.decode()
+                lat, lon = (float(v) for v in stored.split(","))
+                _geocode_cache[key] = (lat, lon)
+                return lat, lon
+        except Exception:
+            logger.debug("Geocode cache read failed for %s", city, exc_info=True)
+
+    coords = await _request_geocode(city, client)
+    _geocode_cache[key] = coords
+    if coords and redis is not None:
+        try:
+            await redis.hset(_GEOCODE_REDIS_KEY, key, f"{coords[0]},{coords[1]}")
+        except Exception:
+            logger.debug("Geocode cache write failed for %s", city, exc_info=True)
+    return coords
 
 
 @retry(
@@ -79,17 +125,7 @@ async def geocode_city(city: str, client: httpx.AsyncClient) -> tuple[float, flo
     retry=retry_if_exception(_is_retryable),
     reraise=True,
 )
-async def fetch_forecast(
-    lat: float,
-    lon: float,
-    game_date: date,
-    game_time: time | None,
-    client: httpx.AsyncClient,
-) -> tuple[int, str] | None:
-    """Fetch weather from Open-Meteo for the given match's start hour.
-
-    Returns (temp_celsius, condition_key) or None if no slot found.
-    """
+async def _request_hourly(lat: float, lon: float, client: httpx.AsyncClient) -> dict:
     resp = await client.get(
         "https://api.open-meteo.com/v1/forecast",
         params={
@@ -101,32 +137,67 @@ async def fetch_forecast(
         },
     )
     resp.raise_for_status()
-    data = resp.json()
+    return resp.json().get("hourly", {})
+
 
-    hourly = data.get("hourly", {})
+def _parse_hourly(hourly: dict) -> HourlyForecast:
     times = hourly.get("time", [])
     temps = hourly.get("temperature_2m", [])
     codes = hourly.get("weather_code", [])
-
-    if not times:
+    return [
+        (datetime.fromisoformat(t), temp, code)
+        for t, temp, code in zip(times, temps, codes)
+        if temp is not None and code is not None
+    ]
+
+
+async def fetch_hourly_forecast(lat: float, lon: float, client: httpx.AsyncClient) -> HourlyForecast:
+    """16-day hourly forecast for a location (cached for FORECAST_TTL_SECONDS)."""
+    lat, lon = location_key(lat, lon)
+    cache_key = f"{_FORECAST_REDIS_PREFIX}:{lat}:{lon}"
+
+    redis = await _redis()
+    if redis is not None:
+        try:
+            stored = await redis.get(cache_key)
+            if stored:
+                return _parse_hourly(json.loads(stored))
+        except Exception:
+            logger.debug("Forecast cache read failed for %s", cache_key, exc_info=True)
+
+    hourly = await _request_hourly(lat, lon, client)
+    if hourly.get("time") and redis is not None:
+        try:
+            await redis.set(cache_key, json.dumps(hourly), ex=FORECAST_TTL_SECONDS)
+        except Exception:
+            logger.debug("Forecast cache write failed for %s", cache_key, exc_info=True)
+    return _parse_hourly(hourly)
+
+
+def forecast_for_kickoff(
+    hourly: HourlyForecast,
+    game_date: date,
+    game_time: time | None,
+) -> tuple[int, str] | None:
+    """Pick the forecast slot closest to kickoff → (temp_celsius, condition_key)."""
+    if not hourly:
         return None
-
     target_hour = game_time.hour if game_time else 15
     target = datetime.combine(game_date, time(target_hour, 0))
+    _, temp, wmo_code = min(hourly, key=lambda slot: abs((slot[0] - target).total_seconds()))
+    return round(temp), _WMO_TO_CONDITION.get(wmo_code, "clouds")
+
 
-    best_idx: int | None = None
-    best_diff: float | None = None
-    for i, t_str in enumerate(times):
-        dt = datetime.fromisoformat(t_str)
-        diff = abs((dt - target).total_seconds())
-        if best_diff is None or diff < best_diff:
-            best_diff = diff
-            best_idx = i
-
-    if best_idx is not None and best_idx < len(temps) and best_idx < len(codes):
-        temp = round(temps[best_idx])
-        wmo_code = codes[best_idx]
-        condition = _WMO_TO_CONDITION.get(wmo_code, "clouds")
-        return temp, condition
-
-    return None
+async def fetch_forecast(
+    lat: float,
+    lon: float,
+    game_date: date,
+    game_time: time | None,
+    client: httpx.AsyncClient,
+) -> tuple[int, str] | None:
+    """Fetch weather from Open-Meteo for the given match's start hour.
+
+    Returns (temp_celsius, condition_key) or None if no slot found.
+    """
+    hourly = await fetch_hourly_forecast(lat, lon, client)
+    return forecast_for_kickoff(hourly, game_date, game_time)
@@ -20,6 +20,7 @@ from app.models.broadcaster import Broadcaster
 from app.services.season_visibility import get_current_season_id
 from app.models import Season
 from app.utils.live_flag import get_redis
+from app.utils.outbound_governor import governed_transport
 from app.utils.team_name_matcher import normalize_team_name, _collect_team_names
 
 logger = logging.getLogger(__name__)
@@ -246,7 +247,7 @@ async def _get_uploads_playlist_id(channel_id: str, api_key: str) -> str:
     if channel_id in _uploads_playlist_ids:
         return _uploads_playlist_ids[channel_id]
 
-    async with httpx.AsyncClient(timeout=10) as client:
+    async with httpx.AsyncClient(timeout=10, transport=governed_transport()) as client:
         resp = await client.get(
             f"{_YT_API}/channels",
             params={"id": channel_id, "part": "contentDetails", "key": api_key},
@@ -269,7 +270,7 @@ async def _fetch_recent_videos(
     playlist_id: str, api_key: str, max_results: int = 50
 ) -> list[dict]:
     """Fetch recent video IDs and titles from uploads playlist."""
-    async with httpx.AsyncClient(timeout=10) as client:
+    async with httpx.AsyncClient(timeout=10, transport=governed_transport()) as client:
         resp = await client.get(
             f"{_YT_API}/playlistItems",
             params={
@@ -298,7 +299,7 @@ async def _enrich_videos(video_ids: list[str], api_key: str) -> dict[str, dict]:
         return {}
 
     result = {}
-    async with httpx.AsyncClient(timeout=10) as client:
+    async with httpx.AsyncClient(timeout=10, transport=governed_transport()) as client:
         for i in range(0, len(video_ids), 50):
             batch = video_ids[i : i + 50]
             resp = await client.get(
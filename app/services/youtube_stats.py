@@ -12,13 +12,15 @@ from datetime import datetime, timedelta, timezone
 from typing import Literal
 
 import httpx
-from sqlalchemy import select, update
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.database import AsyncSessionLocal
 from app.models.game import Game, GameStatus
 from app.models.media_video import MediaVideo
+from app.utils.bulk_write import bulk_update
+from app.utils.outbound_governor import governed_transport
 from app.utils.timestamps import utcnow
 from app.utils.youtube import extract_youtube_id
 
@@ -135,7 +137,7 @@ async def fetch_view_counts(yt_ids: list[str]) -> dict[str, int]:
         return {}
 
     result: dict[str, int] = {}
-    async with httpx.AsyncClient(timeout=_HTTP_TIMEOUT) as client:
+    async with httpx.AsyncClient(timeout=_HTTP_TIMEOUT, transport=governed_transport()) as client:
         for i in range(0, len(yt_ids), _BATCH_SIZE):
             batch = yt_ids[i : i + _BATCH_SIZE]
             try:
@@ -166,7 +168,7 @@ async def _apply_counts(
     now = utcnow()
     updated = 0
 
-    # Group by source to reduce statements
+    # Group by source: one bulk UPDATE per target column set
     game_live_updates: dict[int, int] = {}
     game_review_updates: dict[int, int] = {}
     media_updates: dict[int, int] = {}
@@ -182,29 +184,18 @@ async def _apply_counts(
         elif t.source == "media":
             media_updates[t.ref_id] = count
 
-    for game_id, count in game_live_updates.items():
-        await db.execute(
-            update(Game)
-            .where(Game.id == game_id)
-            .values(youtube_live_view_count=count, youtube_stats_updated_at=now)
-        )
-        updated += 1
-
-    for game_id, count in game_review_updates.items():
-        await db.execute(
-            update(Game)
-            .where(Game.id == game_id)
-            .values(video_review_view_count=count, youtube_stats_updated_at=now)
-        )
-        updated += 1
-
-    for media_id, count in media_updates.items():
-        await db.execute(
-            update(MediaVideo)
-            .where(MediaVideo.id == media_id)
-            .values(view_count=count, stats_updated_at=now)
-        )
-        updated += 1
+    updated += await bulk_update(db, Game, [
+        {"id": game_id, "youtube_live_view_count": count, "youtube_stats_updated_at": now}
+        for game_id, count in game_live_updates.items()
+    ])
+    updated += await bulk_update(db, Game, [
+        {"id": game_id, "video_review_view_count": count, "youtube_stats_updated_at": now}
+        for game_id, count in game_review_updates.items()
+    ])
+    updated += await bulk_update(db, MediaVideo, [
+        {"id": media_id, "view_count": count, "stats_updated_at": now}
+        for media_id, count in media_updates.items()
+    ])
 
     return updated
 
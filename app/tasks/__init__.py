@@ -2,29 +2,57 @@ import logging
 
 from celery import Celery
 from celery.schedules import crontab
-from celery.signals import worker_ready, worker_shutdown
+from celery.signals import worker_init, worker_ready, worker_shutdown
 
 from app.config import get_settings
+from app.tasks.worker_profiles import get_worker_profile
 from app.utils.feature_flags import log_feature_flags
+from app.utils.metrics import install_celery_task_metrics, start_worker_exporter
 
 logger = logging.getLogger(__name__)
 
 settings = get_settings()
 
+TASK_MODULES = (
+    "app.tasks.sync_tasks",
+    "app.tasks.live_tasks",
+    "app.tasks.weather_tasks",
+    "app.tasks.ticket_tasks",
+    "app.tasks.fcms_tasks",
+    "app.tasks.youtube_tasks",
+    "app.tasks.telegram_tasks",
+    "app.tasks.goal_video_tasks",
+    "app.tasks.sync_job_tasks",
+)
+
+
+def select_task_modules(raw: str, default: tuple[str, ...] = ()) -> list[str]:
+    """Task modules for this worker from ``CELERY_TASK_MODULES``.
+
+    Celery imports every ``include`` module at worker start, so a dedicated
+    live worker lists only ``app.tasks.live_tasks``. Tasks from other modules
+    can still be sent by name; they just are not executed here. Empty falls
+    back to ``default`` (the worker profile's modules), then to all.
+    """
+    selected = [name.strip() for name in raw.split(",") if name.strip()] or list(default)
+    if not selected:
+        return list(TASK_MODULES)
+    unknown = sorted(set(selected) - set(TASK_MODULES))
+    if unknown:
+        raise ValueError(f"Unknown CELERY_TASK_MODULES entries: {', '.join(unknown)}")
+    return selected
+
+
+worker_profile = get_worker_profile(settings.celery_worker_profile)
+
 celery_app = Celery(
     "qfl_tasks",
     broker=settings.redis_url,
     backend=settings.redis_url,
-    include=[
-        "app.tasks.sync_tasks",
-        "app.tasks.live_tasks",
-        "app.tasks.weather_tasks",
-        "app.tasks.ticket_tasks",
-        "app.tasks.fcms_tasks",
-        "app.tasks.youtube_tasks",
-        "app.tasks.telegram_tasks",
-        "app.tasks.goal_video_tasks",
-    ],
+    include=select_task_modules(
+        settings.celery_task_modules,
+        worker_profile.task_modules if worker_profile else (),
+    ),
 )
 
 celery_app.conf.update(
@@ -44,9 +72,11 @@ celery_app.conf.update(
         "app.tasks.live_tasks.auto_end_finished_games": {"queue": "live"},
         "app.tasks.live_tasks.fetch_pregame_lineups": {"queue": "live"},
         "app.tasks.live_tasks.backfill_sota_game_ids": {"queue": "live"},
+        "app.tasks.live_tasks.refresh_home_widgets_task": {"queue": "live"},
         "app.tasks.telegram_tasks.post_match_start_task": {"queue": "telegram"},
         "app.tasks.telegram_tasks.post_match_finish_task": {"queue": "telegram"},
         "app.tasks.telegram_tasks.post_game_event_task": {"queue": "telegram"},
+        "app.tasks.telegram_tasks.post_game_events_task": {"queue": "telegram"},
         "app.tasks.telegram_tasks.post_pregame_lineup_task": {"queue": "telegram"},
         "app.tasks.telegram_tasks.post_goal_video_task": {"queue": "media"},
         "app.tasks.telegram_tasks.tour_announce_daily": {"queue": "telegram"},
@@ -54,6 +84,11 @@ celery_app.conf.update(
     },
 )
 
+if worker_profile:
+    celery_app.conf.update(worker_profile.celery_conf())
+
+install_celery_task_metrics()
+
 if settings.sota_enabled:
     celery_app.conf.beat_schedule = {
         "sync-best-players-every-15min": {
@@ -105,6 +140,26 @@ celery_app.conf.beat_schedule["monitor-stuck-transactions-every-5min"] = {
     "schedule": crontab(minute="*/5"),
 }
 
+celery_app.conf.beat_schedule["resume-stale-sync-jobs-every-5min"] = {
+    "task": "app.tasks.sync_job_tasks.resume_stale_sync_jobs",
+    "schedule": crontab(minute="*/5"),
+}
+
+# Repairs games.has_stats / has_lineup that a writer failed to maintain
+# (read paths trust the stored flags).
+celery_app.conf.beat_schedule["reconcile-game-flags-hourly"] = {
+    "task": "app.tasks.sync_tasks.reconcile_game_flags",
+    "schedule": crontab(minute="50"),
+}
+
+# Replaces home-widget snapshots past their freshness horizon (completed
+# window closed, Almaty midnight, live backstop); changes refresh on demand.
+celery_app.conf.beat_schedule["refresh-due-home-widgets-every-1min"] = {
+    "task": "app.tasks.live_tasks.refresh_home_widgets_task",
+    "schedule": crontab(minute="*/1"),
+    "kwargs": {"only_due": True},
+}
+
 celery_app.conf.beat_schedule["fetch-weather-every-3h"] = {
     "task": "app.tasks.weather_tasks.fetch_weather",
     "schedule": crontab(minute="30", hour="*/3"),
@@ -199,11 +254,45 @@ if settings.youtube_api_key:
         "schedule": crontab(minute="*/30"),
     }
 
+def _loop_inflight_limit(profile) -> int | None:
+    """Loop-thread slots this worker can back with pooled DB connections.
+
+    Every task coroutine on the shared loop holds a connection from the same
+    worker engine, so running more of them than pool_size + max_overflow only
+    parks the surplus on pool_timeout until it raises.
+    """
+    capacity = (
+        None if settings.database_pool_class == "null"
+        else settings.database_pool_size + settings.database_max_overflow
+    )
+    limit = profile.inflight_limit(capacity)
+    if limit != profile.max_inflight:
+        logger.warning(
+            "worker profile %s: max_inflight %s exceeds DB pool capacity %s, capping at %s; "
+            "raise DATABASE_POOL_SIZE / DATABASE_MAX_OVERFLOW to use every slot",
+            profile.name, profile.max_inflight, capacity, limit,
+        )
+    return limit
+
+
+@worker_init.connect
+def on_worker_init(**kwargs):
+    if worker_profile and worker_profile.uses_loop_thread:
+        from app.utils.async_celery import start_loop_thread
+        start_loop_thread(_loop_inflight_limit(worker_profile))
+
+
 @worker_ready.connect
 def on_worker_ready(sender=None, **kwargs):
     queues = sorted(q.name for q in sender.app.amqp.queues.consume_from.values()) if sender else []
-    logger.info("celery_worker_ready queues=%s", queues)
+    logger.info(
+        "celery_worker_ready profile=%s queues=%s",
+        worker_profile.name if worker_profile else "-", queues,
+    )
     log_feature_flags(logger, service="celery_worker")
+    if settings.metrics_worker_port:
+        start_worker_exporter(settings.metrics_worker_port)
+        logger.info("celery metrics exporter listening on :%d", settings.metrics_worker_port)
 
 
 @worker_shutdown.connect
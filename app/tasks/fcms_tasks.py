@@ -1,5 +1,6 @@
 """Celery tasks for FCMS integration: bulk import, pre-match lineups, post-match protocols, roster sync."""
 
+import asyncio
 import logging
 
 from sqlalchemy import func, select
@@ -86,6 +87,13 @@ async def _fetch_fcms_pregame_lineups() -> dict:
         if not games:
             return {"games_found": 0}
 
+        # All FCMS downloads up front and concurrently; the loop below is DB work
+        await db.commit()
+        await asyncio.gather(
+            service.prefetch_lineups(games),
+            referee_service.prefetch_allocations(g.fcms_match_id for g in games),
+        )
+
         results = []
         referee_totals = {"added": 0, "updated": 0, "removed": 0, "created_referees": 0}
         for game in games:
@@ -146,6 +154,9 @@ async def _sync_fcms_post_match_protocol() -> dict:
         if not games:
             return {"games_found": 0}
 
+        await db.commit()
+        await service.prefetch_protocols(games)
+
         results = []
         for game in games:
             try:
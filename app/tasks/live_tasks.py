@@ -9,6 +9,7 @@ Tasks:
 - sync_post_match_protocol: Re-sync events & stats for recently finished games
 - post_finish_followup: Post-match pipeline (resync, tour check, extended stats)
 - sync_extended_stats_for_game: Game-scoped extended stats sync
+- refresh_home_widgets_task: Rebuild precomputed home-widget snapshots
 """
 import asyncio
 import logging
@@ -139,6 +140,22 @@ async def _sync_single_game_impl(game_id: int, token: str):
         except Exception as ps_err:
             logger.warning("Failed to sync player stats for game %s: %s", game_id, ps_err)
 
+        # Score, minute and half on the homepage widget, live scores in the
+        # season brackets (both debounced per season).
+        try:
+            async with AsyncSessionLocal() as db:
+                season_id = (
+                    await db.execute(select(Game.season_id).where(Game.id == game_id))
+                ).scalar_one_or_none()
+            if season_id is not None:
+                from app.services.home_widget_snapshots import enqueue_home_widget_refresh
+                from app.services.season_snapshots import enqueue_season_snapshot_build
+
+                await enqueue_home_widget_refresh(season_id)
+                await enqueue_season_snapshot_build(season_id)
+        except Exception:
+            logger.warning("Failed to enqueue snapshot refresh for game %s", game_id, exc_info=True)
+
         # Telegram dispatch uses its own short session — keeps the live-sync
         # path free of any extra holding window.
         try:
@@ -871,3 +888,32 @@ def post_finish_followup(game_id: int):
 def sync_extended_stats_for_game(self, game_id: int):
     """Celery task: Sync extended stats for a single game."""
     return run_async(_sync_extended_stats_for_game(self, game_id))
+
+
+# ==================== Home-widget snapshots ====================
+
+
+async def _refresh_home_widgets(season_id: int | None, only_due: bool) -> dict:
+    from app.services.home_widget_snapshots import (
+        clear_refresh_pending,
+        frontend_codes_for_season,
+        refresh_home_widgets,
+    )
+
+    if not only_due:
+        # Before reading: a change committed from here on enqueues a new run.
+        await clear_refresh_pending(season_id)
+    async with AsyncSessionLocal() as db:
+        codes = None if season_id is None else await frontend_codes_for_season(db, season_id)
+        written = await refresh_home_widgets(db, codes, only_due=only_due)
+    return {"season_id": season_id, "written": written}
+
+
+@celery_app.task(name="app.tasks.live_tasks.refresh_home_widgets_task", soft_time_limit=120, time_limit=150)
+def refresh_home_widgets_task(season_id: int | None = None, only_due: bool = False):
+    """Celery task: Rebuild home-widget snapshots for one season's frontend code (all when None).
+
+    Enqueued (debounced) on game status/score changes; the per-minute beat
+    runs it with only_due=True to replace snapshots past their horizon.
+    """
+    return run_async(_refresh_home_widgets(season_id, only_due))
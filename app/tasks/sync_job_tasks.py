@@ -0,0 +1,228 @@
+"""Celery side of resumable bulk sync jobs (see app.services.sync_jobs).
+
+Registers the job kinds for the bulk tasks that used to restart from
+scratch — player tour stats backfill, extended-stats resync, game events
+sync — and runs them in time-boxed slices that re-enqueue
+themselves until every unit is checkpointed.
+"""
+
+import logging
+from datetime import timedelta
+
+from sqlalchemy import select
+
+from app.config import get_settings
+from app.database import AsyncSessionLocal
+from app.models import Game
+from app.services.sync import SyncOrchestrator
+from app.services.sync_jobs import (
+    JOB_RUNNING,
+    SyncJobKind,
+    UnitContext,
+    completed_unit_results,
+    find_stale_jobs,
+    register_job_kind,
+    run_job_slice,
+)
+from app.services.telegram import send_telegram_message
+from app.tasks import celery_app
+from app.utils.async_celery import run_async
+from app.utils.redis_lock import acquire_token_lock, release_token_lock
+from app.utils.timestamps import utcnow
+
+logger = logging.getLogger(__name__)
+
+settings = get_settings()
+
+# Slice budget stays well inside task_soft_time_limit (600s): the check runs
+# between units, so the last unit of a slice may overrun by its own duration.
+_SLICE_BUDGET_SECONDS = 420
+_SLICE_LOCK_TTL_SECONDS = 660
+# A running job whose heartbeat is older than this lost its worker.
+_STALE_AFTER = timedelta(minutes=15)
+
+
+# ---------------------------------------------------------------------------
+# backfill_player_tour_stats — one unit per tour
+# ---------------------------------------------------------------------------
+
+async def _plan_player_tour_backfill(db, params: dict) -> list[str]:
+    season_id = int(params["season_id"])
+    if not params.get("force") and not await SyncOrchestrator(db).is_sync_enabled(season_id):
+        logger.info("Season %s: sync disabled, nothing to backfill", season_id)
+        return []
+    return [f"tour:{tour}" for tour in range(1, int(params["max_tour"]) + 1)]
+
+
+async def _run_player_tour_unit(ctx: UnitContext) -> dict:
+    tour = int(ctx.unit_key.split(":", 1)[1])
+    async with ctx.session_factory() as db:
+        count = await SyncOrchestrator(db).sync_player_tour_stats(
+            int(ctx.params["season_id"]), tour, force=True,
+        )
+        await db.commit()
+    return {"tour": tour, "players": count}
+
+
+register_job_kind(SyncJobKind(
+    name="backfill_player_tour_stats",
+    plan=_plan_player_tour_backfill,
+    run_unit=_run_player_tour_unit,
+))
+
+
+# ---------------------------------------------------------------------------
+# resync_extended_stats — one unit per game, then one per touched season
+# ---------------------------------------------------------------------------
+
+async def _plan_extended_resync(db, params: dict) -> list[str]:
+    result = await db.execute(
+        select(Game.id, Game.season_id)
+        .where(Game.id.in_([int(g) for g in params["game_ids"]]), Game.sync_disabled == False)
+        .order_by(Game.season_id, Game.tour, Game.id)
+    )
+    rows = result.all()
+    season_ids = dict.fromkeys(row.season_id for row in rows if row.season_id)
+    # Season units come after every game unit, so the aggregates see all
+    # game-level stats that this job managed to sync.
+    return [f"game:{row.id}" for row in rows] + [f"season:{sid}" for sid in season_ids]
+
+
+async def _run_extended_resync_unit(ctx: UnitContext) -> dict:
+    from app.tasks.sync_tasks import _game_extended_stats_node, _sync_extended_aggregate_bundle
+
+    unit_type, raw_id = ctx.unit_key.split(":", 1)
+    if unit_type == "game":
+        node = _game_extended_stats_node(int(raw_id), utcnow())
+        async with ctx.session_factory() as db:
+            result = await node.run(db)
+            await db.commit()
+        return result
+
+    season_id = int(raw_id)
+    async with ctx.session_factory() as db:
+        game_results = await completed_unit_results(db, ctx.job_id, prefix="game:")
+    synced = [
+        r for r in game_results.values()
+        if r.get("synced") and r.get("season_id") == season_id
+    ]
+    if not synced:
+        return {"season_id": season_id, "skipped": "no synced games"}
+    tours = {r["tour"] for r in synced if r.get("tour") is not None}
+    result = await _sync_extended_aggregate_bundle(season_id, tours, force=True)
+    if result["errors"]:
+        # Per-step errors are already isolated by the bundle; surface them as
+        # a unit failure so the job retries the aggregates.
+        raise RuntimeError("; ".join(result["errors"]))
+    return {
+        "season_id": season_id,
+        "teams": result["teams"],
+        "players": result["players"],
+        "tour_stats": {str(k): v for k, v in result["tour_stats"].items()},
+    }
+
+
+async def _notify_extended_resync_done(job) -> None:
+    lines = [
+        f"🔄 Admin resync extended stats (job #{job.id})",
+        f"Units: {job.units_done} done, {job.units_failed} failed of {job.units_total}",
+    ]
+    await send_telegram_message("\n".join(lines))
+
+
+register_job_kind(SyncJobKind(
+    name="resync_extended_stats",
+    plan=_plan_extended_resync,
+    run_unit=_run_extended_resync_unit,
+    on_complete=_notify_extended_resync_done,
+))
+
+
+# ---------------------------------------------------------------------------
+# sync_all_game_events — one unit per game
+# ---------------------------------------------------------------------------
+
+async def _plan_all_game_events(db, params: dict) -> list[str]:
+    season_id = int(params["season_id"])
+    if not params.get("force") and not await SyncOrchestrator(db).is_sync_enabled(season_id):
+        logger.info("Season %s: sync disabled, no game events to sync", season_id)
+        return []
+    result = await db.execute(
+        select(Game.id).where(Game.season_id == season_id).order_by(Game.date, Game.id)
+    )
+    return [f"game:{gid}" for gid in result.scalars().all()]
+
+
+async def _run_game_events_unit(ctx: UnitContext) -> dict:
+    game_id = int(ctx.unit_key.split(":", 1)[1])
+    async with ctx.session_factory() as db:
+        result = await SyncOrchestrator(db).sync_game_events(game_id)
+        await db.commit()
+    # "error" results (no sota_id, …) are deterministic — record, don't retry.
+    return result
+
+
+register_job_kind(SyncJobKind(
+    name="sync_all_game_events",
+    plan=_plan_all_game_events,
+    run_unit=_run_game_events_unit,
+))
+
+
+async def _plan_game_events(db, params: dict) -> list[str]:
+    return [f"game:{int(params['game_id'])}"]
+
+
+register_job_kind(SyncJobKind(
+    name="sync_game_events",
+    plan=_plan_game_events,
+    run_unit=_run_game_events_unit,
+))
+
+
+# ---------------------------------------------------------------------------
+# Celery tasks
+# ---------------------------------------------------------------------------
+
+def _slice_lock_key(job_id: int) -> str:
+    return f"qfl:sync-job:{job_id}"
+
+
+async def _run_sync_job(job_id: int) -> dict:
+    lock_key = _slice_lock_key(job_id)
+    token = await acquire_token_lock(lock_key, _SLICE_LOCK_TTL_SECONDS)
+    if token is None:
+        return {"job_id": job_id, "skipped": "slice already running"}
+    try:
+        status = await run_job_slice(
+            job_id,
+            session_factory=AsyncSessionLocal,
+            budget_seconds=_SLICE_BUDGET_SECONDS,
+        )
+    finally:
+        await release_token_lock(lock_key, token)
+
+    if status == JOB_RUNNING:
+        run_sync_job_task.apply_async(args=[job_id], countdown=1)
+    return {"job_id": job_id, "status": status}
+
+
+@celery_app.task(name="app.tasks.sync_job_tasks.run_sync_job")
+def run_sync_job_task(job_id: int):
+    """Celery task: run one time-boxed slice of a resumable sync job."""
+    return run_async(_run_sync_job(job_id))
+
+
+async def _resume_stale_sync_jobs() -> dict:
+    async with AsyncSessionLocal() as db:
+        job_ids = await find_stale_jobs(db, stale_after=_STALE_AFTER)
+    for job_id in job_ids:
+        logger.warning("Resuming stale sync job %s", job_id)
+        run_sync_job_task.delay(job_id)
+    return {"resumed": job_ids}
+
+
+@celery_app.task(name="app.tasks.sync_job_tasks.resume_stale_sync_jobs")
+def resume_stale_sync_jobs():
+    """Celery task: re-enqueue jobs whose worker died mid-slice."""
+    return run_async(_resume_stale_sync_jobs())
@@ -3,17 +3,20 @@ from datetime import datetime, timedelta
 from zoneinfo import ZoneInfo
 
 import redis as redis_lib
-from sqlalchemy import select, func, case, exists, text
+from sqlalchemy import select, func, case, text
 from sqlalchemy.exc import OperationalError
 
 from app.tasks import celery_app
 from app.database import AsyncSessionLocal
-from app.services.sync import SyncOrchestrator
-from app.models import Game, GameStatus, GameTeamStats, GamePlayerStats
+from app.services.sync import SyncDagExecutor, SyncNode, SyncOrchestrator, run_full_sync_dag
+from app.models import Game, GameStatus
 from app.models.team_of_week import TeamOfWeek
 from app.config import get_settings
+from app.services.season_snapshots import enqueue_season_snapshot_build, rebuild_season_snapshots
+from app.services.team_overview_aggregates import refresh_team_overview_aggregates
 from app.services.telegram import send_telegram_message
 from app.utils.async_celery import run_async
+from app.utils.has_stats import reconcile_game_flags
 from app.utils.timestamps import today_almaty, utcnow
 from app.utils.tour_completion import (
     tour_completed_predicate,
@@ -252,6 +255,9 @@ async def _sync_extended_aggregate_bundle(
         if marked_tours:
             await _dispatch_tow_sync_for_tours(season_id, marked_tours, "extended")
 
+        if team_count or player_count:
+            await refresh_team_overview_aggregates(db2, season_id)
+
     return {
         "teams": team_count,
         "players": player_count,
@@ -296,16 +302,11 @@ async def _sync_live_stats():
                     results_by_season[f"season_{season_id}"] = "skipped"
                     continue
 
-                # Derived has_stats: check actual stats records instead of stored flag
-                has_stats_filter = (
-                    exists().where(GameTeamStats.game_id == Game.id)
-                    | exists().where(GamePlayerStats.game_id == Game.id)
-                )
                 result = await db.execute(
                     select(Game.id).where(
                         Game.season_id == season_id,
                         Game.date >= three_days_ago,
-                        has_stats_filter,
+                        Game.has_stats == True,
                         Game.sync_disabled == False,
                     )
                 )
@@ -378,6 +379,116 @@ async def _sync_best_players():
     return {"best_players_synced": total, "by_season": results_by_season}
 
 
+def _dag_executor() -> SyncDagExecutor:
+    return SyncDagExecutor(
+        AsyncSessionLocal,
+        sota_concurrency=settings.sync_dag_sota_concurrency,
+        db_concurrency=settings.sync_dag_db_concurrency,
+    )
+
+
+def _game_extended_stats_node(game_id: int, now: datetime) -> SyncNode:
+    """Re-sync one game's stats (v2 enrichment) in its own session.
+
+    Marks ``extended_stats_synced_at`` in the same transaction, so a failure
+    on another game can no longer roll back this game's flag.
+    """
+    async def _run(db):
+        game = await db.get(Game, game_id)
+        if game is None:
+            # Deleted between selection and this node; nothing to mark.
+            logger.info("Game %s: no longer exists, skipping extended stats", game_id)
+            return {"skipped": True, "synced": False, "season_id": None, "tour": None}
+        r = await SyncOrchestrator(db).sync_game_stats(game_id)
+        team_count = r.get("teams", 0)
+        v2_count = r.get("v2_enriched", 0)
+        synced = team_count > 0 or v2_count > 0
+        if synced:
+            game.extended_stats_synced_at = now
+        else:
+            logger.info("Game %s: no team stats or v2 data yet, will retry", game_id)
+        return {
+            **r,
+            "synced": synced,
+            "season_id": game.season_id,
+            "tour": game.tour,
+        }
+
+    return SyncNode(f"game:{game_id}", _run)
+
+
+async def _sync_games_extended_stats(
+    game_ids: list[int],
+    *,
+    force: bool = False,
+) -> dict:
+    """Game-level extended stats, then season aggregates, through the sync DAG.
+
+    Games run concurrently (each in its own session) under the global SOTA/DB
+    caps; every touched season's aggregate bundle then runs as its own node,
+    in parallel with the other seasons. OperationalError from any node is
+    re-raised after the run so Celery can autoretry the task.
+    """
+    now = utcnow()
+    executor = _dag_executor()
+
+    games_report = await executor.run(
+        [_game_extended_stats_node(gid, now) for gid in game_ids]
+    )
+    game_results = []
+    game_errors = []
+    season_tours: dict[int, set[int]] = {}
+    for node in games_report.nodes:
+        game_id = int(node.name.split(":", 1)[1])
+        if node.status != "ok":
+            logger.warning("Extended game stats failed for game %s: %s", game_id, node.error)
+            game_errors.append(f"Game {game_id}: {node.error}")
+            continue
+        r = node.result
+        game_results.append({"game_id": game_id, **r})
+        if r["synced"] and r["season_id"]:
+            season_tours.setdefault(r["season_id"], set())
+            if r["tour"] is not None:
+                season_tours[r["season_id"]].add(r["tour"])
+
+    def _bundle(season_id: int, tours: set[int]) -> SyncNode:
+        async def _run(_db):
+            return await _sync_extended_aggregate_bundle(season_id, tours, force=force)
+        return SyncNode(f"season:{season_id}:aggregates", _run, managed_session=False)
+
+    seasons_report = await executor.run(
+        [_bundle(sid, tours) for sid, tours in sorted(season_tours.items())]
+    )
+    season_results = {}
+    for node in seasons_report.nodes:
+        season_id = int(node.name.split(":")[1])
+        if node.status != "ok":
+            game_errors.append(f"Season {season_id}: {node.error}")
+            continue
+        season_results[season_id] = {
+            "teams": node.result["teams"],
+            "players": node.result["players"],
+            "tour_stats": node.result["tour_stats"],
+        }
+        game_errors.extend(
+            [f"Season {season_id}: {err}" for err in node.result.get("errors", [])]
+        )
+
+    lock_error = seasons_report.first_exception(OperationalError)
+    if lock_error is not None:
+        raise lock_error
+
+    return {
+        "game_results": game_results,
+        "season_results": season_results,
+        "errors": game_errors,
+        "timings": {
+            "games": games_report.as_dict(),
+            "seasons": seasons_report.as_dict(),
+        },
+    }
+
+
 async def _sync_extended_stats():
     """
     Sync extended stats for games finished 24h+ ago that haven't been synced yet.
@@ -385,23 +496,17 @@ async def _sync_extended_stats():
     After ~24h, SOTA publishes extended data (xG, detailed passes, duels, etc.).
     This task:
     1. Finds finished games without extended_stats_synced_at (24h+ after finish)
-    2. Re-syncs game stats with v2 enrichment
-    3. Syncs team/player season stats ONLY if new games were processed
+    2. Re-syncs game stats with v2 enrichment (concurrently, one session per game)
+    3. Syncs team/player season stats ONLY for seasons where new games were processed
     4. Marks games as synced to avoid redundant work
     """
-    now = utcnow()
-    cutoff = now - timedelta(hours=24)
-    season_tours: dict[int, set[int]] = {}
-    game_results = []
-    game_errors = []
+    cutoff = utcnow() - timedelta(hours=24)
 
-    async with AsyncSessionLocal() as db:
-        try:
-            orchestrator = SyncOrchestrator(db)
-
-            # 1. Find games finished 24h+ ago, not yet synced, in active seasons only
+    try:
+        # 1. Find games finished 24h+ ago, not yet synced, in active seasons only
+        async with AsyncSessionLocal() as db:
             result = await db.execute(
-                select(Game).where(
+                select(Game.id).where(
                     Game.status == GameStatus.finished,
                     Game.finished_at.isnot(None),
                     Game.finished_at <= cutoff,
@@ -411,52 +516,25 @@ async def _sync_extended_stats():
                     Game.season_id.in_(settings.extended_stats_season_ids),
                 )
             )
-            games = list(result.scalars().all())
-
-            if not games:
-                return {"extended_stats": "no new games to sync"}
-
-            # 2. Re-sync game stats (with v2 enrichment)
-            for game in games:
-                try:
-                    r = await orchestrator.sync_game_stats(game.id)
-                    game_results.append({"game_id": game.id, **r})
-                    team_count = r.get("teams", 0)
-                    v2_count = r.get("v2_enriched", 0)
-                    if team_count > 0 or v2_count > 0:
-                        game.extended_stats_synced_at = now
-                        if game.season_id:
-                            season_tours.setdefault(game.season_id, set())
-                            if game.tour is not None:
-                                season_tours[game.season_id].add(game.tour)
-                    else:
-                        logger.info("Game %s: no team stats or v2 data yet, will retry", game.id)
-                except Exception as e:
-                    logger.warning("Extended game stats failed for game %s: %s", game.id, e)
-                    game_errors.append(f"Game {game.id}: {e}")
-                    await db.rollback()
+            game_ids = list(result.scalars().all())
 
-            await db.commit()
-        except Exception as e:
-            await db.rollback()
-            try:
-                await send_telegram_message(f"❌ Extended stats sync failed:\n{e}")
-            except Exception:
-                pass
-            raise
+        if not game_ids:
+            return {"extended_stats": "no new games to sync"}
 
-    # 3. Sync season aggregates in isolated transactions
-    season_results = {}
-    for season_id, tours in sorted(season_tours.items()):
-        result = await _sync_extended_aggregate_bundle(season_id, tours)
-        season_results[season_id] = {
-            "teams": result["teams"],
-            "players": result["players"],
-            "tour_stats": result["tour_stats"],
-        }
-        game_errors.extend(
-            [f"Season {season_id}: {err}" for err in result.get("errors", [])]
-        )
+        # 2-3. Game stats, then season aggregates
+        outcome = await _sync_games_extended_stats(game_ids)
+    except OperationalError:
+        raise
+    except Exception as e:
+        try:
+            await send_telegram_message(f"❌ Extended stats sync failed:\n{e}")
+        except Exception:
+            pass
+        raise
+
+    game_results = outcome["game_results"]
+    season_results = outcome["season_results"]
+    game_errors = outcome["errors"]
 
     # 4. Telegram notification
     if season_results or game_errors:
@@ -474,60 +552,34 @@ async def _sync_extended_stats():
         "games_resynced": len(game_results),
         "seasons_synced": season_results,
         "errors": game_errors,
+        "timings": outcome["timings"],
     }
 
 
 async def _resync_extended_stats(game_ids: list[int]):
     """Resync extended stats for specific games (admin-triggered)."""
-    now = utcnow()
-    season_tours: dict[int, set[int]] = {}
-
-    async with AsyncSessionLocal() as db:
-        try:
-            orchestrator = SyncOrchestrator(db)
-
+    try:
+        async with AsyncSessionLocal() as db:
             result = await db.execute(
-                select(Game).where(Game.id.in_(game_ids), Game.sync_disabled == False)
+                select(Game.id).where(Game.id.in_(game_ids), Game.sync_disabled == False)
             )
-            games = list(result.scalars().all())
-            if not games:
-                return {"message": "No games found"}
-
-            game_results = []
-            game_errors = []
-            for game in games:
-                try:
-                    r = await orchestrator.sync_game_stats(game.id)
-                    game_results.append({"game_id": game.id, **r})
-                    team_count = r.get("teams", 0)
-                    v2_count = r.get("v2_enriched", 0)
-                    if team_count > 0 or v2_count > 0:
-                        game.extended_stats_synced_at = now
-                        if game.season_id:
-                            season_tours.setdefault(game.season_id, set())
-                            if game.tour is not None:
-                                season_tours[game.season_id].add(game.tour)
-                    else:
-                        logger.info("Game %s: no team stats or v2 data", game.id)
-                except Exception as e:
-                    logger.warning("Resync failed for game %s: %s", game.id, e)
-                    game_errors.append(f"Game {game.id}: {e}")
-                    await db.rollback()
+            found_ids = list(result.scalars().all())
+        if not found_ids:
+            return {"message": "No games found"}
 
-            await db.commit()
-        except Exception as e:
-            await db.rollback()
-            try:
-                await send_telegram_message(f"❌ Admin resync failed:\n{e}")
-            except Exception:
-                pass
-            raise
+        outcome = await _sync_games_extended_stats(found_ids, force=True)
+    except OperationalError:
+        raise
+    except Exception as e:
+        try:
+            await send_telegram_message(f"❌ Admin resync failed:\n{e}")
+        except Exception:
+            pass
+        raise
 
-    season_results = {}
-    for sid, tours in sorted(season_tours.items()):
-        result = await _sync_extended_aggregate_bundle(sid, tours, force=True)
-        season_results[sid] = {"teams": result["teams"], "players": result["players"]}
-        game_errors.extend([f"Season {sid}: {err}" for err in result.get("errors", [])])
+    game_results = outcome["game_results"]
+    season_results = outcome["season_results"]
+    game_errors = outcome["errors"]
 
     # Telegram notification
     lines = ["🔄 Admin resync extended stats"]
@@ -539,7 +591,11 @@ async def _resync_extended_stats(game_ids: list[int]):
             lines.append(f"  ⚠️ {err}")
     await send_telegram_message("\n".join(lines))
 
-    return {"games_resynced": len(game_results), "errors": game_errors}
+    return {
+        "games_resynced": len(game_results),
+        "errors": game_errors,
+        "timings": outcome["timings"],
+    }
 
 
 @celery_app.task(name="app.tasks.sync_tasks.resync_extended_stats")
@@ -598,6 +654,11 @@ async def _sync_season_aggregates():
                 logger.exception("Player aggregate failed for season %s", season_id)
                 entry["players_error"] = str(exc)
 
+        async with AsyncSessionLocal() as db:
+            entry["team_overviews"] = await refresh_team_overview_aggregates(db, season_id)
+        # Built by the snapshot task, which serialises builds per season.
+        await enqueue_season_snapshot_build(season_id)
+
         results[f"season_{season_id}"] = entry
     return results
 
@@ -608,6 +669,30 @@ def sync_season_aggregates():
     return run_async(_sync_season_aggregates())
 
 
+async def _full_sync_seasons(season_ids: list[int] | None = None, force: bool = False) -> dict:
+    """Full sync for several seasons concurrently (see ``run_full_sync_dag``)."""
+    report = await run_full_sync_dag(
+        season_ids or settings.sync_season_ids,
+        session_factory=AsyncSessionLocal,
+        force=force,
+    )
+    slow = sorted(report["nodes"], key=lambda n: n["duration_seconds"], reverse=True)[:5]
+    logger.info(
+        "full_sync_seasons: %s seasons in %.1fs (parallelism %.2f), slowest=%s",
+        len(report["seasons"]),
+        report["total_seconds"],
+        report["parallelism"],
+        [(n["name"], n["duration_seconds"]) for n in slow],
+    )
+    return report
+
+
+@celery_app.task(name="app.tasks.sync_tasks.full_sync_seasons")
+def full_sync_seasons_task(season_ids: list[int] | None = None, force: bool = False):
+    """Celery task: Full sync across seasons through the sync DAG."""
+    return run_async(_full_sync_seasons(season_ids, force=force))
+
+
 @celery_app.task(name="app.tasks.sync_tasks.sync_extended_stats", **_DB_RETRY_KW)
 def sync_extended_stats():
     """Celery task: Sync extended stats 24h+ after match finish."""
@@ -869,3 +954,42 @@ def monitor_stuck_transactions():
     idle_in_transaction_session_timeout handles that).
     """
     return run_async(_monitor_stuck_transactions())
+
+
+async def _reconcile_game_flags() -> dict:
+    """Repair games.has_stats / has_lineup drift (see app.utils.has_stats).
+
+    Drift means a writer added or removed stats/lineup rows without
+    maintaining the flag; the ids are logged so that writer can be found.
+    """
+    async with AsyncSessionLocal() as db:
+        fixed = await reconcile_game_flags(db)
+        await db.commit()
+
+    for flag, game_ids in fixed.items():
+        if game_ids:
+            logger.warning(
+                "Repaired %s on %d games (first ids: %s)", flag, len(game_ids), game_ids[:20]
+            )
+    return {flag: len(game_ids) for flag, game_ids in fixed.items()}
+
+
+@celery_app.task(name="app.tasks.sync_tasks.reconcile_game_flags", **_DB_RETRY_KW)
+def reconcile_game_flags_task():
+    """Celery task: re-derive drifted has_stats / has_lineup flags."""
+    return run_async(_reconcile_game_flags())
+
+
+async def _build_season_snapshots(season_id: int) -> dict:
+    async with AsyncSessionLocal() as db:
+        written = await rebuild_season_snapshots(db, season_id)
+    return {"season_id": season_id, "written": written}
+
+
+@celery_app.task(name="app.tasks.sync_tasks.build_season_snapshots", soft_time_limit=120, time_limit=150)
+def build_season_snapshots_task(season_id: int):
+    """Celery task: Rebuild the season's results-grid and bracket snapshots.
+
+    Enqueued (debounced) on game status/score changes and cup-draw edits.
+    """
+    return run_async(_build_season_snapshots(season_id))
@@ -9,7 +9,7 @@ import logging
 from datetime import date as date_cls, timedelta
 
 import httpx
-from sqlalchemy import select
+from sqlalchemy import func, select
 
 from app.database import AsyncSessionLocal
 from app.models import Game
@@ -17,6 +17,7 @@ from app.models.game import GameStatus
 from app.services.telegram_posts import (
     find_ready_daily_results_payloads,
     post_game_event,
+    post_game_events,
     post_daily_results_digest,
     post_goal_video,
     post_match_finish,
@@ -24,7 +25,7 @@ from app.services.telegram_posts import (
     post_pregame_lineup,
     post_tour_announcement,
 )
-from app.services.telegram_user_client import TelegramTransientError
+from app.services.telegram_user_client import PublicTelegramSender, TelegramTransientError
 from app.tasks import celery_app
 from app.utils.async_celery import run_async
 
@@ -72,6 +73,29 @@ def post_game_event_task(event_id: int):
     return run_async(_post_game_event(event_id))
 
 
+# Set while a post_game_events_task for the game sits in the queue, so live
+# sync cycles don't stack duplicate tasks behind it.
+_OUTBOX_QUEUED_KEY = "qfl:tg-outbox:queued:{game_id}"
+_OUTBOX_QUEUED_TTL = 120
+
+
+async def _post_game_events(game_id: int) -> int:
+    try:
+        from app.utils.live_flag import get_redis
+
+        redis = await get_redis()
+        await redis.delete(_OUTBOX_QUEUED_KEY.format(game_id=game_id))
+    except Exception:
+        pass
+    async with AsyncSessionLocal() as db, PublicTelegramSender() as sender:
+        return await post_game_events(db, game_id, sender)
+
+
+@celery_app.task(name="app.tasks.telegram_tasks.post_game_events_task", **_RETRY_KW)
+def post_game_events_task(game_id: int):
+    return run_async(_post_game_events(game_id))
+
+
 async def _post_goal_video(event_id: int) -> bool:
     async with AsyncSessionLocal() as db:
         return await post_goal_video(db, event_id)
@@ -197,22 +221,40 @@ def tour_announce_daily():
 # ---------------------------------------------------------------------- #
 
 async def dispatch_pending_event_posts(db, game_id: int) -> int:
-    """Dispatch post_game_event for events with telegram_sent_at IS NULL.
+    """Queue the game's Telegram outbox if it has events with telegram_sent_at IS NULL.
 
-    Called from live sync task after commit. Returns number dispatched.
+    Called from live sync task after commit. One post_game_events_task per game
+    per cycle (none while one is already queued) instead of one task per
+    event. Returns the number of pending events.
     """
-    from app.models.game_event import GameEvent, GameEventType
+    from app.models.game_event import GameEvent
     from app.services.telegram_posts import POSTABLE_EVENT_TYPES
 
-    q = select(GameEvent.id).where(
+    q = select(func.count(GameEvent.id)).where(
         GameEvent.game_id == game_id,
         GameEvent.telegram_sent_at.is_(None),
         GameEvent.event_type.in_(POSTABLE_EVENT_TYPES),
     )
-    ids = (await db.execute(q)).scalars().all()
-    for eid in ids:
-        try:
-            post_game_event_task.delay(eid)
-        except Exception:
-            logger.exception("Failed to enqueue post_game_event_task(%s)", eid)
-    return len(ids)
+    pending = (await db.execute(q)).scalar_one()
+    if not pending:
+        return 0
+    key = _OUTBOX_QUEUED_KEY.format(game_id=game_id)
+    redis = None
+    try:
+        from app.utils.live_flag import get_redis
+
+        redis = await get_redis()
+        if not await redis.set(key, "1", nx=True, ex=_OUTBOX_QUEUED_TTL):
+            return pending
+    except Exception:
+        redis = None  # fail open: a duplicate task only finds nothing left to claim
+    try:
+        post_game_events_task.delay(game_id)
+    except Exception:
+        logger.exception("Failed to enqueue post_game_events_task(%s)", game_id)
+        if redis is not None:
+            try:
+                await redis.delete(key)
+            except Exception:
+                pass
+    return pending
@@ -0,0 +1,137 @@
+"""Queue-specialised Celery worker profiles.
+
+One worker image serves four very different workloads. A process started with
+``CELERY_WORKER_PROFILE=<name>`` consumes only that profile's queues, imports
+only its task modules and runs with its own pool, concurrency, prefetch and
+time limits:
+
+- ``live``: latency-critical, I/O-bound SOTA polling. Thread pool over one
+  shared event loop (``app.utils.async_celery.start_loop_thread``), so dozens
+  of ``sync_single_game`` coroutines overlap in a single process;
+  ``max_inflight`` caps how many run on the loop at once, clamped at worker
+  start to the DB pool capacity so coroutines never queue on pool_timeout.
+- ``telegram``: Bot API / Telethon posting, same model with fewer slots.
+- ``media``: CPU-heavy goal-video transcodes. Prefork, one task per child at a
+  time, ack late so a killed transcode is redelivered.
+- ``bulk``: the default ``celery`` queue (nightly/hourly sync, FCMS, tickets,
+  YouTube). Prefork with long limits, recycled children.
+
+An empty profile keeps the historical single-worker behaviour.
+"""
+
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class WorkerProfile:
+    name: str
+    queues: tuple[str, ...]
+    # () = every module in app.tasks.TASK_MODULES
+    task_modules: tuple[str, ...]
+    pool: str  # celery --pool: "prefork" or "threads"
+    concurrency: int
+    prefetch_multiplier: int
+    soft_time_limit: int
+    time_limit: int
+    max_tasks_per_child: int | None = None
+    acks_late: bool = False
+    # Loop-thread profiles: task coroutines running on the loop at once
+    max_inflight: int | None = None
+
+    @property
+    def uses_loop_thread(self) -> bool:
+        """Thread pools share one event loop running in its own thread."""
+        return self.pool == "threads"
+
+    def inflight_limit(self, pool_capacity: int | None) -> int | None:
+        """``max_inflight`` clamped to the DB pool (None capacity = unbounded)."""
+        if self.max_inflight is None or pool_capacity is None:
+            return self.max_inflight
+        return max(1, min(self.max_inflight, pool_capacity))
+
+    def celery_conf(self) -> dict:
+        from kombu import Queue
+
+        return {
+            "task_queues": [Queue(name) for name in self.queues],
+            "worker_pool": self.pool,
+            "worker_concurrency": self.concurrency,
+            "worker_prefetch_multiplier": self.prefetch_multiplier,
+            "worker_max_tasks_per_child": self.max_tasks_per_child,
+            "task_soft_time_limit": self.soft_time_limit,
+            "task_time_limit": self.time_limit,
+            "task_acks_late": self.acks_late,
+        }
+
+
+WORKER_PROFILES: dict[str, WorkerProfile] = {
+    profile.name: profile
+    for profile in (
+        WorkerProfile(
+            name="live",
+            queues=("live",),
+            task_modules=("app.tasks.live_tasks",),
+            pool="threads",
+            concurrency=64,
+            prefetch_multiplier=2,
+            soft_time_limit=300,
+            time_limit=330,
+            max_inflight=32,
+        ),
+        WorkerProfile(
+            name="telegram",
+            queues=("telegram",),
+            task_modules=("app.tasks.telegram_tasks",),
+            pool="threads",
+            concurrency=16,
+            prefetch_multiplier=2,
+            soft_time_limit=180,
+            time_limit=210,
+            max_inflight=8,
+        ),
+        WorkerProfile(
+            name="media",
+            queues=("media",),
+            task_modules=("app.tasks.goal_video_tasks", "app.tasks.telegram_tasks"),
+            pool="prefork",
+            concurrency=2,
+            prefetch_multiplier=1,
+            soft_time_limit=1800,
+            time_limit=1860,
+            max_tasks_per_child=10,
+            acks_late=True,
+        ),
+        WorkerProfile(
+            name="bulk",
+            queues=("celery",),
+            task_modules=(
+                "app.tasks.sync_tasks",
+                "app.tasks.live_tasks",
+                "app.tasks.weather_tasks",
+                "app.tasks.ticket_tasks",
+                "app.tasks.fcms_tasks",
+                "app.tasks.youtube_tasks",
+                "app.tasks.sync_job_tasks",
+            ),
+            pool="prefork",
+            concurrency=4,
+            prefetch_multiplier=1,
+            soft_time_limit=600,
+            time_limit=660,
+            max_tasks_per_child=100,
+        ),
+    )
+}
+
+
+def get_worker_profile(name: str) -> WorkerProfile | None:
+    """Profile for ``CELERY_WORKER_PROFILE`` ("" = none)."""
+    name = name.strip()
+    if not name:
+        return None
+    try:
+        return WORKER_PROFILES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown CELERY_WORKER_PROFILE {name!r}; expected one of {', '.join(WORKER_PROFILES)}"
+        ) from None
@@ -4,9 +4,18 @@ Shared event loop for Celery async tasks.
 This module provides a shared event loop that is reused across
 Celery task invocations, avoiding the overhead and potential
 resource leaks of creating a new loop for each task.
+
+Prefork children drive the loop with ``run_until_complete``. Thread-pool
+workers (the ``live``/``telegram`` profiles in app.tasks.worker_profiles)
+call ``start_loop_thread`` once: the loop then runs forever in its own thread
+and every pool thread submits its coroutine to it, so many tasks overlap on
+one loop, one DB pool and one set of HTTP clients.
 """
 import asyncio
+import contextlib
 import logging
+import threading
+from contextvars import ContextVar
 from functools import wraps
 from typing import Callable, Coroutine, Any, TypeVar
 
@@ -14,6 +23,16 @@ logger = logging.getLogger(__name__)
 
 # Global shared event loop
 _loop: asyncio.AbstractEventLoop | None = None
+# Set when the loop runs in a dedicated thread (thread-pool workers)
+_loop_thread: threading.Thread | None = None
+_loop_thread_lock = threading.Lock()
+# Caps concurrent task coroutines on the loop thread (None = unbounded)
+_inflight: asyncio.Semaphore | None = None
+# Sessions begun by the task coroutine currently running on the shared loop.
+# Every task has its own asyncio context, so concurrent tasks never see each
+# other's set.
+_task_sessions: ContextVar[set | None] = ContextVar("celery_task_sessions", default=None)
+_session_tracking_installed = False
 
 T = TypeVar("T")
 
@@ -59,10 +78,118 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
         def my_sync_task():
             return run_async(my_async_function())
     """
+    if _loop_thread is not None:
+        future = asyncio.run_coroutine_threadsafe(
+            _run_task_coroutine(coro, _current_soft_time_limit()), _loop
+        )
+        return future.result()
     loop = get_event_loop()
     return loop.run_until_complete(coro)
 
 
+def start_loop_thread(max_inflight: int | None = None) -> asyncio.AbstractEventLoop:
+    """
+    Run the shared event loop forever in a daemon thread.
+
+    Called once per thread-pool worker (``worker_init``). Afterwards
+    ``run_async`` from any pool thread schedules its coroutine on this loop
+    and blocks only the calling thread. ``max_inflight`` caps how many task
+    coroutines run on the loop at once; the rest wait for a slot (pool
+    threads are cheap, DB connections and upstream rate limits are not).
+    """
+    global _loop, _loop_thread, _inflight
+
+    with _loop_thread_lock:
+        if _loop_thread is None or not _loop_thread.is_alive():
+            _install_session_tracking()
+            _inflight = asyncio.Semaphore(max_inflight) if max_inflight else None
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="celery-asyncio-loop", daemon=True
+            )
+            _loop_thread.start()
+            logger.info(
+                "Started shared event loop thread for Celery tasks (max_inflight=%s)",
+                max_inflight,
+            )
+    return _loop
+
+
+def _current_soft_time_limit() -> float | None:
+    """Soft limit of the task being executed in this thread, if any.
+
+    Celery enforces time limits only in prefork children, so the loop-thread
+    mode applies the soft limit itself.
+    """
+    from celery import current_task
+
+    if not current_task:
+        return None
+    timelimit = getattr(current_task.request, "timelimit", None) or (None, None)
+    return (
+        timelimit[1]
+        or current_task.soft_time_limit
+        or current_task.app.conf.task_soft_time_limit
+    )
+
+
+async def _run_task_coroutine(coro: Coroutine[Any, Any, T], soft_limit: float | None) -> T:
+    """One task on the shared loop: wait for a slot, enforce the soft limit,
+    and close any session the task left open."""
+    async with _inflight or contextlib.nullcontext():
+        sessions: set = set()
+        token = _task_sessions.set(sessions)
+        deadline = asyncio.timeout(soft_limit or None)
+        try:
+            async with deadline:
+                return await coro
+        except TimeoutError:
+            if not deadline.expired():
+                raise
+            from celery.exceptions import SoftTimeLimitExceeded
+
+            raise SoftTimeLimitExceeded(soft_limit) from None
+        finally:
+            _task_sessions.reset(token)
+            await _close_leaked_sessions(sessions)
+
+
+def _install_session_tracking() -> None:
+    global _session_tracking_installed
+    if _session_tracking_installed:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.orm import Session
+
+    @event.listens_for(Session, "after_begin")
+    def _track_task_session(session, transaction, connection):
+        sessions = _task_sessions.get()
+        if sessions is not None:
+            sessions.add(session)
+
+    _session_tracking_installed = True
+
+
+async def _close_leaked_sessions(sessions: set) -> None:
+    """Roll back and close sessions a task did not close itself.
+
+    With many tasks on one loop a leaked ``AsyncSessionLocal()`` session would
+    keep its pooled connection (and any row locks) until garbage collection.
+    """
+    from sqlalchemy.ext.asyncio import async_session
+
+    for session in sessions:
+        if session.get_transaction() is None:
+            continue
+        proxy = async_session(session)
+        logger.warning("Celery task left a DB session open; closing it")
+        try:
+            if proxy is not None:
+                await proxy.close()
+        except Exception:
+            logger.exception("Failed to close leaked task session")
+
+
 def async_task(func: Callable[..., Coroutine[Any, Any, T]]) -> Callable[..., T]:
     """
     Decorator to convert an async function to a sync function
@@ -99,7 +226,11 @@ def cleanup_event_loop() -> None:
     Call this when shutting down the Celery worker to ensure
     proper cleanup of async resources.
     """
-    global _loop
+    global _loop, _loop_thread
+
+    if _loop_thread is not None:
+        _stop_loop_thread()
+        return
 
     if _loop is not None and not _loop.is_closed():
         try:
@@ -125,3 +256,30 @@ def cleanup_event_loop() -> None:
             logger.error(f"Error cleaning up event loop: {e}")
         finally:
             _loop = None
+
+
+def _stop_loop_thread() -> None:
+    global _loop, _loop_thread
+
+    loop, thread = _loop, _loop_thread
+    try:
+        from app.database import engine
+        asyncio.run_coroutine_threadsafe(engine.dispose(), loop).result(timeout=30)
+        logger.info("SQLAlchemy engine disposed")
+
+        async def _cancel_pending() -> None:
+            pending = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        asyncio.run_coroutine_threadsafe(_cancel_pending(), loop).result(timeout=30)
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=30)
+        loop.close()
+        logger.info("Shared event loop thread cleaned up successfully")
+    except Exception as e:
+        logger.error(f"Error cleaning up event loop thread: {e}")
+    finally:
+        _loop = None
+        _loop_thread = None
@@ -0,0 +1,184 @@
+"""Set-based bulk writes shared by the sync services.
+
+``bulk_update`` replaces loops of ``UPDATE t SET ... WHERE id = :id``. On
+PostgreSQL each chunk becomes a single
+``UPDATE t SET ... FROM (VALUES ...) AS bulk_src WHERE t.id = bulk_src.id``,
+so thousands of rows cost a handful of round trips. Other dialects (SQLite in
+tests) fall back to one ``executemany`` per chunk.
+
+``upsert_statement`` / ``bulk_upsert`` build the multi-row
+``INSERT ... ON CONFLICT (...) DO UPDATE SET col = excluded.col`` that the sync
+services otherwise write by hand, one row at a time.
+
+Both issue Core statements: they bypass the ORM unit of work, so model
+instances already loaded in the session are not refreshed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import Table, bindparam, cast, column, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# PostgreSQL caps one statement at 32767 bind parameters.
+_MAX_PARAMS = 30_000
+
+
+def _table(target: Any) -> Table:
+    return target.__table__ if hasattr(target, "__table__") else target
+
+
+def _dialect_name(db: AsyncSession) -> str:
+    return db.get_bind().dialect.name
+
+
+def _group_by_columns(rows: Iterable[Mapping[str, Any]]) -> dict[tuple[str, ...], list[Mapping[str, Any]]]:
+    """Rows sharing a column set can share one statement."""
+    groups: dict[tuple[str, ...], list[Mapping[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return groups
+
+
+def _chunks(rows: Sequence, width: int, chunk_size: int) -> Iterator[Sequence]:
+    size = max(1, min(chunk_size, _MAX_PARAMS // max(1, width)))
+    for start in range(0, len(rows), size):
+        yield rows[start:start + size]
+
+
+def update_from_values(
+    target: Any, key: str, set_columns: Sequence[str], rows: Sequence[Mapping[str, Any]]
+):
+    """``UPDATE target SET c = src.c FROM (VALUES ...) AS src WHERE target.key = src.key``."""
+    table = _table(target)
+    names = [key, *set_columns]
+    # Every cell is cast to its target column type: a bare NULL would leave
+    # PostgreSQL to infer ``text`` for a column that is NULL in every row.
+    types = [table.c[name].type for name in names]
+    source = values(
+        *(column(name, type_) for name, type_ in zip(names, types)),
+        name="bulk_src",
+    ).data([
+        tuple(cast(bindparam(None, row[name], type_=type_), type_) for name, type_ in zip(names, types))
+        for row in rows
+    ])
+    return (
+        update(table)
+        .where(table.c[key] == source.c[key])
+        .values({name: source.c[name] for name in set_columns})
+    )
+
+
+async def bulk_update(
+    db: AsyncSession,
+    target: Any,
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    key: str = "id",
+    chunk_size: int = 1000,
+    lock_in_key_order: bool = False,
+) -> int:
+    """Apply per-row values to the rows of ``target`` identified by ``key``.
+
+    Each mapping holds ``key`` plus the columns to set; rows may set different
+    columns (one statement per distinct column set). Returns the number of
+    input rows. ``lock_in_key_order`` first takes the row locks in ascending
+    key order (PostgreSQL ``SELECT ... FOR UPDATE``) for writers that rely on
+    a deterministic lock order against a concurrent duplicate task.
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    table = _table(target)
+    key_column = table.c[key]
+    dialect = _dialect_name(db)
+
+    if lock_in_key_order and dialect == "postgresql":
+        keys = sorted({row[key] for row in rows})
+        for chunk in _chunks(keys, 1, chunk_size):
+            await db.execute(
+                select(key_column)
+                .where(key_column.in_(chunk))
+                .order_by(key_column)
+                .with_for_update()
+            )
+
+    for names, group in _group_by_columns(rows).items():
+        if key not in names:
+            raise ValueError(f"bulk_update row without key column {key!r}: {sorted(names)}")
+        set_columns = [name for name in names if name != key]
+        if not set_columns:
+            continue
+        for chunk in _chunks(group, len(names), chunk_size):
+            if dialect == "postgresql":
+                await db.execute(update_from_values(table, key, set_columns, chunk))
+                continue
+            stmt = (
+                update(table)
+                .where(key_column == bindparam("_bulk_key"))
+                .values({name: bindparam(f"_bulk_{name}") for name in set_columns})
+            )
+            await db.execute(
+                stmt,
+                [
+                    {"_bulk_key": row[key], **{f"_bulk_{name}": row[name] for name in set_columns}}
+                    for row in chunk
+                ],
+            )
+    return len(rows)
+
+
+def upsert_statement(
+    dialect_name: str,
+    target: Any,
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str] | None = None,
+):
+    """Multi-row ``INSERT ... ON CONFLICT`` for PostgreSQL (and SQLite in tests).
+
+    ``update_columns`` defaults to every inserted column outside the conflict
+    target; an empty list turns the statement into ``ON CONFLICT DO NOTHING``.
+    """
+    if dialect_name == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        from sqlalchemy.dialects.postgresql import insert
+
+    stmt = insert(_table(target)).values(list(rows))
+    if update_columns is None:
+        update_columns = [name for name in rows[0] if name not in index_elements]
+    if not update_columns:
+        return stmt.on_conflict_do_nothing(index_elements=list(index_elements))
+    return stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={name: stmt.excluded[name] for name in update_columns},
+    )
+
+
+async def bulk_upsert(
+    db: AsyncSession,
+    target: Any,
+    rows: Iterable[Mapping[str, Any]],
+    *,
+    index_elements: Sequence[str],
+    update_columns: Sequence[str] | None = None,
+    chunk_size: int = 1000,
+) -> int:
+    """Insert-or-update ``rows`` in multi-row chunks. Returns the number of input rows."""
+    rows = list(rows)
+    if not rows:
+        return 0
+    dialect = _dialect_name(db)
+    for names, group in _group_by_columns(rows).items():
+        for chunk in _chunks(group, len(names), chunk_size):
+            await db.execute(
+                upsert_statement(
+                    dialect, target, chunk,
+                    index_elements=index_elements, update_columns=update_columns,
+                )
+            )
+    return len(rows)
@@ -11,6 +11,13 @@ import threading
 import time
 from typing import Awaitable, Callable
 
+from app.utils.metrics import (
+    CACHE_EVICTIONS,
+    CACHE_REQUESTS,
+    CACHE_SINGLEFLIGHT_WAITS,
+    cache_family,
+)
+
 logger = logging.getLogger(__name__)
 
 _cache: dict[str, tuple[float, bytes]] = {}
@@ -36,13 +43,16 @@ def cache_get(key: str) -> bytes | None:
         entry = _cache.get(key)
         if entry is None:
             logger.debug("cache miss: %s", key)
+            CACHE_REQUESTS.labels(cache_family(key), "miss").inc()
             return None
         expires_at, value = entry
         if time.monotonic() > expires_at:
             del _cache[key]
             logger.debug("cache expired: %s", key)
+            CACHE_REQUESTS.labels(cache_family(key), "expired").inc()
             return None
         logger.debug("cache hit: %s", key)
+        CACHE_REQUESTS.labels(cache_family(key), "hit").inc()
         return value
 
 
@@ -52,6 +62,7 @@ def cache_set(key: str, value: bytes, ttl: int) -> None:
             # Evict the entry closest to expiry
             oldest_key = min(_cache, key=lambda k: _cache[k][0])
             del _cache[oldest_key]
+            CACHE_EVICTIONS.labels(cache_family(oldest_key)).inc()
         _cache[key] = (time.monotonic() + ttl, value)
 
 
@@ -93,6 +104,8 @@ async def cache_get_or_compute(
         return cached
 
     lock = _singleflight_locks.setdefault(key, asyncio.Lock())
+    if lock.locked():
+        CACHE_SINGLEFLIGHT_WAITS.labels(cache_family(key)).inc()
     async with lock:
         cached = cache_get(key)
         if cached is not None:
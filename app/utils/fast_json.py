@@ -0,0 +1,50 @@
+"""Fast JSON serialization for API responses.
+
+FastAPI's default path for a handler's return value is expensive on large
+payloads: a model is dumped to a dict, re-validated against
+``response_model``, serialized again, walked by ``jsonable_encoder`` (for
+plain dicts) and finally ``json.dumps``-ed. Hot read endpoints skip all of it
+by returning ``json_response(payload)``: a pydantic model goes through its
+own Rust serializer (``model_dump_json``, no validation); dicts, lists,
+dataclasses and TypedDict rows go through orjson.
+
+``FastJSONResponse`` is also the default response class of the public
+routers, so handlers that still return plain data get orjson for the last
+step. NaN/Infinity become ``null`` instead of raising.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize a response payload to JSON bytes."""
+    if isinstance(content, BaseModel):
+        return content.model_dump_json().encode()
+    return orjson.dumps(content, default=_default, option=_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def json_response(content: Any, status_code: int = 200) -> FastJSONResponse:
+    """Pre-rendered response; FastAPI returns it as is, skipping response_model work."""
+    return FastJSONResponse(content, status_code=status_code)
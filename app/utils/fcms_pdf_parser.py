@@ -3,7 +3,9 @@
 import re
 import logging
 
-import fitz  # PyMuPDF
+from app.utils.lazy_import import lazy_module
+
+fitz = lazy_module("fitz")  # PyMuPDF
 
 logger = logging.getLogger(__name__)
 
@@ -1,7 +1,7 @@
 """Game grouping and player name fallback utilities."""
 
 from collections import defaultdict
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -16,6 +16,9 @@ from app.utils.game_status import compute_game_status
 from app.utils.localization import get_localized_field
 from app.utils.team_logo_fallback import resolve_team_logo_url
 
+if TYPE_CHECKING:
+    from app.services.reference_data import ReferenceSnapshot
+
 
 async def get_player_names_fallback(
     db: AsyncSession,
@@ -101,6 +104,7 @@ def group_games_by_date(
     games: list[Game],
     lang: str = "ru",
     status_mode: Literal["list", "home_widget"] = "list",
+    refs: "ReferenceSnapshot | None" = None,
 ) -> list[MatchCenterDateGroup]:
     """
     Group games by date with formatted labels.
@@ -108,6 +112,8 @@ def group_games_by_date(
     Args:
         games: List of Game objects to group (relationships must be eager-loaded)
         lang: Language for date formatting (kz, ru, en)
+        refs: Reference snapshot to take teams and stadiums from; without it
+            ``home_team`` / ``away_team`` / ``stadium_rel`` must be eager-loaded
 
     Returns:
         List of MatchCenterDateGroup models
@@ -146,9 +152,15 @@ def group_games_by_date(
                 video_review_url=game.video_review_url,
                 youtube_live_url=game.youtube_live_url,
                 protocol_url=game.protocol_url,
-                home_team=_build_team(game.home_team, lang),
-                away_team=_build_team(game.away_team, lang),
-                stadium=_build_stadium(game.stadium_rel, lang),
+                home_team=_build_team(
+                    refs.teams.get(game.home_team_id) if refs else game.home_team, lang,
+                ),
+                away_team=_build_team(
+                    refs.teams.get(game.away_team_id) if refs else game.away_team, lang,
+                ),
+                stadium=_build_stadium(
+                    refs.stadiums.get(game.stadium_id) if refs else game.stadium_rel, lang,
+                ),
                 broadcasters=[
                     BroadcasterInfo(
                         id=gb.broadcaster.id,
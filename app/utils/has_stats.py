@@ -1,50 +1,82 @@
 """
-Derived has_stats utility.
+Maintained Game.has_stats / Game.has_lineup flags.
 
-Computes has_stats from existence of game_team_stats or game_player_stats
-records instead of relying on the stored (always-false) Game.has_stats column.
+``Game.has_stats`` is true when the game has game_team_stats or
+game_player_stats rows, ``Game.has_lineup`` when it has game_lineups rows.
+Writers keep the flags in the same transaction as the rows they write
+(``mark_has_stats`` for stats; lineup writers set ``has_lineup`` directly),
+so read paths use the columns as stored.
+
+``check_game_flags`` lists games whose flags disagree with their rows;
+``reconcile_game_flags`` repairs them. The ``reconcile_game_flags`` beat
+task runs both and logs any drift, which points at a writer that skipped
+the flag.
 """
-from sqlalchemy import select, union
+from sqlalchemy import exists, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.util import identity_key
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.sql.elements import ColumnElement
 
-from app.models import Game, GameTeamStats, GamePlayerStats
-
+from app.models import Game, GameLineup, GamePlayerStats, GameTeamStats
 
-async def enrich_games_has_stats(
-    db: AsyncSession, games: list[Game]
-) -> None:
-    """Set derived has_stats on a list of Game objects (single DB query)."""
-    if not games:
-        return
-    game_ids = [g.id for g in games]
 
-    q = union(
-        select(GameTeamStats.game_id).where(
-            GameTeamStats.game_id.in_(game_ids)
-        ),
-        select(GamePlayerStats.game_id).where(
-            GamePlayerStats.game_id.in_(game_ids)
-        ),
+def has_stats_expression() -> ColumnElement[bool]:
+    """SQL truth of ``Game.has_stats``, derived from the stats rows."""
+    return (
+        exists().where(GameTeamStats.game_id == Game.id)
+        | exists().where(GamePlayerStats.game_id == Game.id)
     )
-    result = await db.execute(select(q.c.game_id))
-    ids_with_stats = set(result.scalars().all())
 
-    for game in games:
-        game.has_stats = game.id in ids_with_stats
 
+def has_lineup_expression() -> ColumnElement[bool]:
+    """SQL truth of ``Game.has_lineup``, derived from the lineup rows."""
+    return exists().where(GameLineup.game_id == Game.id)
 
-async def compute_single_has_stats(db: AsyncSession, game_id: int) -> bool:
-    """Compute derived has_stats for a single game."""
-    ts = await db.execute(
-        select(GameTeamStats.game_id)
-        .where(GameTeamStats.game_id == game_id)
-        .limit(1)
-    )
-    if ts.scalar_one_or_none() is not None:
-        return True
-    ps = await db.execute(
-        select(GamePlayerStats.game_id)
-        .where(GamePlayerStats.game_id == game_id)
-        .limit(1)
+
+async def mark_has_stats(db: AsyncSession, game_id: int) -> None:
+    """Set ``has_stats`` after writing stats rows for ``game_id`` (caller commits).
+
+    A ``Game`` already loaded in the session gets the value too, so callers
+    holding it (sessions run with ``expire_on_commit=False``) don't read a
+    stale ``False``.
+    """
+    await db.execute(
+        Game.__table__.update()
+        .where(Game.id == game_id, Game.has_stats.is_not(True))
+        .values(has_stats=True)
     )
-    return ps.scalar_one_or_none() is not None
+    game = db.identity_map.get(identity_key(Game, game_id))
+    if game is not None:
+        set_committed_value(game, "has_stats", True)
+
+
+_FLAGS = {
+    "has_stats": has_stats_expression,
+    "has_lineup": has_lineup_expression,
+}
+
+
+async def check_game_flags(db: AsyncSession) -> dict[str, list[int]]:
+    """Ids of games whose stored flag disagrees with their rows, per flag."""
+    drift: dict[str, list[int]] = {}
+    for name, expression in _FLAGS.items():
+        column = getattr(Game, name)
+        result = await db.execute(
+            select(Game.id).where(column.is_distinct_from(expression())).order_by(Game.id)
+        )
+        drift[name] = list(result.scalars().all())
+    return drift
+
+
+async def reconcile_game_flags(db: AsyncSession) -> dict[str, list[int]]:
+    """Repair drifted flags; returns the ids that were fixed, per flag (caller commits)."""
+    drift = await check_game_flags(db)
+    for name, game_ids in drift.items():
+        if game_ids:
+            await db.execute(
+                Game.__table__.update()
+                .where(Game.id.in_(game_ids))
+                .values({name: _FLAGS[name]()})
+            )
+    return drift
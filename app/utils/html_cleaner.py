@@ -1,8 +1,11 @@
 """HTML content cleaner and sanitizer for news articles."""
 import re
+from functools import cache
 
-import bleach
-from bs4 import BeautifulSoup
+from app.utils.lazy_import import lazy_module
+
+bleach = lazy_module("bleach")
+bs4 = lazy_module("bs4")
 
 
 def clean_news_content(html: str | None) -> str | None:
@@ -15,7 +18,7 @@ def clean_news_content(html: str | None) -> str | None:
     if not html:
         return html
 
-    soup = BeautifulSoup(html, "lxml")
+    soup = bs4.BeautifulSoup(html, "lxml")
 
     # 0. Extract YouTube iframes before cleaning (they may be nested deep)
     youtube_iframes = []
@@ -93,7 +96,7 @@ def clean_news_content(html: str | None) -> str | None:
     filtered_parts = []
     for part in result_parts:
         # Parse to check content
-        part_soup = BeautifulSoup(part, "lxml")
+        part_soup = bs4.BeautifulSoup(part, "lxml")
         text = part_soup.get_text(strip=True)
 
         # Skip date-only paragraphs
@@ -158,13 +161,15 @@ _YOUTUBE_EMBED_PREFIXES = (
     "https://www.youtube-nocookie.com/embed/",
 )
 
-_bleach_cleaner = bleach.sanitizer.Cleaner(
-    tags=_ALLOWED_TAGS,
-    attributes=_ALLOWED_ATTRS,
-    protocols=_ALLOWED_PROTOCOLS,
-    strip=True,
-    strip_comments=True,
-)
+@cache
+def _bleach_cleaner():
+    return bleach.sanitizer.Cleaner(
+        tags=_ALLOWED_TAGS,
+        attributes=_ALLOWED_ATTRS,
+        protocols=_ALLOWED_PROTOCOLS,
+        strip=True,
+        strip_comments=True,
+    )
 
 
 _DROP_WITH_CONTENT_TAGS = ("script", "style", "noscript")
@@ -190,13 +195,13 @@ def sanitize_news_html(html: str | None) -> str | None:
     if not html:
         return html
 
-    pre_soup = BeautifulSoup(html, "html.parser")
+    pre_soup = bs4.BeautifulSoup(html, "html.parser")
     for tag in pre_soup.find_all(_DROP_WITH_CONTENT_TAGS):
         tag.decompose()
 
-    cleaned = _bleach_cleaner.clean(str(pre_soup))
+    cleaned = _bleach_cleaner().clean(str(pre_soup))
 
-    soup = BeautifulSoup(cleaned, "html.parser")
+    soup = bs4.BeautifulSoup(cleaned, "html.parser")
 
     for iframe in list(soup.find_all("iframe")):
         src = (iframe.get("src") or "").strip()
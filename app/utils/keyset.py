@@ -0,0 +1,132 @@
+"""Keyset (cursor) pagination for public list endpoints.
+
+``OFFSET n`` makes Postgres produce and discard ``n`` rows, so crawlers
+paging deep into ``/players`` or ``/news`` cost more the further they go.
+A cursor carries the sort-key values of the last row served; the next page
+is ``WHERE (keys) > (cursor) ORDER BY keys LIMIT n``, which an index on the
+sort keys answers without touching the skipped rows.
+
+Every key list must end with a unique column (the primary key) so the order
+is total. NULLs always sort last, in both directions, so the keyset
+predicate is the same on Postgres and SQLite.
+
+Cursors are opaque to clients: URL-safe base64 of ``[sort, [values...]]``.
+``sort`` names the ordering the cursor was issued for; a cursor replayed
+against a different ordering is rejected with 400.
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from fastapi import HTTPException
+from sqlalchemy import and_, false, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+
+@dataclass(frozen=True)
+class SortKey:
+    column: Any
+    descending: bool = False
+
+    @property
+    def nullable(self) -> bool:
+        return getattr(getattr(self.column, "expression", self.column), "nullable", True)
+
+    def order_clause(self) -> ColumnElement:
+        clause = self.column.desc() if self.descending else self.column.asc()
+        return clause.nulls_last() if self.nullable else clause
+
+    def python_type(self) -> type | None:
+        try:
+            return self.column.type.python_type
+        except (AttributeError, NotImplementedError):
+            return None
+
+
+def order_by(keys: Sequence[SortKey]) -> list[ColumnElement]:
+    return [key.order_clause() for key in keys]
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, (date, time, datetime)):
+        return value.isoformat()
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def _decode_value(key: SortKey, value: Any) -> Any:
+    if value is None:
+        return None
+    kind = key.python_type()
+    if kind is datetime:
+        return datetime.fromisoformat(value)
+    if kind is date:
+        return date.fromisoformat(value)
+    if kind is time:
+        return time.fromisoformat(value)
+    if kind is Decimal:
+        return Decimal(value)
+    if kind is int and not isinstance(value, int):
+        raise ValueError("integer expected")
+    if kind is str and not isinstance(value, str):
+        raise ValueError("string expected")
+    return value
+
+
+def encode_cursor(sort: str, values: Sequence[Any]) -> str:
+    """Cursor pointing just past a row whose sort-key values are ``values``."""
+    raw = json.dumps([sort, [_encode_value(v) for v in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str, sort: str, keys: Sequence[SortKey]) -> list[Any]:
+    """Sort-key values from ``cursor``; 400 when it is malformed or issued for another sort."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_sort, values = json.loads(raw)
+        if cursor_sort != sort or len(values) != len(keys):
+            raise ValueError("cursor does not match this ordering")
+        return [_decode_value(key, value) for key, value in zip(keys, values)]
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError, InvalidOperation):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _equal(key: SortKey, value: Any) -> ColumnElement:
+    return key.column.is_(None) if value is None else key.column == value
+
+
+def _after(key: SortKey, value: Any) -> ColumnElement:
+    if value is None:
+        # NULLs sort last: nothing follows a NULL on this key.
+        return false()
+    clause = key.column < value if key.descending else key.column > value
+    return or_(clause, key.column.is_(None)) if key.nullable else clause
+
+
+def after(keys: Sequence[SortKey], values: Sequence[Any]) -> ColumnElement:
+    """WHERE clause selecting the rows that sort strictly after ``values``."""
+    terms = []
+    for i, key in enumerate(keys):
+        prefix = [_equal(k, v) for k, v in zip(keys[:i], values[:i])]
+        terms.append(and_(*prefix, _after(key, values[i])))
+    return or_(*terms)
+
+
+def split_page(rows: Sequence, limit: int, sort: str, key_values) -> tuple[list, str | None]:
+    """Trim rows fetched with ``LIMIT limit + 1`` and build the next cursor.
+
+    ``key_values(row)`` returns the row's sort-key values in key order. The
+    cursor is ``None`` on the last page.
+    """
+    rows = list(rows)
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(sort, key_values(rows[-1]))
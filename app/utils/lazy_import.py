@@ -0,0 +1,46 @@
+"""Deferred imports for heavy optional SDKs.
+
+``anthropic`` alone adds ~1.8s to a cold import, and ``openai``/``telethon``
+follow close behind. Modules that only touch an SDK inside a call bind it
+through ``lazy_module`` instead of a top-level import, so merely importing the
+service (every router, every Celery worker) stays cheap:
+
+    anthropic = lazy_module("anthropic")
+    ...
+    client = anthropic.AsyncAnthropic(api_key=...)   # imported here, once
+
+The real import happens on first attribute access; a missing package raises
+``ImportError`` at that point rather than at process start.
+"""
+
+import importlib
+from types import ModuleType
+
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access."""
+
+    def __init__(self, name: str):
+        self._name = name
+        self._module: ModuleType | None = None
+
+    def _load(self) -> ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._module is not None
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module {self._name!r} ({state})>"
+
+
+def lazy_module(name: str) -> LazyModule:
+    """Return a proxy that imports ``name`` the first time it is used."""
+    return LazyModule(name)
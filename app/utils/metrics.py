@@ -0,0 +1,293 @@
+"""Prometheus metrics for the web app and Celery workers.
+
+Exposed by ``GET /metrics`` (app.main) and, in workers, by a small HTTP
+exporter on ``METRICS_WORKER_PORT`` (app.tasks). Families:
+
+- ``qfl_cache_*``: in-process response cache hits/misses/evictions and
+  singleflight waits, per key family (the key prefix before the first ``:``).
+- ``qfl_db_pool_*``: connection checkout wait and checked-out connections
+  for the ``web`` and ``worker`` engines.
+- ``qfl_http_request_duration_seconds``: per-route latency (route template,
+  never the raw path).
+- ``qfl_task_duration_seconds``: Celery task duration by outcome.
+- ``qfl_outbound_request_duration_seconds``: SOTA/FCMS/Telegram/... call
+  latency by outcome.
+
+Every label value comes from a closed set or passes through ``BoundedLabel``,
+which folds anything past its limit into ``"other"``, so a crawler hitting
+random URLs or a bug generating unique cache keys cannot blow up the series
+count. Recording is a dict lookup plus a lock-protected add.
+
+Gunicorn and prefork Celery run several processes: set
+``PROMETHEUS_MULTIPROC_DIR`` (an empty, writable directory per service) and
+``render_metrics`` aggregates across them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import REGISTRY as _DEFAULT_REGISTRY
+
+__all__ = ["CONTENT_TYPE_LATEST", "render_metrics"]
+
+OTHER = "other"
+
+_FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+_SLOW_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0)
+
+
+class BoundedLabel:
+    """Pass label values through until ``limit`` distinct ones were seen."""
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._seen: set[str] = set()
+        self._lock = threading.Lock()
+
+    def __call__(self, value: str) -> str:
+        if value in self._seen:
+            return value
+        with self._lock:
+            if len(self._seen) >= self._limit:
+                return OTHER
+            self._seen.add(value)
+            return value
+
+
+# --- response cache ---------------------------------------------------------
+
+CACHE_REQUESTS = Counter(
+    "qfl_cache_requests_total", "In-process cache lookups.", ["family", "result"]
+)
+CACHE_EVICTIONS = Counter(
+    "qfl_cache_evictions_total", "Entries evicted to stay under the size cap.", ["family"]
+)
+CACHE_SINGLEFLIGHT_WAITS = Counter(
+    "qfl_cache_singleflight_waits_total",
+    "Callers that waited on another coroutine computing the same cold key.",
+    ["family"],
+)
+_cache_family = BoundedLabel(64)
+
+
+def cache_family(key: str) -> str:
+    return _cache_family(key.split(":", 1)[0])
+
+
+# --- database pools ---------------------------------------------------------
+
+DB_POOL_CHECKOUT = Histogram(
+    "qfl_db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection.",
+    ["pool"],
+    buckets=_FAST_BUCKETS,
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "qfl_db_pool_checked_out", "Connections currently checked out.", ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_CAPACITY = Gauge(
+    "qfl_db_pool_capacity", "pool_size + max_overflow.", ["pool"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_TIMEOUTS = Counter(
+    "qfl_db_pool_timeouts_total", "Checkouts that gave up waiting for a connection.", ["pool"]
+)
+
+
+def instrument_pool(engine, name: str) -> None:
+    """Record checkout wait and saturation for ``engine`` (async or sync)."""
+    from sqlalchemy import event
+    from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+    pool = getattr(engine, "sync_engine", engine).pool
+    if getattr(pool, "_qfl_metrics", False) or not hasattr(pool, "_do_get"):
+        return
+    pool._qfl_metrics = True
+
+    if hasattr(pool, "size") and hasattr(pool, "_max_overflow"):
+        DB_POOL_CAPACITY.labels(name).set(pool.size() + max(pool._max_overflow, 0))
+
+    checkout = DB_POOL_CHECKOUT.labels(name)
+    timeouts = DB_POOL_TIMEOUTS.labels(name)
+    checked_out = DB_POOL_CHECKED_OUT.labels(name)
+    do_get = pool._do_get
+
+    def timed_do_get():
+        started = time.perf_counter()
+        try:
+            return do_get()
+        except PoolTimeout:
+            timeouts.inc()
+            raise
+        finally:
+            checkout.observe(time.perf_counter() - started)
+
+    pool._do_get = timed_do_get
+    event.listen(pool, "checkout", lambda *_: checked_out.inc())
+    event.listen(pool, "checkin", lambda *_: checked_out.dec())
+
+
+# --- HTTP routes ------------------------------------------------------------
+
+HTTP_REQUEST_DURATION = Histogram(
+    "qfl_http_request_duration_seconds",
+    "API latency per route template.",
+    ["method", "route", "status"],
+    buckets=_FAST_BUCKETS,
+)
+_route_label = BoundedLabel(400)
+_METHODS = frozenset({"GET", "POST", "PUT", "PATCH", "DELETE", "HEAD", "OPTIONS"})
+
+
+class MetricsMiddleware:
+    """ASGI middleware timing each request under its matched route template."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path", None)
+            method = scope.get("method", "GET")
+            HTTP_REQUEST_DURATION.labels(
+                method if method in _METHODS else OTHER,
+                _route_label(path) if path else "unmatched",
+                f"{status // 100}xx",
+            ).observe(time.perf_counter() - started)
+
+
+# --- Celery tasks -----------------------------------------------------------
+
+TASK_DURATION = Histogram(
+    "qfl_task_duration_seconds",
+    "Celery task run time by outcome.",
+    ["task", "outcome"],
+    buckets=_SLOW_BUCKETS,
+)
+_task_label = BoundedLabel(200)
+_task_started: dict[str, float] = {}
+
+
+def install_celery_task_metrics() -> None:
+    """Hook task signals; call once in the Celery app module."""
+    from celery.signals import task_postrun, task_prerun
+
+    def on_prerun(task_id=None, **_):
+        _task_started[task_id] = time.perf_counter()
+
+    def on_postrun(task_id=None, task=None, state=None, **_):
+        started = _task_started.pop(task_id, None)
+        if started is None or task is None:
+            return
+        outcome = {"SUCCESS": "success", "RETRY": "retry"}.get(state, "failure")
+        TASK_DURATION.labels(_task_label(task.name), outcome).observe(
+            time.perf_counter() - started
+        )
+
+    # postrun fires for failures and retries too, with the final state.
+    task_prerun.connect(on_prerun, weak=False)
+    task_postrun.connect(on_postrun, weak=False)
+
+
+# --- outbound calls ---------------------------------------------------------
+
+OUTBOUND_DURATION = Histogram(
+    "qfl_outbound_request_duration_seconds",
+    "Third-party API call latency by outcome.",
+    ["service", "outcome"],
+    buckets=_SLOW_BUCKETS,
+)
+_service_label = BoundedLabel(32)
+
+
+class OutboundCall:
+    """Handle yielded by ``observe_outbound``; set the HTTP status if any."""
+
+    __slots__ = ("outcome",)
+
+    def __init__(self):
+        self.outcome = "ok"
+
+    def status(self, code: int) -> None:
+        if code == 429:
+            self.outcome = "rate_limited"
+        elif code >= 500:
+            self.outcome = "http_5xx"
+        elif code >= 400:
+            self.outcome = "http_4xx"
+        else:
+            self.outcome = "ok"
+
+
+@contextmanager
+def observe_outbound(service: str) -> Iterator[OutboundCall]:
+    call = OutboundCall()
+    started = time.perf_counter()
+    try:
+        yield call
+    except asyncio.CancelledError:
+        call.outcome = "cancelled"
+        raise
+    except BaseException as exc:
+        call.outcome = getattr(exc, "metrics_outcome", "error")
+        raise
+    finally:
+        OUTBOUND_DURATION.labels(_service_label(service), call.outcome).observe(
+            time.perf_counter() - started
+        )
+
+
+# --- exposition -------------------------------------------------------------
+
+
+def _registry() -> CollectorRegistry:
+    if not os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        return _DEFAULT_REGISTRY
+    from prometheus_client import multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def render_metrics() -> bytes:
+    """Text exposition of every metric (all processes in multiprocess mode)."""
+    return generate_latest(_registry())
+
+
+def start_worker_exporter(port: int) -> None:
+    """Serve ``render_metrics`` over HTTP from a Celery worker process."""
+    from prometheus_client import start_http_server
+
+    start_http_server(port, registry=_registry())
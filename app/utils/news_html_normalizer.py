@@ -6,13 +6,15 @@ import re
 from typing import Literal
 from urllib.parse import parse_qs, urljoin, urlparse
 
-from bs4 import BeautifulSoup
 from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import get_settings
 from app.models import Player, Team
 from app.utils.file_urls import resolve_file_url
+from app.utils.lazy_import import lazy_module
+
+bs4 = lazy_module("bs4")
 
 DEFAULT_NEWS_BASE_URL = "https://kffleague.kz"
 _EXTERNAL_LINK_REL = "noopener noreferrer nofollow"
@@ -309,7 +311,7 @@ def _to_relative_if_internal(url: str, *, internal_hosts: set[str]) -> str:
     return path
 
 
-def _render_soup_fragment(soup: BeautifulSoup) -> str:
+def _render_soup_fragment(soup: bs4.BeautifulSoup) -> str:
     if soup.body is None:
         return str(soup)
     return "".join(str(child) for child in soup.body.contents)
@@ -348,7 +350,7 @@ async def normalize_news_html_content(
     base_origin = _base_origin(base_url)
     internal_hosts = _build_internal_hosts(base_url, fallback_base_url)
 
-    soup = BeautifulSoup(content, "lxml")
+    soup = bs4.BeautifulSoup(content, "lxml")
     mutated = False
 
     anchors = list(soup.find_all("a"))
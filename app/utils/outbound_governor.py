@@ -0,0 +1,357 @@
+"""Shared governor for outbound calls to third-party APIs.
+
+Every external client (SOTA, FCMS, Serper, YouTube Data API, Open-Meteo,
+METAR) sends its requests through ``GovernedTransport``, an httpx transport
+that adds, per destination host:
+
+* a token bucket kept in Redis, so all workers share one request budget
+  (reservation style: a caller that has to wait sleeps exactly as long as
+  its token needs, instead of polling);
+* a circuit breaker: after ``failure_threshold`` consecutive failures
+  (transport errors, 5xx) the host is opened for ``cooldown_seconds`` and
+  calls fail fast with ``CircuitOpenError``. The open state is mirrored to
+  Redis so other workers stop calling too; after the cooldown one probe is
+  let through (half-open);
+* adaptive timeouts: once enough successful calls are observed, the
+  connect/read timeouts shrink to ``timeout_multiplier`` × observed p99
+  (never below ``min_timeout_seconds`` and never above what the caller
+  asked for), so a stalled host can't pin a worker slot for minutes.
+
+Redis errors fail open — the governor never blocks a call because Redis is
+down. ``snapshot()`` backs ``GET /admin/ops/outbound``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.config import get_settings
+from app.utils.metrics import observe_outbound
+
+logger = logging.getLogger(__name__)
+
+KEY_PREFIX = "qfl:outbound"
+
+
+@dataclass(frozen=True)
+class HostPolicy:
+    rate_per_second: float
+    burst: int
+    failure_threshold: int = 5
+    cooldown_seconds: float = 30.0
+    max_wait_seconds: float = 30.0
+    min_timeout_seconds: float = 5.0
+    timeout_multiplier: float = 4.0
+    min_samples: int = 20
+
+
+# Matched by host suffix; the most specific (longest) suffix wins.
+HOST_POLICIES: dict[str, HostPolicy] = {
+    "sota.id": HostPolicy(rate_per_second=8, burst=16),
+    "fcms.ma.services": HostPolicy(rate_per_second=4, burst=8),
+    "google.serper.dev": HostPolicy(rate_per_second=2, burst=5),
+    "googleapis.com": HostPolicy(rate_per_second=5, burst=10),
+    "open-meteo.com": HostPolicy(rate_per_second=5, burst=10),
+    "aviationweather.gov": HostPolicy(rate_per_second=2, burst=4),
+}
+# Ticket search scrapes arbitrary club websites and t.me pages.
+DEFAULT_POLICY = HostPolicy(rate_per_second=5, burst=10)
+
+_LATENCY_WINDOW = 200
+
+# Reservation token bucket. Returns the wait in ms before the reserved token
+# is usable, -1 if that would exceed max_wait (nothing reserved), or -2 if
+# another worker opened the circuit for this host. Uses the Redis clock so
+# workers with skewed clocks still agree.
+_BUCKET_SCRIPT = """
+if redis.call("EXISTS", KEYS[2]) == 1 then
+    return -2
+end
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local max_wait = tonumber(ARGV[3])
+local t = redis.call("TIME")
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local state = redis.call("HMGET", KEYS[1], "tokens", "ts")
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + (now - ts) * rate / 1000)
+local wait = 0
+if tokens < 1 then
+    wait = math.ceil((1 - tokens) * 1000 / rate)
+    if wait > max_wait then
+        return -1
+    end
+end
+redis.call("HSET", KEYS[1], "tokens", tokens - 1, "ts", now)
+redis.call("PEXPIRE", KEYS[1], math.ceil(burst * 1000 / rate) + 60000)
+return wait
+"""
+
+
+class CircuitOpenError(httpx.TransportError):
+    """Host is degraded; the call was not attempted."""
+
+    metrics_outcome = "circuit_open"
+
+
+class RateLimitExceeded(httpx.TransportError):
+    """The shared budget for this host would need too long a wait."""
+
+    metrics_outcome = "rate_limited"
+
+
+def policy_for(host: str) -> tuple[str, HostPolicy]:
+    """(bucket name, policy) for a host — known hosts share one bucket per suffix."""
+    best = ""
+    for suffix in HOST_POLICIES:
+        if (host == suffix or host.endswith("." + suffix)) and len(suffix) > len(best):
+            best = suffix
+    if best:
+        return best, HOST_POLICIES[best]
+    return host, DEFAULT_POLICY
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, math.ceil(pct * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+@dataclass
+class HostState:
+    name: str
+    policy: HostPolicy
+    latencies: deque = field(default_factory=lambda: deque(maxlen=_LATENCY_WINDOW))
+    consecutive_failures: int = 0
+    opened_until: float = 0.0  # monotonic; 0 = closed
+    probe_in_flight: bool = False
+    requests: int = 0
+    failures: int = 0
+    rejected_open: int = 0
+    rejected_rate: int = 0
+    throttled_seconds: float = 0.0
+    last_error: str | None = None
+
+    @property
+    def state(self) -> str:
+        if not self.opened_until:
+            return "closed"
+        return "open" if time.monotonic() < self.opened_until else "half_open"
+
+    def adaptive_timeout(self) -> float | None:
+        if len(self.latencies) < self.policy.min_samples:
+            return None
+        p99 = _percentile(sorted(self.latencies), 0.99)
+        return max(self.policy.min_timeout_seconds, p99 * self.policy.timeout_multiplier)
+
+    def as_dict(self) -> dict[str, Any]:
+        ordered = sorted(self.latencies)
+        adaptive = self.adaptive_timeout()
+        return {
+            "host": self.name,
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "requests": self.requests,
+            "failures": self.failures,
+            "rejected_open": self.rejected_open,
+            "rejected_rate": self.rejected_rate,
+            "throttled_seconds": round(self.throttled_seconds, 3),
+            "latency_p50": round(_percentile(ordered, 0.50), 3),
+            "latency_p95": round(_percentile(ordered, 0.95), 3),
+            "latency_p99": round(_percentile(ordered, 0.99), 3),
+            "samples": len(ordered),
+            "adaptive_timeout": round(adaptive, 3) if adaptive is not None else None,
+            "rate_per_second": self.policy.rate_per_second,
+            "burst": self.policy.burst,
+            "last_error": self.last_error,
+        }
+
+
+class OutboundGovernor:
+    def __init__(self, *, enabled: bool = True, redis_getter=None):
+        self.enabled = enabled
+        self._redis_getter = redis_getter
+        self._hosts: dict[str, HostState] = {}
+
+    def host_state(self, host: str) -> HostState:
+        name, policy = policy_for(host)
+        state = self._hosts.get(name)
+        if state is None:
+            state = self._hosts[name] = HostState(name=name, policy=policy)
+        return state
+
+    async def before_request(self, host: str, request: httpx.Request) -> HostState:
+        """Breaker check + token reservation. Raises instead of calling a bad host."""
+        state = self.host_state(host)
+        state.requests += 1
+
+        if state.state == "open":
+            state.rejected_open += 1
+            raise CircuitOpenError(f"circuit open for {state.name}", request=request)
+        if state.state == "half_open":
+            if state.probe_in_flight:
+                state.rejected_open += 1
+                raise CircuitOpenError(f"circuit half-open for {state.name}", request=request)
+            state.probe_in_flight = True
+
+        wait_ms = await self._reserve(state)
+        if wait_ms == -2:
+            state.rejected_open += 1
+            state.probe_in_flight = False
+            raise CircuitOpenError(f"circuit open for {state.name} (shared)", request=request)
+        if wait_ms == -1:
+            state.rejected_rate += 1
+            state.probe_in_flight = False
+            raise RateLimitExceeded(f"rate budget exhausted for {state.name}", request=request)
+        if wait_ms > 0:
+            state.throttled_seconds += wait_ms / 1000
+            await asyncio.sleep(wait_ms / 1000)
+        return state
+
+    def adapt_timeout(self, state: HostState, timeout: dict[str, float | None]) -> dict[str, float | None]:
+        adaptive = state.adaptive_timeout()
+        if adaptive is None:
+            return timeout
+        adapted = dict(timeout)
+        for phase in ("connect", "read"):
+            current = adapted.get(phase)
+            adapted[phase] = adaptive if current is None else min(current, adaptive)
+        return adapted
+
+    def record_success(self, state: HostState, latency: float) -> None:
+        state.latencies.append(latency)
+        state.consecutive_failures = 0
+        if state.opened_until:
+            logger.info("outbound: circuit for %s closed", state.name)
+        state.opened_until = 0.0
+        state.probe_in_flight = False
+
+    async def record_failure(self, state: HostState, error: str) -> None:
+        state.failures += 1
+        state.consecutive_failures += 1
+        state.last_error = error
+        was_probe = state.probe_in_flight
+        state.probe_in_flight = False
+        if was_probe or state.consecutive_failures >= state.policy.failure_threshold:
+            state.opened_until = time.monotonic() + state.policy.cooldown_seconds
+            logger.warning(
+                "outbound: circuit for %s opened for %.0fs after %d failures (%s)",
+                state.name, state.policy.cooldown_seconds, state.consecutive_failures, error,
+            )
+            await self._share_open(state)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        return [state.as_dict() for _name, state in sorted(self._hosts.items())]
+
+    # ---- redis ------------------------------------------------------------
+
+    async def _redis(self):
+        try:
+            if self._redis_getter is not None:
+                return await self._redis_getter()
+            from app.utils.live_flag import get_redis
+
+            return await get_redis()
+        except Exception:
+            return None
+
+    async def _reserve(self, state: HostState) -> int:
+        redis = await self._redis()
+        if redis is None:
+            return 0
+        policy = state.policy
+        try:
+            return int(await redis.eval(
+                _BUCKET_SCRIPT, 2,
+                f"{KEY_PREFIX}:bucket:{state.name}",
+                f"{KEY_PREFIX}:open:{state.name}",
+                policy.rate_per_second, policy.burst, int(policy.max_wait_seconds * 1000),
+            ))
+        except Exception:
+            logger.debug("outbound: bucket unavailable for %s", state.name, exc_info=True)
+            return 0
+
+    async def _share_open(self, state: HostState) -> None:
+        redis = await self._redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(
+                f"{KEY_PREFIX}:open:{state.name}", "1",
+                px=int(state.policy.cooldown_seconds * 1000),
+            )
+        except Exception:
+            logger.debug("outbound: could not share open circuit for %s", state.name, exc_info=True)
+
+
+class GovernedTransport(httpx.AsyncBaseTransport):
+    """httpx transport that routes every request through the governor."""
+
+    def __init__(self, governor: OutboundGovernor | None = None, **transport_kwargs):
+        self._governor = governor
+        self._inner = httpx.AsyncHTTPTransport(**transport_kwargs)
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        bucket, _ = policy_for(request.url.host)
+        with observe_outbound(bucket if bucket in HOST_POLICIES else "other") as call:
+            response = await self._governed_request(request)
+            call.status(response.status_code)
+            return response
+
+    async def _governed_request(self, request: httpx.Request) -> httpx.Response:
+        governor = self._governor or get_governor()
+        if not governor.enabled:
+            return await self._inner.handle_async_request(request)
+
+        state = await governor.before_request(request.url.host, request)
+        request.extensions["timeout"] = governor.adapt_timeout(
+            state, request.extensions.get("timeout", {})
+        )
+        started = time.monotonic()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except httpx.TransportError as exc:
+            await governor.record_failure(state, f"{type(exc).__name__}: {exc}")
+            raise
+        except BaseException:
+            # Cancellation etc. — says nothing about the host's health.
+            state.probe_in_flight = False
+            raise
+
+        if response.status_code >= 500:
+            await governor.record_failure(state, f"HTTP {response.status_code}")
+        else:
+            governor.record_success(state, time.monotonic() - started)
+        return response
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+_governor: OutboundGovernor | None = None
+
+
+def get_governor() -> OutboundGovernor:
+    global _governor
+    if _governor is None:
+        _governor = OutboundGovernor(enabled=get_settings().outbound_governor_enabled)
+    return _governor
+
+
+def governed_transport(**transport_kwargs) -> GovernedTransport:
+    """Transport for ``httpx.AsyncClient(transport=...)``.
+
+    Client-level ``limits`` are ignored when a transport is passed, so hand
+    them to this function instead.
+    """
+    return GovernedTransport(**transport_kwargs)
@@ -4,7 +4,9 @@ import re
 import logging
 from dataclasses import dataclass, field
 
-import fitz  # PyMuPDF
+from app.utils.lazy_import import lazy_module
+
+fitz = lazy_module("fitz")  # PyMuPDF
 
 logger = logging.getLogger(__name__)
 
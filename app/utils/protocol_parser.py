@@ -3,9 +3,12 @@
 import re
 import logging
 
-import fitz  # PyMuPDF
 from minio import Minio
 
+from app.utils.lazy_import import lazy_module
+
+fitz = lazy_module("fitz")  # PyMuPDF
+
 logger = logging.getLogger(__name__)
 
 
@@ -0,0 +1,162 @@
+"""Per-request SQL profiling and N+1 detection.
+
+``install_query_profiler`` hooks SQLAlchemy's cursor events on every
+``Engine``. While a ``QueryProfile`` is active in the current context (one
+per HTTP request, set by ``QueryProfilerMiddleware``), each statement adds to
+its count and DB time, keyed by SQL text — the same SELECT executed with
+different parameters is the N+1 signature. Outside a profile the listeners
+cost one ContextVar lookup.
+
+The middleware is opt-in (``QUERY_PROFILER_ENABLED``). It adds a
+``Server-Timing: db;dur=..;desc="N queries"`` header and logs one structured
+line per request, at WARNING when a statement repeats
+``QUERY_PROFILER_REPEAT_THRESHOLD`` times or more. Registered sinks (the
+pytest query-budget plugin) receive every profile even when the setting is
+off.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from collections.abc import Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Iterator
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_current: ContextVar["QueryProfile | None"] = ContextVar("query_profile", default=None)
+_sinks: list[Callable[["QueryProfile"], None]] = []
+_installed = False
+
+
+@dataclass
+class QueryProfile:
+    label: str = ""
+    count: int = 0
+    db_seconds: float = 0.0
+    statements: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.db_seconds += elapsed
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """Statements executed at least ``threshold`` times, most frequent first."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        return f'db;dur={self.db_seconds * 1000:.1f};desc="{self.count} queries"'
+
+
+def install_query_profiler() -> None:
+    """Attach the cursor listeners to all engines (idempotent)."""
+    global _installed
+    if _installed:
+        return
+    from sqlalchemy import event
+    from sqlalchemy.engine import Engine
+
+    @event.listens_for(Engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if _current.get() is not None:
+            conn.info.setdefault("qfl_query_started", []).append(time.perf_counter())
+
+    @event.listens_for(Engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        profile = _current.get()
+        if profile is None:
+            return
+        started = conn.info.get("qfl_query_started")
+        if started:
+            profile.record(statement, time.perf_counter() - started.pop())
+
+    @event.listens_for(Engine, "handle_error")
+    def _on_error(context):
+        # A failed statement never reaches after_cursor_execute; drop its start
+        # time so the pooled connection's stack does not grow with every error.
+        conn = context.connection
+        started = conn.info.get("qfl_query_started") if conn is not None else None
+        if not started:
+            return
+        elapsed = time.perf_counter() - started.pop()
+        profile = _current.get()
+        if profile is not None and context.statement is not None:
+            profile.record(context.statement, elapsed)
+
+    _installed = True
+
+
+@contextmanager
+def profile_queries(label: str = "") -> Iterator[QueryProfile]:
+    """Collect every statement executed in this context into one profile."""
+    install_query_profiler()
+    profile = QueryProfile(label)
+    token = _current.set(profile)
+    try:
+        yield profile
+    finally:
+        _current.reset(token)
+
+
+def add_sink(sink: Callable[[QueryProfile], None]) -> None:
+    _sinks.append(sink)
+
+
+def remove_sink(sink: Callable[[QueryProfile], None]) -> None:
+    if sink in _sinks:
+        _sinks.remove(sink)
+
+
+def log_profile(profile: QueryProfile, repeat_threshold: int) -> None:
+    repeated = profile.repeated(repeat_threshold)
+    log = logger.warning if repeated else logger.debug
+    log(
+        "query_profile request=%s queries=%d db_ms=%.1f repeated=%s",
+        profile.label,
+        profile.count,
+        profile.db_seconds * 1000,
+        [(n, " ".join(sql.split())[:160]) for sql, n in repeated],
+    )
+
+
+class QueryProfilerMiddleware:
+    """ASGI middleware: one ``QueryProfile`` per HTTP request."""
+
+    def __init__(self, app):
+        self.app = app
+        settings = get_settings()
+        self.enabled = settings.query_profiler_enabled
+        self.repeat_threshold = settings.query_profiler_repeat_threshold
+        if self.enabled:
+            install_query_profiler()
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not (self.enabled or _sinks):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", profile.server_timing().encode()))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        with profile_queries(f"{scope.get('method', '')} {scope.get('path', '')}") as profile:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = scope.get("route")
+                if getattr(route, "path", None):
+                    profile.label = f"{scope.get('method', '')} {route.path}"
+                if self.enabled:
+                    log_profile(profile, self.repeat_threshold)
+                for sink in list(_sinks):
+                    sink(profile)
@@ -8,6 +8,11 @@ quality loss.
 Runs as an out-of-process ``ffmpeg`` call so it doesn't block the event
 loop. If transcoding fails for any reason, callers should fall back to the
 original file — we never want to lose a clip because of a re-encode hiccup.
+
+Optionally (``package_hls_paths``) the clip is also packaged as an fMP4 HLS
+ladder (1080p/720p/480p) with a master playlist, a poster JPEG and a
+faststart MP4 fallback, so mobile viewers on weak connections start playback
+from the lowest rung instead of pulling the whole 1080p file first.
 """
 
 from __future__ import annotations
@@ -15,6 +20,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
+import shutil
 import subprocess
 import tempfile
 from dataclasses import dataclass
@@ -35,6 +41,24 @@ _DEFAULT_THREADS = "0"
 _TRANSCODE_TIMEOUT_SECONDS = 15 * 60
 
 
+# HLS package layout — every file lives under one per-clip directory so the
+# whole package can be uploaded / deleted by prefix.
+HLS_MASTER_PLAYLIST = "master.m3u8"
+HLS_FALLBACK_MP4 = "fallback.mp4"
+HLS_POSTER = "poster.jpg"
+_DEFAULT_HLS_LADDER = (1080, 720, 480)
+_DEFAULT_HLS_SEGMENT_SECONDS = 4
+# Peak video bitrate per rung (kbit/s). CRF still drives quality; the cap
+# keeps each rung inside a predictable BANDWIDTH for the ABR switcher.
+_HLS_MAXRATE_KBPS = {1080: 5000, 720: 2800, 480: 1200, 360: 800}
+_HLS_CONTENT_TYPES = {
+    ".m3u8": "application/vnd.apple.mpegurl",
+    ".m4s": "video/iso.segment",
+    ".mp4": "video/mp4",
+    ".jpg": "image/jpeg",
+}
+
+
 @dataclass(frozen=True)
 class TranscodeResult:
     data: bytes
@@ -55,6 +79,51 @@ class TranscodePathResult:
     transcoded: bool
 
 
+@dataclass(frozen=True)
+class HlsPackageResult:
+    """Outcome of ``package_hls_paths``.
+
+    `files` lists the absolute path of every produced file under
+    `output_dir` (playlists, init segments, media segments, poster,
+    fallback) — the caller uploads each one under one object prefix, keyed
+    by its path relative to `output_dir`.
+    """
+    output_dir: Path
+    master_playlist: Path
+    fallback_mp4: Path
+    poster: Path | None
+    files: tuple[Path, ...]
+    size: int
+
+
+def hls_content_type(path: Path | str) -> str:
+    """Content-Type for a file inside an HLS package."""
+    return _HLS_CONTENT_TYPES.get(Path(path).suffix.lower(), "application/octet-stream")
+
+
+def is_hls_manifest(value: str | None) -> bool:
+    """True when a stored video URL / object name points at an HLS master playlist."""
+    if not value:
+        return False
+    return value.split("?", 1)[0].endswith(f"/{HLS_MASTER_PLAYLIST}")
+
+
+def hls_package_prefix(value: str) -> str:
+    """`goal_videos/1/2-abc/master.m3u8` → `goal_videos/1/2-abc/`."""
+    return value.split("?", 1)[0].rsplit("/", 1)[0] + "/"
+
+
+def hls_sibling(value: str | None, filename: str) -> str | None:
+    """Swap the master playlist for another file of the same package.
+
+    Non-HLS values are returned unchanged so callers can use this blindly
+    (legacy single-MP4 clips are their own fallback).
+    """
+    if not is_hls_manifest(value):
+        return value
+    return hls_package_prefix(value) + filename
+
+
 async def transcode_mp4(
     source_bytes: bytes,
     *,
@@ -105,6 +174,233 @@ async def transcode_mp4_paths(
     )
 
 
+async def package_hls_paths(
+    input_path: Path,
+    output_dir: Path,
+    *,
+    ladder: tuple[int, ...] = _DEFAULT_HLS_LADDER,
+    segment_seconds: int = _DEFAULT_HLS_SEGMENT_SECONDS,
+    crf: str = _DEFAULT_CRF,
+    preset: str = _DEFAULT_PRESET,
+    audio_bitrate: str = _DEFAULT_AUDIO_BITRATE,
+    threads: str = _DEFAULT_THREADS,
+    timeout_seconds: int = _TRANSCODE_TIMEOUT_SECONDS,
+) -> HlsPackageResult | None:
+    """Package a clip as fMP4 HLS + poster + faststart MP4 fallback.
+
+    The three ffmpeg passes run one after another in a single worker thread
+    within the same `threads` cap as ``transcode_mp4_paths`` — the ladder
+    pass splits it across its rungs, so packaging never uses more cores than
+    the plain transcode did. Returns ``None`` on any failure so the caller
+    falls back to the single-MP4 path.
+    """
+    return await asyncio.to_thread(
+        _package_hls_sync,
+        Path(input_path),
+        Path(output_dir),
+        ladder=tuple(ladder),
+        segment_seconds=segment_seconds,
+        crf=crf,
+        preset=preset,
+        audio_bitrate=audio_bitrate,
+        threads=threads,
+        timeout_seconds=timeout_seconds,
+    )
+
+
+def _has_audio(input_path: Path) -> bool:
+    """Whether the clip has an audio stream; assumes it does if ffprobe fails."""
+    cmd = [
+        "ffprobe", "-v", "error",
+        "-select_streams", "a",
+        "-show_entries", "stream=index",
+        "-of", "csv=p=0",
+        str(input_path),
+    ]
+    try:
+        proc = subprocess.run(cmd, capture_output=True, timeout=60)
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        logger.warning("ffprobe unavailable; assuming %s has audio", input_path.name)
+        return True
+    if proc.returncode != 0:
+        return True
+    return bool((proc.stdout or b"").strip())
+
+
+def _threads_per_rung(threads: str, rungs: int) -> str:
+    """Split the `threads` budget across the ladder's encoders.
+
+    ``-threads`` applies to each libx264 encoder, so N rungs at the full cap
+    would use N times the cores of the plain transcode. ``"0"`` (auto)
+    resolves to the host's core count first.
+    """
+    try:
+        budget = int(threads)
+    except ValueError:
+        return threads
+    if budget <= 0:
+        budget = os.cpu_count() or 1
+    return str(max(1, budget // max(1, rungs)))
+
+
+def _hls_ladder_cmd(
+    input_path: Path,
+    output_dir: Path,
+    *,
+    ladder: tuple[int, ...],
+    segment_seconds: int,
+    crf: str,
+    preset: str,
+    audio_bitrate: str,
+    threads: str,
+    has_audio: bool = True,
+) -> list[str]:
+    """One ffmpeg invocation: decode once, split, scale per rung, mux HLS.
+
+    ``min(ih, H)`` keeps a 720p source from being upscaled into the 1080p
+    rung; keyframes are forced on segment boundaries so every rung switches
+    cleanly. Without `has_audio` the variants are video-only — ``-var_stream_map``
+    fails on ``a:`` entries that map to no stream.
+    """
+    n = len(ladder)
+    split_labels = "".join(f"[v{i}]" for i in range(n))
+    filters = [f"[0:v]split={n}{split_labels}"]
+    for i, height in enumerate(ladder):
+        filters.append(f"[v{i}]scale=-2:'min(ih,{height})'[v{i}out]")
+
+    cmd = [
+        "ffmpeg", "-y", "-i", str(input_path),
+        "-filter_complex", ";".join(filters),
+    ]
+    for i, height in enumerate(ladder):
+        maxrate = _HLS_MAXRATE_KBPS.get(height, 1200)
+        cmd += [
+            "-map", f"[v{i}out]",
+            f"-c:v:{i}", "libx264",
+            f"-crf:v:{i}", crf,
+            f"-maxrate:v:{i}", f"{maxrate}k",
+            f"-bufsize:v:{i}", f"{maxrate * 2}k",
+        ]
+    if has_audio:
+        for i in range(n):
+            cmd += ["-map", "0:a", f"-c:a:{i}", "aac", f"-b:a:{i}", audio_bitrate]
+
+    audio = ",a:{i}" if has_audio else ""
+    var_stream_map = " ".join(
+        f"v:{i}{audio.format(i=i)},name:{h}p" for i, h in enumerate(ladder)
+    )
+    cmd += [
+        "-preset", preset,
+        "-sc_threshold", "0",
+        "-force_key_frames", f"expr:gte(t,n_forced*{segment_seconds})",
+        "-threads", _threads_per_rung(threads, n),
+        "-f", "hls",
+        "-hls_time", str(segment_seconds),
+        "-hls_playlist_type", "vod",
+        "-hls_segment_type", "fmp4",
+        "-hls_fmp4_init_filename", "init.mp4",
+        "-hls_segment_filename", str(output_dir / "%v" / "seg_%03d.m4s"),
+        "-master_pl_name", HLS_MASTER_PLAYLIST,
+        "-var_stream_map", var_stream_map,
+        str(output_dir / "%v" / "index.m3u8"),
+    ]
+    return cmd
+
+
+def _run_ffmpeg(cmd: list[str], *, timeout_seconds: int, what: str) -> bool:
+    try:
+        proc = subprocess.run(cmd, capture_output=True, timeout=timeout_seconds)
+    except subprocess.TimeoutExpired:
+        logger.warning("ffmpeg %s timed out after %ss", what, timeout_seconds)
+        return False
+    except FileNotFoundError:
+        logger.warning("ffmpeg binary not found; skipping %s", what)
+        return False
+    if proc.returncode != 0:
+        stderr = (proc.stderr or b"").decode("utf-8", "replace")[-500:]
+        logger.warning("ffmpeg %s exited %d. stderr: %s", what, proc.returncode, stderr)
+        return False
+    return True
+
+
+def _package_hls_sync(
+    input_path: Path,
+    output_dir: Path,
+    *,
+    ladder: tuple[int, ...],
+    segment_seconds: int,
+    crf: str,
+    preset: str,
+    audio_bitrate: str,
+    threads: str,
+    timeout_seconds: int,
+) -> HlsPackageResult | None:
+    if not ladder:
+        return None
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    cmd = _hls_ladder_cmd(
+        input_path, output_dir,
+        ladder=ladder,
+        segment_seconds=segment_seconds,
+        crf=crf,
+        preset=preset,
+        audio_bitrate=audio_bitrate,
+        threads=threads,
+        has_audio=_has_audio(input_path),
+    )
+    if not _run_ffmpeg(cmd, timeout_seconds=timeout_seconds, what="HLS ladder"):
+        return None
+    master = output_dir / HLS_MASTER_PLAYLIST
+    if not master.exists():
+        logger.warning("ffmpeg HLS ladder produced no master playlist")
+        return None
+
+    # Faststart fallback for players without HLS support (and for Telegram,
+    # which needs a single file). Same CRF/preset as the plain transcode; if
+    # it doesn't shrink the original we ship the original bytes instead.
+    fallback = output_dir / HLS_FALLBACK_MP4
+    fallback_result = _transcode_paths_sync(
+        input_path,
+        fallback,
+        crf=crf,
+        preset=preset,
+        audio_bitrate=audio_bitrate,
+        threads=threads,
+        timeout_seconds=timeout_seconds,
+    )
+    if not fallback_result.transcoded:
+        shutil.copyfile(input_path, fallback)
+
+    # Poster is best-effort — a missing poster never fails the package.
+    poster: Path | None = output_dir / HLS_POSTER
+    poster_cmd = [
+        "ffmpeg", "-y", "-ss", "1", "-i", str(input_path),
+        "-frames:v", "1",
+        "-vf", "scale=-2:'min(ih,720)'",
+        "-q:v", "3",
+        "-threads", threads,
+        str(poster),
+    ]
+    if not _run_ffmpeg(poster_cmd, timeout_seconds=60, what="poster") or not poster.exists():
+        poster = None
+
+    files = tuple(sorted(p for p in output_dir.rglob("*") if p.is_file()))
+    size = sum(p.stat().st_size for p in files)
+    logger.info(
+        "HLS package OK: %d rungs, %d files, %.1f MB total",
+        len(ladder), len(files), size / 1024 / 1024,
+    )
+    return HlsPackageResult(
+        output_dir=output_dir,
+        master_playlist=master,
+        fallback_mp4=fallback,
+        poster=poster,
+        files=files,
+        size=size,
+    )
+
+
 def _transcode_paths_sync(
     input_path: Path,
     output_path: Path,
@@ -0,0 +1,82 @@
+"""Benchmark: per-row UPDATE loop vs app.utils.bulk_write.bulk_update.
+
+Creates a scratch table inside one transaction, updates N rows both ways,
+prints statement count (DB round trips) and wall time, then rolls back —
+nothing is left behind.
+
+Usage:
+    python -m scripts.benchmark_bulk_update                 # DATABASE_URL from settings
+    python -m scripts.benchmark_bulk_update --rows 10000
+    python -m scripts.benchmark_bulk_update --url sqlite+aiosqlite:///:memory:
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table, event, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.config import get_settings
+from app.utils.bulk_write import bulk_update
+from app.utils.timestamps import utcnow
+
+_metadata = MetaData()
+bench = Table(
+    "bench_bulk_update",
+    _metadata,
+    Column("id", Integer, primary_key=True),
+    Column("value", Integer, nullable=False),
+    Column("touched_at", DateTime(timezone=True)),
+)
+
+
+async def main(url: str, rows: int) -> None:
+    engine = create_async_engine(url)
+    statements = 0
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(*_args):
+        nonlocal statements
+        statements += 1
+
+    async with engine.connect() as conn:
+        trans = await conn.begin()
+        await conn.run_sync(_metadata.create_all)
+        await conn.execute(insert(bench), [{"id": i, "value": 0} for i in range(1, rows + 1)])
+        db = AsyncSession(bind=conn)
+
+        now = utcnow()
+        statements = 0
+        started = time.perf_counter()
+        for i in range(1, rows + 1):
+            await db.execute(update(bench).where(bench.c.id == i).values(value=i, touched_at=now))
+        loop_time, loop_statements = time.perf_counter() - started, statements
+
+        statements = 0
+        started = time.perf_counter()
+        await bulk_update(
+            db, bench, [{"id": i, "value": i * 2, "touched_at": now} for i in range(1, rows + 1)],
+        )
+        bulk_time, bulk_statements = time.perf_counter() - started, statements
+
+        await trans.rollback()
+    await engine.dispose()
+
+    print(f"dialect: {engine.dialect.name}, rows: {rows}")
+    print(f"per-row loop : {loop_statements:6d} statements  {loop_time:8.3f}s")
+    print(f"bulk_update  : {bulk_statements:6d} statements  {bulk_time:8.3f}s")
+    if bulk_time:
+        print(f"speed-up     : {loop_time / bulk_time:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--url", default=get_settings().database_url)
+    args = parser.parse_args()
+    asyncio.run(main(args.url, args.rows))
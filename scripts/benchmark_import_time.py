@@ -0,0 +1,112 @@
+"""Benchmark: cold import cost of the web app and Celery worker entry points.
+
+Runs ``python -X importtime -c "import <target>"`` in a fresh interpreter per
+target, prints the cumulative import time and the heaviest top-level
+packages, and checks ``IMPORT_BUDGETS``: heavy optional SDKs (Anthropic,
+OpenAI, Telethon, PyMuPDF, ...) must stay out of a process until the code
+path that needs them runs. tests/scripts/test_import_budget.py enforces the
+same budgets.
+
+Usage:
+    python -m scripts.benchmark_import_time                    # all targets
+    python -m scripts.benchmark_import_time app.tasks.live_tasks --top 20
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+_AI_SDKS = frozenset({"anthropic", "openai"})
+_HEAVY_SDKS = _AI_SDKS | {"telethon", "fitz", "pymupdf", "colorthief"}
+
+# target module -> top-level packages it must not import
+IMPORT_BUDGETS: dict[str, frozenset[str]] = {
+    # Live-queue worker (CELERY_TASK_MODULES=app.tasks.live_tasks).
+    "app.tasks.live_tasks": _HEAVY_SDKS | {"bs4", "bleach", "PIL", "minio"},
+    # Full worker: every include= module, still no SDK until a task needs it.
+    "app.tasks.all": _HEAVY_SDKS,
+    # Web process.
+    "app.main": _HEAVY_SDKS,
+}
+
+# Pseudo-target expanding to the Celery app plus all of its task modules.
+_ALL_TASKS_CODE = (
+    "import importlib, app.tasks as t\n"
+    "for name in t.TASK_MODULES: importlib.import_module(name)"
+)
+
+
+@dataclass
+class ImportProfile:
+    target: str
+    total_us: int = 0
+    packages: dict[str, int] = field(default_factory=dict)  # top-level -> self us, summed
+
+    @property
+    def loaded(self) -> set[str]:
+        return set(self.packages)
+
+    def violations(self, forbidden: frozenset[str]) -> list[str]:
+        return sorted(self.loaded & forbidden)
+
+
+def _import_code(target: str) -> str:
+    return _ALL_TASKS_CODE if target == "app.tasks.all" else f"import {target}"
+
+
+def measure(target: str) -> ImportProfile:
+    """Import ``target`` in a clean interpreter and parse ``-X importtime``."""
+    env = {**os.environ, "PYTHONPATH": str(ROOT), "PYTHONWARNINGS": "ignore"}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _import_code(target)],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {target} failed:\n{proc.stderr[-2000:]}")
+
+    profile = ImportProfile(target)
+    for line in proc.stderr.splitlines():
+        # "import time:      self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        try:
+            self_us, cumulative_us, name = line[len("import time:"):].split("|")
+            self_us, cumulative_us = int(self_us), int(cumulative_us)
+        except ValueError:
+            continue
+        indent = len(name) - len(name.lstrip())
+        package = name.strip().split(".")[0]
+        if indent == 1:  # imported directly by the target, not nested
+            profile.total_us += cumulative_us
+        profile.packages[package] = profile.packages.get(package, 0) + self_us
+    return profile
+
+
+def main(targets: list[str], top: int) -> int:
+    failed = False
+    for target in targets:
+        profile = measure(target)
+        forbidden = IMPORT_BUDGETS.get(target, frozenset())
+        bad = profile.violations(forbidden)
+        failed |= bool(bad)
+
+        print(f"{target}: {profile.total_us / 1000:8.1f} ms, {len(profile.packages)} packages")
+        heaviest = sorted(profile.packages.items(), key=lambda item: -item[1])[:top]
+        for package, self_us in heaviest:
+            print(f"    {self_us / 1000:8.1f} ms  {package}")
+        if bad:
+            print(f"    OVER BUDGET: imports {', '.join(bad)}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("targets", nargs="*", default=list(IMPORT_BUDGETS))
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+    sys.exit(main(args.targets, args.top))
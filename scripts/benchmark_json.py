@@ -0,0 +1,165 @@
+"""Benchmark: FastAPI's default response serialization vs app.utils.fast_json.
+
+Builds the largest public payloads synthetically (no database needed) and
+times, per payload:
+
+- ``fastapi``: what a handler returning the payload went through —
+  ``serialize_response`` (dump + re-validate against ``response_model``, or
+  ``jsonable_encoder`` for plain dicts) then ``JSONResponse.render``;
+- ``fast``: ``json_response(payload)`` — ``model_dump_json`` for models,
+  orjson for plain data.
+
+Both outputs are compared after ``json.loads`` so a speed-up can't hide a
+shape change. tests/utils/test_fast_json.py runs the same comparison.
+
+Usage:
+    python -m scripts.benchmark_json
+    python -m scripts.benchmark_json --repeat 500 --payload player_stats
+"""
+
+import argparse
+import asyncio
+import json
+import time
+import typing
+from collections.abc import Callable
+from datetime import date, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import BaseModel
+
+from app.schemas.country import CountryInPlayer
+from app.schemas.player import PlayerStatsTableEntry, PlayerStatsTableResponse
+from app.schemas.stats import ResultsGridResponse, TeamResultsGridEntry
+from app.utils.fast_json import dumps
+
+TEAMS = 16
+TOURS = 30
+
+
+def _fill(model: type[BaseModel], i: int, **overrides) -> BaseModel:
+    """Model instance with every scalar field set, like a fully-synced row."""
+    values = {}
+    for name, field in model.model_fields.items():
+        kinds = typing.get_args(field.annotation) or (field.annotation,)
+        if int in kinds:
+            values[name] = i
+        elif float in kinds:
+            values[name] = i / 7
+        elif str in kinds:
+            values[name] = f"{name} {i} Қазақстан"
+    values.update(overrides)
+    return model(**values)
+
+
+def player_stats_payload() -> PlayerStatsTableResponse:
+    """/seasons/{id}/player-stats at limit=100."""
+    country = CountryInPlayer(id=1, code="KZ", name="Қазақстан", flag_url="/flags/kz.webp")
+    return PlayerStatsTableResponse(
+        season_id=61,
+        sort_by="goal",
+        items=[_fill(PlayerStatsTableEntry, i, country=country) for i in range(100)],
+        total=412,
+    )
+
+
+def results_grid_payload() -> ResultsGridResponse:
+    """/seasons/{id}/results-grid for a full 16-team season."""
+    outcomes = ("W", "D", "L", None)
+    return ResultsGridResponse(
+        season_id=61,
+        total_tours=TOURS,
+        teams=[
+            TeamResultsGridEntry(
+                position=n + 1,
+                team_id=100 + n,
+                team_name=f"Команда {n}",
+                team_logo=f"/api/v1/files/teams/team-{n}/logo",
+                results=[outcomes[(n + t) % 4] for t in range(TOURS)],
+            )
+            for n in range(TEAMS)
+        ],
+    )
+
+
+def league_performance_payload() -> dict:
+    """/seasons/{id}/league-performance (plain dict response)."""
+    start = date(2025, 3, 1)
+    return {
+        "season_id": 61,
+        "week_count": TOURS,
+        "max_tour": TOURS,
+        "weeks": [
+            {"week": w + 1, "start": (start + timedelta(weeks=w)).isoformat()} for w in range(TOURS)
+        ],
+        "teams": [
+            {
+                "team_id": 100 + n,
+                "team_name": f"Команда {n}",
+                "team_logo": f"/api/v1/files/teams/team-{n}/logo",
+                "positions": [(n + w) % TEAMS + 1 for w in range(TOURS)],
+            }
+            for n in range(TEAMS)
+        ],
+    }
+
+
+# name -> (payload builder, response_model or None)
+PAYLOADS: dict[str, tuple[Callable[[], object], type[BaseModel] | None]] = {
+    "player_stats": (player_stats_payload, PlayerStatsTableResponse),
+    "results_grid": (results_grid_payload, ResultsGridResponse),
+    "league_performance": (league_performance_payload, None),
+}
+
+
+def fastapi_path(payload, response_model: type[BaseModel] | None) -> bytes:
+    field = create_response_field(name="Response", type_=response_model) if response_model else None
+    content = asyncio.run(serialize_response(field=field, response_content=payload))
+    return JSONResponse(content).body
+
+
+def _time_per_call(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            fn()
+        best = min(best, (time.perf_counter() - started) / repeat)
+    return best
+
+
+async def _fastapi_timed(payload, response_model, repeat: int) -> float:
+    field = create_response_field(name="Response", type_=response_model) if response_model else None
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            JSONResponse(await serialize_response(field=field, response_content=payload)).body
+        best = min(best, (time.perf_counter() - started) / repeat)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare response serialization paths.")
+    parser.add_argument("--payload", action="append", choices=sorted(PAYLOADS), help="default: all")
+    parser.add_argument("--repeat", type=int, default=200, help="calls per timing round")
+    args = parser.parse_args()
+
+    print(f"{'payload':<20}{'bytes':>9}{'fastapi ms':>12}{'fast ms':>10}{'speed-up':>10}")
+    for name in args.payload or list(PAYLOADS):
+        build, response_model = PAYLOADS[name]
+        payload = build()
+        current, new = fastapi_path(payload, response_model), dumps(payload)
+        if json.loads(current) != json.loads(new):
+            print(f"{name:<20}OUTPUT MISMATCH")
+            return 1
+        old_s = asyncio.run(_fastapi_timed(payload, response_model, args.repeat))
+        new_s = _time_per_call(lambda: dumps(payload), args.repeat)
+        print(f"{name:<20}{len(new):>9}{old_s * 1000:>12.3f}{new_s * 1000:>10.3f}{old_s / new_s:>9.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,9 @@
+"""Reproducible load tests for the hot public endpoints.
+
+``seed`` fills a scratch database with a deterministic synthetic league
+(scripts/loadtest/seed.py); ``run`` replays recorded traffic shapes
+(scripts/loadtest/scenarios.py) against the ASGI app in-process and reports
+p50/p95/p99 latency, SQL queries per request and in-process cache hit rate per
+scenario. ``baseline.json`` is the committed reference run; see __main__.py
+for usage.
+"""
@@ -0,0 +1,114 @@
+"""Load-test CLI.
+
+Usage:
+    # once: a scratch database (never the production one)
+    createdb qfl_bench
+    python -m scripts.loadtest seed --url postgresql+asyncpg://localhost/qfl_bench
+
+    python -m scripts.loadtest run --url postgresql+asyncpg://localhost/qfl_bench \\
+        --compare scripts/loadtest/baseline.json
+    python -m scripts.loadtest run --url ... --scenario table_ft_burst --output /tmp/run.json
+    python -m scripts.loadtest run --url ... --output scripts/loadtest/baseline.json   # refresh
+
+``run`` exits 1 when ``--compare`` finds a regression.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+async def _seed(url: str, reset: bool, config) -> None:
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+    from app.database import Base
+    from scripts.loadtest.seed import database_is_empty, seed_league
+
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        if reset:
+            await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        if not await database_is_empty(session):
+            raise SystemExit("database already has teams; use a scratch database or --reset")
+        league = await seed_league(session, config)
+    await engine.dispose()
+    for table, count in league.rows.items():
+        print(f"{table:<22}{count:>8}")
+
+
+async def _run(names: list[str], scale: float) -> dict:
+    from httpx import ASGITransport, AsyncClient
+
+    from app import database
+    from app.main import app
+    from scripts.loadtest.runner import build_report, run_scenario
+    from scripts.loadtest.seed import SeedConfig, load_league
+
+    async with database.AsyncSessionLocal() as session:
+        league = await load_league(session)
+
+    results = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://loadtest") as client:
+        await client.get("/health")  # build the middleware stack outside the measurement
+        for name in names:
+            results.append(await run_scenario(client, name, league, scale))
+    await database.engine.dispose()
+    await database.web_engine.dispose()
+    return build_report(
+        results, dialect=database.web_engine.dialect.name, seed=SeedConfig().seed, scale=scale
+    )
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Seed a synthetic league and replay hot-endpoint traffic.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    seed = sub.add_parser("seed", help="create tables and insert the synthetic league")
+    seed.add_argument("--url", required=True, help="scratch database URL")
+    seed.add_argument("--reset", action="store_true", help="drop and recreate all tables first")
+    seed.add_argument("--seasons", type=int, default=3)
+    seed.add_argument("--teams", type=int, default=16)
+    run = sub.add_parser("run", help="replay the traffic shapes and report")
+    run.add_argument("--url", required=True, help="seeded database URL")
+    run.add_argument("--scenario", action="append", help="scenario name (repeatable; default all)")
+    run.add_argument("--scale", type=float, default=1.0, help="request volume multiplier")
+    run.add_argument("--output", type=Path, help="write the JSON report here")
+    run.add_argument("--compare", type=Path, nargs="?", const=BASELINE, help="baseline JSON to compare with")
+    args = parser.parse_args()
+
+    # app.config reads DATABASE_URL once, at first import of app.*.
+    os.environ["DATABASE_URL"] = args.url
+
+    if args.command == "seed":
+        from scripts.loadtest.seed import SeedConfig
+
+        asyncio.run(_seed(args.url, args.reset, SeedConfig(seasons=args.seasons, teams=args.teams)))
+        return 0
+
+    from scripts.loadtest.report import compare, format_table
+    from scripts.loadtest.scenarios import SCENARIOS
+
+    names = args.scenario or list(SCENARIOS)
+    unknown = sorted(set(names) - set(SCENARIOS))
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}; known: {', '.join(SCENARIOS)}")
+    report = asyncio.run(_run(names, args.scale))
+    print(format_table(report))
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2, ensure_ascii=False) + "\n")
+    if args.compare:
+        problems = compare(report, json.loads(args.compare.read_text()))
+        for problem in problems:
+            print(f"REGRESSION {problem}")
+        return 1 if problems else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
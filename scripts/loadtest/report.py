@@ -0,0 +1,114 @@
+"""Per-scenario measurements, JSON reports and baseline comparison."""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+
+from app.utils.metrics import CACHE_REQUESTS
+from app.utils.query_profiler import QueryProfile
+
+# A run regresses against the baseline when a scenario exceeds these.
+LATENCY_TOLERANCE = 0.25  # p95 may grow by 25% (same database dialect only)
+QUERY_TOLERANCE = 0.5  # mean queries per request may grow by half a query
+CACHE_HIT_TOLERANCE = 0.05  # hit rate may drop by five points
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+def cache_counts() -> Counter:
+    """Process-wide in-process cache lookups by result (hit / miss / expired)."""
+    counts: Counter = Counter()
+    for metric in CACHE_REQUESTS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_total"):
+                counts[sample.labels["result"]] += sample.value
+    return counts
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    latencies: list[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+    profiles: list[QueryProfile] = field(default_factory=list)
+    cache: Counter = field(default_factory=Counter)
+    wall_seconds: float = 0.0
+
+    def summary(self) -> dict:
+        requests = len(self.latencies)
+        queries = [p.count for p in self.profiles]
+        lookups = sum(self.cache.values())
+        ms = [value * 1000 for value in self.latencies]
+        return {
+            "requests": requests,
+            "errors": sum(n for status, n in self.statuses.items() if status >= 500),
+            "statuses": {str(status): n for status, n in sorted(self.statuses.items())},
+            "rps": round(requests / self.wall_seconds, 1) if self.wall_seconds else 0.0,
+            "latency_ms": {
+                "p50": round(percentile(ms, 50), 2),
+                "p95": round(percentile(ms, 95), 2),
+                "p99": round(percentile(ms, 99), 2),
+                "max": round(max(ms, default=0.0), 2),
+            },
+            "queries_per_request": {
+                "mean": round(sum(queries) / len(queries), 2) if queries else 0.0,
+                "p95": percentile(queries, 95),
+                "max": max(queries, default=0),
+            },
+            "db_ms_per_request": round(
+                sum(p.db_seconds for p in self.profiles) * 1000 / len(self.profiles), 2
+            ) if self.profiles else 0.0,
+            "cache_hit_rate": round(self.cache["hit"] / lookups, 3) if lookups else None,
+        }
+
+
+def compare(current: dict, baseline: dict) -> list[str]:
+    """Regressions of ``current`` against ``baseline`` (both ``build_report`` output)."""
+    problems = []
+    same_dialect = current.get("dialect") == baseline.get("dialect")
+    for name, base in baseline.get("scenarios", {}).items():
+        now = current.get("scenarios", {}).get(name)
+        if now is None:
+            continue
+        if now["errors"] > base["errors"]:
+            problems.append(f"{name}: {now['errors']} 5xx responses (baseline {base['errors']})")
+        if same_dialect:
+            limit = base["latency_ms"]["p95"] * (1 + LATENCY_TOLERANCE)
+            if now["latency_ms"]["p95"] > limit:
+                problems.append(
+                    f"{name}: p95 {now['latency_ms']['p95']}ms > {limit:.1f}ms "
+                    f"(baseline {base['latency_ms']['p95']}ms)"
+                )
+        queries, base_queries = now["queries_per_request"]["mean"], base["queries_per_request"]["mean"]
+        if queries > base_queries + QUERY_TOLERANCE:
+            problems.append(f"{name}: {queries} queries/request (baseline {base_queries})")
+        hit_rate, base_hit_rate = now["cache_hit_rate"], base["cache_hit_rate"]
+        if base_hit_rate is not None and (hit_rate or 0.0) < base_hit_rate - CACHE_HIT_TOLERANCE:
+            problems.append(f"{name}: cache hit rate {hit_rate} (baseline {base_hit_rate})")
+    return problems
+
+
+def format_table(report: dict) -> str:
+    lines = [
+        f"dialect: {report['dialect']}  seed: {report['seed']}",
+        f"{'scenario':<24}{'req':>6}{'5xx':>5}{'rps':>8}{'p50':>9}{'p95':>9}{'p99':>9}"
+        f"{'q/req':>7}{'q max':>7}{'db ms':>8}{'hit':>7}",
+    ]
+    for name, s in report["scenarios"].items():
+        hit = "-" if s["cache_hit_rate"] is None else f"{s['cache_hit_rate']:.0%}"
+        lat = s["latency_ms"]
+        lines.append(
+            f"{name:<24}{s['requests']:>6}{s['errors']:>5}{s['rps']:>8}"
+            f"{lat['p50']:>9}{lat['p95']:>9}{lat['p99']:>9}"
+            f"{s['queries_per_request']['mean']:>7}{s['queries_per_request']['max']:>7}"
+            f"{s['db_ms_per_request']:>8}{hit:>7}"
+        )
+    return "\n".join(lines)
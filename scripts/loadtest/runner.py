@@ -0,0 +1,36 @@
+"""Run scenarios against the ASGI app and assemble the JSON report."""
+
+from __future__ import annotations
+
+import time
+
+from httpx import AsyncClient
+
+from app.utils import query_profiler
+from scripts.loadtest.report import ScenarioResult, cache_counts
+from scripts.loadtest.scenarios import SCENARIOS
+from scripts.loadtest.seed import League
+
+
+async def run_scenario(client: AsyncClient, name: str, league: League, scale: float = 1.0) -> ScenarioResult:
+    """Replay one traffic shape; every request made meanwhile is attributed to it."""
+    result = ScenarioResult(name)
+    cache_before = cache_counts()
+    query_profiler.add_sink(result.profiles.append)
+    started = time.perf_counter()
+    try:
+        await SCENARIOS[name](client, league, result, scale)
+    finally:
+        result.wall_seconds = time.perf_counter() - started
+        query_profiler.remove_sink(result.profiles.append)
+    result.cache = cache_counts() - cache_before
+    return result
+
+
+def build_report(results: list[ScenarioResult], *, dialect: str, seed: int, scale: float) -> dict:
+    return {
+        "dialect": dialect,
+        "seed": seed,
+        "scale": scale,
+        "scenarios": {result.name: result.summary() for result in results},
+    }
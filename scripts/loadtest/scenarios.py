@@ -0,0 +1,76 @@
+"""Recorded traffic shapes replayed against the ASGI app.
+
+Each scenario is an async function ``(client, league, result, scale)`` that
+issues requests through ``client`` and records them via ``timed_get``.
+``scale`` multiplies request volume (1.0 = production shape, tests use less).
+
+- ``table_ft_burst``: full time — the table cache is invalidated and SSR
+  renders for every open page arrive at once, RU ~6x KZ (2026-05-28).
+- ``players_crawler``: a search-engine crawler walking every player page
+  with a few parallel connections, plus some dead ids.
+- ``games_matchday_polling``: open match-centre tabs polling the current
+  tour's fixtures while games are live.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from httpx import AsyncClient
+
+from app.utils.cache import cache_clear
+from scripts.loadtest.report import ScenarioResult
+from scripts.loadtest.seed import League
+
+
+async def timed_get(client: AsyncClient, url: str, result: ScenarioResult) -> None:
+    started = time.perf_counter()
+    response = await client.get(url)
+    result.latencies.append(time.perf_counter() - started)
+    result.statuses[response.status_code] += 1
+
+
+async def table_ft_burst(client: AsyncClient, league: League, result: ScenarioResult, scale: float) -> None:
+    url = f"/api/v1/seasons/{league.current_season_id}/table"
+    ru, kz = max(1, round(34 * scale)), max(1, round(6 * scale))
+    for _ in range(max(1, round(6 * scale))):
+        cache_clear()  # FT: live_tasks invalidates the table caches
+        await asyncio.gather(
+            *(timed_get(client, f"{url}?lang=ru", result) for _ in range(ru)),
+            *(timed_get(client, f"{url}?lang=kz", result) for _ in range(kz)),
+        )
+
+
+async def players_crawler(client: AsyncClient, league: League, result: ScenarioResult, scale: float) -> None:
+    count = max(1, round(len(league.player_ids) * scale))
+    ids = league.player_ids[:count]
+    dead = [max(league.player_ids) + n for n in range(1, max(1, count // 20) + 1)]
+    gate = asyncio.Semaphore(8)
+
+    async def fetch(index: int, player_id: int) -> None:
+        async with gate:
+            lang = "kz" if index % 2 else "ru"
+            await timed_get(client, f"/api/v1/players/{player_id}?lang={lang}", result)
+
+    await asyncio.gather(*(fetch(i, pid) for i, pid in enumerate(ids + dead)))
+
+
+async def games_matchday_polling(
+    client: AsyncClient, league: League, result: ScenarioResult, scale: float
+) -> None:
+    url = f"/api/v1/games?season_id={league.current_season_id}&tour={league.matchday_tour}"
+    clients = max(1, round(30 * scale))
+    for _ in range(max(1, round(12 * scale))):
+        await asyncio.gather(*(
+            timed_get(client, f"{url}&lang={'ru' if n % 4 else 'kz'}", result)
+            for n in range(clients)
+        ))
+        await asyncio.sleep(0.25)
+
+
+SCENARIOS = {
+    "table_ft_burst": table_ft_burst,
+    "players_crawler": players_crawler,
+    "games_matchday_polling": games_matchday_polling,
+}
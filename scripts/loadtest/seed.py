@@ -0,0 +1,367 @@
+"""Deterministic synthetic league for load tests.
+
+``seed_league`` writes a complete league into an empty database: one
+championship, ``seasons`` double round-robin seasons of ``teams`` clubs,
+``players_per_team`` players per club, and for every played match the
+events (goals, assists, cards, substitutions), per-player and per-team stats
+that the public pages read. Season tables, team and player season aggregates
+are derived from those matches, so every endpoint sees consistent data.
+
+The last season is "in progress": tours before ``matchday_tour`` are
+finished, half of the matchday fixtures are live and the rest scheduled.
+Same ``seed`` → same rows, so runs on different branches are comparable.
+"""
+
+from __future__ import annotations
+
+import random
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta, timezone
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models import (
+    Championship,
+    Game,
+    GameEvent,
+    GameEventType,
+    GamePlayerStats,
+    GameStatus,
+    GameTeamStats,
+    Player,
+    PlayerSeasonStats,
+    PlayerTeam,
+    ScoreTable,
+    Season,
+    SeasonParticipant,
+    Team,
+    TeamSeasonStats,
+)
+
+CHAMPIONSHIP_ID = 1
+FIRST_SEASON_ID = 198
+ROUND_ROBIN_START = date(2024, 3, 2)
+
+# (amplua, top_role ru, top_role kz, top_role en); a 44-man squad is 4 GK, 14 DF, 14 MF, 12 FW.
+_ROLES = (
+    (1, "Вратарь", "Қақпашы", "Goalkeeper"),
+    (2, "Защитник", "Қорғаушы", "Defender"),
+    (3, "Полузащитник", "Жартылай қорғаушы", "Midfielder"),
+    (4, "Нападающий", "Шабуылшы", "Forward"),
+)
+_ROLE_WEIGHTS = (4, 14, 14, 12)
+_FIRST_NAMES = ["Абай", "Нурсултан", "Ерлан", "Максим", "Даурен", "Иван", "Темирлан", "Алишер", "Руслан", "Дмитрий"]
+_LAST_NAMES = ["Ахметов", "Садыков", "Жумабаев", "Иванов", "Ким", "Петров", "Омаров", "Сейткали", "Бекова", "Тулегенов"]
+_CITIES = ["Астана", "Алматы", "Шымкент", "Караганда", "Актобе", "Костанай", "Павлодар", "Атырау"]
+_STARTERS = (1, 4, 4, 2)  # GK, DF, MF, FW in a 4-4-2
+
+
+def _squad_roles(size: int) -> list[tuple]:
+    if size < 15:
+        raise ValueError("players_per_team must be at least 15 (11 starters + bench)")
+    counts = [max(need, size * weight // sum(_ROLE_WEIGHTS)) for need, weight in zip(_STARTERS, _ROLE_WEIGHTS)]
+    counts[2] += size - sum(counts)
+    return [role for role, count in zip(_ROLES, counts) for _ in range(count)]
+
+
+@dataclass(frozen=True)
+class SeedConfig:
+    seasons: int = 3
+    teams: int = 16
+    players_per_team: int = 44
+    matchday_tour: int = 24
+    seed: int = 20260528
+
+
+@dataclass
+class League:
+    """Ids the scenarios need to address the seeded data."""
+
+    season_ids: list[int]
+    team_ids: list[int]
+    player_ids: list[int]
+    matchday_tour: int
+    rows: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def current_season_id(self) -> int:
+        return self.season_ids[-1]
+
+
+def _round_robin(team_ids: list[int]) -> list[list[tuple[int, int]]]:
+    """Circle-method double round robin: 2 * (n - 1) tours of n / 2 games."""
+    teams = list(team_ids)
+    n = len(teams)
+    first_half = []
+    for tour in range(n - 1):
+        pairs = []
+        for i in range(n // 2):
+            home, away = teams[i], teams[n - 1 - i]
+            pairs.append((home, away) if (tour + i) % 2 == 0 else (away, home))
+        first_half.append(pairs)
+        teams = [teams[0], teams[-1], *teams[1:-1]]
+    return first_half + [[(away, home) for home, away in pairs] for pairs in first_half]
+
+
+async def database_is_empty(session: AsyncSession) -> bool:
+    return not await session.scalar(select(func.count()).select_from(Team))
+
+
+async def load_league(session: AsyncSession) -> League:
+    """Rebuild the ``League`` ids from an already seeded database."""
+    season_ids = list((await session.scalars(
+        select(Season.id).where(Season.championship_id == CHAMPIONSHIP_ID).order_by(Season.id)
+    )).all())
+    if not season_ids:
+        raise RuntimeError("database holds no seeded league; run the seed command first")
+    current_round = await session.scalar(select(Season.current_round).where(Season.id == season_ids[-1]))
+    return League(
+        season_ids=season_ids,
+        team_ids=list((await session.scalars(select(Team.id).order_by(Team.id))).all()),
+        player_ids=list((await session.scalars(select(Player.id).order_by(Player.id))).all()),
+        matchday_tour=current_round,
+    )
+
+
+async def seed_league(session: AsyncSession, config: SeedConfig = SeedConfig()) -> League:
+    """Insert the synthetic league and commit. Expects empty tables."""
+    rng = random.Random(config.seed)
+    rows: dict[str, list[dict]] = defaultdict(list)
+    team_ids = list(range(1, config.teams + 1))
+    season_ids = list(range(FIRST_SEASON_ID, FIRST_SEASON_ID + config.seasons))
+
+    rows["championships"].append(
+        {"id": CHAMPIONSHIP_ID, "name": "Премьер-Лига", "name_kz": "Премьер-Лига",
+         "name_en": "Premier League", "slug": "premier-league"}
+    )
+    for team_id in team_ids:
+        city = _CITIES[team_id % len(_CITIES)]
+        rows["teams"].append(
+            {"id": team_id, "name": f"ФК {city} {team_id}", "name_kz": f"{city} {team_id} ФК",
+             "name_en": f"FC {team_id}", "city": city,
+             "primary_color": f"#{rng.randrange(0x1000000):06X}"}
+        )
+
+    squads: dict[int, list[int]] = {}
+    player_role: dict[int, tuple] = {}
+    player_name: dict[int, str] = {}
+    player_id = 0
+    for team_id in team_ids:
+        squads[team_id] = []
+        for role in _squad_roles(config.players_per_team):
+            player_id += 1
+            first, last = rng.choice(_FIRST_NAMES), rng.choice(_LAST_NAMES)
+            squads[team_id].append(player_id)
+            player_role[player_id] = role
+            player_name[player_id] = f"{first} {last}"
+            rows["players"].append(
+                {"id": player_id, "sota_id": uuid.UUID(int=rng.getrandbits(128)),
+                 "first_name": first, "first_name_kz": first, "first_name_en": first,
+                 "last_name": last, "last_name_kz": last, "last_name_en": last,
+                 "birthday": date(1990 + rng.randrange(16), rng.randrange(1, 13), rng.randrange(1, 29)),
+                 "player_type": "player", "height": rng.randrange(170, 196),
+                 "top_role": role[1], "top_role_kz": role[2], "top_role_en": role[3]}
+            )
+
+    game_id = 0
+    fixtures = _round_robin(team_ids)
+    for index, season_id in enumerate(season_ids):
+        is_current = index == len(season_ids) - 1
+        season_start = ROUND_ROBIN_START.replace(year=ROUND_ROBIN_START.year + index)
+        rows["seasons"].append(
+            {"id": season_id, "name": str(season_start.year), "name_kz": str(season_start.year),
+             "name_en": str(season_start.year), "championship_id": CHAMPIONSHIP_ID,
+             "is_current": is_current, "date_start": season_start,
+             "date_end": season_start + timedelta(weeks=len(fixtures) + 1),
+             "frontend_code": "pl", "tournament_type": "league", "has_table": True,
+             "current_round": config.matchday_tour if is_current else len(fixtures),
+             "total_rounds": len(fixtures), "relegation_spots": 2}
+        )
+        for order, team_id in enumerate(team_ids):
+            rows["season_participants"].append(
+                {"team_id": team_id, "season_id": season_id, "sort_order": order}
+            )
+            for number, pid in enumerate(squads[team_id], start=1):
+                role = player_role[pid]
+                rows["player_teams"].append(
+                    {"player_id": pid, "team_id": team_id, "season_id": season_id,
+                     "amplua": role[0], "position_ru": role[1], "position_kz": role[2],
+                     "position_en": role[3], "number": number}
+                )
+
+        standings = {t: {"p": 0, "w": 0, "d": 0, "l": 0, "gf": 0, "ga": 0, "form": ""} for t in team_ids}
+        season_players: dict[int, dict] = defaultdict(lambda: defaultdict(int))
+        for tour, pairs in enumerate(fixtures, start=1):
+            match_day = season_start + timedelta(weeks=tour - 1)
+            for slot, (home, away) in enumerate(pairs):
+                game_id += 1
+                if not is_current or tour < config.matchday_tour:
+                    status = GameStatus.finished
+                elif tour == config.matchday_tour and slot < len(pairs) // 2:
+                    status = GameStatus.live
+                else:
+                    status = GameStatus.created
+                played = status != GameStatus.created
+                home_goals = rng.choices(range(5), (25, 35, 23, 12, 5))[0] if played else None
+                away_goals = rng.choices(range(5), (32, 36, 20, 9, 3))[0] if played else None
+                rows["games"].append(
+                    {"id": game_id, "sota_id": uuid.UUID(int=rng.getrandbits(128)),
+                     "date": match_day, "time": time(13 + slot % 4 * 2, 0), "tour": tour,
+                     "season_id": season_id, "home_team_id": home, "away_team_id": away,
+                     "home_score": home_goals, "away_score": away_goals,
+                     "has_stats": status == GameStatus.finished, "has_lineup": played,
+                     "status": status, "visitors": rng.randrange(2000, 25000) if played else None,
+                     "live_minute": 67 if status == GameStatus.live else None,
+                     "live_half": 2 if status == GameStatus.live else None,
+                     "finished_at": (
+                         datetime.combine(match_day, time(17, 0), tzinfo=timezone.utc)
+                         if status == GameStatus.finished else None
+                     )}
+                )
+                if not played:
+                    continue
+                _play_game(rng, rows, game_id, (home, home_goals), (away, away_goals),
+                           squads, player_name, player_role, season_players)
+                if status == GameStatus.finished:
+                    _record_result(standings, home, away, home_goals, away_goals)
+
+        ranked = sorted(
+            team_ids,
+            key=lambda t: (-(3 * standings[t]["w"] + standings[t]["d"]),
+                           -(standings[t]["gf"] - standings[t]["ga"]), -standings[t]["gf"], t),
+        )
+        for position, team_id in enumerate(ranked, start=1):
+            s = standings[team_id]
+            points = 3 * s["w"] + s["d"]
+            rows["score_table"].append(
+                {"season_id": season_id, "team_id": team_id, "position": position,
+                 "games_played": s["p"], "wins": s["w"], "draws": s["d"], "losses": s["l"],
+                 "goals_scored": s["gf"], "goals_conceded": s["ga"],
+                 "goal_difference": s["gf"] - s["ga"], "points": points, "form": s["form"][-5:]}
+            )
+            rows["team_season_stats"].append(
+                {"team_id": team_id, "season_id": season_id, "games_played": s["p"],
+                 "games_total": len(fixtures), "win": s["w"], "draw": s["d"], "match_loss": s["l"],
+                 "goal": s["gf"], "goals_conceded": s["ga"], "goals_difference": s["gf"] - s["ga"],
+                 "points": points}
+            )
+        for pid, totals in season_players.items():
+            rows["player_season_stats"].append({"player_id": pid, "season_id": season_id, **totals})
+
+    for model in (
+        Championship, Team, Player, Season, SeasonParticipant, PlayerTeam, Game,
+        GameEvent, GamePlayerStats, GameTeamStats, ScoreTable, TeamSeasonStats, PlayerSeasonStats,
+    ):
+        batch = rows[model.__tablename__]
+        for start in range(0, len(batch), 2000):
+            await session.execute(insert(model), batch[start:start + 2000])
+    await session.commit()
+
+    return League(
+        season_ids=season_ids,
+        team_ids=team_ids,
+        player_ids=[p["id"] for p in rows["players"]],
+        matchday_tour=config.matchday_tour,
+        rows={name: len(batch) for name, batch in rows.items()},
+    )
+
+
+def _record_result(standings: dict, home: int, away: int, home_goals: int, away_goals: int) -> None:
+    for team, scored, conceded in ((home, home_goals, away_goals), (away, away_goals, home_goals)):
+        s = standings[team]
+        s["p"] += 1
+        s["gf"] += scored
+        s["ga"] += conceded
+        outcome = "w" if scored > conceded else "d" if scored == conceded else "l"
+        s[outcome] += 1
+        s["form"] += outcome.upper()
+
+
+def _lineup(rng: random.Random, squad: list[int], player_role: dict[int, tuple]) -> tuple[list[int], list[int]]:
+    by_role: dict[int, list[int]] = defaultdict(list)
+    for pid in squad:
+        by_role[player_role[pid][0]].append(pid)
+    starters = [
+        pid for amplua, count in zip((1, 2, 3, 4), _STARTERS)
+        for pid in rng.sample(by_role[amplua], count)
+    ]
+    bench = rng.sample([pid for pid in squad if pid not in starters and player_role[pid][0] != 1], 3)
+    return starters, bench
+
+
+def _play_game(rng, rows, game_id, home_side, away_side, squads, player_name, player_role, season_players):
+    for (team_id, goals), (_, conceded) in ((home_side, away_side), (away_side, home_side)):
+        starters, bench = _lineup(rng, squads[team_id], player_role)
+        minutes = {pid: 90 for pid in starters}
+        for off, on in zip(rng.sample(starters[1:], 3), bench):
+            minute = rng.randrange(46, 86)
+            minutes[off], minutes[on] = minute, 90 - minute
+            rows["game_events"].append(
+                {"game_id": game_id, "half": 2, "minute": minute,
+                 "event_type": GameEventType.substitution, "team_id": team_id,
+                 "player_id": off, "player_name": player_name[off],
+                 "player2_id": on, "player2_name": player_name[on]}
+            )
+        outfield = [pid for pid in minutes if player_role[pid][0] != 1]
+        scorers, assists, cards = defaultdict(int), defaultdict(int), defaultdict(int)
+        for _ in range(goals):
+            scorer = rng.choices(outfield, [player_role[p][0] ** 2 for p in outfield])[0]
+            assist = rng.choice([p for p in outfield if p != scorer]) if rng.random() < 0.7 else None
+            minute = rng.randrange(1, 91)
+            scorers[scorer] += 1
+            if assist:
+                assists[assist] += 1
+            rows["game_events"].append(
+                {"game_id": game_id, "half": 1 if minute <= 45 else 2, "minute": minute,
+                 "event_type": GameEventType.goal, "team_id": team_id,
+                 "player_id": scorer, "player_name": player_name[scorer],
+                 "assist_player_id": assist, "assist_player_name": player_name.get(assist)}
+            )
+        for pid in rng.sample(outfield, rng.randrange(0, 4)):
+            minute = rng.randrange(1, 91)
+            cards[pid] += 1
+            rows["game_events"].append(
+                {"game_id": game_id, "half": 1 if minute <= 45 else 2, "minute": minute,
+                 "event_type": GameEventType.yellow_card, "team_id": team_id,
+                 "player_id": pid, "player_name": player_name[pid]}
+            )
+
+        team_shots = team_passes = 0
+        for pid, played in minutes.items():
+            shots = scorers[pid] + rng.randrange(0, 3) if player_role[pid][0] != 1 else 0
+            passes = rng.randrange(10, 70) * played // 90
+            team_shots += shots
+            team_passes += passes
+            rows["game_player_stats"].append(
+                {"game_id": game_id, "player_id": pid, "team_id": team_id,
+                 "minutes_played": played, "started": pid in starters,
+                 "position": player_role[pid][3][:2].upper(), "shots": shots,
+                 "shots_on_goal": min(shots, scorers[pid] + rng.randrange(0, 2)),
+                 "passes": passes, "pass_accuracy": round(rng.uniform(62, 93), 2),
+                 "duel": rng.randrange(0, 15), "tackle": rng.randrange(0, 6),
+                 "foul": rng.randrange(0, 4), "yellow_cards": cards[pid],
+                 "extra_stats": {"goals": scorers[pid], "assists": assists[pid]}}
+            )
+            totals = season_players[pid]
+            totals["team_id"] = team_id
+            totals["games_played"] += 1
+            totals["games_starting"] += int(pid in starters)
+            totals["time_on_field_total"] += played
+            totals["goal"] += scorers[pid]
+            totals["goal_pass"] += assists[pid]
+            totals["goal_and_assist"] += scorers[pid] + assists[pid]
+            totals["shot"] += shots
+            totals["passes"] += passes
+            totals["yellow_cards"] += cards[pid]
+            if player_role[pid][0] == 1 and played == 90:
+                totals["goals_conceded"] += conceded
+        rows["game_team_stats"].append(
+            {"game_id": game_id, "team_id": team_id, "possession_percent": rng.randrange(35, 66),
+             "shots": team_shots, "shots_on_goal": team_shots // 2, "passes": team_passes,
+             "pass_accuracy": round(rng.uniform(70, 90), 2), "fouls": rng.randrange(6, 20),
+             "yellow_cards": sum(cards.values()), "red_cards": 0, "corners": rng.randrange(1, 11),
+             "offsides": rng.randrange(0, 5), "xg": round(goals * 0.8 + rng.uniform(0, 1.2), 2)}
+        )
@@ -0,0 +1,104 @@
+from datetime import date, time
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+
+from app.models import AdminUser, Championship, Game, Season, Team
+from app.models.game import GameStatus
+from app.security import hash_password
+
+
+@pytest.fixture
+async def operator_user(test_session):
+    user = AdminUser(
+        email="events-operator@test.local",
+        password_hash=hash_password("operator-secret"),
+        role="operator",
+        is_active=True,
+    )
+    test_session.add(user)
+    await test_session.commit()
+    await test_session.refresh(user)
+    return user
+
+
+@pytest.fixture
+async def season_games(test_session):
+    championship = Championship(id=511, name="Премьер-Лига", name_kz="Премьер-Лига")
+    season = Season(
+        id=611,
+        name="Премьер-Лига 2026",
+        name_kz="Премьер-Лига 2026",
+        championship_id=championship.id,
+        sync_enabled=True,
+    )
+    teams = [
+        Team(id=711, name="Астана", name_kz="Астана"),
+        Team(id=712, name="Қайрат", name_kz="Қайрат"),
+    ]
+    test_session.add_all([championship, season, *teams])
+    await test_session.commit()
+    games = [
+        Game(
+            id=811 + i,
+            date=date(2026, 4, 25 + i),
+            time=time(15, 0),
+            season_id=season.id,
+            home_team_id=teams[0].id,
+            away_team_id=teams[1].id,
+            status=GameStatus.finished,
+            tour=i + 1,
+        )
+        for i in range(2)
+    ]
+    test_session.add_all(games)
+    await test_session.commit()
+    return season, games
+
+
+async def _headers(client: AsyncClient, user: AdminUser) -> dict:
+    response = await client.post(
+        "/api/v1/admin/auth/login",
+        json={"email": user.email, "password": "operator-secret"},
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.mark.asyncio
+async def test_game_events_sync_is_queued_as_a_job(client, operator_user, season_games):
+    _, games = season_games
+    headers = await _headers(client, operator_user)
+
+    with patch("app.api.admin.ops.run_sync_job_task") as task_mock:
+        response = await client.post(
+            f"/api/v1/admin/ops/sync/game-events/{games[0].id}", headers=headers,
+        )
+
+    assert response.status_code == 200, response.text
+    job_id = response.json()["details"]["job_id"]
+    task_mock.delay.assert_called_once_with(job_id)
+
+    job = await client.get(f"/api/v1/admin/ops/jobs/{job_id}", headers=headers)
+    assert job.status_code == 200, job.text
+    assert job.json()["kind"] == "sync_game_events"
+    assert job.json()["units_total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_all_game_events_sync_plans_one_unit_per_game(client, operator_user, season_games):
+    season, _ = season_games
+    headers = await _headers(client, operator_user)
+
+    with patch("app.api.admin.ops.run_sync_job_task") as task_mock:
+        response = await client.post(
+            "/api/v1/admin/ops/sync/all-game-events",
+            params={"season_id": season.id},
+            headers=headers,
+        )
+
+    assert response.status_code == 200, response.text
+    details = response.json()["details"]
+    assert details["games"] == 2
+    task_mock.delay.assert_called_once_with(details["job_id"])
@@ -17,8 +17,9 @@ class TestGamesAPI:
         assert response.status_code == 404
         assert response.json()["detail"] == "Season not found"
 
+    @pytest.mark.query_budget(max_queries=6)
     async def test_get_games_with_data(
-        self, client: AsyncClient, sample_season, sample_game
+        self, client: AsyncClient, sample_season, sample_game, warm_reference_snapshot
     ):
         """Test getting all games."""
         response = await client.get("/api/v1/games?season_id=61")
@@ -249,6 +250,7 @@ class TestGamesAPI:
         assert response.status_code == 400
         assert "mutually exclusive" in response.json()["detail"]
 
+    @pytest.mark.query_budget(max_queries=6)
     async def test_get_game_by_id(self, client: AsyncClient, sample_game):
         """Test getting game by int ID."""
         response = await client.get(f"/api/v1/games/{sample_game.id}")
@@ -313,7 +315,8 @@ class TestGamesAPI:
         assert response.status_code == 404
         assert response.json()["detail"] == "Game not found"
 
-    async def test_get_game_stats(self, client: AsyncClient, sample_game):
+    @pytest.mark.query_budget(max_queries=7)
+    async def test_get_game_stats(self, client: AsyncClient, sample_game, warm_reference_snapshot):
         """Test getting game statistics."""
         response = await client.get(f"/api/v1/games/{sample_game.id}/stats")
         assert response.status_code == 200
@@ -427,12 +430,14 @@ class TestGamesAPI:
         detail_data = detail_response.json()
         assert detail_data["is_schedule_tentative"] is True
 
+    @pytest.mark.query_budget(max_queries=8)
     async def test_get_game_lineup_orders_starters_by_position_order(
         self,
         client: AsyncClient,
         test_session,
         sample_game,
         sample_player,
+        warm_reference_snapshot,
     ):
         """Test /games/{id}/lineup returns starters sorted by amplua + field_position."""
         def_left = Player(sota_id=uuid4(), first_name="Def", last_name="Left")
@@ -859,7 +864,7 @@ async def test_home_widget_returns_narrow_statuses_and_caps_completed_window_ttl
         MatchCenterGame,
     )
     import app.services.home_matches as home_matches_service
-    import app.utils.cache as cache_module
+    import app.services.home_widget_snapshots as home_widget_snapshots
 
     expires_at = datetime.now(timezone.utc) + timedelta(seconds=30)
     captured: dict[str, int] = {}
@@ -917,15 +922,20 @@ async def test_home_widget_returns_narrow_statuses_and_caps_completed_window_ttl
             completed_window_expires_at=expires_at,
         )
 
-    def fake_cache_get(_key: str):
-        return None
+    class _FakeRedis:
+        async def get(self, _key):
+            return None
+
+        async def set(self, key, _value, ex=None, **_kwargs):
+            captured["key"] = key
+            captured["ttl"] = ex - home_widget_snapshots.REFRESH_LEAD
+            return True
 
-    def fake_cache_set(_key: str, _value: bytes, ttl: int):
-        captured["ttl"] = ttl
+    async def fake_redis():
+        return _FakeRedis()
 
     monkeypatch.setattr(home_matches_service, "get_home_widget", fake_get_home_widget)
-    monkeypatch.setattr(cache_module, "cache_get", fake_cache_get)
-    monkeypatch.setattr(cache_module, "cache_set", fake_cache_set)
+    monkeypatch.setattr(home_widget_snapshots, "_redis", fake_redis)
 
     response = await client.get("/api/v1/games/home-widget?frontend_code=pl&lang=ru")
 
@@ -936,4 +946,6 @@ async def test_home_widget_returns_narrow_statuses_and_caps_completed_window_ttl
     assert data["show_tabs"] is True
     assert data["groups"][0]["games"][0]["status"] == "finished"
     assert data["upcoming_groups"][0]["games"][0]["status"] == "upcoming"
+    # Snapshot fresh only until the completed window closes.
+    assert captured["key"] == "qfl:home_widget:pl::ru"
     assert 1 <= captured["ttl"] <= 30
@@ -155,3 +155,28 @@ async def test_events_ru_keeps_stored_team_name(
     resp = await client.get(f"/api/v1/live/events/{sample_game.id}?lang=ru")
     events = _by_minute(resp.json()["events"])
     assert events[12]["team_name"] == "Astana"
+
+
+@pytest.mark.asyncio
+async def test_hls_clip_poster_url_only_when_recorded(client, test_session, sample_game):
+    test_session.add_all([
+        GameEvent(
+            game_id=sample_game.id, half=1, minute=5, event_type=GameEventType.goal,
+            player_name="A With Poster",
+            video_url="goal_videos/1/1-abc/master.m3u8",
+            video_poster_url="goal_videos/1/1-abc/poster.jpg",
+        ),
+        GameEvent(
+            game_id=sample_game.id, half=1, minute=9, event_type=GameEventType.goal,
+            player_name="B No Poster",
+            video_url="goal_videos/1/2-def/master.m3u8",
+        ),
+    ])
+    await test_session.commit()
+
+    response = await client.get(f"/api/v1/live/events/{sample_game.id}")
+
+    with_poster, without_poster = response.json()["events"]
+    assert with_poster["video_poster_url"].endswith("/goal_videos/1/1-abc/poster.jpg")
+    assert without_poster["video_poster_url"] is None
+    assert without_poster["video_mp4_url"].endswith("/goal_videos/1/2-def/fallback.mp4")
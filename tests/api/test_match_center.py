@@ -0,0 +1,105 @@
+"""Tests for the composite /games/{id}/match-center endpoint."""
+
+import asyncio
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.games import match_center
+from app.services.game_api_cache import game_events_cache_key, invalidate_game_api_cache
+from app.utils.cache import cache_get
+
+pytestmark = [
+    pytest.mark.asyncio,
+    pytest.mark.usefixtures("override_web_session_factory"),
+]
+
+
+async def test_match_center_stitches_all_sections(client: AsyncClient, sample_game):
+    response = await client.get(f"/api/v1/games/{sample_game.id}/match-center?lang=ru")
+
+    assert response.status_code == 200
+    data = response.json()
+    assert set(data) == {"game", "lineup", "events", "stats", "table", "h2h"}
+    assert data["game"]["id"] == sample_game.id
+    assert data["lineup"]["game_id"] == sample_game.id
+    assert data["events"] == {"game_id": sample_game.id, "events": [], "total": 0}
+    assert data["stats"]["game_id"] == sample_game.id
+    assert data["table"]["season_id"] == sample_game.season_id
+    assert data["h2h"]["team1_id"] == sample_game.home_team_id
+
+    # Sections share cache entries with the standalone endpoints.
+    standalone = await client.get(f"/api/v1/live/events/{sample_game.id}?lang=ru")
+    assert standalone.json() == data["events"]
+
+
+async def test_match_center_missing_game_is_404(client: AsyncClient):
+    response = await client.get("/api/v1/games/999999/match-center")
+
+    assert response.status_code == 404
+
+
+async def test_failed_section_is_null(client: AsyncClient, sample_game, monkeypatch):
+    async def broken(*args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(match_center, "render_game_stats", broken)
+
+    response = await client.get(f"/api/v1/games/{sample_game.id}/match-center")
+
+    assert response.status_code == 200
+    assert response.json()["stats"] is None
+    assert response.json()["game"]["id"] == sample_game.id
+
+
+async def test_sections_respect_connection_budget(client: AsyncClient, sample_game, monkeypatch):
+    in_flight = 0
+    peak = 0
+    factory = match_center.database.get_web_session_factory()
+
+    class _Counted:
+        def __init__(self):
+            self._cm = factory()
+
+        async def __aenter__(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            session = await self._cm.__aenter__()
+            await asyncio.sleep(0.01)
+            return session
+
+        async def __aexit__(self, *exc):
+            nonlocal in_flight
+            in_flight -= 1
+            return await self._cm.__aexit__(*exc)
+
+    monkeypatch.setattr(match_center.database, "get_web_session_factory", lambda: _Counted)
+    monkeypatch.setattr(match_center.settings, "match_center_max_connections", 2)
+
+    response = await client.get(f"/api/v1/games/{sample_game.id}/match-center")
+
+    assert response.status_code == 200
+    assert peak == 2
+
+
+async def test_invalidate_drops_cached_sections(client: AsyncClient, sample_game):
+    await client.get(f"/api/v1/games/{sample_game.id}/match-center?lang=kz")
+    assert cache_get(game_events_cache_key(sample_game.id, "kz")) is not None
+
+    invalidate_game_api_cache(sample_game.id)
+
+    assert cache_get(game_events_cache_key(sample_game.id, "kz")) is None
+
+
+async def test_game_row_is_loaded_once(client: AsyncClient, sample_game, test_engine):
+    from sqlalchemy import event
+
+    statements: list[str] = []
+    event.listen(test_engine.sync_engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+
+    response = await client.get(f"/api/v1/games/{sample_game.id}/match-center")
+
+    assert response.status_code == 200
+    by_id = [s for s in statements if "FROM games" in s and "WHERE games.id = ?" in s]
+    assert len(by_id) == 1, by_id
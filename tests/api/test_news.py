@@ -1,7 +1,11 @@
+from datetime import date
+
 import pytest
 from httpx import AsyncClient
 
-from app.models import Player, Team
+from app.models import Language, Player, Team
+from app.models.news import News
+from app.services.list_counts import invalidate_list_counts
 
 
 @pytest.mark.asyncio
@@ -33,6 +37,35 @@ class TestNewsAPI:
         assert len(data["items"]) == 1
         assert data["pages"] == 2
 
+    async def test_get_news_cursor_pagination(self, client: AsyncClient, sample_news):
+        """Cursor paging follows the selected sort and is bound to it."""
+        first = (await client.get("/api/v1/news?lang=ru&sort=likes_desc&per_page=1")).json()
+        assert [item["id"] for item in first["items"]] == [2]
+        assert first["next_cursor"]
+
+        second = (await client.get(
+            f"/api/v1/news?lang=ru&sort=likes_desc&per_page=1&cursor={first['next_cursor']}"
+        )).json()
+        assert [item["id"] for item in second["items"]] == [1]
+        assert second["next_cursor"] is None
+        assert second["total"] == 2
+
+        other_sort = await client.get(f"/api/v1/news?lang=ru&sort=date_asc&cursor={first['next_cursor']}")
+        assert other_sort.status_code == 400
+
+    async def test_news_total_is_cached_until_invalidated(self, client: AsyncClient, sample_news, test_session):
+        assert (await client.get("/api/v1/news?lang=ru")).json()["total"] == 2
+
+        test_session.add(News(id=3, language=Language.RU, title="Новая", publish_date=date(2025, 5, 3)))
+        await test_session.commit()
+
+        data = (await client.get("/api/v1/news?lang=ru")).json()
+        assert len(data["items"]) == 3
+        assert data["total"] == 2
+
+        invalidate_list_counts("news")
+        assert (await client.get("/api/v1/news?lang=ru")).json()["total"] == 3
+
     async def test_get_news_by_tournament(self, client: AsyncClient, sample_news):
         """Test filtering news by championship_code."""
         response = await client.get("/api/v1/news?lang=ru&championship_code=pl")
@@ -55,6 +88,12 @@ class TestNewsAPI:
         assert len(data["items"]) == 1
         assert data["items"][0]["id"] == 2
 
+    async def test_news_search_total_bypasses_count_cache(self, client: AsyncClient, sample_news):
+        from app.utils import cache
+
+        assert (await client.get("/api/v1/news?lang=ru&search=xg")).json()["total"] == 1
+        assert not [key for key in cache._cache if key.startswith("list_count:news:")]
+
     async def test_get_news_sort_views_desc(self, client: AsyncClient, sample_news):
         response = await client.get("/api/v1/news?lang=ru&sort=views_desc")
         assert response.status_code == 200
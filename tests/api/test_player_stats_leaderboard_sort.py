@@ -78,3 +78,43 @@ class TestLeaderboardSortByValue:
 
         # Within equal goals, SOTA's rank order is preserved (ascending).
         assert names == ["Satpaev", "DaCosta", "Murtazaev", "Amir", "Anuarbekov"]
+
+    async def test_cursor_pages_follow_value_then_rank_order(
+        self,
+        client: AsyncClient,
+        test_session,
+        sample_season,
+        sample_teams,
+    ):
+        rows = [
+            ("Amir", 6, 1),
+            ("Satpaev", 7, 2),
+            ("DaCosta", 7, 3),
+            ("Murtazaev", 7, 4),
+            ("Anuarbekov", 6, 5),
+        ]
+        await self._seed(test_session, sample_season.id, sample_teams[0].id, rows)
+
+        names, cursors, cursor = [], [], None
+        while True:
+            params = {"sort_by": "goal", "limit": 2, "lang": "ru"}
+            if cursor:
+                params["cursor"] = cursor
+            resp = await client.get(f"/api/v1/seasons/{sample_season.id}/player-stats", params=params)
+            assert resp.status_code == 200
+            data = resp.json()
+            names += [item["last_name"] for item in data["items"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+            cursors.append(cursor)
+
+        assert names == ["Satpaev", "DaCosta", "Murtazaev", "Amir", "Anuarbekov"]
+        assert len(cursors) == 2
+
+        # A cursor is bound to the sort it was issued for.
+        resp = await client.get(
+            f"/api/v1/seasons/{sample_season.id}/player-stats",
+            params={"sort_by": "xg", "cursor": cursors[0]},
+        )
+        assert resp.status_code == 400
@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.models import Player
+
 
 @pytest.mark.asyncio
 class TestPlayersAPI:
@@ -14,6 +16,7 @@ class TestPlayersAPI:
         assert data["items"] == []
         assert data["total"] == 0
 
+    @pytest.mark.query_budget(max_queries=3)
     async def test_get_players_with_data(self, client: AsyncClient, sample_player):
         """Test getting all players."""
         response = await client.get("/api/v1/players")
@@ -30,6 +33,37 @@ class TestPlayersAPI:
         assert len(data["items"]) == 1
         assert data["total"] == 1
 
+    async def test_get_players_cursor_walks_same_order_as_offset(self, client: AsyncClient, test_session):
+        """Cursor pages concatenate to the offset listing, NULL names included."""
+        test_session.add_all([
+            Player(id=901, first_name="Arman", last_name="Abenov"),
+            Player(id=902, first_name=None, last_name="Abenov"),
+            Player(id=903, first_name="Arman", last_name="Abenov"),
+            Player(id=904, first_name="Dias", last_name=None),
+            Player(id=905, first_name="Dias", last_name="Zhumabek"),
+        ])
+        await test_session.commit()
+
+        full = (await client.get("/api/v1/players?limit=100")).json()
+        assert full["next_cursor"] is None
+
+        walked, cursor = [], None
+        while True:
+            url = "/api/v1/players?limit=2" + (f"&cursor={cursor}" if cursor else "")
+            page = (await client.get(url)).json()
+            assert page["total"] == 5
+            walked += [item["id"] for item in page["items"]]
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        assert walked == [item["id"] for item in full["items"]] == [901, 903, 902, 905, 904]
+
+    async def test_get_players_rejects_bad_cursor(self, client: AsyncClient):
+        response = await client.get("/api/v1/players?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    @pytest.mark.query_budget(max_queries=3)
     async def test_get_player_by_id(self, client: AsyncClient, sample_player):
         """Test getting player by id."""
         player_id = sample_player.id
@@ -294,6 +328,7 @@ class TestPlayerTournamentsCurrentLeague:
         await test_session.refresh(player)
         return player
 
+    @pytest.mark.query_budget(max_queries=9)
     async def test_current_league_from_active_first_league_contract(
         self, client: AsyncClient, test_session
     ):
@@ -57,6 +57,7 @@ class TestSeasonsAPI:
         assert data["items"] == []
         assert data["total"] == 0
 
+    @pytest.mark.query_budget(max_queries=3)
     async def test_get_seasons_with_data(self, client: AsyncClient, sample_season):
         """Test getting seasons with data."""
         response = await client.get("/api/v1/seasons")
@@ -135,6 +136,7 @@ class TestSeasonsAPI:
         assert data["season_id"] == 61
         assert data["table"] == []
 
+    @pytest.mark.query_budget(max_queries=6)
     async def test_get_season_table_with_data(
         self, client: AsyncClient, sample_season, sample_score_table
     ):
@@ -370,6 +372,7 @@ class TestSeasonsAPI:
         assert response.status_code == 400
         assert "mutually exclusive" in response.json()["detail"]
 
+    @pytest.mark.query_budget(max_queries=6)
     async def test_get_season_games(self, client: AsyncClient, sample_season, sample_game):
         """Test getting games for a season."""
         response = await client.get("/api/v1/seasons/61/games")
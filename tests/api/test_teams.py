@@ -132,6 +132,7 @@ class TestTeamsAPI:
         assert {item["id"] for item in data["items"]} == {sample_teams[0].id}
         assert data["total"] == 1
 
+    @pytest.mark.query_budget(max_queries=1)
     async def test_get_team_by_id(self, client: AsyncClient, sample_teams):
         """Test getting team by ID."""
         response = await client.get("/api/v1/teams/91")
@@ -239,6 +240,7 @@ class TestTeamsAPI:
         assert data["items"] == []
         assert data["total"] == 0
 
+    @pytest.mark.query_budget(max_queries=6)
     async def test_get_team_games(
         self, client: AsyncClient, sample_teams, sample_season, sample_game
     ):
@@ -263,6 +265,7 @@ class TestTeamsAPI:
         assert response.status_code == 404
         assert "detail" in response.json()
 
+    @pytest.mark.query_budget(max_queries=13)
     async def test_get_team_overview_fallback_summary(
         self, client: AsyncClient, sample_teams, sample_season, sample_game
     ):
@@ -405,6 +408,7 @@ class TestTeamsAPI:
         assert len(data["leaders"]["assists_table"]) > 0
         assert len(data["staff_preview"]) == 1
 
+    @pytest.mark.query_budget(max_queries=13)
     async def test_get_team_overview_localization(
         self, client: AsyncClient, test_session, sample_teams, sample_season, sample_game
     ):
@@ -418,6 +422,35 @@ class TestTeamsAPI:
         data = response.json()
         assert data["team"]["name"] == "Қайрат"
 
+    async def test_get_team_overview_limits_slice_one_cached_render(
+        self, client: AsyncClient, test_session, sample_teams, sample_season, sample_game, query_profiles
+    ):
+        """Different limits are served from the same cached render."""
+        test_session.add_all(
+            [
+                Game(
+                    sota_id=uuid4(),
+                    date=date(2025, 6, day),
+                    time=time(18, 0),
+                    tour=day,
+                    season_id=61,
+                    home_team_id=13,
+                    away_team_id=90,
+                )
+                for day in (1, 8, 15)
+            ]
+        )
+        await test_session.commit()
+
+        first = await client.get("/api/v1/teams/13/overview?season_id=61&lang=ru&fixtures_limit=1")
+        second = await client.get("/api/v1/teams/13/overview?season_id=61&lang=ru&fixtures_limit=3")
+        assert first.status_code == second.status_code == 200
+
+        assert [m["tour"] for m in first.json()["upcoming_matches"]] == [1]
+        assert [m["tour"] for m in second.json()["upcoming_matches"]] == [1, 8, 15]
+        overview_queries = [p.count for p in query_profiles if "overview" in p.label]
+        assert overview_queries[1] < overview_queries[0]
+
     async def test_head_to_head_uses_logo_fallback_in_form_guide_table_and_meetings(
         self,
         client: AsyncClient,
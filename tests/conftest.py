@@ -14,6 +14,7 @@ from app.main import app
 from app.database import Base
 from app.api.deps import get_db  # Import from where routes actually use it
 from app.utils.cache import cache_clear
+from app.services.reference_data import invalidate_reference_snapshot
 from app.services.season_visibility import invalidate_season_cache
 from app.models import (
     Season, Team, Player, PlayerTeam,
@@ -22,6 +23,8 @@ from app.models import (
 )
 
 
+pytest_plugins = ["tests.plugins.query_budget"]
+
 TEST_DATABASE_URL = "sqlite+aiosqlite:///:memory:"
 
 
@@ -138,13 +141,27 @@ def override_web_session_factory(test_engine, monkeypatch):
     yield test_factory
 
 
+@pytest.fixture
+async def warm_reference_snapshot(test_session):
+    """Load the reference-data snapshot up front, as a long-lived process has it.
+
+    List it after the data fixtures so the snapshot sees their rows; query
+    budgets then measure the steady-state request.
+    """
+    from app.services.reference_data import get_reference_snapshot
+
+    return await get_reference_snapshot(test_session)
+
+
 @pytest.fixture(autouse=True)
 def clear_runtime_caches():
     cache_clear()
     invalidate_season_cache()
+    invalidate_reference_snapshot()
     yield
     cache_clear()
     invalidate_season_cache()
+    invalidate_reference_snapshot()
 
 
 # --- Data Fixtures ---
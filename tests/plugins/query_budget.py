@@ -0,0 +1,74 @@
+"""Query-count budgets for API tests.
+
+    @pytest.mark.query_budget(max_queries=6)
+    async def test_team_overview(client, ...):
+        ...
+
+Every HTTP request made through the app while the test runs is profiled by
+``QueryProfilerMiddleware``; the test fails if any single request executes
+more than ``max_queries`` statements or repeats one statement more than
+``max_repeats`` times (default 3, the N+1 guard). Requests to a path can be
+narrowed with ``path=`` (substring match on the route template). The
+``query_profiles`` fixture gives direct access to the collected profiles.
+"""
+
+import pytest
+
+from app.utils import query_profiler
+
+DEFAULT_MAX_REPEATS = 3
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries, max_repeats=3, path=None): "
+        "fail if a request runs more SQL statements than allowed",
+    )
+
+
+@pytest.fixture
+def query_profiles():
+    profiles: list[query_profiler.QueryProfile] = []
+    query_profiler.add_sink(profiles.append)
+    yield profiles
+    query_profiler.remove_sink(profiles.append)
+
+
+def _format(profile: query_profiler.QueryProfile) -> str:
+    lines = [f"{profile.label}: {profile.count} queries"]
+    for sql, n in profile.statements.most_common(5):
+        lines.append(f"  {n}x {' '.join(sql.split())[:200]}")
+    return "\n".join(lines)
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+    max_queries = marker.kwargs.get("max_queries", marker.args[0] if marker.args else None)
+    max_repeats = marker.kwargs.get("max_repeats", DEFAULT_MAX_REPEATS)
+    path = marker.kwargs.get("path")
+
+    profiles: list[query_profiler.QueryProfile] = []
+    query_profiler.add_sink(profiles.append)
+    try:
+        result = yield
+    finally:
+        query_profiler.remove_sink(profiles.append)
+
+    checked = [p for p in profiles if path is None or path in p.label]
+    if not checked:
+        pytest.fail(f"query_budget: no request matching {path or 'any path'} was made", pytrace=False)
+    over = [
+        p for p in checked
+        if (max_queries is not None and p.count > max_queries) or p.repeated(max_repeats + 1)
+    ]
+    if over:
+        pytest.fail(
+            f"query budget exceeded (max_queries={max_queries}, max_repeats={max_repeats}):\n"
+            + "\n".join(_format(p) for p in over),
+            pytrace=False,
+        )
+    return result
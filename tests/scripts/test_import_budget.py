@@ -0,0 +1,33 @@
+"""Worker and web entry points must not import heavy SDKs at start-up."""
+
+import pytest
+
+from app.tasks import TASK_MODULES, select_task_modules
+from app.utils.lazy_import import lazy_module
+from scripts.benchmark_import_time import IMPORT_BUDGETS, measure
+
+
+@pytest.mark.parametrize("target", sorted(IMPORT_BUDGETS))
+def test_entry_point_stays_within_import_budget(target):
+    profile = measure(target)
+
+    assert profile.violations(IMPORT_BUDGETS[target]) == []
+    assert "app" in profile.loaded
+
+
+def test_lazy_module_imports_on_first_attribute_access():
+    json_module = lazy_module("json")
+
+    assert not json_module.is_loaded
+    assert json_module.dumps({"a": 1}) == '{"a": 1}'
+    assert json_module.is_loaded
+
+    with pytest.raises(ImportError):
+        lazy_module("qfl_no_such_sdk").Client
+
+
+def test_task_modules_selected_per_worker():
+    assert select_task_modules("") == list(TASK_MODULES)
+    assert select_task_modules(" app.tasks.live_tasks ,") == ["app.tasks.live_tasks"]
+    with pytest.raises(ValueError, match="app.tasks.nope"):
+        select_task_modules("app.tasks.live_tasks,app.tasks.nope")
@@ -0,0 +1,58 @@
+"""Load-test harness: seeding, scenario replay and baseline comparison."""
+import copy
+import json
+
+import pytest
+
+from scripts.loadtest.__main__ import BASELINE
+from scripts.loadtest.report import compare, percentile
+from scripts.loadtest.runner import build_report, run_scenario
+from scripts.loadtest.scenarios import SCENARIOS
+from scripts.loadtest.seed import SeedConfig, load_league, seed_league
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+
+    assert [percentile(values, p) for p in (50, 95, 99)] == [50, 95, 99]
+    assert percentile([], 50) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_scenarios_replay_against_seeded_league(client, test_session, override_web_session_factory):
+    seeded = await seed_league(
+        test_session, SeedConfig(seasons=2, teams=4, players_per_team=16, matchday_tour=4)
+    )
+    league = await load_league(test_session)
+
+    assert (league.season_ids, league.team_ids, league.player_ids, league.matchday_tour) == (
+        seeded.season_ids, seeded.team_ids, seeded.player_ids, 4
+    )
+    assert seeded.rows["games"] == 2 * 12
+    assert seeded.rows["game_player_stats"] > 0
+
+    results = [await run_scenario(client, name, league, scale=0.1) for name in SCENARIOS]
+    report = build_report(results, dialect="sqlite", seed=SeedConfig().seed, scale=0.1)
+
+    for name, summary in report["scenarios"].items():
+        assert summary["requests"] > 0, name
+        assert summary["errors"] == 0, summary["statuses"]
+        assert summary["latency_ms"]["p99"] >= summary["latency_ms"]["p50"] > 0
+        assert summary["queries_per_request"]["max"] > 0, name
+    assert report["scenarios"]["table_ft_burst"]["cache_hit_rate"] > 0
+
+
+def test_compare_flags_regressions_against_committed_baseline():
+    baseline = json.loads(BASELINE.read_text())
+    assert set(baseline["scenarios"]) == set(SCENARIOS)
+    assert compare(baseline, baseline) == []
+
+    slower = copy.deepcopy(baseline)
+    scenario = slower["scenarios"]["table_ft_burst"]
+    scenario["latency_ms"]["p95"] *= 2
+    scenario["queries_per_request"]["mean"] += 3
+
+    problems = compare(slower, baseline)
+    assert len(problems) == 2 and all(p.startswith("table_ft_burst:") for p in problems)
+    slower["dialect"] = "sqlite"
+    assert len(compare(slower, baseline)) == 1  # latency is only comparable on the same database
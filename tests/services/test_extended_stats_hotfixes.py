@@ -227,3 +227,90 @@ async def test_sync_extended_stats_for_game_persists_flag_when_aggregates_fail(
     assert result["aggregate_result"]["season_id"] == sample_season.id
     assert any("team_season_stats" in err for err in result["aggregate_result"]["errors"])
     assert any("player_season_stats" in err for err in result["aggregate_result"]["errors"])
+
+
+@pytest.mark.asyncio
+async def test_sync_games_extended_stats_marks_each_game_in_its_own_session(
+    test_engine, sample_season, sample_teams, monkeypatch
+):
+    session_factory = async_sessionmaker(
+        test_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+    async with session_factory() as session:
+        games = [
+            Game(
+                sota_id=uuid4(),
+                date=date(2026, 3, 18),
+                time=time(18, 0),
+                tour=tour,
+                season_id=sample_season.id,
+                home_team_id=sample_teams[0].id,
+                away_team_id=sample_teams[1].id,
+                status=GameStatus.finished,
+                finished_at=utcnow() - timedelta(days=2),
+            )
+            for tour in (2, 3)
+        ]
+        session.add_all(games)
+        await session.commit()
+        game_ids = [g.id for g in games]
+
+    class _OneGameFails(FakeSyncOrchestrator):
+        async def sync_game_stats(self, game_id: int) -> dict:
+            if game_id == game_ids[1]:
+                raise RuntimeError("sota stalled")
+            return await super().sync_game_stats(game_id)
+
+    from app.tasks import sync_tasks
+
+    monkeypatch.setattr(sync_tasks, "SyncOrchestrator", _OneGameFails)
+    monkeypatch.setattr(sync_tasks, "AsyncSessionLocal", session_factory)
+    # SQLite test engine shares one connection — keep the DAG serial here.
+    monkeypatch.setattr(sync_tasks.settings, "sync_dag_db_concurrency", 1)
+
+    outcome = await sync_tasks._sync_games_extended_stats(game_ids)
+
+    async with session_factory() as verify_session:
+        ok_game = await verify_session.get(Game, game_ids[0])
+        failed_game = await verify_session.get(Game, game_ids[1])
+
+    assert ok_game.extended_stats_synced_at is not None
+    assert failed_game.extended_stats_synced_at is None
+    assert [r["game_id"] for r in outcome["game_results"]] == [game_ids[0]]
+    assert any("sota stalled" in err for err in outcome["errors"])
+    assert outcome["timings"]["games"]["counts"] == {"ok": 1, "failed": 1, "skipped": 0}
+    assert outcome["timings"]["seasons"]["counts"]["ok"] == 1
+
+
+@pytest.mark.asyncio
+async def test_sync_games_extended_stats_skips_deleted_game(test_engine, monkeypatch):
+    session_factory = async_sessionmaker(
+        test_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+    class _MustNotSync(FakeSyncOrchestrator):
+        async def sync_game_stats(self, game_id: int) -> dict:
+            raise AssertionError(f"synced missing game {game_id}")
+
+    from app.tasks import sync_tasks
+
+    monkeypatch.setattr(sync_tasks, "SyncOrchestrator", _MustNotSync)
+    monkeypatch.setattr(sync_tasks, "AsyncSessionLocal", session_factory)
+    monkeypatch.setattr(sync_tasks.settings, "sync_dag_db_concurrency", 1)
+
+    outcome = await sync_tasks._sync_games_extended_stats([987654])
+
+    assert outcome["game_results"] == [
+        {"game_id": 987654, "skipped": True, "synced": False, "season_id": None, "tour": None}
+    ]
+    assert outcome["errors"] == []
+    assert outcome["season_results"] == {}
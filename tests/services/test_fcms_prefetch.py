@@ -0,0 +1,103 @@
+"""Tests for concurrent FCMS prefetch ahead of the DB reconcile phase."""
+import asyncio
+
+import pytest
+
+from app.models import GameReferee
+from app.services.fcms_client import FcmsPrefetch
+from app.services.fcms_referee_sync import FcmsRefereeSyncService
+from app.services.fcms_roster_sync import FcmsRosterSyncService
+
+
+class _SlowFcmsClient:
+    """Records how many calls are in flight at once."""
+
+    def __init__(self, competitors=None, fail_team=None):
+        self.competitors = competitors or {}
+        self.fail_team = fail_team
+        self.calls: list[tuple] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def _call(self, *key):
+        self.calls.append(key)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+
+    async def get_competition_competitors(self, comp_id):
+        await self._call("competitors", comp_id)
+        return [{"teamId": t} for t in self.competitors.get(comp_id, [])]
+
+    async def get_competitor_players(self, comp_id, team_id):
+        await self._call("players", comp_id, team_id)
+        if team_id == self.fail_team:
+            raise RuntimeError("FCMS 502")
+        return []
+
+    async def get_competitor_officials(self, comp_id, team_id):
+        await self._call("officials", comp_id, team_id)
+        return []
+
+    async def get_match_official_allocations(self, match_id):
+        await self._call("allocations", match_id)
+        return [{
+            "matchOfficialRole": {"roleType": "REFEREE"},
+            "matchOfficial": {"personId": match_id, "localFirstName": "Иван", "localFamilyName": "Судья"},
+        }]
+
+
+@pytest.mark.asyncio
+async def test_prefetch_bounds_concurrency_and_replays_failures():
+    client = _SlowFcmsClient(fail_team=2)
+    prefetch = FcmsPrefetch(concurrency=3)
+
+    await prefetch.fetch_all({
+        ("players", 1, team): (lambda t=team: client.get_competitor_players(1, t)) for team in range(10)
+    })
+
+    assert client.max_in_flight == 3
+    assert await prefetch.get(("players", 1, 5), None) == []
+    with pytest.raises(RuntimeError, match="FCMS 502"):
+        await prefetch.get(("players", 1, 2), None)
+    assert prefetch.peek(("players", 1, 2)) is None
+    # Keys that were not prefetched are fetched on demand.
+    assert await prefetch.get(("officials", 1, 1), lambda: client.get_competitor_officials(1, 1)) == []
+    assert client.calls[-1] == ("officials", 1, 1)
+
+
+@pytest.mark.asyncio
+async def test_roster_prefetch_fetches_only_local_teams(test_session, sample_teams):
+    for n, team in enumerate(sample_teams):
+        team.fcms_team_id = 900 + n
+    await test_session.commit()
+    client = _SlowFcmsClient(competitors={1: [900, 901, 12345], 2: [902]})
+    service = FcmsRosterSyncService(test_session, client)
+
+    await service.prefetch_competitions([1, 2])
+
+    fetched = {c for c in client.calls if c[0] in ("players", "officials")}
+    assert fetched == {
+        (kind, comp, team)
+        for kind in ("players", "officials")
+        for comp, team in ((1, 900), (1, 901), (2, 902))
+    }
+    assert client.max_in_flight > 1
+
+
+@pytest.mark.asyncio
+async def test_referee_sync_many_prefetches_before_reconcile(test_session, sample_game):
+    sample_game.fcms_match_id = 777
+    await test_session.commit()
+    client = _SlowFcmsClient()
+    service = FcmsRefereeSyncService(test_session, client)
+
+    totals = await service.sync_many([sample_game.id])
+    await test_session.commit()
+
+    assert client.calls == [("allocations", 777)]
+    assert totals["added"] == 1 and totals["errors"] == 0
+    assert len((await test_session.execute(
+        GameReferee.__table__.select().where(GameReferee.game_id == sample_game.id)
+    )).all()) == 1
@@ -286,3 +286,145 @@ async def test_download_and_link_path_pipeline_cleans_up_on_download_failure(mon
     from pathlib import Path as _Path
     assert len(captured_paths) == 1
     assert not _Path(captured_paths[0]).exists(), "tempdir must be cleaned up after download failure"
+
+
+@pytest.mark.asyncio
+async def test_download_and_link_uploads_hls_package_with_master_last(monkeypatch):
+    from pathlib import Path as _Path
+
+    from app.utils.video_transcode import HlsPackageResult
+
+    event = _event()
+    drive_file = _drive_file(name="goal.mp4")
+    db = SimpleNamespace(commit=AsyncMock())
+
+    async def fake_download_to_path(file_id, dest):
+        _Path(dest).write_bytes(b"raw-camera-payload")
+        return 18
+
+    async def fake_package(input_path, output_dir, **kwargs):
+        output_dir = _Path(output_dir)
+        (output_dir / "480p").mkdir(parents=True)
+        files = {
+            "480p/init.mp4": b"init",
+            "480p/seg_000.m4s": b"seg",
+            "480p/index.m3u8": b"#EXTM3U",
+            "master.m3u8": b"#EXTM3U",
+            "fallback.mp4": b"fallback-mp4",
+            "poster.jpg": b"jpeg",
+        }
+        for name, data in files.items():
+            (output_dir / name).write_bytes(data)
+        paths = tuple(sorted(output_dir / name for name in files))
+        return HlsPackageResult(
+            output_dir=output_dir,
+            master_playlist=output_dir / "master.m3u8",
+            fallback_mp4=output_dir / "fallback.mp4",
+            poster=output_dir / "poster.jpg",
+            files=paths,
+            size=sum(len(d) for d in files.values()),
+        )
+
+    uploads: list[tuple[str, str, dict]] = []
+
+    async def fake_upload(path, *, object_name, content_type, category, metadata):
+        uploads.append((object_name, content_type, metadata))
+        return {"object_name": object_name}
+
+    transcode_mock = AsyncMock()
+    monkeypatch.setattr(
+        gvs,
+        "get_settings",
+        lambda: SimpleNamespace(
+            goal_video_transcode_enabled=True,
+            goal_video_transcode_crf="20",
+            goal_video_transcode_preset="medium",
+            goal_video_transcode_threads="0",
+            goal_video_hls_enabled=True,
+            goal_video_hls_ladder="1080,720,480",
+            goal_video_hls_segment_seconds=4,
+        ),
+    )
+    monkeypatch.setattr(gvs, "package_hls_paths", fake_package)
+    monkeypatch.setattr(gvs, "transcode_mp4_paths", transcode_mock)
+    monkeypatch.setattr(gvs.FileStorageService, "upload_file_from_path", fake_upload)
+    monkeypatch.setattr(gvs, "_mark_processed", AsyncMock())
+
+    ok = await gvs._download_and_link(
+        SimpleNamespace(download_file_to_path=fake_download_to_path), db, drive_file, event,
+    )
+
+    assert ok is True
+    transcode_mock.assert_not_awaited()
+    assert event.video_url.startswith("goal_videos/931/16852-")
+    assert event.video_url.endswith("/master.m3u8")
+    prefix = event.video_url.rsplit("/", 1)[0] + "/"
+    assert all(name.startswith(prefix) for name, _, _ in uploads)
+    assert uploads[-1][0] == event.video_url
+    assert uploads[-1][1] == "application/vnd.apple.mpegurl"
+    assert uploads[-1][2]["drive-file-id"] == "drive-file-1"
+    assert all("drive-file-id" not in meta for _, _, meta in uploads[:-1])
+    assert event.video_poster_url == prefix + "poster.jpg"
+
+
+def test_storage_scan_stats_only_clip_roots():
+    assert gvs._is_clip_root_object("goal_videos/931/16852-abc.mp4")
+    assert gvs._is_clip_root_object("goal_videos/931/16852-abc/master.m3u8")
+    assert not gvs._is_clip_root_object("goal_videos/931/16852-abc/480p/seg_000.m4s")
+    assert not gvs._is_clip_root_object("goal_videos/931/16852-abc/poster.jpg")
+
+
+@pytest.mark.asyncio
+async def test_download_and_link_falls_back_to_mp4_when_hls_packaging_fails(monkeypatch):
+    from pathlib import Path as _Path
+
+    event = _event()
+    drive_file = _drive_file(name="goal.mp4")
+    db = SimpleNamespace(commit=AsyncMock())
+
+    async def fake_download_to_path(file_id, dest):
+        _Path(dest).write_bytes(b"raw-camera-payload")
+        return 18
+
+    async def fake_transcode(input_path, output_path, **kwargs):
+        return SimpleNamespace(output_path=input_path, size=18, transcoded=False)
+
+    upload_mock = AsyncMock()
+    monkeypatch.setattr(
+        gvs,
+        "get_settings",
+        lambda: SimpleNamespace(
+            goal_video_transcode_enabled=True,
+            goal_video_transcode_crf="20",
+            goal_video_transcode_preset="medium",
+            goal_video_transcode_threads="0",
+            goal_video_hls_enabled=True,
+            goal_video_hls_ladder="1080,720,480",
+            goal_video_hls_segment_seconds=4,
+        ),
+    )
+    monkeypatch.setattr(gvs, "package_hls_paths", AsyncMock(return_value=None))
+    monkeypatch.setattr(gvs, "transcode_mp4_paths", fake_transcode)
+    monkeypatch.setattr(gvs.FileStorageService, "upload_file_from_path", upload_mock)
+    monkeypatch.setattr(gvs, "_mark_processed", AsyncMock())
+
+    ok = await gvs._download_and_link(
+        SimpleNamespace(download_file_to_path=fake_download_to_path), db, drive_file, event,
+    )
+
+    assert ok is True
+    assert event.video_url.endswith(".mp4")
+    upload_mock.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_goal_video_object_removes_whole_hls_package(monkeypatch):
+    delete_prefix = AsyncMock(return_value=True)
+    delete_file = AsyncMock(return_value=True)
+    monkeypatch.setattr(gvs.FileStorageService, "delete_prefix", delete_prefix)
+    monkeypatch.setattr(gvs.FileStorageService, "delete_file", delete_file)
+
+    assert await gvs._delete_goal_video_object("goal_videos/931/16852-abc/master.m3u8")
+
+    delete_prefix.assert_awaited_once_with("goal_videos/931/16852-abc/")
+    delete_file.assert_not_awaited()
@@ -0,0 +1,144 @@
+"""Tests for precomputed home-widget snapshots."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from app.schemas.game import HomeMatchesWidgetResponse, MatchCenterDateGroup, MatchCenterGame
+from app.services import home_widget_snapshots as snapshots
+from app.services.home_matches import ALMATY_TZ
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value if isinstance(value, bytes) else str(value).encode()
+        self.ttls[key] = ex
+        return True
+
+    async def ttl(self, key):
+        return self.ttls.get(key, -2)
+
+    async def delete(self, key):
+        self.values.pop(key, None)
+        self.ttls.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+
+    async def _get():
+        return redis
+
+    monkeypatch.setattr(snapshots, "_redis", _get)
+    return redis
+
+
+def _widget(window_state="active_round", status="upcoming", expires_at=None) -> HomeMatchesWidgetResponse:
+    groups = [
+        MatchCenterDateGroup(
+            date=date(2026, 5, 9),
+            date_label="9 мая",
+            games=[MatchCenterGame(id=1, date=date(2026, 5, 9), status=status)],
+        )
+    ]
+    return HomeMatchesWidgetResponse(
+        frontend_code="pl",
+        season_id=61,
+        selected_round=7,
+        window_state=window_state,
+        default_tab="finished" if window_state == "completed_window" else "upcoming",
+        show_tabs=False,
+        groups=groups,
+        finished_groups=[],
+        upcoming_groups=groups,
+        completed_window_expires_at=expires_at,
+    )
+
+
+def test_snapshot_ttl_follows_widget_state():
+    now = datetime(2026, 5, 9, 23, 30, tzinfo=ALMATY_TZ)
+
+    completed = _widget("completed_window", "finished", expires_at=now + timedelta(minutes=10))
+    assert snapshots.snapshot_ttl(completed, now) == 600
+    assert snapshots.snapshot_ttl(_widget(status="live"), now) == snapshots.LIVE_SNAPSHOT_TTL
+    # Until the Almaty date rolls over...
+    assert snapshots.snapshot_ttl(_widget(), now) == 1800
+    # ...capped for writers that never trigger a refresh.
+    assert snapshots.snapshot_ttl(_widget(), now.replace(hour=9)) == snapshots.MAX_SNAPSHOT_TTL
+
+
+@pytest.mark.asyncio
+async def test_read_serves_snapshot_without_building(fake_redis, monkeypatch):
+    fake_redis.values[snapshots.home_widget_snapshot_key("2l", "A", "kz")] = b'{"ready":true}'
+
+    async def must_not_build(*_args, **_kwargs):
+        raise AssertionError("request path built the widget")
+
+    monkeypatch.setattr(snapshots, "build_home_widget_snapshot", must_not_build)
+
+    assert await snapshots.read_home_widget(None, "2l", "kz", group="A") == b'{"ready":true}'
+
+
+@pytest.mark.asyncio
+async def test_read_miss_builds_and_stores(fake_redis, monkeypatch):
+    async def build(_db, frontend_code, group, lang):
+        return f'"{frontend_code}/{group}/{lang}"'.encode(), 120
+
+    monkeypatch.setattr(snapshots, "build_home_widget_snapshot", build)
+
+    assert await snapshots.read_home_widget(None, "pl", "ru") == b'"pl/None/ru"'
+    key = snapshots.home_widget_snapshot_key("pl", None, "ru")
+    assert fake_redis.values[key] == b'"pl/None/ru"'
+    assert fake_redis.ttls[key] == 120 + snapshots.REFRESH_LEAD
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_due_skips_fresh_snapshots(fake_redis, monkeypatch):
+    built: list[str] = []
+
+    async def build(_db, frontend_code, group, lang):
+        built.append(snapshots.home_widget_snapshot_key(frontend_code, group, lang))
+        return b"{}", 600
+
+    monkeypatch.setattr(snapshots, "build_home_widget_snapshot", build)
+    fresh = snapshots.home_widget_snapshot_key("pl", None, "kz")
+    due = snapshots.home_widget_snapshot_key("pl", None, "ru")
+    fake_redis.ttls[fresh] = snapshots.REFRESH_LEAD + 300
+    fake_redis.ttls[due] = snapshots.REFRESH_LEAD - 5
+
+    written = await snapshots.refresh_home_widgets(None, ["pl"], only_due=True)
+
+    assert written == 2
+    assert built == [due, snapshots.home_widget_snapshot_key("pl", None, "en")]
+
+    assert await snapshots.refresh_home_widgets(None, ["2l"]) == 12
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_debounced_per_season(fake_redis, monkeypatch):
+    from app.tasks import live_tasks
+
+    calls: list[tuple] = []
+    monkeypatch.setattr(
+        live_tasks.refresh_home_widgets_task, "apply_async", lambda args, countdown: calls.append(tuple(args)),
+    )
+
+    await snapshots.enqueue_home_widget_refresh(61)
+    await snapshots.enqueue_home_widget_refresh(61)
+    await snapshots.enqueue_home_widget_refresh(62)
+    assert calls == [(61,), (62,)]
+
+    # The task clears its pending flag before reading, so new changes enqueue again.
+    await snapshots.clear_refresh_pending(61)
+    await snapshots.enqueue_home_widget_refresh(61)
+    assert calls == [(61,), (62,), (61,)]
@@ -638,3 +638,42 @@ async def test_ensure_player_exists_ambiguous_name_creates_new(
     assert result_id is not None
     assert result_id != p1.id
     assert result_id != p2.id
+
+
+@pytest.mark.asyncio
+async def test_sync_live_lineup_sets_has_lineup(
+    test_session: AsyncSession, game_with_players, monkeypatch,
+):
+    """The /em/ live lineup writer keeps has_lineup in the same transaction."""
+    from app.services.live_sync_service import LiveSyncService
+
+    data = game_with_players
+    game: Game = data["game"]
+    game.has_lineup = False
+    await test_session.commit()
+    players = {"home": data["home_players"], "away": data["away_players"]}
+
+    class _LiveLineupClient:
+        async def get_live_team_lineup(self, _sota_uuid: str, side: str):
+            return [
+                {"number": "FORMATION", "first_name": "4-4-2"},
+                {"number": "ОСНОВНЫЕ"},
+                *({"number": i + 1, "id": str(p.sota_id)} for i, p in enumerate(players[side][:11])),
+            ]
+
+    service = LiveSyncService(test_session, _LiveLineupClient())
+
+    async def save(game_id, team_id, player_data, lineup_type, season_id=None):
+        player = next(p for p in players["home"] + players["away"] if str(p.sota_id) == player_data["id"])
+        test_session.add(GameLineup(
+            game_id=game_id, team_id=team_id, player_id=player.id, lineup_type=lineup_type,
+        ))
+        return player.id
+
+    monkeypatch.setattr(service, "_save_player_lineup", save)
+
+    result = await service.sync_live_lineup(game.id)
+
+    assert result["lineup_count"] == 22
+    await test_session.refresh(game)
+    assert game.has_lineup is True
@@ -0,0 +1,134 @@
+from datetime import date
+from uuid import uuid4
+
+import pytest
+
+from app.models import Player, PlayerTeam
+from app.services.fcms_roster_sync import FcmsRosterSyncService
+from app.services.player_identity import PlayerIdentity, PlayerIdentityIndex
+from app.utils.query_profiler import install_query_profiler, profile_queries
+
+
+def _identity(player_id, first_name, last_name, **kwargs):
+    values = dict(
+        id=player_id, sota_id=None, fcms_person_id=None,
+        first_name=first_name, last_name=last_name,
+        first_name_kz=None, last_name_kz=None, first_name_en=None, last_name_en=None,
+        birthday=None,
+    )
+    values.update(kwargs)
+    return PlayerIdentity(**values)
+
+
+def _fcms_player(person_id, fn_ru, ln_ru, number, dob="2000-01-01"):
+    return {
+        "jerseyNumber": str(number),
+        "player": {
+            "personId": person_id,
+            "localFirstName": fn_ru,
+            "localFamilyName": ln_ru,
+            "dateOfBirth": dob,
+        },
+    }
+
+
+def test_find_global_keeps_priority_order():
+    index = PlayerIdentityIndex()
+    index.put(_identity(1, "Азамат", "Жумабаев", birthday=date(1999, 5, 1)))
+    index.put(_identity(2, "Жумабаев", "Азамат"))
+    index.put(_identity(3, "Иван", "Петров", fcms_person_id=77))
+    index.put(_identity(4, "Мансур", "Алихан", first_name_kz="Мансұр", last_name_kz="Әліхан"))
+
+    assert index.find_global("Азамат", "Жумабаев", "", "", 77, None) == (3, "global_fcms_id")
+    assert index.find_global("Азамат", "Жумабаев", "", "", None, None) == (1, "global_name")
+    assert index.find_global("мансұр", "ӘЛІХАН", "", "", None, None) == (4, "global_name")
+    assert index.find_global("Петров", "Иван", "", "", None, None) == (3, "global_name_rev")
+    assert index.find_global("А.", "Жумабаев-Ули", "", "", None, date(1999, 5, 1)) == (None, None)
+    assert index.find_global("А.", "Жумабаев", "", "", None, date(1999, 5, 1)) == (1, "global_dob+name")
+    # Transliterated spellings are not auto-linked.
+    assert index.find_global("", "", "Ivan", "Petrov", None, None) == (None, None)
+    assert index.find_global("", "", "Nobody", "Known", None, None) == (None, None)
+
+
+def test_put_reindexes_changed_identifiers():
+    index = PlayerIdentityIndex()
+    old_sota, new_sota = uuid4(), uuid4()
+    index.put(_identity(1, "Мансур", "Алихан", sota_id=old_sota, fcms_person_id=5))
+
+    index.put(_identity(1, "Мансур", "Алиханов", sota_id=new_sota, fcms_person_id=6))
+
+    assert index.by_sota_id(old_sota) is None
+    assert index.by_sota_id(new_sota) == 1
+    assert index.by_fcms_person_id(5) is None
+    assert index.by_name("Алихан", "Мансур") is None
+    assert index.by_name("Алиханов", "Мансур") == 1
+
+
+@pytest.mark.asyncio
+async def test_roster_and_lineup_lookups(test_session, sample_season, sample_teams, sample_game):
+    team_id, season_id = sample_teams[0].id, sample_season.id
+    linked = Player(first_name="Мансур", last_name="Алихан", sota_id=uuid4())
+    unlinked = Player(first_name="Азамат", last_name="Жумабаев", first_name_kz="Әзамат")
+    test_session.add_all([linked, unlinked])
+    await test_session.flush()
+    test_session.add_all([
+        PlayerTeam(player_id=linked.id, team_id=team_id, season_id=season_id, number=7, is_active=True),
+        PlayerTeam(player_id=unlinked.id, team_id=team_id, season_id=season_id, number=9,
+                   is_active=True, is_hidden=True),
+    ])
+    await test_session.commit()
+
+    index = PlayerIdentityIndex()
+    await index.load_sota_ids(test_session, [linked.sota_id])
+    await index.load_rosters(test_session, season_id, [team_id])
+
+    assert index.by_sota_id(linked.sota_id) == linked.id
+    assert index.find_unlinked_in_roster(team_id, season_id, "Азамат", "Жумабаев") == unlinked.id
+    assert index.find_unlinked_in_roster(team_id, season_id, "Мансур", "Алихан") is None
+    assert index.find_by_number(team_id, season_id, 7) == linked.id
+    assert index.find_by_number(team_id, season_id, 9) is None  # hidden contract
+
+    from app.models import GameLineup, LineupType
+
+    test_session.add(GameLineup(
+        game_id=sample_game.id, team_id=team_id, player_id=unlinked.id, lineup_type=LineupType.starter,
+    ))
+    await test_session.commit()
+    await index.load_lineup(test_session, sample_game.id)
+    assert index.find_in_lineup(sample_game.id, "Әзамат", "Жумабаев") == unlinked.id
+    assert index.find_in_lineup(sample_game.id, "Әзамат", "Жумабаев", sample_teams[1].id) is None
+    assert index.lineup_team_ids(sample_game.id, unlinked.id) == {team_id}
+
+
+@pytest.mark.asyncio
+async def test_fcms_roster_sync_matches_globally_without_per_player_queries(
+    test_session, sample_season, sample_teams
+):
+    install_query_profiler()
+    team, other_team = sample_teams[0], sample_teams[1]
+    elsewhere = Player(first_name="Азамат", last_name="Жумабаев")
+    known_id = Player(first_name="Иван", last_name="Петров", fcms_person_id=501)
+    test_session.add_all([elsewhere, known_id])
+    await test_session.flush()
+    test_session.add(PlayerTeam(
+        player_id=elsewhere.id, team_id=other_team.id, season_id=sample_season.id, number=4, is_active=True,
+    ))
+    await test_session.commit()
+
+    fcms_players = [
+        _fcms_player(500, "Азамат", "Жумабаев", 10),
+        _fcms_player(501, "Иван", "Петров", 11),
+    ] + [_fcms_player(600 + n, f"Новый{n}", f"Игрок{n}", 20 + n) for n in range(6)]
+
+    service = FcmsRosterSyncService(test_session, client=None)
+    with profile_queries("fcms roster") as profile:
+        changes = await service.sync_team_roster(team, fcms_players, sample_season.id)
+
+    assert changes["matched"] == 2
+    assert len(changes["new_players"]) == 6
+    await test_session.refresh(elsewhere)
+    assert elsewhere.fcms_person_id == 500  # global_name is a strong match
+    # Local roster plus two index loads up front (and at most a db.get per
+    # matched player); no SELECT per lookup tier per FCMS player.
+    selects = sum(n for sql, n in profile.statements.items() if sql.lstrip().upper().startswith("SELECT"))
+    assert selects <= 5, profile.statements
@@ -0,0 +1,70 @@
+"""Tests for the in-process reference-data snapshot."""
+
+import pytest
+
+from app.models import Country, Team
+from app.services import reference_data
+from app.services.reference_data import bump_reference_version, get_reference_snapshot
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_snapshot_pre_resolves_logo_fallback(test_session, sample_teams):
+    refs = await get_reference_snapshot(test_session)
+
+    assert refs.teams[91].name == "Astana"
+    assert refs.teams[91].logo_url == "/api/v1/files/teams/astana/logo"
+    assert refs is await get_reference_snapshot(test_session, teams=[91, 13, None])
+
+
+async def test_missing_reference_row_triggers_one_reload(test_session, sample_teams):
+    refs = await get_reference_snapshot(test_session)
+    test_session.add_all([Team(id=500, name="Ulytau"), Country(code="KZ", name="Казахстан")])
+    await test_session.commit()
+
+    fresh = await get_reference_snapshot(test_session, teams=[500])
+
+    assert fresh is not refs
+    assert fresh.teams[500].name == "Ulytau"
+    assert [c.code for c in fresh.countries.values()] == ["KZ"]
+
+
+async def test_version_bump_in_another_process_reloads(test_session, sample_teams, monkeypatch):
+    remote = {"version": "1"}
+
+    async def fake_remote_version():
+        return remote["version"]
+
+    monkeypatch.setattr(reference_data, "_remote_version", fake_remote_version)
+    refs = await get_reference_snapshot(test_session)
+    assert refs.version == "1"
+
+    team = await test_session.get(Team, 91)
+    team.name = "Astana FC"
+    await test_session.commit()
+    remote["version"] = "2"
+    monkeypatch.setattr(reference_data, "_checked_at", 0)
+
+    fresh = await get_reference_snapshot(test_session)
+    assert fresh.version == "2"
+    assert fresh.teams[91].name == "Astana FC"
+
+
+async def test_bump_drops_local_snapshot_when_redis_is_down(test_session, sample_teams):
+    refs = await get_reference_snapshot(test_session)
+
+    await bump_reference_version()
+
+    assert await get_reference_snapshot(test_session) is not refs
+
+
+async def test_country_admin_write_refreshes_snapshot(client, test_session):
+    country = Country(code="KZ", name="Казахстан")
+    test_session.add(country)
+    await test_session.commit()
+    assert (await get_reference_snapshot(test_session)).countries[country.id].name == "Казахстан"
+
+    response = await client.put(f"/api/v1/countries/{country.id}", json={"name": "Қазақстан"})
+    assert response.status_code == 200
+
+    assert (await get_reference_snapshot(test_session)).countries[country.id].name == "Қазақстан"
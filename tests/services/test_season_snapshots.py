@@ -0,0 +1,175 @@
+"""Tests for prebuilt season results-grid and bracket snapshots."""
+
+import json
+
+import pytest
+
+from app.models import GameStatus, SeasonParticipant
+from app.services import season_snapshots as snapshots
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.ttls: dict[str, int | None] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.values:
+            return None
+        self.values[key] = value if isinstance(value, bytes) else str(value).encode()
+        self.ttls[key] = ex
+        return True
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+            self.ttls.pop(key, None)
+
+    async def eval(self, _script, _numkeys, key, token):
+        # CAS delete of app.utils.redis_lock.
+        if self.values.get(key) == token.encode():
+            await self.delete(key)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+
+    async def _get():
+        return redis
+
+    monkeypatch.setattr(snapshots, "_redis", _get)
+    monkeypatch.setattr("app.utils.live_flag.get_redis", _get)
+    return redis
+
+
+@pytest.fixture
+def enqueued(monkeypatch):
+    from app.tasks import sync_tasks
+
+    calls: list[int] = []
+    monkeypatch.setattr(
+        sync_tasks.build_season_snapshots_task, "apply_async",
+        lambda args, countdown: calls.append(args[0]),
+    )
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_build_writes_every_variant_and_language(test_session, sample_season, sample_teams, sample_game, fake_redis):
+    sample_game.status = GameStatus.finished
+    test_session.add_all(
+        [
+            SeasonParticipant(team_id=91, season_id=61, group_name="A"),
+            SeasonParticipant(team_id=13, season_id=61, group_name="A"),
+            SeasonParticipant(team_id=90, season_id=61, group_name="B"),
+        ]
+    )
+    await test_session.commit()
+    stale = snapshots.season_snapshot_key(61, snapshots.RESULTS_GRID, "group:C", "kz")
+    fake_redis.values[snapshots._manifest_key(61)] = json.dumps([stale]).encode()
+    fake_redis.values[stale] = b"{}"
+
+    # Whole season + groups A and B, season bracket, cup bracket; no final stages.
+    assert await snapshots.build_season_snapshots(test_session, 61) == 5 * 3
+
+    grid = json.loads(fake_redis.values[snapshots.season_snapshot_key(61, snapshots.RESULTS_GRID, "group:A", "ru")])
+    assert {team["team_id"]: team["results"][0] for team in grid["teams"]} == {91: "W", 13: "L"}
+    bracket = fake_redis.values[snapshots.season_snapshot_key(61, snapshots.SEASON_BRACKET, "", "en")]
+    assert json.loads(bracket) == {"season_id": 61, "rounds": []}
+    assert fake_redis.values[snapshots.season_snapshot_key(61, snapshots.CUP_BRACKET, "", "kz")] == b"null"
+    # Stored for a day; variants that disappeared are dropped.
+    assert set(fake_redis.ttls.values()) == {snapshots._SNAPSHOT_TTL}
+    assert stale not in fake_redis.values
+
+
+@pytest.mark.asyncio
+async def test_read_serves_snapshot_without_rendering(fake_redis, monkeypatch):
+    key = snapshots.season_snapshot_key(61, snapshots.RESULTS_GRID, "final", "kz")
+    fake_redis.values[key] = b'{"ready":true}'
+
+    async def must_not_render(*_args, **_kwargs):
+        raise AssertionError("request path rendered the snapshot")
+
+    monkeypatch.setattr(snapshots, "_render", must_not_render)
+
+    body = await snapshots.read_season_snapshot(
+        None, 61, snapshots.RESULTS_GRID, "kz", variant=snapshots.grid_variant(final=True),
+    )
+    assert body == b'{"ready":true}'
+
+
+@pytest.mark.asyncio
+async def test_read_miss_renders_inline_and_enqueues_unbuilt_season(fake_redis, enqueued, monkeypatch):
+    async def render(_db, season_id, kind, variant, lang):
+        return f'"{season_id}/{kind}/{variant}/{lang}"'.encode()
+
+    monkeypatch.setattr(snapshots, "_render", render)
+
+    assert await snapshots.read_season_snapshot(None, 61, snapshots.SEASON_BRACKET, "ru") == b'"61/bracket//ru"'
+    assert enqueued == [61]
+
+    # Built season: an unknown variant is rendered inline only.
+    fake_redis.values[snapshots._manifest_key(62)] = b"[]"
+    body = await snapshots.read_season_snapshot(
+        None, 62, snapshots.RESULTS_GRID, "kz", variant=snapshots.grid_variant(group="Z"),
+    )
+    assert body == b'"62/results_grid/group:Z/kz"'
+    assert enqueued == [61]
+    assert snapshots.season_snapshot_key(62, snapshots.RESULTS_GRID, "group:Z", "kz") not in fake_redis.values
+
+
+@pytest.mark.asyncio
+async def test_enqueue_is_debounced_per_season(fake_redis, enqueued):
+    await snapshots.enqueue_season_snapshot_build(61)
+    await snapshots.enqueue_season_snapshot_build(61)
+    await snapshots.enqueue_season_snapshot_build(None)
+    assert enqueued == [61]
+
+    await snapshots.clear_build_pending(61)
+    await snapshots.enqueue_season_snapshot_build(61)
+    assert enqueued == [61, 61]
+
+
+@pytest.mark.asyncio
+async def test_rebuild_waits_for_a_running_build_of_the_season(fake_redis, enqueued, monkeypatch):
+    built: list[int] = []
+
+    async def build(_db, season_id):
+        built.append(season_id)
+        return 1
+
+    monkeypatch.setattr(snapshots, "build_season_snapshots", build)
+    lock_key = f"{snapshots._BUILD_LOCK_PREFIX}:61"
+    fake_redis.values[lock_key] = b"running-build"
+    await snapshots.enqueue_season_snapshot_build(61)
+    assert enqueued == [61]
+
+    # The build reschedules itself and keeps its pending flag.
+    assert await snapshots.rebuild_season_snapshots(None, 61) is None
+    assert enqueued == [61, 61]
+    assert snapshots._pending_key(61) in fake_redis.values
+    assert built == []
+
+    del fake_redis.values[lock_key]
+    assert await snapshots.rebuild_season_snapshots(None, 61) == 1
+    assert built == [61]
+    assert snapshots._pending_key(61) not in fake_redis.values
+    assert lock_key not in fake_redis.values
+
+
+@pytest.mark.asyncio
+async def test_team_edit_enqueues_every_season_of_the_team(
+    test_session, sample_season, sample_teams, sample_game, fake_redis, enqueued,
+):
+    test_session.add(SeasonParticipant(team_id=sample_game.home_team_id, season_id=61))
+    await test_session.commit()
+
+    await snapshots.enqueue_team_season_snapshot_builds(test_session, sample_game.away_team_id)
+    assert enqueued == [61]
+    # A team with no games or participations has nothing to rebuild.
+    await snapshots.enqueue_team_season_snapshot_builds(test_session, 999999)
+    assert enqueued == [61]
@@ -0,0 +1,134 @@
+import asyncio
+
+import pytest
+
+from app.services import sota_cache
+from app.services.sota_cache import (
+    NOT_MODIFIED,
+    CachedResponse,
+    SotaResponseCache,
+    parse_ttl_overrides,
+)
+
+
+class FakeRedis:
+    def __init__(self):
+        self.data: dict[str, str] = {}
+        self.hashes: dict[str, dict[str, int]] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+
+    async def hincrby(self, key, field, amount):
+        bucket = self.hashes.setdefault(key, {})
+        bucket[field] = bucket.get(field, 0) + amount
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+def _cache(redis, **ttls) -> SotaResponseCache:
+    async def getter():
+        return redis
+    return SotaResponseCache(ttls or {"games": 100}, redis_getter=getter)
+
+
+class Loader:
+    def __init__(self, body=None, etag=None, delay=0.0):
+        self.body = body if body is not None else {"items": [1, 2]}
+        self.etag = etag
+        self.delay = delay
+        self.calls: list[dict] = []
+        self.not_modified = False
+
+    async def __call__(self, conditional):
+        self.calls.append(conditional)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.not_modified and conditional:
+            return NOT_MODIFIED
+        return CachedResponse(self.body, etag=self.etag)
+
+
+@pytest.mark.asyncio
+async def test_fresh_entry_is_served_without_request():
+    redis = FakeRedis()
+    cache = _cache(redis)
+    loader = Loader()
+
+    first = await cache.fetch("games", "u", {"season_id": 1}, "ru", loader)
+    second = await cache.fetch("games", "u", {"season_id": 1}, "ru", loader)
+    other_lang = await cache.fetch("games", "u", {"season_id": 1}, "kz", loader)
+
+    assert first == second == other_lang == {"items": [1, 2]}
+    assert len(loader.calls) == 2  # ru once, kz once
+    assert cache.local_stats()["games"] == {"miss": 2, "hit": 1}
+    assert (await cache.shared_stats())["games"] == {"miss": 2, "hit": 1}
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_with_etag_is_revalidated(monkeypatch):
+    redis = FakeRedis()
+    cache = _cache(redis)
+    loader = Loader(etag='"v1"')
+    now = [1000.0]
+    monkeypatch.setattr(sota_cache.time, "time", lambda: now[0])
+
+    await cache.fetch("games", "u", None, "ru", loader)
+    now[0] += 500  # past the 100s TTL
+    loader.not_modified = True
+    body = await cache.fetch("games", "u", None, "ru", loader)
+
+    assert body == {"items": [1, 2]}
+    assert loader.calls == [{}, {"If-None-Match": '"v1"'}]
+    assert cache.local_stats()["games"] == {"miss": 1, "revalidated": 1}
+
+    # The 304 refreshed the entry's age: served from cache again.
+    await cache.fetch("games", "u", None, "ru", loader)
+    assert len(loader.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_calls_share_one_request():
+    cache = _cache(FakeRedis())
+    loader = Loader(delay=0.02)
+
+    results = await asyncio.gather(
+        *(cache.fetch("games", "u", {"season_id": 1}, "ru", loader) for _ in range(5))
+    )
+
+    assert len(loader.calls) == 1
+    assert all(r == {"items": [1, 2]} for r in results)
+    # Waiters get their own copy — in-place post-processing can't leak.
+    assert len({id(r) for r in results}) == 5
+    assert cache.local_stats()["games"] == {"coalesced": 4, "miss": 1}
+
+
+@pytest.mark.asyncio
+async def test_uncached_endpoint_and_missing_redis_go_straight_to_sota():
+    loader = Loader()
+    cache = _cache(FakeRedis(), games=0)
+    await cache.fetch("games", "u", None, "ru", loader)
+    await cache.fetch("games", "u", None, "ru", loader)
+    assert len(loader.calls) == 2
+    assert cache.local_stats() == {}
+
+    async def broken():
+        raise ConnectionError("redis down")
+
+    cache = SotaResponseCache({"games": 100}, redis_getter=broken)
+    loader = Loader()
+    assert await cache.fetch("games", "u", None, "ru", loader) == {"items": [1, 2]}
+    assert await cache.fetch("games", "u", None, "ru", loader) == {"items": [1, 2]}
+    assert len(loader.calls) == 2
+
+
+def test_parse_ttl_overrides_ignores_garbage():
+    assert parse_ttl_overrides("games=60, score_table=0,bad,x=y,players=-5") == {
+        "games": 60,
+        "score_table": 0,
+        "players": 0,
+    }
@@ -0,0 +1,127 @@
+import asyncio
+
+import pytest
+from sqlalchemy.exc import OperationalError
+
+from app.services.sync import SyncOrchestrator
+from app.services.sync.dag import SyncDagExecutor, SyncNode
+
+
+class _FakeSession:
+    def __init__(self, log: list[str]):
+        self.log = log
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def commit(self):
+        self.log.append("commit")
+
+    async def rollback(self):
+        self.log.append("rollback")
+
+
+def _factory(log: list[str]):
+    return lambda: _FakeSession(log)
+
+
+@pytest.mark.asyncio
+async def test_dependents_wait_for_inputs_and_siblings_overlap():
+    order: list[str] = []
+    running = 0
+    peak = 0
+
+    def step(name: str, delay: float = 0.02):
+        async def _run(db):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            order.append(f"start:{name}")
+            await asyncio.sleep(delay)
+            order.append(f"end:{name}")
+            running -= 1
+            return name
+        return _run
+
+    nodes = [
+        SyncNode("a:games", step("a:games")),
+        SyncNode("b:games", step("b:games")),
+        SyncNode("a:stats", step("a:stats"), deps=("a:games",)),
+        SyncNode("b:stats", step("b:stats"), deps=("b:games",)),
+    ]
+    report = await SyncDagExecutor(_factory([]), sota_concurrency=4, db_concurrency=4).run(nodes)
+
+    assert report.failed == []
+    assert order.index("end:a:games") < order.index("start:a:stats")
+    assert order.index("end:b:games") < order.index("start:b:stats")
+    assert peak == 2
+    assert report.result_of("b:stats") == "b:stats"
+
+
+@pytest.mark.asyncio
+async def test_concurrency_cap_is_respected():
+    running = 0
+    peak = 0
+
+    async def _run(db):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    nodes = [SyncNode(f"n{i}", _run) for i in range(6)]
+    await SyncDagExecutor(_factory([]), sota_concurrency=2, db_concurrency=4).run(nodes)
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_node_rolls_back_and_skips_dependents():
+    log: list[str] = []
+
+    async def _boom(db):
+        raise OperationalError("UPDATE", {}, Exception("lock timeout"))
+
+    async def _ok(db):
+        return 1
+
+    nodes = [
+        SyncNode("games", _boom),
+        SyncNode("stats", _ok, deps=("games",)),
+        SyncNode("other", _ok),
+    ]
+    report = await SyncDagExecutor(_factory(log)).run(nodes)
+    by_name = {n.name: n for n in report.nodes}
+
+    assert by_name["games"].status == "failed"
+    assert by_name["stats"].status == "skipped"
+    assert by_name["other"].status == "ok"
+    assert log.count("rollback") == 1
+    assert log.count("commit") == 1
+    assert isinstance(report.first_exception(OperationalError), OperationalError)
+    assert report.as_dict()["counts"] == {"ok": 1, "failed": 1, "skipped": 1}
+
+
+@pytest.mark.asyncio
+async def test_cycle_is_rejected():
+    async def _ok(db):
+        return None
+
+    with pytest.raises(ValueError):
+        await SyncDagExecutor(_factory([])).run(
+            [SyncNode("a", _ok, deps=("b",)), SyncNode("b", _ok, deps=("a",))]
+        )
+
+
+def test_full_sync_nodes_declare_step_dependencies():
+    nodes = {n.name: n for n in SyncOrchestrator.full_sync_nodes(200, client=object())}
+
+    assert nodes["season:200:games"].deps == ()
+    assert nodes["season:200:team_season_stats"].deps == ("season:200:games",)
+    assert nodes["season:200:player_season_stats"].deps == ("season:200:games",)
+    assert nodes["season:200:best_players"].deps == ("season:200:player_season_stats",)
+    assert nodes["season:200:team_of_week"].deps == ("season:200:games",)
@@ -0,0 +1,198 @@
+from dataclasses import replace
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.models.sync_job import SyncJob, SyncJobUnit
+from app.services import sync_jobs
+from app.services.sync_jobs import (
+    SyncJobKind,
+    completed_unit_results,
+    create_job,
+    job_summary,
+    list_job_summaries,
+    pause_job,
+    resume_job,
+    run_job_slice,
+)
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    return async_sessionmaker(
+        test_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False,
+    )
+
+
+@pytest.fixture
+def job_kind(monkeypatch):
+    """Register a throwaway kind: units ``item:0..n-1`` plus a fan-in ``total``."""
+    calls: list[str] = []
+    failures: dict[str, int] = {}
+    completed: list[int] = []
+
+    async def plan(_db, params):
+        return [f"item:{i}" for i in range(params["n"])] + ["total"]
+
+    async def run_unit(ctx):
+        calls.append(ctx.unit_key)
+        if failures.get(ctx.unit_key, 0) > 0:
+            failures[ctx.unit_key] -= 1
+            raise RuntimeError(f"boom {ctx.unit_key}")
+        if ctx.unit_key == "total":
+            async with ctx.session_factory() as db:
+                done = await completed_unit_results(db, ctx.job_id, prefix="item:")
+            return {"sum": sum(r["value"] for r in done.values())}
+        return {"value": int(ctx.unit_key.split(":")[1])}
+
+    async def on_complete(job):
+        completed.append(job.id)
+
+    monkeypatch.setattr(sync_jobs, "_KINDS", {})
+    sync_jobs.register_job_kind(SyncJobKind(
+        name="test_kind", plan=plan, run_unit=run_unit, on_complete=on_complete, max_attempts=2,
+    ))
+    return calls, failures, completed
+
+
+async def _start(session_factory, n: int) -> int:
+    async with session_factory() as db:
+        job = await create_job(db, "test_kind", {"n": n}, triggered_by="test")
+        await db.commit()
+        return job.id
+
+
+@pytest.mark.asyncio
+async def test_slice_checkpoints_and_next_slice_resumes(session_factory, job_kind, monkeypatch):
+    calls, _failures, completed = job_kind
+    job_id = await _start(session_factory, 3)
+
+    # Every unit "takes" 3s, so a 5s budget stops after two units and the
+    # next slice must pick up at item:2.
+    clock = [0.0]
+    monkeypatch.setattr(sync_jobs, "time", SimpleNamespace(monotonic=lambda: clock[0]))
+
+    kind = sync_jobs.get_job_kind("test_kind")
+
+    async def slow(ctx):
+        clock[0] += 3
+        return await kind.run_unit(ctx)
+
+    sync_jobs.register_job_kind(replace(kind, run_unit=slow))
+    status = await run_job_slice(job_id, session_factory=session_factory, budget_seconds=5)
+    assert status == "running"
+    assert calls == ["item:0", "item:1"]
+
+    status = await run_job_slice(job_id, session_factory=session_factory, budget_seconds=60)
+
+    assert status == "completed"
+    assert calls == ["item:0", "item:1", "item:2", "total"]
+    assert completed == [job_id]
+    async with session_factory() as db:
+        summary = await job_summary(db, job_id)
+        total = await db.scalar(
+            select(SyncJobUnit.result).where(
+                SyncJobUnit.job_id == job_id, SyncJobUnit.unit_key == "total"
+            )
+        )
+    assert summary["units_done"] == 4
+    assert summary["slices"] == 2
+    assert total == {"sum": 3}
+
+
+@pytest.mark.asyncio
+async def test_pause_stops_between_units_and_resume_continues(session_factory, job_kind):
+    calls, _failures, _completed = job_kind
+    job_id = await _start(session_factory, 2)
+
+    async with session_factory() as db:
+        await pause_job(db, job_id)
+        await db.commit()
+    assert await run_job_slice(job_id, session_factory=session_factory, budget_seconds=60) == "paused"
+    assert calls == []
+
+    async with session_factory() as db:
+        await resume_job(db, job_id)
+        await db.commit()
+    assert await run_job_slice(job_id, session_factory=session_factory, budget_seconds=60) == "completed"
+    assert calls == ["item:0", "item:1", "total"]
+
+
+@pytest.mark.asyncio
+async def test_failing_unit_is_retried_then_given_up(session_factory, job_kind):
+    calls, failures, _completed = job_kind
+    failures["item:0"] = 5
+    failures["item:1"] = 1
+    job_id = await _start(session_factory, 2)
+
+    assert await run_job_slice(job_id, session_factory=session_factory, budget_seconds=60) == "completed"
+
+    # item:1 succeeded on its second attempt; item:0 hit max_attempts=2.
+    assert calls.count("item:0") == 2
+    assert calls.count("item:1") == 2
+    async with session_factory() as db:
+        summary = await job_summary(db, job_id)
+        job = await db.get(SyncJob, job_id)
+    assert summary["units_failed"] == 1
+    assert summary["failed_units"][0]["unit_key"] == "item:0"
+    assert job.error_message == "1 of 3 units failed"
+
+    failures.clear()
+    async with session_factory() as db:
+        await resume_job(db, job_id, retry_failed=True)
+        await db.commit()
+    assert await run_job_slice(job_id, session_factory=session_factory, budget_seconds=60) == "completed"
+    async with session_factory() as db:
+        summary = await job_summary(db, job_id)
+    assert summary["units_failed"] == 0
+    assert summary["units_done"] == 3
+
+
+@pytest.mark.asyncio
+async def test_unit_that_kept_killing_the_worker_is_given_up(session_factory, job_kind):
+    calls, _failures, _completed = job_kind
+    job_id = await _start(session_factory, 1)
+
+    # Simulate two slices that died mid-unit: attempts bumped, never checkpointed.
+    async with session_factory() as db:
+        unit = await db.scalar(select(SyncJobUnit).where(SyncJobUnit.unit_key == "item:0"))
+        unit.attempts = 2
+        await db.commit()
+
+    assert await run_job_slice(job_id, session_factory=session_factory, budget_seconds=60) == "completed"
+    assert calls == ["total"]
+    async with session_factory() as db:
+        summary = await job_summary(db, job_id)
+    assert summary["failed_units"][0]["error"].startswith("gave up after 2 attempts")
+
+
+@pytest.mark.asyncio
+async def test_list_job_summaries_loads_the_page_in_two_queries(session_factory, test_engine, job_kind):
+    from sqlalchemy import event
+
+    done_id = await _start(session_factory, 1)
+    assert await run_job_slice(done_id, session_factory=session_factory, budget_seconds=60) == "completed"
+    pending_ids = [await _start(session_factory, 2) for _ in range(2)]
+
+    statements: list[str] = []
+
+    def _record(*args):
+        statements.append(args[2])
+
+    event.listen(test_engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        async with session_factory() as db:
+            items = await list_job_summaries(db, limit=10)
+    finally:
+        event.remove(test_engine.sync_engine, "before_cursor_execute", _record)
+
+    assert len(statements) == 2, statements
+    assert [item["id"] for item in items] == [*reversed(pending_ids), done_id]
+    assert [item["next_unit"] for item in items] == ["item:0", "item:0", None]
+    assert all(item["failed_units"] == [] for item in items)
@@ -11,6 +11,7 @@ write refactor:
 from types import SimpleNamespace
 
 import pytest
+from sqlalchemy.dialects import postgresql
 
 from app.services.sync.game_sync import GameSyncService
 from app.services.sync.guardrails import dead_season_cache_key
@@ -270,6 +271,9 @@ class QueueSpyDB:
 
         return _Ctx()
 
+    def get_bind(self):
+        return SimpleNamespace(dialect=SimpleNamespace(name="postgresql"))
+
     async def commit(self):
         self.in_tx = False
         self.ops.append("commit")
@@ -351,26 +355,28 @@ async def test_game_v2_enrichment_fetch_sees_no_open_transaction():
 
 
 class OrderRecordingDB(QueueSpyDB):
-    """Captures the row id targeted by each UPDATE (from the compiled WHERE bind)."""
+    """Captures the row ids locked by the bulk writer's SELECT ... FOR UPDATE."""
 
     def __init__(self, read_results):
         super().__init__(read_results)
-        self.update_ids: list[int] = []
+        self.locked_ids: list[int] = []
+        self.update_count = 0
 
     async def execute(self, stmt, params=None):
-        if "update" in type(stmt).__name__.lower():
-            compiled = stmt.compile()
-            for k, v in compiled.params.items():
-                if k.startswith("id"):
-                    self.update_ids.append(v)
-                    break
+        kind = type(stmt).__name__.lower()
+        if "update" in kind:
+            self.update_count += 1
+        elif "select" in kind:
+            compiled = stmt.compile(dialect=postgresql.dialect())
+            if "ORDER BY" in str(compiled) and "FOR UPDATE" in str(compiled):
+                self.locked_ids.extend(next(iter(compiled.params.values())))
         return await super().execute(stmt, params)
 
 
 @pytest.mark.asyncio
 async def test_v2_enrichment_writes_in_ascending_id_order():
-    # Rows arrive shuffled; UPDATEs must still go out in ascending id order so
-    # two concurrent enrichments of the same game can't deadlock.
+    # Rows arrive shuffled; row locks must still be taken in ascending id order
+    # so two concurrent enrichments of the same game can't deadlock.
     rows = [
         (30, {}, None, None, "sota-30"),
         (10, {}, None, None, "sota-10"),
@@ -382,7 +388,8 @@ async def test_v2_enrichment_writes_in_ascending_id_order():
 
     await service._enrich_with_v2_stats(1, "game-uuid")
 
-    assert db.update_ids == [10, 20, 30]
+    assert db.locked_ids == [10, 20, 30]
+    assert db.update_count == 1
 
 
 @pytest.mark.asyncio
@@ -400,7 +407,8 @@ async def test_em_enrichment_writes_in_ascending_id_order():
 
     await service._enrich_player_stats_from_em(1, "game-uuid")
 
-    assert db.update_ids == [10, 20, 30]
+    assert db.locked_ids == [10, 20, 30]
+    assert db.update_count == 1
 
 
 @pytest.mark.asyncio
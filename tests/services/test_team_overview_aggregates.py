@@ -0,0 +1,97 @@
+"""Tests for the per-team season aggregates behind the team overview."""
+
+import json
+from datetime import date, time
+from uuid import uuid4
+
+import pytest
+
+from app.models import Game, Player, PlayerSeasonStats, PlayerTeam
+from app.services import team_overview_aggregates as aggregates
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.values[key] = value
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+
+    async def _get():
+        return redis
+
+    monkeypatch.setattr(aggregates, "_redis", _get)
+    return redis
+
+
+def _upcoming(day: int, kickoff: time) -> Game:
+    return Game(
+        sota_id=uuid4(),
+        date=date(2025, 6, day),
+        time=kickoff,
+        tour=day,
+        season_id=61,
+        home_team_id=13,
+        away_team_id=90,
+    )
+
+
+def test_top_ids_keeps_ties_at_cutoff():
+    rows = [
+        {"player_id": 1, "goal": 3, "games_played": 10},
+        {"player_id": 2, "goal": 5, "games_played": 10},
+        {"player_id": 3, "goal": 3, "games_played": 10},
+        {"player_id": 4, "goal": 1, "games_played": 10},
+    ]
+
+    def key(row):
+        return row["goal"], row["games_played"]
+
+    assert aggregates._top_ids(rows, key, 2) == [2, 1, 3]
+    assert aggregates._top_ids(rows, key, 5) == [2, 1, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_build_aggregate(test_session, sample_teams, sample_season, sample_game):
+    later, sooner = _upcoming(20, time(18, 0)), _upcoming(10, time(15, 0))
+    keeper, striker = Player(first_name="Keeper", last_name="One"), Player(first_name="Striker", last_name="Two")
+    test_session.add_all([later, sooner, keeper, striker])
+    await test_session.flush()
+    test_session.add_all(
+        [
+            PlayerTeam(player_id=keeper.id, team_id=13, season_id=61, amplua=1),
+            PlayerSeasonStats(player_id=keeper.id, team_id=13, season_id=61, games_played=3, games_starting=3),
+            PlayerSeasonStats(player_id=striker.id, team_id=13, season_id=61, games_played=3, goal=4),
+        ]
+    )
+    await test_session.commit()
+
+    aggregate = await aggregates.build_team_overview_aggregate(test_session, 13, 61)
+
+    # No TeamSeasonStats yet: W/D/L from the finished 2-1 away defeat.
+    assert aggregate["summary"]["games_played"] == 1
+    assert aggregate["summary"]["match_loss"] == 1
+    assert aggregate["summary"]["goals_conceded"] == 2
+    assert aggregate["form_game_ids"] == [sample_game.id]
+    assert aggregate["upcoming_game_ids"] == [sooner.id, later.id]
+    assert aggregate["leaders"]["goal"][0] == striker.id
+    assert aggregate["leaders"]["gk"] == [keeper.id]
+    assert aggregate["leaders"]["fwd"] == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_stores_every_season_team(test_session, sample_teams, sample_season, sample_game, fake_redis):
+    assert await aggregates.refresh_team_overview_aggregates(test_session, 61) == 2
+
+    stored = fake_redis.values[aggregates.team_overview_aggregate_key(61, 91)]
+    assert json.loads(stored)["summary"]["win"] == 1
+    # Readers get the stored record without touching the database.
+    assert await aggregates.get_team_overview_aggregate(None, 91, 61) == json.loads(stored)
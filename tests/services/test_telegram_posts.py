@@ -1,13 +1,15 @@
 """Unit tests for app.services.telegram_posts."""
-from datetime import date, datetime, time
+from datetime import date, datetime, time, timedelta
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from sqlalchemy import select
 
 from app.models import Game, GameEvent, Team
 from app.models.game import GameStatus
 from app.models.game_event import GameEventType
 from app.services import telegram_posts as tp
+from app.utils.timestamps import utcnow
 
 
 # ---------- Pure helpers ---------- #
@@ -359,3 +361,188 @@ async def test_post_match_start_no_send_on_http_failure(test_session, sample_pub
     assert ok is False
     await test_session.refresh(sample_public_game)
     assert sample_public_game.start_telegram_sent_at is None
+
+
+# ---------- Per-game outbox ---------- #
+
+class _FakeSender:
+    def __init__(self, reject_minutes=()):
+        self.reject_minutes = set(reject_minutes)
+        self.sent: list[tuple[str, int | None]] = []
+
+    async def send(self, text_html, reply_to=None):
+        if any(f" {m}'" in text_html for m in self.reject_minutes):
+            return None
+        self.sent.append((text_html, reply_to))
+        return 1000 + len(self.sent)
+
+
+@pytest.mark.asyncio
+async def test_post_game_events_posts_batch_in_match_order(test_session, sample_public_game):
+    sample_public_game.lineup_telegram_message_id = 77
+    events = [
+        GameEvent(game_id=sample_public_game.id, half=2, minute=70,
+                  event_type=GameEventType.red_card, player_name="A Late"),
+        GameEvent(game_id=sample_public_game.id, half=1, minute=10,
+                  event_type=GameEventType.goal, player_name="B Early"),
+        GameEvent(game_id=sample_public_game.id, half=1, minute=30,
+                  event_type=GameEventType.yellow_card, player_name="C Ignored"),
+        GameEvent(game_id=sample_public_game.id, half=1, minute=20,
+                  event_type=GameEventType.goal, player_name="D Done",
+                  telegram_sent_at=datetime(2026, 5, 1, 18, 20)),
+    ]
+    test_session.add_all(events)
+    await test_session.commit()
+
+    sender = _FakeSender()
+    posted = await tp.post_game_events(test_session, sample_public_game.id, sender)
+
+    assert posted == 2
+    assert ["Early" in sender.sent[0][0], "Late" in sender.sent[1][0]] == [True, True]
+    assert {reply_to for _, reply_to in sender.sent} == {77}
+    for ev in events:
+        await test_session.refresh(ev)
+    assert events[0].telegram_message_id == 1002
+    assert events[1].telegram_message_id == 1001
+    assert events[2].telegram_sent_at is None
+
+    # Nothing left: a second run is a no-op.
+    assert await tp.post_game_events(test_session, sample_public_game.id, _FakeSender()) == 0
+
+
+@pytest.mark.asyncio
+async def test_post_game_events_leaves_rejected_event_unsent(test_session, sample_public_game):
+    test_session.add_all([
+        GameEvent(game_id=sample_public_game.id, half=1, minute=5,
+                  event_type=GameEventType.goal, player_name="A Rejected"),
+        GameEvent(game_id=sample_public_game.id, half=1, minute=9,
+                  event_type=GameEventType.goal, player_name="B Posted"),
+    ])
+    await test_session.commit()
+
+    sender = _FakeSender(reject_minutes=[5])
+    assert await tp.post_game_events(test_session, sample_public_game.id, sender) == 1
+
+    rows = (await test_session.execute(
+        select(GameEvent.minute, GameEvent.telegram_sent_at).order_by(GameEvent.minute)
+    )).all()
+    assert rows[0].telegram_sent_at is None and rows[1].telegram_sent_at is not None
+
+
+@pytest.mark.asyncio
+async def test_post_game_events_skips_events_claimed_by_another_run(test_session, sample_public_game):
+    now = utcnow()
+    in_flight = GameEvent(game_id=sample_public_game.id, half=1, minute=5,
+                          event_type=GameEventType.goal, player_name="A InFlight",
+                          telegram_sending_at=now)
+    abandoned = GameEvent(game_id=sample_public_game.id, half=1, minute=9,
+                          event_type=GameEventType.goal, player_name="B Abandoned",
+                          telegram_sending_at=now - tp.EVENT_CLAIM_TIMEOUT - timedelta(seconds=1))
+    test_session.add_all([in_flight, abandoned])
+    await test_session.commit()
+
+    sender = _FakeSender()
+    assert await tp.post_game_events(test_session, sample_public_game.id, sender) == 1
+
+    assert "Abandoned" in sender.sent[0][0]
+    await test_session.refresh(in_flight)
+    await test_session.refresh(abandoned)
+    assert in_flight.telegram_sent_at is None
+    assert abandoned.telegram_sent_at is not None and abandoned.telegram_sending_at is None
+
+
+@pytest.mark.asyncio
+async def test_post_game_events_releases_claim_when_send_raises(test_session, sample_public_game):
+    from app.services.telegram_user_client import TelegramTransientError
+
+    event = GameEvent(game_id=sample_public_game.id, half=1, minute=12,
+                      event_type=GameEventType.goal, player_name="A Retry")
+    test_session.add(event)
+    await test_session.commit()
+
+    class _FlakySender(_FakeSender):
+        async def send(self, text_html, reply_to=None):
+            raise TelegramTransientError("flood wait")
+
+    with pytest.raises(TelegramTransientError):
+        await tp.post_game_events(test_session, sample_public_game.id, _FlakySender())
+
+    await test_session.refresh(event)
+    assert event.telegram_sending_at is None
+    # The autoretry posts it immediately, not after EVENT_CLAIM_TIMEOUT.
+    sender = _FakeSender()
+    assert await tp.post_game_events(test_session, sample_public_game.id, sender) == 1
+    assert "Retry" in sender.sent[0][0]
+
+
+@pytest.mark.asyncio
+async def test_dispatch_queues_one_task_per_game(test_session, sample_public_game, monkeypatch):
+    from app.tasks import telegram_tasks
+    import app.utils.live_flag as live_flag
+
+    class FakeRedis:
+        def __init__(self):
+            self.keys: set[str] = set()
+
+        async def set(self, key, value, nx=False, ex=None):
+            if nx and key in self.keys:
+                return None
+            self.keys.add(key)
+            return True
+
+    redis = FakeRedis()
+
+    async def fake_get_redis():
+        return redis
+
+    monkeypatch.setattr(live_flag, "get_redis", fake_get_redis)
+    test_session.add_all([
+        GameEvent(game_id=sample_public_game.id, half=1, minute=m,
+                  event_type=GameEventType.goal, player_name="X Y")
+        for m in (3, 4, 5)
+    ])
+    await test_session.commit()
+
+    with patch.object(telegram_tasks.post_game_events_task, "delay") as delay_mock:
+        assert await telegram_tasks.dispatch_pending_event_posts(test_session, sample_public_game.id) == 3
+        # Next live cycle while the first task is still queued: nothing new enqueued.
+        assert await telegram_tasks.dispatch_pending_event_posts(test_session, sample_public_game.id) == 3
+
+    delay_mock.assert_called_once_with(sample_public_game.id)
+
+
+@pytest.mark.asyncio
+async def test_sender_sleeps_through_short_flood_wait(monkeypatch):
+    from telethon import errors as tg_errors
+
+    from app.services import telegram_user_client as tuc
+
+    slept: list[float] = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    class FakeClient:
+        def __init__(self):
+            self.calls = 0
+
+        async def send_message(self, chat_id, text, **kwargs):
+            self.calls += 1
+            if self.calls == 1:
+                raise tg_errors.FloodWaitError(request=None, capture=7)
+            return type("Msg", (), {"id": 55})()
+
+    monkeypatch.setattr(tuc.asyncio, "sleep", fake_sleep)
+    monkeypatch.setattr(tuc, "_last_sent_at", {})
+    sender = tuc.PublicTelegramSender()
+    sender._client = FakeClient()
+    sender._chat_id = "@kffleague"
+
+    assert await sender.send("<b>ГООООЛ</b>") == 55
+    assert slept[0] == 7
+    assert sender.flood_waited == 7
+
+    sender._client.calls = 0
+    monkeypatch.setattr(tuc, "MAX_INLINE_FLOOD_WAIT", 5)
+    with pytest.raises(tuc.TelegramTransientError):
+        await sender.send("<b>ГООООЛ</b>")
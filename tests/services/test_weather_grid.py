@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+
+import app.services.weather as weather
+from app.models import Game, GameStatus, Stadium
+from app.services.weather.openmeteo import forecast_for_kickoff
+
+
+def _hourly(day: date) -> list[tuple[datetime, float, int]]:
+    # 18:00 is rainy and warm, everything else clear and cool.
+    return [
+        (datetime.combine(day, time(hour, 0)), 20.4 if hour == 18 else 11.0, 61 if hour == 18 else 0)
+        for hour in range(24)
+    ]
+
+
+class TestForecastForKickoff:
+    def test_picks_kickoff_hour(self):
+        day = date(2026, 5, 1)
+        assert forecast_for_kickoff(_hourly(day), day, time(18, 30)) == (20, "rain")
+
+    def test_defaults_to_15_when_time_unknown(self):
+        day = date(2026, 5, 1)
+        assert forecast_for_kickoff(_hourly(day), day, None) == (11, "clear")
+
+    def test_empty_grid(self):
+        assert forecast_for_kickoff([], date(2026, 5, 1), time(18, 0)) is None
+
+
+@pytest.mark.asyncio
+async def test_games_sharing_a_city_use_one_forecast_and_one_metar(
+    test_session, sample_season, sample_teams, monkeypatch
+):
+    central = Stadium(name="Central", city="Almaty")
+    ortalyk = Stadium(name="Ortalyk", city="Almaty")
+    shymkent = Stadium(name="Shymkent Arena", city="Shymkent")
+    test_session.add_all([central, ortalyk, shymkent])
+    await test_session.flush()
+
+    def game(stadium: Stadium, day: int, status=GameStatus.created) -> Game:
+        return Game(
+            date=date(2026, 5, day),
+            time=time(18, 0),
+            tour=day,
+            season_id=sample_season.id,
+            home_team_id=sample_teams[0].id,
+            away_team_id=sample_teams[1].id,
+            stadium_id=stadium.id,
+            status=status,
+        )
+
+    test_session.add_all([
+        game(central, 1), game(central, 2), game(ortalyk, 3), game(shymkent, 4),
+        game(central, 5, GameStatus.live), game(ortalyk, 6, GameStatus.live),
+    ])
+    await test_session.commit()
+
+    calls = {"geocode": [], "forecast": [], "metar": []}
+
+    async def fake_geocode(city, _client):
+        calls["geocode"].append(city)
+        return {"Almaty": (43.2389, 76.8897), "Shymkent": (42.3417, 69.5901)}[city]
+
+    async def fake_forecast(lat, lon, _client):
+        calls["forecast"].append((lat, lon))
+        return [slot for day in range(1, 7) for slot in _hourly(date(2026, 5, day))]
+
+    async def fake_metar(icao, _client):
+        calls["metar"].append(icao)
+        return 17, "clouds"
+
+    monkeypatch.setattr(weather, "geocode_city", fake_geocode)
+    monkeypatch.setattr(weather, "fetch_hourly_forecast", fake_forecast)
+    monkeypatch.setattr(weather, "fetch_metar", fake_metar)
+
+    games = (await test_session.execute(
+        select(Game).options(selectinload(Game.stadium_rel))
+    )).scalars().all()
+    counts = await weather._refresh_games(test_session, list(games), client=None)
+    await test_session.commit()
+
+    assert sorted(calls["geocode"]) == ["Almaty", "Shymkent"]
+    assert sorted(calls["forecast"]) == [(42.34, 69.59), (43.24, 76.89)]
+    assert calls["metar"] == ["UAAA"]
+    assert counts == {"updated": 6, "skipped": 0, "errors": 0, "locations": 2, "stations": 1}
+
+    rows = (await test_session.execute(
+        select(Game.status, Game.weather_temp, Game.weather_condition, Game.weather_fetched_at)
+        .execution_options(populate_existing=True)
+    )).all()
+    assert all(row.weather_fetched_at is not None for row in rows)
+    assert {(row.weather_temp, row.weather_condition) for row in rows if row.status == GameStatus.live} == {(17, "clouds")}
+    assert {(row.weather_temp, row.weather_condition) for row in rows if row.status == GameStatus.created} == {(20, "rain")}
@@ -374,6 +374,7 @@ async def test_tow_extended_dispatch_in_sync_aggregate_bundle():
     mock_mark = AsyncMock()
     mock_revalidate = AsyncMock()
     mock_dispatch = AsyncMock()
+    mock_refresh = AsyncMock()
 
     with patch("app.tasks.sync_tasks.AsyncSessionLocal") as mock_session:
         # Every `async with AsyncSessionLocal() as db:` yields a new AsyncMock,
@@ -389,6 +390,9 @@ async def test_tow_extended_dispatch_in_sync_aggregate_bundle():
                     with patch(
                         "app.tasks.sync_tasks._dispatch_tow_sync_for_tours",
                         mock_dispatch,
+                    ), patch(
+                        "app.tasks.sync_tasks.refresh_team_overview_aggregates",
+                        mock_refresh,
                     ):
                         from app.tasks.sync_tasks import _sync_extended_aggregate_bundle
 
@@ -404,6 +408,9 @@ async def test_tow_extended_dispatch_in_sync_aggregate_bundle():
     reval_args = mock_revalidate.await_args.args
     assert reval_args[1:] == (100, 5)
     mock_dispatch.assert_awaited_once_with(100, [5], "extended")
+    # Season counts moved, so the team overview aggregates are refreshed.
+    mock_refresh.assert_awaited_once()
+    assert mock_refresh.await_args.args[1:] == (100,)
 
 
 @pytest.mark.asyncio
@@ -419,6 +426,7 @@ async def test_tow_extended_dispatch_in_live_aggregate_path():
     mock_mark = AsyncMock()
     mock_revalidate = AsyncMock()
     mock_dispatch = AsyncMock()
+    mock_refresh = AsyncMock()
 
     # The live aggregate path now delegates to sync_tasks._sync_extended_aggregate_bundle,
     # which resolves AsyncSessionLocal/SyncOrchestrator from the sync_tasks module.
@@ -434,6 +442,9 @@ async def test_tow_extended_dispatch_in_live_aggregate_path():
                     with patch(
                         "app.tasks.sync_tasks._dispatch_tow_sync_for_tours",
                         mock_dispatch,
+                    ), patch(
+                        "app.tasks.sync_tasks.refresh_team_overview_aggregates",
+                        mock_refresh,
                     ):
                         from app.tasks.live_tasks import (
                             _sync_extended_aggregates_for_season,
@@ -445,3 +456,25 @@ async def test_tow_extended_dispatch_in_live_aggregate_path():
     mock_mark.assert_awaited_once_with(mock_db, 100, 5)
     mock_revalidate.assert_awaited_once_with(mock_db, 100, 5)
     mock_dispatch.assert_awaited_once_with(100, [5], "extended")
+    mock_refresh.assert_awaited_once_with(mock_db, 100)
+
+
+@pytest.mark.asyncio
+async def test_aggregate_bundle_skips_overview_refresh_when_nothing_synced():
+    mock_orch = AsyncMock()
+    mock_orch.sync_team_season_stats.return_value = 0
+    mock_orch.sync_player_stats.return_value = 0
+    mock_refresh = AsyncMock()
+
+    with patch("app.tasks.sync_tasks.AsyncSessionLocal") as mock_session:
+        mock_session.return_value.__aenter__ = AsyncMock(side_effect=lambda: AsyncMock())
+        mock_session.return_value.__aexit__ = AsyncMock(return_value=False)
+        with patch("app.tasks.sync_tasks.SyncOrchestrator", return_value=mock_orch), patch(
+            "app.tasks.sync_tasks.refresh_team_overview_aggregates", mock_refresh,
+        ):
+            from app.tasks.sync_tasks import _sync_extended_aggregate_bundle
+
+            result = await _sync_extended_aggregate_bundle(100)
+
+    assert result["teams"] == 0 and result["players"] == 0
+    mock_refresh.assert_not_awaited()
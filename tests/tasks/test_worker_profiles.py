@@ -0,0 +1,54 @@
+"""Worker profiles: every routed task has a worker with the right settings."""
+import importlib
+
+import pytest
+
+from app.tasks import TASK_MODULES, celery_app
+from app.tasks.worker_profiles import WORKER_PROFILES, get_worker_profile
+
+
+def test_every_registered_task_is_served_by_a_profile():
+    for name in TASK_MODULES:
+        importlib.import_module(name)
+    routes = celery_app.conf.task_routes
+    consumers: dict[str, set[str]] = {}
+    for profile in WORKER_PROFILES.values():
+        assert set(profile.task_modules) <= set(TASK_MODULES), profile.name
+        for queue in profile.queues:
+            consumers.setdefault(queue, set()).update(profile.task_modules)
+
+    task_names = [name for name in celery_app.tasks if name.startswith("app.tasks.")]
+    assert task_names
+    for task_name in task_names:
+        queue = routes.get(task_name, {}).get("queue", "celery")
+        assert task_name.rsplit(".", 1)[0] in consumers.get(queue, set()), task_name
+
+
+def test_profile_conf_and_lookup():
+    media = get_worker_profile("media")
+    conf = media.celery_conf()
+
+    assert [q.name for q in conf["task_queues"]] == ["media"]
+    assert conf["worker_prefetch_multiplier"] == 1
+    assert conf["task_acks_late"] is True
+    assert get_worker_profile("live").uses_loop_thread
+    assert get_worker_profile("") is None
+    with pytest.raises(ValueError, match="nope"):
+        get_worker_profile("nope")
+
+
+def test_loop_inflight_limit_is_capped_by_db_pool(monkeypatch):
+    import app.tasks as tasks
+
+    live = get_worker_profile("live")
+    assert live.inflight_limit(None) == 32
+    assert get_worker_profile("media").inflight_limit(15) is None
+
+    monkeypatch.setattr(tasks.settings, "database_pool_class", "")
+    monkeypatch.setattr(tasks.settings, "database_pool_size", 5)
+    monkeypatch.setattr(tasks.settings, "database_max_overflow", 10)
+    assert tasks._loop_inflight_limit(live) == 15
+    assert tasks._loop_inflight_limit(get_worker_profile("telegram")) == 8
+
+    monkeypatch.setattr(tasks.settings, "database_pool_class", "null")
+    assert tasks._loop_inflight_limit(live) == 32
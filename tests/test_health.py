@@ -9,3 +9,26 @@ async def test_health_check(client: AsyncClient):
     assert response.status_code == 200
     data = response.json()
     assert data["status"] == "healthy"
+
+
+@pytest.mark.asyncio
+async def test_metrics_disabled_without_token(client: AsyncClient, monkeypatch):
+    from app import main
+
+    monkeypatch.setattr(main.settings, "metrics_token", "")
+    response = await client.get("/metrics")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_metrics_requires_bearer_token(client: AsyncClient, monkeypatch):
+    from app import main
+
+    monkeypatch.setattr(main.settings, "metrics_token", "scrape-secret")
+    assert (await client.get("/metrics")).status_code == 401
+    wrong = await client.get("/metrics", headers={"Authorization": "Bearer nope"})
+    assert wrong.status_code == 401
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "qfl_" in response.text
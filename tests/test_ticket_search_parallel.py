@@ -0,0 +1,171 @@
+"""Tests for the per-run caches, limiters and game fan-out of ticket search."""
+
+import asyncio
+import time
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+import app.utils.live_flag as live_flag
+from app.services import ticket_search
+from app.services.ticket_search import (
+    SerperAuthError,
+    TicketMatch,
+    _ProviderLimiter,
+    _run_game,
+    _TicketSearchRun,
+)
+
+
+class _FakeResponse:
+    def __init__(self, text: str = "", status_code: int = 200):
+        self.text = text
+        self.status_code = status_code
+
+
+class _CountingClient:
+    def __init__(self, status_code: int = 200, delay: float = 0.0):
+        self.status_code = status_code
+        self.delay = delay
+        self.gets: list[str] = []
+        self.posts: list[dict] = []
+
+    async def get(self, url, **kwargs):
+        self.gets.append(url)
+        await asyncio.sleep(self.delay)
+        return _FakeResponse(f"page {url}", self.status_code)
+
+    async def post(self, url, **kwargs):
+        self.posts.append(kwargs.get("json"))
+        return _FakeResponse("{}", self.status_code)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.sets: dict[str, set] = {}
+
+    async def sismember(self, key, member):
+        return member in self.sets.get(key, set())
+
+    async def sadd(self, key, member):
+        self.sets.setdefault(key, set()).add(member)
+
+    async def expire(self, key, seconds):
+        pass
+
+
+def _settings(**overrides):
+    values = dict(
+        ticket_search_concurrency=4,
+        ticket_serper_rps=0,
+        ticket_glm_concurrency=2,
+        serper_api_key="key",
+    )
+    values.update(overrides)
+    return SimpleNamespace(**values)
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_are_fetched_once_per_run():
+    client = _CountingClient(delay=0.01)
+    run = _TicketSearchRun(client, _settings())
+
+    pages = await asyncio.gather(*(run.get("https://t.me/s/fcelimai") for _ in range(4)))
+    await run.get("https://t.me/s/fcelimai", timeout=15)
+    await run.post(ticket_search.SERPER_SCRAPE_URL, json={"url": "https://a"})
+    await run.post(ticket_search.SERPER_SCRAPE_URL, json={"url": "https://a"})
+    await run.post(ticket_search.SERPER_SCRAPE_URL, json={"url": "https://b"})
+
+    assert client.gets == ["https://t.me/s/fcelimai"]
+    assert len({id(p) for p in pages}) == 1
+    assert client.posts == [{"url": "https://a"}, {"url": "https://b"}]
+    assert run.stats["web_cache_hits"] == 4
+    assert run.stats["serper_requests"] == 2
+
+
+@pytest.mark.asyncio
+async def test_server_errors_are_not_cached():
+    client = _CountingClient(status_code=503)
+    run = _TicketSearchRun(client, _settings())
+
+    await run.get("https://fcelimai.kz")
+    await run.get("https://fcelimai.kz")
+
+    assert len(client.gets) == 2
+
+
+@pytest.mark.asyncio
+async def test_provider_limiter_spaces_call_starts():
+    limiter = _ProviderLimiter(concurrency=3, rate_per_second=50)
+    starts: list[float] = []
+
+    async def call():
+        async with limiter.slot():
+            starts.append(time.monotonic())
+
+    await asyncio.gather(*(call() for _ in range(3)))
+
+    assert starts[2] - starts[0] >= 0.035
+
+
+@pytest.mark.asyncio
+async def test_ai_url_verdicts_cached_per_url_and_game(monkeypatch):
+    redis = _FakeRedis()
+
+    async def fake_get_redis():
+        return redis
+
+    calls: list[str] = []
+
+    async def fake_validate(url, title, snippet, home, away, game_date):
+        calls.append(url)
+        return "good" in url
+
+    monkeypatch.setattr(live_flag, "get_redis", fake_get_redis)
+    monkeypatch.setattr(ticket_search, "_ai_validate_ticket_url", fake_validate)
+
+    game = SimpleNamespace(id=7, date=date(2026, 6, 21))
+    other_game = SimpleNamespace(id=8, date=date(2026, 6, 21))
+    good = TicketMatch(url="https://ticketon.kz/event/good", title="", snippet="")
+    bad = TicketMatch(url="https://ticketon.kz/event/bad", title="", snippet="")
+
+    run = _TicketSearchRun(_CountingClient(), _settings())
+    assert await run.url_verdict(good, game, "Актобе", "Астана")
+    assert await run.url_verdict(good, game, "Актобе", "Астана")
+    assert not await run.url_verdict(bad, game, "Актобе", "Астана")
+    assert not await run.url_verdict(bad, other_game, "Актобе", "Астана")
+    assert calls == [good.url, bad.url, bad.url]
+
+    # A later run reuses stored rejections but asks again about acceptances.
+    next_run = _TicketSearchRun(_CountingClient(), _settings())
+    assert not await next_run.url_verdict(bad, game, "Актобе", "Астана")
+    assert await next_run.url_verdict(good, game, "Актобе", "Астана")
+    assert calls == [good.url, bad.url, bad.url, good.url]
+
+
+@pytest.mark.asyncio
+async def test_serper_auth_error_stops_remaining_games(monkeypatch):
+    searched: list[int] = []
+    notices: list[str] = []
+
+    async def fake_search(run, game):
+        searched.append(game.id)
+        if game.id == 1:
+            raise SerperAuthError("Serper API 403")
+        return "searched"
+
+    async def fake_notify(text):
+        notices.append(text)
+
+    monkeypatch.setattr(ticket_search, "_search_game", fake_search)
+    monkeypatch.setattr(ticket_search, "send_telegram_message", fake_notify)
+
+    run = _TicketSearchRun(_CountingClient(), _settings())
+    slots = asyncio.Semaphore(1)
+    games = [SimpleNamespace(id=i, home_team=None, away_team=None) for i in (1, 2, 3)]
+    outcomes = await asyncio.gather(*(_run_game(run, g, slots) for g in games))
+
+    assert outcomes == ["aborted", "aborted", "aborted"]
+    assert searched == [1]
+    assert len(notices) == 1
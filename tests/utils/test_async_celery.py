@@ -0,0 +1,97 @@
+"""Loop-thread mode of run_async: one event loop shared by many pool threads."""
+import asyncio
+import threading
+import time
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from app.utils import async_celery
+
+
+@pytest.fixture
+def loop_thread(monkeypatch):
+    monkeypatch.setattr(async_celery, "_loop", None)
+    monkeypatch.setattr(async_celery, "_loop_thread", None)
+    monkeypatch.setattr(async_celery, "_inflight", None)
+    monkeypatch.setattr(async_celery, "_current_soft_time_limit", lambda: None)
+
+    def start(max_inflight=None):
+        return async_celery.start_loop_thread(max_inflight)
+
+    yield start
+    loop = async_celery._loop
+    loop.call_soon_threadsafe(loop.stop)
+    async_celery._loop_thread.join(timeout=5)
+    loop.close()
+
+
+def _run_in_threads(coros):
+    threads = [threading.Thread(target=async_celery.run_async, args=(c,)) for c in coros]
+    started = time.monotonic()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return time.monotonic() - started
+
+
+def test_pool_threads_overlap_on_the_shared_loop(loop_thread):
+    loop = loop_thread()
+    loops: list[asyncio.AbstractEventLoop] = []
+
+    async def io_bound():
+        loops.append(asyncio.get_running_loop())
+        await asyncio.sleep(0.2)
+
+    assert _run_in_threads([io_bound() for _ in range(10)]) < 1.0
+    assert set(loops) == {loop}
+
+
+def test_max_inflight_caps_concurrent_task_coroutines(loop_thread):
+    loop_thread(max_inflight=2)
+    running = peak = 0
+
+    async def io_bound():
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+
+    _run_in_threads([io_bound() for _ in range(6)])
+
+    assert peak == 2
+
+
+def test_loop_thread_applies_the_soft_time_limit(loop_thread, monkeypatch):
+    loop_thread()
+    monkeypatch.setattr(async_celery, "_current_soft_time_limit", lambda: 0.05)
+
+    with pytest.raises(SoftTimeLimitExceeded):
+        async_celery.run_async(asyncio.sleep(1))
+
+    async def own_timeout():
+        raise TimeoutError("upstream")
+
+    with pytest.raises(TimeoutError, match="upstream"):
+        async_celery.run_async(own_timeout())
+
+
+def test_session_left_open_by_a_task_is_closed(loop_thread):
+    loop_thread()
+    leaked = []
+
+    async def leaky_task():
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        session = async_sessionmaker(engine)()
+        await session.execute(text("SELECT 1"))
+        leaked.append((engine, session))
+
+    async_celery.run_async(leaky_task())
+
+    engine, session = leaked[0]
+    assert session.sync_session.get_transaction() is None
+    asyncio.run_coroutine_threadsafe(engine.dispose(), async_celery._loop).result()
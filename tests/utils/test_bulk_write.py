@@ -0,0 +1,105 @@
+from datetime import date, datetime, time, timezone
+
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.dialects.postgresql import asyncpg
+
+from app.models import Game
+from app.models.tour_sync_status import TourSyncStatus
+from app.utils.bulk_write import bulk_update, bulk_upsert, update_from_values, upsert_statement
+
+
+def test_postgres_update_is_one_statement_from_typed_values():
+    stmt = update_from_values(
+        Game, "id", ["weather_temp", "weather_condition"],
+        [
+            {"id": 1, "weather_temp": 20, "weather_condition": "rain"},
+            {"id": 2, "weather_temp": 11, "weather_condition": "clear"},
+        ],
+    )
+    sql = str(stmt.compile(dialect=asyncpg.dialect()))
+
+    assert sql.startswith("UPDATE games SET weather_temp=bulk_src.weather_temp")
+    assert "FROM (VALUES (CAST($2::BIGINT AS BIGINT), CAST($3::INTEGER AS INTEGER)" in sql
+    assert sql.endswith("WHERE games.id = bulk_src.id")
+
+
+def test_postgres_values_keep_column_types_when_every_row_is_null():
+    stmt = update_from_values(
+        Game, "id", ["weather_temp"], [{"id": 1, "weather_temp": None}, {"id": 2, "weather_temp": None}],
+    )
+    compiled = stmt.compile(dialect=asyncpg.dialect())
+
+    assert "NULL" not in str(compiled)
+    assert str(compiled).count("AS INTEGER)") == 2
+    assert [compiled.params[name] for name in compiled.positiontup[1:]] == [1, None, 2, None]
+
+
+@pytest.mark.asyncio
+async def test_thousands_of_rows_cost_a_few_statements(test_engine, test_session, sample_season, sample_teams):
+    test_session.add_all([
+        Game(
+            date=date(2026, 5, 1), time=time(18, 0), tour=1, season_id=sample_season.id,
+            home_team_id=sample_teams[0].id, away_team_id=sample_teams[1].id,
+        )
+        for _ in range(2500)
+    ])
+    await test_session.commit()
+    ids = (await test_session.execute(select(Game.id))).scalars().all()
+
+    statements: list[str] = []
+    event.listen(test_engine.sync_engine, "before_cursor_execute", lambda *a: statements.append(a[2]))
+    written = await bulk_update(
+        test_session, Game,
+        [{"id": game_id, "weather_temp": game_id % 30} for game_id in ids],
+    )
+    await test_session.commit()
+
+    assert written == 2500
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 3  # 1000-row chunks
+    temps = dict((await test_session.execute(select(Game.id, Game.weather_temp))).all())
+    assert all(temps[game_id] == game_id % 30 for game_id in ids)
+
+
+@pytest.mark.asyncio
+async def test_rows_with_different_columns_are_grouped(test_session, sample_game):
+    await bulk_update(test_session, Game, [
+        {"id": sample_game.id, "weather_temp": 5},
+        {"id": sample_game.id, "is_free_entry": True},
+    ])
+    await test_session.commit()
+    await test_session.refresh(sample_game)
+
+    assert sample_game.weather_temp == 5
+    assert sample_game.is_free_entry is True
+
+    with pytest.raises(ValueError):
+        await bulk_update(test_session, Game, [{"weather_temp": 1}])
+
+
+@pytest.mark.asyncio
+async def test_bulk_upsert_inserts_then_updates(test_session, sample_season):
+    first = datetime(2026, 5, 1, tzinfo=timezone.utc)
+    later = datetime(2026, 5, 2, tzinfo=timezone.utc)
+    rows = [{"season_id": sample_season.id, "tour": tour, "synced_at": first} for tour in (1, 2)]
+    await bulk_upsert(test_session, TourSyncStatus, rows, index_elements=["season_id", "tour"])
+    await bulk_upsert(
+        test_session, TourSyncStatus,
+        [{"season_id": sample_season.id, "tour": 2, "synced_at": later}],
+        index_elements=["season_id", "tour"],
+    )
+    await test_session.commit()
+
+    synced = dict((await test_session.execute(
+        select(TourSyncStatus.tour, TourSyncStatus.synced_at)
+    )).all())
+    assert len(synced) == 2
+    assert synced[2].day == 2 and synced[1].day == 1
+
+
+def test_upsert_without_update_columns_does_nothing_on_conflict():
+    stmt = upsert_statement(
+        "postgresql", TourSyncStatus, [{"season_id": 1, "tour": 1}],
+        index_elements=["season_id", "tour"], update_columns=[],
+    )
+    assert "ON CONFLICT (season_id, tour) DO NOTHING" in str(stmt.compile(dialect=asyncpg.dialect()))
@@ -0,0 +1,36 @@
+import json
+from dataclasses import dataclass
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from app.utils.fast_json import dumps, json_response
+from scripts.benchmark_json import PAYLOADS, fastapi_path
+
+
+@pytest.mark.parametrize("name", sorted(PAYLOADS))
+def test_fast_path_matches_fastapi_output(name):
+    build, response_model = PAYLOADS[name]
+    payload = build()
+
+    assert json.loads(dumps(payload)) == json.loads(fastapi_path(payload, response_model))
+
+
+def test_dumps_handles_rows_and_non_finite_numbers():
+    @dataclass
+    class Row:
+        id: int
+        day: date
+
+    body = dumps({"rows": [Row(1, date(2025, 5, 1))], "avg": Decimal("1.5"), "xg": float("nan"), 7: {3}})
+
+    assert json.loads(body) == {"rows": [{"id": 1, "day": "2025-05-01"}], "avg": 1.5, "xg": None, "7": [3]}
+
+
+def test_json_response_is_prerendered():
+    response = json_response({"ok": True}, status_code=201)
+
+    assert response.status_code == 201
+    assert response.body == b'{"ok":true}'
+    assert response.media_type == "application/json"
@@ -0,0 +1,47 @@
+"""Tests for the maintained has_stats / has_lineup game flags."""
+
+import pytest
+from sqlalchemy import select
+
+from app.models import Game, GameTeamStats
+from app.utils.has_stats import check_game_flags, mark_has_stats, reconcile_game_flags
+
+pytestmark = pytest.mark.asyncio
+
+
+async def _flags(db, game_id: int) -> tuple[bool, bool]:
+    row = (await db.execute(select(Game.has_stats, Game.has_lineup).where(Game.id == game_id))).one()
+    return row.has_stats, row.has_lineup
+
+
+async def test_mark_has_stats(test_session, sample_game):
+    sample_game.has_stats = False
+    await test_session.commit()
+
+    await mark_has_stats(test_session, sample_game.id)
+    # The loaded instance sees the flag without a refresh.
+    assert sample_game.has_stats is True
+    await test_session.commit()
+
+    assert await _flags(test_session, sample_game.id) == (True, False)
+
+
+async def test_reconcile_repairs_drift_both_ways(test_session, sample_game):
+    # Stats rows written by a path that skipped the flag, and a lineup flag
+    # left set after its rows were removed.
+    sample_game.has_stats = False
+    sample_game.has_lineup = True
+    test_session.add(GameTeamStats(game_id=sample_game.id, team_id=sample_game.home_team_id))
+    await test_session.commit()
+
+    assert await check_game_flags(test_session) == {
+        "has_stats": [sample_game.id],
+        "has_lineup": [sample_game.id],
+    }
+
+    fixed = await reconcile_game_flags(test_session)
+    await test_session.commit()
+
+    assert fixed == {"has_stats": [sample_game.id], "has_lineup": [sample_game.id]}
+    assert await _flags(test_session, sample_game.id) == (True, False)
+    assert await check_game_flags(test_session) == {"has_stats": [], "has_lineup": []}
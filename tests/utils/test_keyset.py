@@ -0,0 +1,51 @@
+from datetime import date, time
+from decimal import Decimal
+
+import pytest
+from fastapi import HTTPException
+
+from app.models import Game, PlayerSeasonStats
+from app.utils import keyset
+
+GAME_KEYS = (keyset.SortKey(Game.date), keyset.SortKey(Game.time), keyset.SortKey(Game.id))
+
+
+def test_cursor_round_trips_typed_values():
+    cursor = keyset.encode_cursor("games", [date(2025, 5, 1), time(18, 30), 42])
+
+    assert keyset.decode_cursor(cursor, "games", GAME_KEYS) == [date(2025, 5, 1), time(18, 30), 42]
+
+
+def test_cursor_round_trips_decimal_and_null():
+    keys = (keyset.SortKey(PlayerSeasonStats.xg, descending=True), keyset.SortKey(PlayerSeasonStats.id))
+    cursor = keyset.encode_cursor("player_stats:xg", [Decimal("3.25"), 7])
+
+    assert keyset.decode_cursor(cursor, "player_stats:xg", keys) == [Decimal("3.25"), 7]
+    assert keyset.decode_cursor(keyset.encode_cursor("player_stats:xg", [None, 7]), "player_stats:xg", keys) == [None, 7]
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "%%%",
+        keyset.encode_cursor("news:date_desc", [date(2025, 5, 1), time(18, 30), 42]),
+        keyset.encode_cursor("games", [date(2025, 5, 1), 42]),
+        keyset.encode_cursor("games", ["not a date", None, 42]),
+        keyset.encode_cursor("games", [date(2025, 5, 1), None, "42"]),
+    ],
+)
+def test_invalid_cursor_is_400(cursor):
+    with pytest.raises(HTTPException) as exc:
+        keyset.decode_cursor(cursor, "games", GAME_KEYS)
+
+    assert exc.value.status_code == 400
+
+
+def test_split_page_emits_cursor_only_when_more_rows():
+    rows = [(1, "a"), (2, "b"), (3, "c")]
+
+    page, cursor = keyset.split_page(rows, 2, "s", lambda row: (row[0],))
+    assert page == rows[:2]
+    assert keyset.decode_cursor(cursor, "s", (keyset.SortKey(Game.id),)) == [2]
+
+    assert keyset.split_page(rows, 3, "s", lambda row: (row[0],)) == (rows, None)
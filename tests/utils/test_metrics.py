@@ -0,0 +1,121 @@
+import asyncio
+
+import httpx
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.tasks import celery_app
+from app.utils import cache
+from app.utils.metrics import BoundedLabel, instrument_pool, observe_outbound
+from app.utils.outbound_governor import GovernedTransport, OutboundGovernor
+
+
+def _sample(name: str, **labels) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_bounded_label_folds_overflow_into_other():
+    label = BoundedLabel(2)
+
+    assert [label(v) for v in ("a", "b", "c", "a", "d")] == ["a", "b", "other", "a", "other"]
+
+
+@pytest.mark.asyncio
+async def test_cache_hits_misses_and_singleflight_waits_per_family():
+    cache.cache_clear()
+    before = {
+        result: _sample("qfl_cache_requests_total", family="metricsprobe", result=result)
+        for result in ("hit", "miss")
+    }
+    waits = _sample("qfl_cache_singleflight_waits_total", family="metricsprobe")
+
+    async def compute():
+        await asyncio.sleep(0.01)
+        return b"{}"
+
+    await asyncio.gather(*(
+        cache.cache_get_or_compute("metricsprobe:1:ru", 30, compute) for _ in range(3)
+    ))
+    cache.cache_get("metricsprobe:1:ru")
+
+    assert _sample("qfl_cache_requests_total", family="metricsprobe", result="miss") - before["miss"] == 4
+    assert _sample("qfl_cache_requests_total", family="metricsprobe", result="hit") - before["hit"] == 3
+    assert _sample("qfl_cache_singleflight_waits_total", family="metricsprobe") - waits == 2
+    cache.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_pool_checkout_wait_and_checked_out_gauge():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    instrument_pool(engine, "probe")
+    before = _sample("qfl_db_pool_checkout_seconds_count", pool="probe")
+
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+        assert _sample("qfl_db_pool_checked_out", pool="probe") == 1
+    await engine.dispose()
+
+    assert _sample("qfl_db_pool_checkout_seconds_count", pool="probe") - before >= 1
+    assert _sample("qfl_db_pool_checked_out", pool="probe") == 0
+
+
+@pytest.mark.asyncio
+async def test_outbound_calls_labelled_by_known_service_and_outcome():
+    governor = OutboundGovernor(enabled=False)
+    transport = GovernedTransport(governor)
+    transport._inner = httpx.MockTransport(lambda request: httpx.Response(503))
+    before = _sample(
+        "qfl_outbound_request_duration_seconds_count", service="sota.id", outcome="http_5xx"
+    )
+    other = _sample("qfl_outbound_request_duration_seconds_count", service="other", outcome="http_5xx")
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://api.sota.id/games")
+        await client.get("https://some-club.kz/tickets")
+
+    assert _sample(
+        "qfl_outbound_request_duration_seconds_count", service="sota.id", outcome="http_5xx"
+    ) - before == 1
+    assert _sample(
+        "qfl_outbound_request_duration_seconds_count", service="other", outcome="http_5xx"
+    ) - other == 1
+
+    with pytest.raises(ValueError):
+        with observe_outbound("telegram-mtproto"):
+            raise ValueError
+    assert _sample(
+        "qfl_outbound_request_duration_seconds_count", service="telegram-mtproto", outcome="error"
+    ) >= 1
+
+
+def test_task_duration_recorded_with_outcome():
+    @celery_app.task(name="tests.metrics_probe")
+    def probe(fail: bool):
+        if fail:
+            raise RuntimeError("boom")
+        return "ok"
+
+    probe.apply(args=(False,))
+    probe.apply(args=(True,))
+
+    assert _sample("qfl_task_duration_seconds_count", task="tests.metrics_probe", outcome="success") == 1
+    assert _sample("qfl_task_duration_seconds_count", task="tests.metrics_probe", outcome="failure") == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_endpoint_reports_route_templates(client, monkeypatch):
+    from app import main
+
+    monkeypatch.setattr(main.settings, "metrics_token", "scrape-secret")
+    await client.get("/health")
+    await client.get("/api/v1/no-such-route/12345")
+
+    response = await client.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+    assert response.status_code == 200
+    body = response.text
+    assert 'qfl_http_request_duration_seconds_count{method="GET",route="/health",status="2xx"}' in body
+    assert 'route="unmatched",status="4xx"' in body
+    assert "12345" not in body
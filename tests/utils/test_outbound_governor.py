@@ -0,0 +1,127 @@
+import httpx
+import pytest
+
+from app.utils import outbound_governor
+from app.utils.outbound_governor import (
+    CircuitOpenError,
+    GovernedTransport,
+    OutboundGovernor,
+    RateLimitExceeded,
+    policy_for,
+)
+
+
+class FakeRedis:
+    """Answers the bucket script with a canned wait and records shared opens."""
+
+    def __init__(self, wait_ms: int = 0):
+        self.wait_ms = wait_ms
+        self.opened: list[str] = []
+
+    async def eval(self, _script, _numkeys, bucket_key, open_key, *args):
+        if open_key in self.opened:
+            return -2
+        return self.wait_ms
+
+    async def set(self, key, value, px=None):
+        self.opened.append(key)
+
+
+def _client(handler, redis: FakeRedis | None = None) -> tuple[httpx.AsyncClient, OutboundGovernor]:
+    async def getter():
+        if redis is None:
+            raise ConnectionError("redis down")
+        return redis
+
+    governor = OutboundGovernor(redis_getter=getter)
+    transport = GovernedTransport(governor)
+    transport._inner = httpx.MockTransport(handler)
+    return httpx.AsyncClient(transport=transport, timeout=30), governor
+
+
+def test_policy_matches_most_specific_host_suffix():
+    assert policy_for("sota.id")[0] == "sota.id"
+    assert policy_for("api.sota.id")[0] == "sota.id"
+    assert policy_for("geocoding-api.open-meteo.com")[0] == "open-meteo.com"
+    assert policy_for("notsota.id")[0] == "notsota.id"
+
+
+@pytest.mark.asyncio
+async def test_breaker_opens_after_consecutive_failures_and_fails_fast(monkeypatch):
+    calls = 0
+
+    def handler(request):
+        nonlocal calls
+        calls += 1
+        return httpx.Response(503)
+
+    redis = FakeRedis()
+    client, governor = _client(handler, redis)
+    for _ in range(5):
+        await client.get("https://sota.id/api/x")
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://sota.id/api/x")
+    assert calls == 5
+    assert redis.opened == ["qfl:outbound:open:sota.id"]
+    [host] = governor.snapshot()
+    assert host["state"] == "open"
+    assert host["rejected_open"] == 1
+
+    # After the cooldown one probe goes through; a success closes the circuit.
+    state = governor.host_state("sota.id")
+    state.opened_until = 1.0  # long past
+    redis.opened.clear()
+    client._transport._inner = httpx.MockTransport(lambda r: httpx.Response(200))
+    assert (await client.get("https://sota.id/api/x")).status_code == 200
+    assert governor.snapshot()[0]["state"] == "closed"
+
+
+@pytest.mark.asyncio
+async def test_circuit_opened_by_another_worker_is_honoured():
+    redis = FakeRedis()
+    redis.opened.append("qfl:outbound:open:googleapis.com")
+    client, _governor = _client(lambda r: httpx.Response(200), redis)
+
+    with pytest.raises(CircuitOpenError):
+        await client.get("https://www.googleapis.com/youtube/v3/videos")
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_wait_is_slept_and_overflow_rejected(monkeypatch):
+    slept: list[float] = []
+
+    async def fake_sleep(seconds):
+        slept.append(seconds)
+
+    monkeypatch.setattr(outbound_governor.asyncio, "sleep", fake_sleep)
+    redis = FakeRedis(wait_ms=250)
+    client, governor = _client(lambda r: httpx.Response(200), redis)
+
+    await client.get("https://google.serper.dev/search")
+    assert slept == [0.25]
+    assert governor.snapshot()[0]["throttled_seconds"] == 0.25
+
+    redis.wait_ms = -1
+    with pytest.raises(RateLimitExceeded):
+        await client.get("https://google.serper.dev/search")
+
+
+@pytest.mark.asyncio
+async def test_timeouts_adapt_to_observed_latency_and_redis_outage_fails_open():
+    seen_timeouts: list[dict] = []
+
+    def handler(request):
+        seen_timeouts.append(request.extensions["timeout"])
+        return httpx.Response(200)
+
+    client, governor = _client(handler, redis=None)
+    state = governor.host_state("api-standard.fcms.ma.services")
+    state.latencies.extend([0.5] * 30)
+
+    await client.get("https://api-standard.fcms.ma.services/v1/matches")
+
+    # p99 0.5s × 4 = 2s, floored at 5s; never above the caller's 30s.
+    assert seen_timeouts[-1]["read"] == 5.0
+    assert seen_timeouts[-1]["connect"] == 5.0
+    assert seen_timeouts[-1]["write"] == 30
@@ -0,0 +1,81 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.utils.query_profiler import QueryProfilerMiddleware, profile_queries
+
+
+@pytest.mark.asyncio
+async def test_profile_counts_queries_and_flags_repeats():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 0"))
+        with profile_queries("probe") as profile:
+            for i in range(4):
+                await conn.execute(text("SELECT :i"), {"i": i})
+            await conn.execute(text("SELECT 'once'"))
+        await conn.execute(text("SELECT 0"))
+    await engine.dispose()
+
+    assert profile.count == 5
+    assert profile.db_seconds > 0
+    assert profile.repeated(3) == [("SELECT ?", 4)]
+    assert profile.server_timing().endswith('desc="5 queries"')
+
+
+@pytest.mark.asyncio
+async def test_failed_statement_does_not_leak_its_start_time():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.connect() as conn:
+        with profile_queries("probe") as profile:
+            for _ in range(3):
+                with pytest.raises(Exception):
+                    await conn.execute(text("SELECT * FROM missing_table"))
+                await conn.rollback()
+            await conn.execute(text("SELECT 1"))
+        stack = conn.sync_connection.info.get("qfl_query_started")
+    await engine.dispose()
+
+    assert stack == []
+    assert profile.count == 4
+    assert profile.statements["SELECT * FROM missing_table"] == 3
+
+
+@pytest.mark.asyncio
+async def test_middleware_adds_server_timing_and_warns_on_n_plus_one(caplog):
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    inner = FastAPI()
+
+    @inner.get("/items/{item_id}")
+    async def item(item_id: int):
+        async with engine.connect() as conn:
+            for i in range(item_id):
+                await conn.execute(text("SELECT :i"), {"i": i})
+        return {"ok": True}
+
+    middleware = QueryProfilerMiddleware(inner)
+    middleware.enabled = True
+    middleware.repeat_threshold = 5
+
+    with caplog.at_level(logging.DEBUG, logger="app.utils.query_profiler"):
+        async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as ac:
+            few = await ac.get("/items/2")
+            many = await ac.get("/items/6")
+    await engine.dispose()
+
+    assert few.headers["server-timing"].endswith('desc="2 queries"')
+    assert many.headers["server-timing"].endswith('desc="6 queries"')
+    records = [r for r in caplog.records if r.name == "app.utils.query_profiler"]
+    assert [r.levelno for r in records] == [logging.DEBUG, logging.WARNING]
+    assert "request=GET /items/{item_id} queries=6" in records[1].getMessage()
+
+
+@pytest.mark.query_budget(max_queries=1)
+async def test_query_budget_marker_passes_within_budget(client, sample_teams):
+    response = await client.get(f"/api/v1/teams/{sample_teams[0].id}")
+
+    assert response.status_code == 200
@@ -0,0 +1,71 @@
+from pathlib import Path
+
+from app.utils.video_transcode import (
+    _hls_ladder_cmd,
+    hls_content_type,
+    hls_sibling,
+    is_hls_manifest,
+)
+
+
+def test_is_hls_manifest_matches_master_playlist_only():
+    assert is_hls_manifest("goal_videos/1/2-abc/master.m3u8")
+    assert is_hls_manifest("https://cdn/qfl-files/goal_videos/1/2-abc/master.m3u8?x=1")
+    assert not is_hls_manifest("goal_videos/1/2-abc.mp4")
+    assert not is_hls_manifest("goal_videos/1/2-abc/480p/index.m3u8")
+    assert not is_hls_manifest(None)
+
+
+def test_hls_sibling_swaps_master_for_package_file():
+    assert hls_sibling("goal_videos/1/2-abc/master.m3u8", "fallback.mp4") == (
+        "goal_videos/1/2-abc/fallback.mp4"
+    )
+
+
+def test_hls_sibling_keeps_legacy_single_mp4():
+    assert hls_sibling("goal_videos/1/2-abc.mp4", "fallback.mp4") == "goal_videos/1/2-abc.mp4"
+
+
+def test_hls_content_types():
+    assert hls_content_type("master.m3u8") == "application/vnd.apple.mpegurl"
+    assert hls_content_type("480p/seg_001.m4s") == "video/iso.segment"
+    assert hls_content_type("poster.jpg") == "image/jpeg"
+
+
+def test_hls_ladder_cmd_maps_one_variant_per_rung():
+    cmd = _hls_ladder_cmd(
+        Path("/tmp/in.mp4"),
+        Path("/tmp/out"),
+        ladder=(1080, 720, 480),
+        segment_seconds=4,
+        crf="20",
+        preset="medium",
+        audio_bitrate="128k",
+        threads="2",
+    )
+
+    assert cmd[cmd.index("-var_stream_map") + 1] == (
+        "v:0,a:0,name:1080p v:1,a:1,name:720p v:2,a:2,name:480p"
+    )
+    assert cmd[cmd.index("-hls_segment_type") + 1] == "fmp4"
+    # Three encoders share the two-thread budget.
+    assert cmd[cmd.index("-threads") + 1] == "1"
+    assert "split=3[v0][v1][v2]" in cmd[cmd.index("-filter_complex") + 1]
+
+
+def test_hls_ladder_cmd_without_audio_maps_video_only():
+    cmd = _hls_ladder_cmd(
+        Path("/tmp/in.mp4"),
+        Path("/tmp/out"),
+        ladder=(720, 480),
+        segment_seconds=4,
+        crf="20",
+        preset="medium",
+        audio_bitrate="128k",
+        threads="8",
+        has_audio=False,
+    )
+
+    assert cmd[cmd.index("-var_stream_map") + 1] == "v:0,name:720p v:1,name:480p"
+    assert "0:a" not in cmd
+    assert cmd[cmd.index("-threads") + 1] == "4"